@@ -0,0 +1,66 @@
+/*
+  Document numbers (invoice, payment, lab/pharmacy order, MRN) are allocated
+  per tenant from "DocumentSequence", so they are only unique within a tenant.
+
+  - The global unique indexes on the number columns become (tenantId, number).
+  - Counters are seeded from the highest number already issued, so new
+    numbers continue after the existing ones.
+*/
+-- CreateTable
+CREATE TABLE "DocumentSequence" (
+    "tenantId" TEXT NOT NULL,
+    "key" TEXT NOT NULL,
+    "value" INTEGER NOT NULL DEFAULT 0,
+    "updatedAt" TIMESTAMP(3) NOT NULL,
+
+    CONSTRAINT "DocumentSequence_pkey" PRIMARY KEY ("tenantId","key")
+);
+
+-- AddForeignKey
+ALTER TABLE "DocumentSequence" ADD CONSTRAINT "DocumentSequence_tenantId_fkey" FOREIGN KEY ("tenantId") REFERENCES "Tenant"("id") ON DELETE RESTRICT ON UPDATE CASCADE;
+
+-- DropIndex
+DROP INDEX "Invoice_invoiceNumber_key";
+DROP INDEX "Payment_paymentNumber_key";
+DROP INDEX "LabOrder_orderNumber_key";
+DROP INDEX "PharmacyOrder_orderNumber_key";
+DROP INDEX "patients_medicalRecordNumber_key";
+
+-- CreateIndex
+CREATE UNIQUE INDEX "Invoice_tenantId_invoiceNumber_key" ON "Invoice"("tenantId", "invoiceNumber");
+CREATE UNIQUE INDEX "Payment_tenantId_paymentNumber_key" ON "Payment"("tenantId", "paymentNumber");
+CREATE UNIQUE INDEX "LabOrder_tenantId_orderNumber_key" ON "LabOrder"("tenantId", "orderNumber");
+CREATE UNIQUE INDEX "PharmacyOrder_tenantId_orderNumber_key" ON "PharmacyOrder"("tenantId", "orderNumber");
+CREATE UNIQUE INDEX "patients_tenantId_medicalRecordNumber_key" ON "patients"("tenantId", "medicalRecordNumber");
+
+-- Backfill: INV-YYYYMM-NNNNNN and PAY-YYYYMM-NNNNNN restart every month
+INSERT INTO "DocumentSequence" ("tenantId", "key", "value", "updatedAt")
+SELECT "tenantId", substring("invoiceNumber" from 1 for 10), MAX(substring("invoiceNumber" from 12)::INTEGER), NOW()
+FROM "Invoice"
+WHERE "invoiceNumber" ~ '^INV-[0-9]{6}-[0-9]+$'
+GROUP BY "tenantId", substring("invoiceNumber" from 1 for 10);
+
+INSERT INTO "DocumentSequence" ("tenantId", "key", "value", "updatedAt")
+SELECT "tenantId", substring("paymentNumber" from 1 for 10), MAX(substring("paymentNumber" from 12)::INTEGER), NOW()
+FROM "Payment"
+WHERE "paymentNumber" ~ '^PAY-[0-9]{6}-[0-9]+$'
+GROUP BY "tenantId", substring("paymentNumber" from 1 for 10);
+
+-- Backfill: LABYYYYMMNNNNN, PHYYYYMMNNNNN and MRNYYMMNNNNNN count per tenant
+INSERT INTO "DocumentSequence" ("tenantId", "key", "value", "updatedAt")
+SELECT "tenantId", 'LAB', MAX(substring("orderNumber" from 10)::INTEGER), NOW()
+FROM "LabOrder"
+WHERE "orderNumber" ~ '^LAB[0-9]{11,}$'
+GROUP BY "tenantId";
+
+INSERT INTO "DocumentSequence" ("tenantId", "key", "value", "updatedAt")
+SELECT "tenantId", 'PH', MAX(substring("orderNumber" from 9)::INTEGER), NOW()
+FROM "PharmacyOrder"
+WHERE "orderNumber" ~ '^PH[0-9]{11,}$'
+GROUP BY "tenantId";
+
+INSERT INTO "DocumentSequence" ("tenantId", "key", "value", "updatedAt")
+SELECT "tenantId", 'MRN', MAX(substring("medicalRecordNumber" from 8)::INTEGER), NOW()
+FROM "patients"
+WHERE "medicalRecordNumber" ~ '^MRN[0-9]{10,}$'
+GROUP BY "tenantId";
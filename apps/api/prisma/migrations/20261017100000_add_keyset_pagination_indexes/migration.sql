@@ -0,0 +1,22 @@
+/*
+  Indexes backing keyset (cursor) pagination of the list endpoints: each one
+  matches the endpoint's tenant filter and (sort column, id) ordering, so a
+  page after a cursor is a single index range scan.
+*/
+-- CreateIndex
+CREATE INDEX "patients_tenantId_createdAt_id_idx" ON "patients"("tenantId", "createdAt", "id");
+
+-- CreateIndex
+CREATE INDEX "Appointment_tenantId_startTime_id_idx" ON "Appointment"("tenantId", "startTime", "id");
+
+-- CreateIndex
+CREATE INDEX "Invoice_tenantId_createdAt_id_idx" ON "Invoice"("tenantId", "createdAt", "id");
+
+-- CreateIndex
+CREATE INDEX "Payment_tenantId_paymentDate_id_idx" ON "Payment"("tenantId", "paymentDate", "id");
+
+-- CreateIndex
+CREATE INDEX "LabOrder_tenantId_orderDate_id_idx" ON "LabOrder"("tenantId", "orderDate", "id");
+
+-- CreateIndex
+CREATE INDEX "Message_tenantId_createdAt_id_idx" ON "Message"("tenantId", "createdAt", "id");
@@ -0,0 +1,35 @@
+/*
+  Indexes for patient search.
+
+  - Trigram (pg_trgm) GIN indexes let the case-insensitive substring filters
+    of GET /patients (ILIKE '%term%' on each column) use bitmap index scans
+    instead of scanning the whole table.
+  - The expression indexes serve the prefix lookups of GET /patients/search:
+    upper-cased MRN and digits-only phone, LIKE 'term%'.
+
+  The expression indexes are not representable in schema.prisma; keep the
+  expressions in sync with PatientSearchService.
+*/
+-- CreateExtension
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- CreateIndex
+CREATE INDEX "patients_firstName_trgm_idx" ON "patients" USING GIN ("firstName" gin_trgm_ops);
+
+-- CreateIndex
+CREATE INDEX "patients_lastName_trgm_idx" ON "patients" USING GIN ("lastName" gin_trgm_ops);
+
+-- CreateIndex
+CREATE INDEX "patients_email_trgm_idx" ON "patients" USING GIN ("email" gin_trgm_ops);
+
+-- CreateIndex
+CREATE INDEX "patients_phone_trgm_idx" ON "patients" USING GIN ("phone" gin_trgm_ops);
+
+-- CreateIndex
+CREATE INDEX "patients_medicalRecordNumber_trgm_idx" ON "patients" USING GIN ("medicalRecordNumber" gin_trgm_ops);
+
+-- CreateIndex
+CREATE INDEX "patients_tenantId_mrn_prefix_idx" ON "patients" ("tenantId", upper("medicalRecordNumber") text_pattern_ops);
+
+-- CreateIndex
+CREATE INDEX "patients_tenantId_phone_digits_prefix_idx" ON "patients" ("tenantId", regexp_replace("phone", '[^0-9]', '', 'g') text_pattern_ops);
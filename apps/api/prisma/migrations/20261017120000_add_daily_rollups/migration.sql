@@ -0,0 +1,51 @@
+/*
+  Per-tenant daily summary rows read by the reports and finance endpoints.
+  DailyRollupService keeps them current on writes; the backfill below (and
+  `npm run rollups:rebuild`) recompute them from the source tables.
+*/
+-- CreateTable
+CREATE TABLE "DailyRollup" (
+    "tenantId" TEXT NOT NULL,
+    "day" DATE NOT NULL,
+    "metric" TEXT NOT NULL,
+    "dimension" TEXT NOT NULL,
+    "count" INTEGER NOT NULL DEFAULT 0,
+    "amount" DOUBLE PRECISION NOT NULL DEFAULT 0,
+    "updatedAt" TIMESTAMP(3) NOT NULL,
+
+    CONSTRAINT "DailyRollup_pkey" PRIMARY KEY ("tenantId","metric","day","dimension")
+);
+
+-- AddForeignKey
+ALTER TABLE "DailyRollup" ADD CONSTRAINT "DailyRollup_tenantId_fkey" FOREIGN KEY ("tenantId") REFERENCES "Tenant"("id") ON DELETE RESTRICT ON UPDATE CASCADE;
+
+-- Backfill: payments
+INSERT INTO "DailyRollup" ("tenantId", "day", "metric", "dimension", "count", "amount", "updatedAt")
+SELECT "tenantId", "paymentDate"::DATE, 'payments', "paymentMethod"::TEXT, COUNT(*), COALESCE(SUM("amount"), 0), NOW()
+FROM "Payment"
+WHERE "status" = 'COMPLETED'
+GROUP BY "tenantId", "paymentDate"::DATE, "paymentMethod";
+
+-- Backfill: invoices
+INSERT INTO "DailyRollup" ("tenantId", "day", "metric", "dimension", "count", "amount", "updatedAt")
+SELECT "tenantId", "date"::DATE, 'invoices', "status"::TEXT, COUNT(*), COALESCE(SUM("totalAmount"), 0), NOW()
+FROM "Invoice"
+GROUP BY "tenantId", "date"::DATE, "status";
+
+-- Backfill: appointments
+INSERT INTO "DailyRollup" ("tenantId", "day", "metric", "dimension", "count", "amount", "updatedAt")
+SELECT "tenantId", "startTime"::DATE, 'appointments', "status"::TEXT, COUNT(*), 0, NOW()
+FROM "Appointment"
+GROUP BY "tenantId", "startTime"::DATE, "status";
+
+-- Backfill: lab_orders
+INSERT INTO "DailyRollup" ("tenantId", "day", "metric", "dimension", "count", "amount", "updatedAt")
+SELECT "tenantId", "orderDate"::DATE, 'lab_orders', "status"::TEXT, COUNT(*), 0, NOW()
+FROM "LabOrder"
+GROUP BY "tenantId", "orderDate"::DATE, "status";
+
+-- Backfill: pharmacy_orders
+INSERT INTO "DailyRollup" ("tenantId", "day", "metric", "dimension", "count", "amount", "updatedAt")
+SELECT "tenantId", "orderDate"::DATE, 'pharmacy_orders', "status"::TEXT, COUNT(*), 0, NOW()
+FROM "PharmacyOrder"
+GROUP BY "tenantId", "orderDate"::DATE, "status";
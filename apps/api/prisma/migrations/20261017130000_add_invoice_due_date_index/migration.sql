@@ -0,0 +1,6 @@
+/*
+  Backs the outstanding-invoices report, which reads a tenant's open invoices
+  in (dueDate, id) order and pages/exports them by that key.
+*/
+-- CreateIndex
+CREATE INDEX "Invoice_tenantId_dueDate_id_idx" ON "Invoice"("tenantId", "dueDate", "id");
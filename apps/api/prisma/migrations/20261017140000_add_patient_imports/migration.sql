@@ -0,0 +1,24 @@
+/*
+  Progress rows for bulk patient imports. Each committed batch advances
+  "checkpoint" in the same transaction as its inserts, so an interrupted
+  import can be resumed without duplicating or skipping rows.
+*/
+-- CreateTable
+CREATE TABLE "PatientImport" (
+    "id" TEXT NOT NULL,
+    "tenantId" TEXT NOT NULL,
+    "source" TEXT,
+    "checkpoint" INTEGER NOT NULL DEFAULT 0,
+    "imported" INTEGER NOT NULL DEFAULT 0,
+    "failed" INTEGER NOT NULL DEFAULT 0,
+    "createdAt" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "updatedAt" TIMESTAMP(3) NOT NULL,
+
+    CONSTRAINT "PatientImport_pkey" PRIMARY KEY ("id")
+);
+
+-- CreateIndex
+CREATE INDEX "PatientImport_tenantId_createdAt_idx" ON "PatientImport"("tenantId", "createdAt");
+
+-- AddForeignKey
+ALTER TABLE "PatientImport" ADD CONSTRAINT "PatientImport_tenantId_fkey" FOREIGN KEY ("tenantId") REFERENCES "Tenant"("id") ON DELETE RESTRICT ON UPDATE CASCADE;
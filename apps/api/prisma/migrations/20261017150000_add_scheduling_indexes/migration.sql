@@ -0,0 +1,10 @@
+/*
+  Back the appointment slot engine, which loads each doctor's shifts and
+  bookings overlapping a range (startTime < to AND endTime > from) and checks
+  single bookings for overlaps the same way.
+*/
+-- CreateIndex
+CREATE INDEX "Appointment_doctorId_endTime_idx" ON "Appointment"("doctorId", "endTime");
+
+-- CreateIndex
+CREATE INDEX "Shift_staffId_endTime_idx" ON "Shift"("staffId", "endTime");
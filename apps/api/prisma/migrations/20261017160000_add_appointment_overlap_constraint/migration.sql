@@ -0,0 +1,66 @@
+/*
+  Reject overlapping bookings in the database: no two non-cancelled
+  SCHEDULED appointments of the same doctor in a tenant may have
+  intersecting [startTime, endTime) ranges. Concurrent bookings of one slot
+  can no longer both pass a read-then-write check; the loser gets 23P01,
+  which AppointmentsService reports as the usual slot conflict.
+
+  OPD walk-ins and IPD admissions are Appointment rows too and were never
+  overlap-checked (a doctor sees several walk-ins in half an hour, and an
+  admission spans days), so rows now carry a kind and only SCHEDULED ones,
+  made through the appointment and patient portal endpoints, are covered.
+  Existing rows are classified before the check:
+  - ADMISSION: IPD stores the ward id in "departmentId".
+  - WALK_IN: OPD starts the visit when it is created and gives it 30
+    minutes, which a booking made ahead of time does not do.
+
+  The columns are timestamp without time zone, so the range is a tsrange
+  (a tstzrange over them would depend on the session TimeZone and cannot be
+  indexed). btree_gist provides the = operators for the text columns.
+
+  Exclusion constraints are not representable in schema.prisma; keep the
+  constraint name in sync with APPOINTMENT_OVERLAP_CONSTRAINT.
+
+  Existing overlapping bookings must be resolved (cancelled or moved)
+  before this runs.
+*/
+-- CreateExtension
+CREATE EXTENSION IF NOT EXISTS btree_gist;
+
+-- CreateEnum
+CREATE TYPE "AppointmentKind" AS ENUM ('SCHEDULED', 'WALK_IN', 'ADMISSION');
+
+-- AlterTable
+ALTER TABLE "Appointment" ADD COLUMN "kind" "AppointmentKind" NOT NULL DEFAULT 'SCHEDULED';
+
+-- Backfill
+UPDATE "Appointment" SET "kind" = 'ADMISSION'
+WHERE "departmentId" IN (SELECT "id" FROM "Ward");
+
+UPDATE "Appointment" SET "kind" = 'WALK_IN'
+WHERE "kind" = 'SCHEDULED'
+  AND "endTime" - "startTime" = INTERVAL '30 minutes'
+  AND "startTime" BETWEEN "createdAt" - INTERVAL '1 minute' AND "createdAt" + INTERVAL '1 minute';
+
+-- CheckExistingOverlaps
+DO $$
+DECLARE
+    overlaps integer;
+BEGIN
+    SELECT COUNT(*) INTO overlaps
+    FROM "Appointment" a
+    JOIN "Appointment" b
+      ON b."tenantId" = a."tenantId" AND b."doctorId" = a."doctorId" AND b."id" > a."id"
+     AND b."startTime" < a."endTime" AND b."endTime" > a."startTime"
+    WHERE a."status" <> 'CANCELLED' AND a."kind" = 'SCHEDULED'
+      AND b."status" <> 'CANCELLED' AND b."kind" = 'SCHEDULED';
+
+    IF overlaps > 0 THEN
+        RAISE EXCEPTION '% pairs of overlapping scheduled appointments must be cancelled or rescheduled before adding "Appointment_doctor_no_overlap"', overlaps;
+    END IF;
+END $$;
+
+-- AddConstraint
+ALTER TABLE "Appointment" ADD CONSTRAINT "Appointment_doctor_no_overlap"
+    EXCLUDE USING gist ("tenantId" WITH =, "doctorId" WITH =, tsrange("startTime", "endTime") WITH &&)
+    WHERE ("status" <> 'CANCELLED' AND "kind" = 'SCHEDULED');
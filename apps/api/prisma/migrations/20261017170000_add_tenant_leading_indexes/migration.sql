@@ -0,0 +1,61 @@
+/*
+  Tenant-leading composite indexes for the access paths every service uses:
+  each query filters on "tenantId" first, so the single-column status/date
+  indexes only helped after reading every tenant's rows.
+
+  - Appointment: stats by status; a doctor's day (calendar, OPD queue per doctor)
+  - Invoice/Payment: stats by status; revenue over a paymentDate range by status
+  - Bed: occupancy by status; beds of a ward
+  - EmergencyCase: the triage queue (status, then triage level and arrival);
+    arrivals over a date range
+  - InventoryItem: active items by name; items of a category
+  - Message/Notification: a user's unread count; a user's list, newest first
+
+  benchmarks/index_plan_check.py EXPLAINs these queries on a seeded tenant
+  and fails if any of them scans a table sequentially.
+*/
+
+-- CreateIndex
+CREATE INDEX "Appointment_tenantId_status_idx" ON "Appointment"("tenantId", "status");
+
+-- CreateIndex
+CREATE INDEX "Appointment_tenantId_doctorId_startTime_idx" ON "Appointment"("tenantId", "doctorId", "startTime");
+
+-- CreateIndex
+CREATE INDEX "Invoice_tenantId_status_idx" ON "Invoice"("tenantId", "status");
+
+-- CreateIndex
+CREATE INDEX "Payment_tenantId_status_idx" ON "Payment"("tenantId", "status");
+
+-- CreateIndex
+CREATE INDEX "Payment_tenantId_paymentDate_status_idx" ON "Payment"("tenantId", "paymentDate", "status");
+
+-- CreateIndex
+CREATE INDEX "Bed_tenantId_status_idx" ON "Bed"("tenantId", "status");
+
+-- CreateIndex
+CREATE INDEX "Bed_tenantId_wardId_idx" ON "Bed"("tenantId", "wardId");
+
+-- CreateIndex
+CREATE INDEX "EmergencyCase_tenantId_status_triageLevel_arrivalTime_idx" ON "EmergencyCase"("tenantId", "status", "triageLevel", "arrivalTime");
+
+-- CreateIndex
+CREATE INDEX "EmergencyCase_tenantId_arrivalTime_idx" ON "EmergencyCase"("tenantId", "arrivalTime");
+
+-- CreateIndex
+CREATE INDEX "InventoryItem_tenantId_isActive_name_idx" ON "InventoryItem"("tenantId", "isActive", "name");
+
+-- CreateIndex
+CREATE INDEX "InventoryItem_tenantId_category_idx" ON "InventoryItem"("tenantId", "category");
+
+-- CreateIndex
+CREATE INDEX "Message_tenantId_recipientId_read_idx" ON "Message"("tenantId", "recipientId", "read");
+
+-- CreateIndex
+CREATE INDEX "Message_tenantId_senderId_createdAt_idx" ON "Message"("tenantId", "senderId", "createdAt");
+
+-- CreateIndex
+CREATE INDEX "Notification_tenantId_userId_read_idx" ON "Notification"("tenantId", "userId", "read");
+
+-- CreateIndex
+CREATE INDEX "Notification_tenantId_userId_createdAt_idx" ON "Notification"("tenantId", "userId", "createdAt");
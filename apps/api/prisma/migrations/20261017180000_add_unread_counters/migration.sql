@@ -0,0 +1,35 @@
+/*
+  Per-user unread counts behind the notification bell and the
+  communications stats. CommunicationsService adjusts them in the same
+  transaction as every write to a read flag; the backfill below seeds them
+  from the rows that are unread today.
+*/
+-- CreateTable
+CREATE TABLE "UnreadCounter" (
+    "tenantId" TEXT NOT NULL,
+    "userId" TEXT NOT NULL,
+    "unreadMessages" INTEGER NOT NULL DEFAULT 0,
+    "unreadNotifications" INTEGER NOT NULL DEFAULT 0,
+    "updatedAt" TIMESTAMP(3) NOT NULL,
+
+    CONSTRAINT "UnreadCounter_pkey" PRIMARY KEY ("tenantId","userId")
+);
+
+-- AddForeignKey
+ALTER TABLE "UnreadCounter" ADD CONSTRAINT "UnreadCounter_tenantId_fkey" FOREIGN KEY ("tenantId") REFERENCES "Tenant"("id") ON DELETE RESTRICT ON UPDATE CASCADE;
+
+-- Backfill: unread messages, counted for the recipient
+INSERT INTO "UnreadCounter" ("tenantId", "userId", "unreadMessages", "updatedAt")
+SELECT "tenantId", "recipientId", COUNT(*), NOW()
+FROM "Message"
+WHERE "read" = false
+GROUP BY "tenantId", "recipientId";
+
+-- Backfill: unread notifications
+INSERT INTO "UnreadCounter" ("tenantId", "userId", "unreadNotifications", "updatedAt")
+SELECT "tenantId", "userId", COUNT(*), NOW()
+FROM "Notification"
+WHERE "read" = false
+GROUP BY "tenantId", "userId"
+ON CONFLICT ("tenantId", "userId")
+DO UPDATE SET "unreadNotifications" = EXCLUDED."unreadNotifications";
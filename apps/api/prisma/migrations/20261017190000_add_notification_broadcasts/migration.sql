@@ -0,0 +1,32 @@
+/*
+  Progress of notification fan-outs (POST communications/notifications/broadcast).
+  Each chunk of notifications commits together with sent and cursor, so a
+  broadcast's row always matches what was delivered.
+*/
+-- CreateTable
+CREATE TABLE "NotificationBroadcast" (
+    "id" TEXT NOT NULL,
+    "tenantId" TEXT NOT NULL,
+    "title" TEXT NOT NULL,
+    "message" TEXT NOT NULL,
+    "type" "NotificationType" NOT NULL DEFAULT 'INFO',
+    "actionUrl" TEXT,
+    "target" JSONB NOT NULL,
+    "status" TEXT NOT NULL DEFAULT 'PENDING',
+    "total" INTEGER NOT NULL DEFAULT 0,
+    "sent" INTEGER NOT NULL DEFAULT 0,
+    "cursor" TEXT,
+    "error" TEXT,
+    "createdById" TEXT,
+    "createdAt" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "updatedAt" TIMESTAMP(3) NOT NULL,
+    "completedAt" TIMESTAMP(3),
+
+    CONSTRAINT "NotificationBroadcast_pkey" PRIMARY KEY ("id")
+);
+
+-- CreateIndex
+CREATE INDEX "NotificationBroadcast_tenantId_createdAt_idx" ON "NotificationBroadcast"("tenantId", "createdAt");
+
+-- AddForeignKey
+ALTER TABLE "NotificationBroadcast" ADD CONSTRAINT "NotificationBroadcast_tenantId_fkey" FOREIGN KEY ("tenantId") REFERENCES "Tenant"("id") ON DELETE RESTRICT ON UPDATE CASCADE;
@@ -0,0 +1,43 @@
+/*
+  Postgres-backed job queue (JobQueueService).
+
+  Workers claim jobs with
+    SELECT ... WHERE "queue" = $1 AND "status" = 'PENDING' AND "runAt" <= NOW()
+    ORDER BY "priority" DESC, "runAt" FOR UPDATE SKIP LOCKED
+  "Job_claim_idx" covers exactly that and only holds pending rows, so it
+  stays small however many finished jobs the table keeps.
+*/
+-- CreateTable
+CREATE TABLE "Job" (
+    "id" TEXT NOT NULL,
+    "tenantId" TEXT,
+    "queue" TEXT NOT NULL,
+    "name" TEXT NOT NULL,
+    "payload" JSONB NOT NULL DEFAULT '{}',
+    "status" TEXT NOT NULL DEFAULT 'PENDING',
+    "priority" INTEGER NOT NULL DEFAULT 0,
+    "attempts" INTEGER NOT NULL DEFAULT 0,
+    "maxAttempts" INTEGER NOT NULL DEFAULT 3,
+    "runAt" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "lockedBy" TEXT,
+    "lockedAt" TIMESTAMP(3),
+    "lastError" TEXT,
+    "result" JSONB,
+    "uniqueKey" TEXT,
+    "createdAt" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "updatedAt" TIMESTAMP(3) NOT NULL,
+    "completedAt" TIMESTAMP(3),
+
+    CONSTRAINT "Job_pkey" PRIMARY KEY ("id")
+);
+
+-- CreateIndex
+CREATE UNIQUE INDEX "Job_uniqueKey_key" ON "Job"("uniqueKey");
+CREATE INDEX "Job_tenantId_createdAt_idx" ON "Job"("tenantId", "createdAt");
+CREATE INDEX "Job_status_lockedAt_idx" ON "Job"("status", "lockedAt");
+
+-- CreateIndex: claim order of due pending jobs
+CREATE INDEX "Job_claim_idx" ON "Job"("queue", "priority" DESC, "runAt") WHERE "status" = 'PENDING';
+
+-- AddForeignKey
+ALTER TABLE "Job" ADD CONSTRAINT "Job_tenantId_fkey" FOREIGN KEY ("tenantId") REFERENCES "Tenant"("id") ON DELETE SET NULL ON UPDATE CASCADE;
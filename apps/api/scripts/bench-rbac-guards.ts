@@ -0,0 +1,123 @@
+/**
+ * Micro-benchmark for the core RBAC guards.
+ *
+ * Compares the current PermissionsGuard/RolesGuard (compiled permission Sets,
+ * memoized route metadata) against the previous implementation, which read
+ * the decorators through the Reflector and scanned the role's permission
+ * array on every request.
+ *
+ * Usage:
+ *   npm run bench:rbac
+ *   npm run bench:rbac -- 500000     # iterations per case
+ */
+import 'reflect-metadata';
+import { ExecutionContext } from '@nestjs/common';
+import { Reflector } from '@nestjs/core';
+import { PermissionsGuard } from '../src/core/rbac/guards/permissions.guard';
+import { RolesGuard } from '../src/core/rbac/guards/roles.guard';
+import { Permissions, RequireAllPermissions, PERMISSIONS_KEY } from '../src/core/rbac/decorators/permissions.decorator';
+import { Roles, ROLES_KEY } from '../src/core/rbac/decorators/roles.decorator';
+import { Permission } from '../src/core/rbac/enums/permissions.enum';
+import { UserRole } from '../src/core/rbac/enums/roles.enum';
+import { getPermissionsForRole } from '../src/core/rbac/role-permission.mapping';
+
+const ITERATIONS = Number(process.argv[2]) || 200000;
+
+class BenchController {
+  // Worst case for the old scan: the permission sits near the end of the enum
+  @Permissions(Permission.VIEW_MESSAGES, Permission.MESSAGE_READ)
+  list() {}
+
+  @RequireAllPermissions(Permission.VIEW_PATIENTS, Permission.UPDATE_PATIENTS)
+  update() {}
+
+  @Roles(UserRole.TENANT_ADMIN, UserRole.DOCTOR, UserRole.NURSE)
+  admin() {}
+}
+
+function contextFor(handler: Function, role: UserRole): ExecutionContext {
+  const request = { user: { id: 'bench-user', role, tenantId: 'bench-tenant' } };
+  return {
+    getClass: () => BenchController,
+    getHandler: () => handler,
+    switchToHttp: () => ({ getRequest: () => request }),
+  } as unknown as ExecutionContext;
+}
+
+/** PermissionsGuard.canActivate as it was before the permission Sets */
+function legacyPermissionsCheck(reflector: Reflector, context: ExecutionContext): boolean {
+  const requiredPermissions = reflector.getAllAndOverride<Permission[]>(
+    PERMISSIONS_KEY,
+    [context.getHandler(), context.getClass()],
+  );
+  const requireAll = reflector.get('require_all_permissions', context.getHandler());
+  const requireAny = reflector.get('require_any_permission', context.getHandler());
+  if (!requiredPermissions && !requireAll && !requireAny) {
+    return true;
+  }
+  const user = context.switchToHttp().getRequest().user;
+  const userPermissions = getPermissionsForRole(user.role);
+  if (requireAll) {
+    return requireAll.permissions.every((p: Permission) => userPermissions.includes(p));
+  }
+  if (requireAny) {
+    return requireAny.permissions.some((p: Permission) => userPermissions.includes(p));
+  }
+  return requiredPermissions.some((p) => userPermissions.includes(p));
+}
+
+/** RolesGuard.canActivate as it was before the memoized role Sets */
+function legacyRolesCheck(reflector: Reflector, context: ExecutionContext): boolean {
+  const requiredRoles = reflector.getAllAndOverride<UserRole[]>(
+    ROLES_KEY,
+    [context.getHandler(), context.getClass()],
+  );
+  if (!requiredRoles || requiredRoles.length === 0) {
+    return true;
+  }
+  const user = context.switchToHttp().getRequest().user;
+  return requiredRoles.some((role) => user.role === role);
+}
+
+function time(label: string, fn: () => boolean): number {
+  // Warm up the JIT before measuring
+  for (let i = 0; i < 10000; i++) fn();
+  const start = process.hrtime.bigint();
+  for (let i = 0; i < ITERATIONS; i++) {
+    if (!fn()) {
+      throw new Error(`${label}: unexpected denial`);
+    }
+  }
+  const nsPerOp = Number(process.hrtime.bigint() - start) / ITERATIONS;
+  console.log(`  ${label.padEnd(34)} ${nsPerOp.toFixed(1).padStart(9)} ns/op`);
+  return nsPerOp;
+}
+
+function main() {
+  const reflector = new Reflector();
+  const permissionsGuard = new PermissionsGuard(reflector);
+  const rolesGuard = new RolesGuard(reflector);
+
+  const cases: Array<[string, ExecutionContext, 'permissions' | 'roles']> = [
+    ['@Permissions, SUPER_ADMIN', contextFor(BenchController.prototype.list, UserRole.SUPER_ADMIN), 'permissions'],
+    ['@Permissions, DOCTOR', contextFor(BenchController.prototype.list, UserRole.DOCTOR), 'permissions'],
+    ['@RequireAllPermissions, DOCTOR', contextFor(BenchController.prototype.update, UserRole.DOCTOR), 'permissions'],
+    ['@Roles, NURSE', contextFor(BenchController.prototype.admin, UserRole.NURSE), 'roles'],
+  ];
+
+  console.log(`RBAC guard micro-benchmark, ${ITERATIONS} iterations per case\n`);
+  for (const [label, context, kind] of cases) {
+    console.log(label);
+    const before =
+      kind === 'permissions'
+        ? time('legacy (reflector + array scan)', () => legacyPermissionsCheck(reflector, context))
+        : time('legacy (reflector + array scan)', () => legacyRolesCheck(reflector, context));
+    const after =
+      kind === 'permissions'
+        ? time('current (memoized + Set)', () => permissionsGuard.canActivate(context))
+        : time('current (memoized + Set)', () => rolesGuard.canActivate(context));
+    console.log(`  speedup ${(before / after).toFixed(1)}x\n`);
+  }
+}
+
+main();
@@ -0,0 +1,107 @@
+/**
+ * Bulk import patients into a tenant from a CSV or NDJSON file.
+ *
+ * Progress is committed per batch. The import id is kept in
+ * <file>.import.json, so running the same command again after an
+ * interruption resumes after the last committed row; delete that file to
+ * start a fresh import. Every rejected row is appended to
+ * <file>.errors.ndjson as {"row": n, "errors": [...]}.
+ *
+ * Usage:
+ *   npm run patients:import -- --tenant <tenantId> --file legacy-patients.csv
+ *   npm run patients:import -- --tenant <tenantId> --file export.ndjson --batch-size 2000
+ */
+import 'reflect-metadata';
+import { createReadStream, existsSync, readFileSync, writeFileSync, appendFileSync } from 'fs';
+import { basename, extname } from 'path';
+import { Module } from '@nestjs/common';
+import { ConfigModule } from '@nestjs/config';
+import { NestFactory } from '@nestjs/core';
+import { PrismaModule } from '../src/prisma/prisma.module';
+import { StatsCacheModule } from '../src/cache/stats-cache.module';
+import { DocumentSequenceModule } from '../src/sequences/document-sequence.module';
+import { PatientImportService } from '../src/patients/patient-import.service';
+import { parseImportFormat, readRecords } from '../src/shared/import/record-reader';
+
+@Module({
+  imports: [ConfigModule.forRoot({ isGlobal: true }), PrismaModule, StatsCacheModule, DocumentSequenceModule],
+  providers: [PatientImportService],
+})
+class ImportPatientsModule {}
+
+function parseArgs(argv: string[]) {
+  const options: { tenantId?: string; file?: string; format?: string; batchSize?: number } = {};
+  for (let i = 0; i < argv.length; i += 2) {
+    const value = argv[i + 1];
+    switch (argv[i]) {
+      case '--tenant':
+        options.tenantId = value;
+        break;
+      case '--file':
+        options.file = value;
+        break;
+      case '--format':
+        options.format = value;
+        break;
+      case '--batch-size':
+        options.batchSize = Number(value);
+        break;
+      default:
+        throw new Error(`Unknown argument: ${argv[i]}`);
+    }
+  }
+  if (!options.tenantId || !options.file) {
+    throw new Error('Usage: import-patients --tenant <tenantId> --file <path> [--format csv|ndjson] [--batch-size n]');
+  }
+  return options;
+}
+
+async function main() {
+  const options = parseArgs(process.argv.slice(2));
+  const format = parseImportFormat(options.format || extname(options.file).slice(1));
+  const checkpointFile = `${options.file}.import.json`;
+  const errorsFile = `${options.file}.errors.ndjson`;
+  const importId = existsSync(checkpointFile)
+    ? JSON.parse(readFileSync(checkpointFile, 'utf8')).importId
+    : undefined;
+
+  const app = await NestFactory.createApplicationContext(ImportPatientsModule, {
+    logger: ['warn', 'error'],
+  });
+
+  try {
+    const started = Date.now();
+    console.log(importId ? `Resuming import ${importId}` : `Starting import of ${options.file}`);
+
+    const result = await app.get(PatientImportService).import(
+      options.tenantId,
+      readRecords(createReadStream(options.file), format),
+      {
+        importId,
+        source: basename(options.file),
+        batchSize: options.batchSize,
+        onError: (error) => appendFileSync(errorsFile, `${JSON.stringify(error)}\n`),
+        onBatch: (progress) => {
+          writeFileSync(checkpointFile, JSON.stringify({ importId: progress.importId, checkpoint: progress.checkpoint }));
+          const seconds = (Date.now() - started) / 1000;
+          console.log(
+            `row ${progress.checkpoint}: ${progress.imported} imported, ${progress.failed} failed ` +
+              `(${Math.round(progress.processed / seconds)} rows/s)`,
+          );
+        },
+      },
+    );
+
+    console.log(
+      `Done in ${((Date.now() - started) / 1000).toFixed(1)}s: ${result.imported} imported, ${result.failed} failed` +
+        (result.failed ? ` (see ${errorsFile})` : ''),
+    );
+  } finally {
+    await app.close();
+  }
+}
+
+main().catch((error) => {
+  console.error(error);
+  process.exit(1);
+});
@@ -0,0 +1,71 @@
+/**
+ * Rebuild the daily rollup tables (DailyRollup) from the source rows.
+ *
+ * The application keeps rollups current on every write; run this after bulk
+ * SQL changes, restores or imports that bypass the services.
+ *
+ * Usage:
+ *   npm run rollups:rebuild
+ *   npm run rollups:rebuild -- --tenant <tenantId> --from 2026-01-01 --to 2026-03-31
+ *   npm run rollups:rebuild -- --metric payments --metric invoices
+ */
+import 'reflect-metadata';
+import { Module } from '@nestjs/common';
+import { NestFactory } from '@nestjs/core';
+import { ConfigModule } from '@nestjs/config';
+import { PrismaModule } from '../src/prisma/prisma.module';
+import { JobsModule } from '../src/jobs/jobs.module';
+import { DailyRollupModule } from '../src/rollups/daily-rollup.module';
+import { DailyRollupService, RollupMetric } from '../src/rollups/daily-rollup.service';
+
+@Module({ imports: [ConfigModule.forRoot({ isGlobal: true }), PrismaModule, JobsModule, DailyRollupModule] })
+class RebuildRollupsModule {}
+
+function parseArgs(argv: string[]) {
+  const options: { tenantId?: string; from?: string; to?: string; metrics?: RollupMetric[] } = {};
+  for (let i = 0; i < argv.length; i += 2) {
+    const value = argv[i + 1];
+    switch (argv[i]) {
+      case '--tenant':
+        options.tenantId = value;
+        break;
+      case '--from':
+        options.from = value;
+        break;
+      case '--to':
+        options.to = value;
+        break;
+      case '--metric':
+        options.metrics = [...(options.metrics || []), value as RollupMetric];
+        break;
+      default:
+        throw new Error(`Unknown argument: ${argv[i]}`);
+    }
+  }
+  return options;
+}
+
+async function main() {
+  const options = parseArgs(process.argv.slice(2));
+  // Only the API instances work the job queue
+  process.env.JOBS_ENABLED = 'false';
+  const app = await NestFactory.createApplicationContext(RebuildRollupsModule, {
+    logger: ['warn', 'error'],
+  });
+
+  try {
+    const started = Date.now();
+    const rebuilt = await app.get(DailyRollupService).rebuild(options);
+    for (const [metric, rows] of Object.entries(rebuilt)) {
+      console.log(`${metric.padEnd(16)} ${rows} rollup row(s)`);
+    }
+    console.log(`Done in ${((Date.now() - started) / 1000).toFixed(1)}s`);
+  } finally {
+    await app.close();
+  }
+}
+
+main().catch((error) => {
+  console.error(error);
+  process.exit(1);
+});
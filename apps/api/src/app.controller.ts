@@ -1,9 +1,13 @@
 import { Controller, Get } from '@nestjs/common';
 import { AppService } from './app.service';
+import { PasswordHashService } from './passwords/password-hash.service';
 
 @Controller()
 export class AppController {
-  constructor(private readonly appService: AppService) {}
+  constructor(
+    private readonly appService: AppService,
+    private readonly passwords: PasswordHashService,
+  ) {}
 
   @Get()
   getHello(): string {
@@ -19,4 +23,9 @@ export class AppController {
       database: 'connected',
     };
   }
+
+  @Get('health/password-hashing')
+  getPasswordHashing() {
+    return this.passwords.metrics();
+  }
 }
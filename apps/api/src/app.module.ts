@@ -10,6 +10,14 @@ import { TenantsModule } from './tenants/tenants.module';
 
 // Existing Prisma-based modules (keep as is for now)
 import { PrismaModule } from './prisma/prisma.module';
+import { StatsCacheModule } from './cache/stats-cache.module';
+import { UserStatusCacheModule } from './cache/user-status-cache.module';
+import { RolePermissionCacheModule } from './cache/role-permission-cache.module';
+import { DocumentSequenceModule } from './sequences/document-sequence.module';
+import { DailyRollupModule } from './rollups/daily-rollup.module';
+import { QueueStateModule } from './queues/queue-state.module';
+import { JobsModule } from './jobs/jobs.module';
+import { PasswordHashModule } from './passwords/password-hash.module';
 import { AuthModule as OldAuthModule } from './auth/auth.module';
 import { PatientsModule } from './patients/patients.module';
 import { AppointmentsModule } from './appointments/appointments.module';
@@ -41,6 +49,7 @@ import { SubscriptionModule } from './subscription/subscription.module';
 import { RbacModule } from './rbac/rbac.module';
 import { DashboardModule } from './dashboard/dashboard.module';
 import { UsersModule } from './users/users.module';
+import { ExportsModule } from './exports/exports.module';
 
 // Basic controllers and services
 import { AppController } from './app.controller';
@@ -73,6 +82,34 @@ import { AppService } from './app.service';
         
         // Optional
         CORS_ORIGIN: Joi.string().default('http://localhost:3000'),
+
+        // Dashboard/stats response cache (0 disables it)
+        STATS_CACHE_TTL_MS: Joi.number().min(0).default(10000),
+        STATS_CACHE_MAX_ENTRIES: Joi.number().min(1).default(1000),
+
+        // User status cache used by the JWT strategies (0 disables it)
+        USER_STATUS_CACHE_TTL_MS: Joi.number().min(0).default(15000),
+        USER_STATUS_CACHE_MAX_ENTRIES: Joi.number().min(1).default(10000),
+
+        // Role permission cache used by the PermissionsGuard (0 disables it)
+        ROLE_PERMISSION_CACHE_TTL_MS: Joi.number().min(0).default(30000),
+        ROLE_PERMISSION_CACHE_MAX_ENTRIES: Joi.number().min(1).default(1000),
+
+        // Document number allocation (values reserved per round-trip)
+        DOCUMENT_SEQUENCE_BLOCK_SIZE: Joi.number().min(1).default(1),
+
+        // Background jobs (JOBS_ENABLED=false stops this instance running them)
+        JOBS_ENABLED: Joi.boolean().default(true),
+        JOBS_POLL_MS: Joi.number().min(100).default(1000),
+        JOBS_CONCURRENCY: Joi.number().min(1).default(2),
+        JOBS_LOCK_TIMEOUT_MS: Joi.number().min(1000).default(300000),
+        JOBS_RETENTION_DAYS: Joi.number().min(1).default(7),
+
+        // Password hashing pool (workers default to min(4, CPUs - 1))
+        BCRYPT_ROUNDS: Joi.number().min(4).max(31).default(12),
+        PASSWORD_HASH_WORKERS: Joi.number().min(1).optional(),
+        PASSWORD_HASH_QUEUE_LIMIT: Joi.number().min(0).default(100),
+        PASSWORD_HASH_QUEUE_TIMEOUT_MS: Joi.number().min(100).default(5000),
       }),
     }),
 
@@ -98,6 +135,30 @@ import { AppService } from './app.service';
     // Existing Prisma database module
     PrismaModule,
 
+    // Tenant-scoped cache for dashboard and stats responses
+    StatsCacheModule,
+
+    // Per-user status cache for JWT validation
+    UserStatusCacheModule,
+
+    // Per-role permission Sets for the PermissionsGuard
+    RolePermissionCacheModule,
+
+    // Per-tenant invoice/payment/order/MRN number sequences
+    DocumentSequenceModule,
+
+    // Daily revenue/census summaries read by reports and finance
+    DailyRollupModule,
+
+    // Live OPD/emergency queue state pushed over SSE
+    QueueStateModule,
+
+    // Postgres-backed background and scheduled jobs
+    JobsModule,
+
+    // bcrypt on a bounded worker-thread pool, off the event loop
+    PasswordHashModule,
+
     // Tenant management
     TenantsModule,
 
@@ -135,6 +196,7 @@ import { AppService } from './app.service';
     RbacModule,
     UsersModule,
     DashboardModule,
+    ExportsModule,
   ],
   controllers: [AppController],
   providers: [
@@ -0,0 +1,117 @@
+import { BadRequestException } from '@nestjs/common';
+import { AppointmentSlotService, isSlotConflict } from './appointment-slots.service';
+
+const at = (time: string) => new Date(`2026-10-19T${time}:00.000Z`);
+
+const doctor = (doctorId: string, firstName = 'Asha') => ({
+  doctorId,
+  kind: 'doctor',
+  start: null,
+  end: null,
+  firstName,
+  lastName: 'Rao',
+});
+const shift = (doctorId: string, start: string, end: string) => ({
+  doctorId,
+  kind: 'shift',
+  start: at(start),
+  end: at(end),
+  firstName: null,
+  lastName: null,
+});
+const booked = (doctorId: string, start: string, end: string) => ({ ...shift(doctorId, start, end), kind: 'booked' });
+
+/** A service whose single schedule query returns `rows` */
+function serviceWith(rows: object[]) {
+  const prisma = { $queryRaw: jest.fn().mockResolvedValue(rows) };
+  return { service: new AppointmentSlotService(prisma as any), prisma };
+}
+
+/** Slot start times of the only doctor, as HH:MM */
+async function starts(rows: object[], from: string, to: string, durationMinutes?: number): Promise<string[]> {
+  const { service } = serviceWith(rows);
+  const [availability] = await service.availability('t1', { from: at(from), to: at(to), durationMinutes });
+  return availability.slots.map((slot) => slot.start.toISOString().slice(11, 16));
+}
+
+describe('AppointmentSlotService', () => {
+  describe('availability', () => {
+    it('falls back to the default working hours for a doctor without shifts', async () => {
+      const { service } = serviceWith([doctor('d1')]);
+      const [availability] = await service.availability('t1', {
+        from: at('00:00'),
+        to: new Date('2026-10-20T00:00:00.000Z'),
+        durationMinutes: 60,
+      });
+
+      expect(availability.workingHours).toBe('default');
+      expect(availability.slots.map((slot) => slot.start.getUTCHours())).toEqual([9, 10, 11, 12, 13, 14, 15, 16]);
+    });
+
+    it("lays the grid from the shift's start, not from the requested time", async () => {
+      const rows = [doctor('d1'), shift('d1', '09:10', '11:10')];
+
+      expect(await starts(rows, '09:00', '12:00')).toEqual(['09:10', '09:40', '10:10', '10:40']);
+      expect(await starts(rows, '09:25', '12:00')).toEqual(['09:40', '10:10', '10:40']);
+    });
+
+    it('skips bookings and resumes on the next grid point after them', async () => {
+      const rows = [doctor('d1'), shift('d1', '09:00', '11:00'), booked('d1', '09:20', '09:50')];
+
+      expect(await starts(rows, '09:00', '11:00')).toEqual(['10:00', '10:30']);
+    });
+
+    it('merges adjoining shifts into one grid', async () => {
+      const rows = [doctor('d1'), shift('d1', '09:00', '10:00'), shift('d1', '10:00', '11:00')];
+
+      expect(await starts(rows, '09:00', '11:00', 40)).toEqual(['09:00', '09:40', '10:20']);
+    });
+
+    it('keeps slots inside the requested range', async () => {
+      const rows = [doctor('d1'), shift('d1', '09:00', '17:00')];
+
+      expect(await starts(rows, '09:00', '10:45')).toEqual(['09:00', '09:30', '10:00']);
+    });
+  });
+
+  describe('nextAvailable', () => {
+    it("returns each doctor's earliest slot, soonest first, up to the limit", async () => {
+      const { service } = serviceWith([
+        doctor('d1', 'Asha'),
+        doctor('d2', 'Bina'),
+        doctor('d3', 'Chetan'),
+        shift('d1', '11:00', '12:00'),
+        shift('d2', '09:00', '12:00'),
+        booked('d2', '09:00', '10:00'),
+        shift('d3', '09:00', '09:20'),
+      ]);
+      const next = await service.nextAvailable('t1', { from: at('08:00'), to: at('18:00') }, 2);
+
+      expect(next.map(({ doctorId, start }) => [doctorId, start.toISOString().slice(11, 16)])).toEqual([
+        ['d2', '10:00'],
+        ['d1', '11:00'],
+      ]);
+    });
+  });
+
+  it('rejects empty and overlong ranges before querying', async () => {
+    const { service, prisma } = serviceWith([]);
+
+    await expect(service.availability('t1', { from: at('10:00'), to: at('10:00') })).rejects.toThrow(
+      BadRequestException,
+    );
+    await expect(
+      service.availability('t1', { from: at('10:00'), to: new Date('2026-12-01T00:00:00.000Z') }),
+    ).rejects.toThrow(BadRequestException);
+    expect(prisma.$queryRaw).not.toHaveBeenCalled();
+  });
+});
+
+describe('isSlotConflict', () => {
+  it('recognises exclusion violations of the overlap constraint only', () => {
+    expect(isSlotConflict({ meta: { code: '23P01' } })).toBe(true);
+    expect(isSlotConflict(new Error('violates exclusion constraint "Appointment_doctor_no_overlap"'))).toBe(true);
+    expect(isSlotConflict({ code: 'P2002', meta: { target: ['id'] } })).toBe(false);
+    expect(isSlotConflict(undefined)).toBe(false);
+  });
+});
@@ -0,0 +1,239 @@
+import { BadRequestException, Injectable } from '@nestjs/common';
+import { Prisma } from '@prisma/client';
+import { CustomPrismaService } from '../prisma/custom-prisma.service';
+import { Interval, IntervalIndex } from '../shared/scheduling/interval-index';
+
+export const DEFAULT_SLOT_MINUTES = 30;
+
+/**
+ * Exclusion constraint rejecting overlapping non-cancelled SCHEDULED bookings
+ * of a doctor (OPD walk-ins and IPD admissions are exempt); see the
+ * add_appointment_overlap_constraint migration.
+ */
+export const APPOINTMENT_OVERLAP_CONSTRAINT = 'Appointment_doctor_no_overlap';
+
+export const SLOT_UNAVAILABLE = 'This time slot is not available for the selected doctor';
+
+/** Whether a failed appointment write was rejected for overlapping another booking */
+export function isSlotConflict(error: any): boolean {
+  return Boolean(
+    error &&
+      (error.meta?.code === '23P01' || String(error.message || '').includes(APPOINTMENT_OVERLAP_CONSTRAINT)),
+  );
+}
+
+/** Working hours (UTC) assumed for a doctor with no shifts in the requested range */
+const DEFAULT_WORKING_HOURS = { start: 9, end: 17 };
+
+const MAX_RANGE_DAYS = 31;
+const MAX_DOCTORS = 200;
+const MINUTE_MS = 60 * 1000;
+const DAY_MS = 24 * 60 * MINUTE_MS;
+
+export interface SlotQuery {
+  /** Defaults to every active doctor of the tenant (or of departmentId) */
+  doctorIds?: string[];
+  departmentId?: string;
+  from: Date;
+  to: Date;
+  durationMinutes?: number;
+}
+
+export interface Slot {
+  start: Date;
+  end: Date;
+}
+
+export interface DoctorAvailability {
+  doctorId: string;
+  firstName: string;
+  lastName: string;
+  /** 'shifts' when working hours come from the doctor's shifts, 'default' when none were found */
+  workingHours: 'shifts' | 'default';
+  slots: Slot[];
+}
+
+export interface NextSlot extends Slot {
+  doctorId: string;
+  firstName: string;
+  lastName: string;
+}
+
+interface DoctorSchedule {
+  doctorId: string;
+  firstName: string;
+  lastName: string;
+  workingHours: 'shifts' | 'default';
+  working: IntervalIndex;
+  booked: IntervalIndex;
+}
+
+interface ScheduleRow {
+  doctorId: string;
+  kind: 'doctor' | 'shift' | 'booked';
+  start: Date | null;
+  end: Date | null;
+  firstName: string | null;
+  lastName: string | null;
+}
+
+/** Round time up onto the grid of `step` starting at origin */
+function alignUp(time: number, origin: number, step: number): number {
+  return origin + Math.ceil((time - origin) / step) * step;
+}
+
+function toSlot(interval: Interval): Slot {
+  return { start: new Date(interval.start), end: new Date(interval.end) };
+}
+
+/** DEFAULT_WORKING_HOURS on every UTC day touching [from, to) */
+function defaultWorkingHours(from: number, to: number): Interval[] {
+  const windows: Interval[] = [];
+  for (let day = Math.floor(from / DAY_MS) * DAY_MS; day < to; day += DAY_MS) {
+    windows.push({
+      start: day + DEFAULT_WORKING_HOURS.start * 60 * MINUTE_MS,
+      end: day + DEFAULT_WORKING_HOURS.end * 60 * MINUTE_MS,
+    });
+  }
+  return windows;
+}
+
+/**
+ * Free slots of `length` ms in [from, to): inside the doctor's working
+ * hours, clear of every booking, on a grid starting at each shift's start.
+ * Each step either yields a slot or jumps past a booking, and each lookup is
+ * a binary search, so a doctor's range costs O((slots + bookings) log n).
+ */
+function* freeSlots(schedule: DoctorSchedule, from: number, to: number, length: number): Generator<Interval> {
+  for (const shift of schedule.working.intersecting(from, to)) {
+    const end = Math.min(shift.end, to);
+    let time = alignUp(Math.max(shift.start, from), shift.start, length);
+    while (time + length <= end) {
+      const free = schedule.booked.nextGap(time, length);
+      if (free === time) {
+        yield { start: time, end: time + length };
+        time += length;
+      } else {
+        time = alignUp(free, shift.start, length);
+      }
+    }
+  }
+}
+
+/**
+ * Appointment slot engine. Working hours come from the doctors' shifts
+ * (falling back to DEFAULT_WORKING_HOURS for a doctor without any in the
+ * range) and bookings from non-cancelled appointments. Everything a request
+ * needs, for any number of doctors and days, is loaded with one query and
+ * indexed per doctor; slots are then computed in memory.
+ */
+@Injectable()
+export class AppointmentSlotService {
+  constructor(private readonly prisma: CustomPrismaService) {}
+
+  /** Free slots per doctor over the range */
+  async availability(tenantId: string, query: SlotQuery): Promise<DoctorAvailability[]> {
+    const length = (query.durationMinutes || DEFAULT_SLOT_MINUTES) * MINUTE_MS;
+    const from = query.from.getTime();
+    const to = query.to.getTime();
+
+    const schedules = await this.schedules(tenantId, query);
+    return schedules.map((schedule) => ({
+      doctorId: schedule.doctorId,
+      firstName: schedule.firstName,
+      lastName: schedule.lastName,
+      workingHours: schedule.workingHours,
+      slots: Array.from(freeSlots(schedule, from, to, length), toSlot),
+    }));
+  }
+
+  /** The earliest free slot of each doctor, soonest first, at most `limit` of them */
+  async nextAvailable(tenantId: string, query: SlotQuery, limit = 5): Promise<NextSlot[]> {
+    const length = (query.durationMinutes || DEFAULT_SLOT_MINUTES) * MINUTE_MS;
+    const from = query.from.getTime();
+    const to = query.to.getTime();
+
+    const found: NextSlot[] = [];
+    for (const schedule of await this.schedules(tenantId, query)) {
+      const { value } = freeSlots(schedule, from, to, length).next();
+      if (value) {
+        found.push({
+          doctorId: schedule.doctorId,
+          firstName: schedule.firstName,
+          lastName: schedule.lastName,
+          ...toSlot(value),
+        });
+      }
+    }
+    return found.sort((a, b) => a.start.getTime() - b.start.getTime()).slice(0, limit);
+  }
+
+  private async schedules(tenantId: string, query: SlotQuery): Promise<DoctorSchedule[]> {
+    const { from, to } = query;
+    if (!(from < to)) {
+      throw new BadRequestException('from must be before to');
+    }
+    if (to.getTime() - from.getTime() > MAX_RANGE_DAYS * DAY_MS) {
+      throw new BadRequestException(`Availability can be requested for at most ${MAX_RANGE_DAYS} days`);
+    }
+
+    const doctorFilters = [
+      Prisma.sql`u."tenantId" = ${tenantId}`,
+      Prisma.sql`u."isActive" = true`,
+      query.doctorIds?.length
+        ? Prisma.sql`u."id" IN (${Prisma.join(query.doctorIds)})`
+        : Prisma.sql`u."role" = 'DOCTOR'`,
+      ...(query.departmentId ? [Prisma.sql`st."departmentId" = ${query.departmentId}`] : []),
+    ];
+
+    const rows = await this.prisma.$queryRaw<ScheduleRow[]>`
+      WITH doctors AS (
+        SELECT u."id", u."firstName", u."lastName"
+        FROM "User" u
+        LEFT JOIN "Staff" st ON st."userId" = u."id"
+        WHERE ${Prisma.join(doctorFilters, ' AND ')}
+        ORDER BY u."firstName", u."lastName", u."id"
+        LIMIT ${MAX_DOCTORS}
+      )
+      SELECT d."id" AS "doctorId", 'doctor' AS "kind", NULL::timestamp AS "start", NULL::timestamp AS "end",
+             d."firstName", d."lastName"
+      FROM doctors d
+      UNION ALL
+      SELECT st."userId", 'shift', s."startTime", s."endTime", NULL, NULL
+      FROM "Shift" s
+      JOIN "Staff" st ON st."id" = s."staffId"
+      JOIN doctors d ON d."id" = st."userId"
+      WHERE s."tenantId" = ${tenantId} AND s."isActive" = true AND s."status" <> 'CANCELLED'
+        AND s."startTime" < ${to} AND s."endTime" > ${from}
+      UNION ALL
+      SELECT a."doctorId", 'booked', a."startTime", a."endTime", NULL, NULL
+      FROM "Appointment" a
+      JOIN doctors d ON d."id" = a."doctorId"
+      WHERE a."tenantId" = ${tenantId} AND a."status" <> 'CANCELLED' AND a."kind" <> 'ADMISSION'
+        AND a."startTime" < ${to} AND a."endTime" > ${from}
+    `;
+
+    const doctors = new Map<string, { firstName: string; lastName: string; shifts: Interval[]; booked: Interval[] }>();
+    for (const row of rows.filter((row) => row.kind === 'doctor')) {
+      doctors.set(row.doctorId, { firstName: row.firstName, lastName: row.lastName, shifts: [], booked: [] });
+    }
+    for (const row of rows) {
+      if (row.kind === 'doctor') {
+        continue;
+      }
+      const interval = { start: row.start.getTime(), end: row.end.getTime() };
+      doctors.get(row.doctorId)[row.kind === 'shift' ? 'shifts' : 'booked'].push(interval);
+    }
+
+    return Array.from(doctors, ([doctorId, doctor]) => ({
+      doctorId,
+      firstName: doctor.firstName,
+      lastName: doctor.lastName,
+      workingHours: doctor.shifts.length ? ('shifts' as const) : ('default' as const),
+      working: new IntervalIndex(
+        doctor.shifts.length ? doctor.shifts : defaultWorkingHours(from.getTime(), to.getTime()),
+      ),
+      booked: new IntervalIndex(doctor.booked),
+    }));
+  }
+}
@@ -26,6 +26,8 @@ import {
   UpdateAppointmentStatusDto,
   CheckAvailabilityDto,
   CalendarQueryDto,
+  AvailabilitySearchDto,
+  NextAvailableSlotQueryDto,
 } from './dto/appointment.dto';
 import { TenantId } from '../shared/decorators/tenant-id.decorator';
 import { PermissionsGuard } from '../rbac/guards/permissions.guard';
@@ -85,6 +87,28 @@ export class AppointmentsController {
     return this.appointmentsService.checkAvailability(tenantId, query);
   }
 
+  @Get('availability/search')
+  @RequirePermissions('appointment.view', 'VIEW_SCHEDULE')
+  @ApiOperation({ summary: 'Free slots of several doctors over several days' })
+  @ApiResponse({ status: 200, description: 'Availability slots retrieved' })
+  async searchAvailability(
+    @TenantId() tenantId: string,
+    @Query() query: AvailabilitySearchDto,
+  ) {
+    return this.appointmentsService.searchAvailability(tenantId, query);
+  }
+
+  @Get('availability/next')
+  @RequirePermissions('appointment.view', 'VIEW_SCHEDULE')
+  @ApiOperation({ summary: 'Earliest free slot of each doctor, soonest first' })
+  @ApiResponse({ status: 200, description: 'Next available slots retrieved' })
+  async findNextAvailable(
+    @TenantId() tenantId: string,
+    @Query() query: NextAvailableSlotQueryDto,
+  ) {
+    return this.appointmentsService.findNextAvailable(tenantId, query);
+  }
+
   @Get('stats')
   @RequirePermissions('appointment.view', 'APPOINTMENT_READ')
   @ApiOperation({ summary: 'Get appointment statistics' })
@@ -1,12 +1,13 @@
 import { Module } from '@nestjs/common';
 import { AppointmentsService } from './appointments.service';
+import { AppointmentSlotService } from './appointment-slots.service';
 import { AppointmentsController } from './appointments.controller';
 import { PrismaModule } from '../prisma/prisma.module';
 
 @Module({
   imports: [PrismaModule],
   controllers: [AppointmentsController],
-  providers: [AppointmentsService],
-  exports: [AppointmentsService],
+  providers: [AppointmentsService, AppointmentSlotService],
+  exports: [AppointmentsService, AppointmentSlotService],
 })
 export class AppointmentsModule {}
@@ -5,43 +5,49 @@ import {
   Logger,
 } from '@nestjs/common';
 import { CustomPrismaService } from '../prisma/custom-prisma.service';
+import { StatsCacheService } from '../cache/stats-cache.service';
+import { DailyRollupService } from '../rollups/daily-rollup.service';
+import { QueueStateService } from '../queues/queue-state.service';
+import {
+  AppointmentSlotService,
+  DEFAULT_SLOT_MINUTES,
+  SLOT_UNAVAILABLE,
+  isSlotConflict,
+} from './appointment-slots.service';
+import { pageWindow, slicePage, countTotal, pageMeta, pageCount } from '../shared/pagination/keyset-pagination';
 import {
   CreateAppointmentDto,
   UpdateAppointmentDto,
   AppointmentQueryDto,
   CheckAvailabilityDto,
   CalendarQueryDto,
+  AvailabilitySearchDto,
+  NextAvailableSlotQueryDto,
 } from './dto/appointment.dto';
 import { AppointmentStatus } from '@prisma/client';
 
 @Injectable()
 export class AppointmentsService {
   private readonly logger = new Logger(AppointmentsService.name);
-  private readonly DEFAULT_DURATION_MINUTES = 30;
 
-  constructor(private readonly prisma: CustomPrismaService) {}
+  constructor(
+    private readonly prisma: CustomPrismaService,
+    private readonly statsCache: StatsCacheService,
+    private readonly rollups: DailyRollupService,
+    private readonly slots: AppointmentSlotService,
+    private readonly queues: QueueStateService,
+  ) {}
 
   async create(tenantId: string, createAppointmentDto: CreateAppointmentDto) {
     try {
-      const { appointmentDateTime, ...rest } = createAppointmentDto;
+      const { appointmentDateTime, durationMinutes, ...rest } = createAppointmentDto;
       const startTime = new Date(appointmentDateTime);
       const endTime = new Date(
-        startTime.getTime() + this.DEFAULT_DURATION_MINUTES * 60 * 1000,
+        startTime.getTime() + (durationMinutes || DEFAULT_SLOT_MINUTES) * 60 * 1000,
       );
 
-      // Check if slot is available
-      const isAvailable = await this.isSlotAvailable(
-        rest.doctorId,
-        startTime,
-        tenantId,
-      );
-
-      if (!isAvailable) {
-        throw new BadRequestException(
-          'This time slot is not available for the selected doctor',
-        );
-      }
-
+      // Overlapping bookings are rejected by the Appointment_doctor_no_overlap
+      // constraint, so concurrent requests for one slot cannot both succeed
       const appointment = await this.prisma.appointment.create({
         data: {
           patientId: rest.patientId,
@@ -61,12 +67,18 @@ export class AppointmentsService {
         `Appointment created: ${appointment.id} for tenant: ${tenantId}`,
       );
 
+      await this.rollups.touch(tenantId, 'appointments', appointment.startTime);
+      this.queues.touch(tenantId, 'opd', appointment.id);
+      await this.statsCache.invalidateTenant(tenantId);
       return {
         success: true,
         message: 'Appointment created successfully',
         data: appointment,
       };
     } catch (error) {
+      if (isSlotConflict(error)) {
+        throw new BadRequestException(SLOT_UNAVAILABLE);
+      }
       this.logger.error(
         `Error creating appointment: ${error.message}`,
         error.stack,
@@ -85,9 +97,10 @@ export class AppointmentsService {
       patientId,
       startDate,
       endDate,
+      cursor,
+      count,
     } = query;
 
-    const skip = (page - 1) * limit;
     const where = this.buildWhereClause(
       tenantId,
       search,
@@ -98,25 +111,29 @@ export class AppointmentsService {
       endDate,
     );
 
-    const [appointments, total] = await Promise.all([
+    const window = pageWindow(where, { page, limit, cursor }, { field: 'startTime', direction: 'asc' });
+
+    const [rows, total] = await Promise.all([
       this.prisma.appointment.findMany({
-        where,
-        skip,
-        take: limit,
-        orderBy: { startTime: 'asc' },
+        where: window.where,
+        skip: window.skip,
+        take: window.take,
+        orderBy: window.orderBy,
         include: this.getAppointmentIncludes(),
       }),
-      this.prisma.appointment.count({ where }),
+      countTotal(count, (take) => this.prisma.appointment.count({ where, take })),
     ]);
+    const slice = slicePage(rows, window);
 
     return {
       success: true,
-      data: appointments,
+      data: slice.items,
       meta: {
-        total,
+        total: total.total,
         page,
         limit,
-        totalPages: Math.ceil(total / limit),
+        totalPages: pageCount(total, limit),
+        ...pageMeta(slice, window, total),
       },
     };
   }
@@ -146,41 +163,25 @@ export class AppointmentsService {
       // Verify appointment exists
       const existing = await this.findOne(tenantId, id);
 
-      const { appointmentDateTime, doctorId, ...rest } = updateAppointmentDto;
+      const { appointmentDateTime, durationMinutes, doctorId, ...rest } =
+        updateAppointmentDto;
       const updateData: any = { ...rest };
 
-      // If updating time or doctor, check availability
-      if (appointmentDateTime || doctorId) {
-        const startTime = appointmentDateTime 
+      // A new time, duration or doctor is checked for overlaps by the
+      // Appointment_doctor_no_overlap constraint as part of the update
+      if (appointmentDateTime || durationMinutes) {
+        const startTime = appointmentDateTime
           ? new Date(appointmentDateTime)
           : existing.data.startTime;
-        const checkDoctorId = doctorId || existing.data.doctorId;
+        const durationMs = durationMinutes
+          ? durationMinutes * 60 * 1000
+          : existing.data.endTime.getTime() - existing.data.startTime.getTime();
+        updateData.startTime = startTime;
+        updateData.endTime = new Date(startTime.getTime() + durationMs);
+      }
 
-        // Check if new slot is available (excluding current appointment)
-        const isAvailable = await this.isSlotAvailableForUpdate(
-          checkDoctorId,
-          startTime,
-          tenantId,
-          id,
-        );
-
-        if (!isAvailable) {
-          throw new BadRequestException(
-            'This time slot is not available for the selected doctor',
-          );
-        }
-
-        if (appointmentDateTime) {
-          const endTime = new Date(
-            startTime.getTime() + this.DEFAULT_DURATION_MINUTES * 60 * 1000,
-          );
-          updateData.startTime = startTime;
-          updateData.endTime = endTime;
-        }
-
-        if (doctorId) {
-          updateData.doctorId = doctorId;
-        }
+      if (doctorId) {
+        updateData.doctorId = doctorId;
       }
 
       const appointment = await this.prisma.appointment.update({
@@ -193,12 +194,18 @@ export class AppointmentsService {
         `Appointment updated: ${id} for tenant: ${tenantId}`,
       );
 
+      await this.rollups.touch(tenantId, 'appointments', existing.data.startTime, appointment.startTime);
+      this.queues.touch(tenantId, 'opd', appointment.id);
+      await this.statsCache.invalidateTenant(tenantId);
       return {
         success: true,
         message: 'Appointment updated successfully',
         data: appointment,
       };
     } catch (error) {
+      if (isSlotConflict(error)) {
+        throw new BadRequestException(SLOT_UNAVAILABLE);
+      }
       this.logger.error(
         `Error updating appointment: ${error.message}`,
         error.stack,
@@ -223,6 +230,9 @@ export class AppointmentsService {
         `Appointment cancelled (soft delete): ${id} for tenant: ${tenantId}`,
       );
 
+      await this.rollups.touch(tenantId, 'appointments', appointment.startTime);
+      this.queues.touch(tenantId, 'opd', appointment.id);
+      await this.statsCache.invalidateTenant(tenantId);
       return {
         success: true,
         message: 'Appointment cancelled successfully',
@@ -264,46 +274,24 @@ export class AppointmentsService {
     });
   }
 
-  async getAvailableSlots(doctorId: string, date: string) {
-    // Basic implementation - in real scenario this would check doctor's schedule
-    const appointedTimes = await this.prisma.appointment.findMany({
-      where: {
-        doctorId,
-        startTime: {
-          gte: new Date(date + 'T00:00:00Z'),
-          lt: new Date(date + 'T23:59:59Z'),
-        },
-      },
-      select: { startTime: true },
+  async getAvailableSlots(
+    tenantId: string,
+    doctorId: string,
+    date: string,
+    durationMinutes?: number,
+  ) {
+    const from = new Date(date.substring(0, 10) + 'T00:00:00Z');
+    const [doctor] = await this.slots.availability(tenantId, {
+      doctorIds: [doctorId],
+      from,
+      to: new Date(from.getTime() + 24 * 60 * 60 * 1000),
+      durationMinutes,
     });
 
-    // Generate time slots (9 AM to 5 PM, 30-minute intervals)
-    const slots = [];
-    const startHour = 9;
-    const endHour = 17;
-
-    for (let hour = startHour; hour < endHour; hour++) {
-      for (let minute = 0; minute < 60; minute += 30) {
-        const slotTime = new Date(
-          date +
-            `T${hour.toString().padStart(2, '0')}:${minute.toString().padStart(2, '0')}:00Z`,
-        );
-        const isBooked = appointedTimes.some(
-          (apt) =>
-            Math.abs(apt.startTime.getTime() - slotTime.getTime()) <
-            30 * 60 * 1000,
-        );
-
-        if (!isBooked) {
-          slots.push({
-            time: slotTime.toTimeString().substring(0, 5),
-            available: true,
-          });
-        }
-      }
-    }
-
-    return slots;
+    return (doctor?.slots || []).map((slot) => ({
+      time: slot.start.toTimeString().substring(0, 5),
+      available: true,
+    }));
   }
 
   async getStats(tenantId: string) {
@@ -354,8 +342,8 @@ export class AppointmentsService {
   }
 
   async checkAvailability(tenantId: string, query: CheckAvailabilityDto) {
-    const { doctorId, date } = query;
-    const slots = await this.getAvailableSlots(doctorId, date);
+    const { doctorId, date, durationMinutes } = query;
+    const slots = await this.getAvailableSlots(tenantId, doctorId, date, durationMinutes);
     
     return {
       success: true,
@@ -363,6 +351,44 @@ export class AppointmentsService {
     };
   }
 
+  async searchAvailability(tenantId: string, query: AvailabilitySearchDto) {
+    const { doctorIds, departmentId, from, to, durationMinutes } = query;
+    const doctors = await this.slots.availability(tenantId, {
+      doctorIds,
+      departmentId,
+      from: new Date(from),
+      to: new Date(to),
+      durationMinutes,
+    });
+
+    return {
+      success: true,
+      data: doctors,
+    };
+  }
+
+  async findNextAvailable(tenantId: string, query: NextAvailableSlotQueryDto) {
+    const { doctorIds, departmentId, durationMinutes, days = 14, limit = 5 } = query;
+    // Never offer a slot that has already started
+    const from = new Date(Math.max(Date.now(), query.from ? new Date(query.from).getTime() : 0));
+    const slots = await this.slots.nextAvailable(
+      tenantId,
+      {
+        doctorIds,
+        departmentId,
+        from,
+        to: new Date(from.getTime() + days * 24 * 60 * 60 * 1000),
+        durationMinutes,
+      },
+      limit,
+    );
+
+    return {
+      success: true,
+      data: slots,
+    };
+  }
+
   async updateStatus(
     id: string,
     status: AppointmentStatus,
@@ -382,12 +408,18 @@ export class AppointmentsService {
         `Appointment status updated: ${id} to ${status} for tenant: ${tenantId}`,
       );
 
+      await this.rollups.touch(tenantId, 'appointments', appointment.startTime);
+      this.queues.touch(tenantId, 'opd', appointment.id);
+      await this.statsCache.invalidateTenant(tenantId);
       return {
         success: true,
         message: 'Appointment status updated successfully',
         data: appointment,
       };
     } catch (error) {
+      if (isSlotConflict(error)) {
+        throw new BadRequestException(SLOT_UNAVAILABLE);
+      }
       this.logger.error(
         `Error updating appointment status: ${error.message}`,
         error.stack,
@@ -487,90 +519,4 @@ export class AppointmentsService {
 
     return where;
   }
-
-  private async isSlotAvailable(
-    doctorId: string,
-    startTime: Date,
-    tenantId: string,
-  ): Promise<boolean> {
-    const endTime = new Date(
-      startTime.getTime() + this.DEFAULT_DURATION_MINUTES * 60 * 1000,
-    );
-
-    const conflictingAppointment = await this.prisma.appointment.findFirst({
-      where: {
-        doctorId,
-        tenantId,
-        status: {
-          not: AppointmentStatus.CANCELLED,
-        },
-        OR: [
-          {
-            AND: [
-              { startTime: { lte: startTime } },
-              { endTime: { gt: startTime } },
-            ],
-          },
-          {
-            AND: [
-              { startTime: { lt: endTime } },
-              { endTime: { gte: endTime } },
-            ],
-          },
-          {
-            AND: [
-              { startTime: { gte: startTime } },
-              { endTime: { lte: endTime } },
-            ],
-          },
-        ],
-      },
-    });
-
-    return !conflictingAppointment;
-  }
-
-  private async isSlotAvailableForUpdate(
-    doctorId: string,
-    startTime: Date,
-    tenantId: string,
-    excludeAppointmentId: string,
-  ): Promise<boolean> {
-    const endTime = new Date(
-      startTime.getTime() + this.DEFAULT_DURATION_MINUTES * 60 * 1000,
-    );
-
-    const conflictingAppointment = await this.prisma.appointment.findFirst({
-      where: {
-        doctorId,
-        tenantId,
-        id: { not: excludeAppointmentId }, // Exclude current appointment
-        status: {
-          not: AppointmentStatus.CANCELLED,
-        },
-        OR: [
-          {
-            AND: [
-              { startTime: { lte: startTime } },
-              { endTime: { gt: startTime } },
-            ],
-          },
-          {
-            AND: [
-              { startTime: { lt: endTime } },
-              { endTime: { gte: endTime } },
-            ],
-          },
-          {
-            AND: [
-              { startTime: { gte: startTime } },
-              { endTime: { lte: endTime } },
-            ],
-          },
-        ],
-      },
-    });
-
-    return !conflictingAppointment;
-  }
 }
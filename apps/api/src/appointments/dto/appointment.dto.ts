@@ -7,10 +7,12 @@ import {
   Min,
   Max,
   IsUUID,
+  ArrayMaxSize,
 } from 'class-validator';
-import { Type } from 'class-transformer';
+import { Transform, Type } from 'class-transformer';
 import { ApiProperty, ApiPropertyOptional } from '@nestjs/swagger';
 import { AppointmentStatus } from '@prisma/client';
+import { KeysetPaginationQueryDto } from '../../shared/pagination/keyset-pagination.dto';
 
 export class CreateAppointmentDto {
   @ApiProperty({ example: 'cmhgbr0ff0003jv1w9zpyz2w9' })
@@ -30,6 +32,14 @@ export class CreateAppointmentDto {
   @IsDateString()
   appointmentDateTime: string;
 
+  @ApiPropertyOptional({ example: 30, minimum: 5, maximum: 480, description: 'Defaults to 30 minutes' })
+  @IsOptional()
+  @Type(() => Number)
+  @IsInt()
+  @Min(5)
+  @Max(480)
+  durationMinutes?: number;
+
   @ApiPropertyOptional({ example: 'Regular checkup' })
   @IsOptional()
   @IsString()
@@ -67,6 +77,14 @@ export class UpdateAppointmentDto {
   @IsDateString()
   appointmentDateTime?: string;
 
+  @ApiPropertyOptional({ example: 30, minimum: 5, maximum: 480, description: 'Defaults to the current duration' })
+  @IsOptional()
+  @Type(() => Number)
+  @IsInt()
+  @Min(5)
+  @Max(480)
+  durationMinutes?: number;
+
   @ApiPropertyOptional({ example: 'Follow-up visit' })
   @IsOptional()
   @IsString()
@@ -83,7 +101,7 @@ export class UpdateAppointmentDto {
   status?: AppointmentStatus;
 }
 
-export class AppointmentQueryDto {
+export class AppointmentQueryDto extends KeysetPaginationQueryDto {
   @ApiPropertyOptional({ example: 1, minimum: 1 })
   @IsOptional()
   @Type(() => Number)
@@ -144,6 +162,76 @@ export class CheckAvailabilityDto {
   @ApiProperty({ example: '2024-01-15' })
   @IsDateString()
   date: string;
+
+  @ApiPropertyOptional({ example: 30, minimum: 5, maximum: 480, description: 'Defaults to 30 minutes' })
+  @IsOptional()
+  @Type(() => Number)
+  @IsInt()
+  @Min(5)
+  @Max(480)
+  durationMinutes?: number;
+}
+
+/** Comma-separated ids in a query string */
+const toIdList = ({ value }) =>
+  typeof value === 'string' ? value.split(',').map((id) => id.trim()).filter(Boolean) : value;
+
+class SlotQueryDto {
+  @ApiPropertyOptional({
+    example: 'cmh7l0zbz0009v4d8vulskzil,cmh7l0zbz0010v4d8aaaaaaaa',
+    description: 'Comma-separated doctor ids; defaults to every active doctor',
+  })
+  @IsOptional()
+  @Transform(toIdList)
+  @IsString({ each: true })
+  @ArrayMaxSize(200)
+  doctorIds?: string[];
+
+  @ApiPropertyOptional({ example: 'cmh7l0zbz0009v4d8vulskzil' })
+  @IsOptional()
+  @IsString()
+  departmentId?: string;
+
+  @ApiPropertyOptional({ example: 30, minimum: 5, maximum: 480, description: 'Defaults to 30 minutes' })
+  @IsOptional()
+  @Type(() => Number)
+  @IsInt()
+  @Min(5)
+  @Max(480)
+  durationMinutes?: number;
+}
+
+export class AvailabilitySearchDto extends SlotQueryDto {
+  @ApiProperty({ example: '2024-01-15T00:00:00Z' })
+  @IsDateString()
+  from: string;
+
+  @ApiProperty({ example: '2024-01-22T00:00:00Z', description: 'Exclusive; at most 31 days after from' })
+  @IsDateString()
+  to: string;
+}
+
+export class NextAvailableSlotQueryDto extends SlotQueryDto {
+  @ApiPropertyOptional({ example: '2024-01-15T08:00:00Z', description: 'Defaults to now' })
+  @IsOptional()
+  @IsDateString()
+  from?: string;
+
+  @ApiPropertyOptional({ example: 14, minimum: 1, maximum: 31, description: 'How many days ahead to look' })
+  @IsOptional()
+  @Type(() => Number)
+  @IsInt()
+  @Min(1)
+  @Max(31)
+  days?: number = 14;
+
+  @ApiPropertyOptional({ example: 5, minimum: 1, maximum: 50 })
+  @IsOptional()
+  @Type(() => Number)
+  @IsInt()
+  @Min(1)
+  @Max(50)
+  limit?: number = 5;
 }
 
 export class CalendarQueryDto {
@@ -3,10 +3,13 @@ import {
   ConflictException,
   UnauthorizedException,
   BadRequestException,
+  OnModuleInit,
 } from '@nestjs/common';
 import { JwtService } from '@nestjs/jwt';
 import { CustomPrismaService } from '../prisma/custom-prisma.service';
-import * as bcrypt from 'bcryptjs';
+import { UserStatusCacheService } from '../cache/user-status-cache.service';
+import { JobQueueService } from '../jobs/job-queue.service';
+import { PasswordHashService } from '../passwords/password-hash.service';
 import {
   RegisterUserDto,
   LoginDto,
@@ -16,12 +19,24 @@ import {
 } from './dto/auth.dto';
 
 @Injectable()
-export class AuthService {
+export class AuthService implements OnModuleInit {
   constructor(
     private prisma: CustomPrismaService,
     private jwtService: JwtService,
+    private userStatusCache: UserStatusCacheService,
+    private jobs: JobQueueService,
+    private passwords: PasswordHashService,
   ) {}
 
+  onModuleInit() {
+    this.jobs.register(
+      'auth.cleanup-expired-tokens',
+      async () => ({ removed: await this.prisma.cleanupExpiredTokens() }),
+      { queue: 'maintenance', concurrency: 1 },
+    );
+    this.jobs.schedule('auth.cleanup-expired-tokens', '0 3 * * *', 'auth.cleanup-expired-tokens');
+  }
+
   async register(registerDto: RegisterUserDto) {
     const { email, password, firstName, lastName, phone, tenantId, role } = registerDto;
 
@@ -40,7 +55,7 @@ export class AuthService {
     }
 
     // Hash password
-    const hashedPassword = await bcrypt.hash(password, 12);
+    const hashedPassword = await this.passwords.hash(password);
 
     try {
       // Create admin user
@@ -105,8 +120,11 @@ export class AuthService {
       throw new UnauthorizedException('Account is not active');
     }
 
-    // Verify password
-    const isPasswordValid = await bcrypt.compare(password, user.passwordHash);
+    // Verify password, upgrading hashes made with another cost unless the
+    // password changed in the meantime
+    const isPasswordValid = await this.passwords.verify(password, user.passwordHash, (passwordHash) =>
+      this.prisma.user.updateMany({ where: { id: user.id, passwordHash: user.passwordHash }, data: { passwordHash } }),
+    );
     if (!isPasswordValid) {
       throw new UnauthorizedException('Invalid credentials');
     }
@@ -155,12 +173,21 @@ export class AuthService {
   }
 
   async validateUser(userId: string): Promise<any> {
-    const user = await this.prisma.user.findUnique({
-      where: { id: userId },
-      include: {
-        tenant: true,
-      },
-    });
+    const user = await this.userStatusCache.getOrLoad(userId, () =>
+      this.prisma.user.findUnique({
+        where: { id: userId },
+        select: {
+          id: true,
+          email: true,
+          firstName: true,
+          lastName: true,
+          role: true,
+          roleId: true,
+          tenantId: true,
+          isActive: true,
+        },
+      }),
+    );
 
     if (!user || !user.isActive) {
       return null;
@@ -172,6 +199,7 @@ export class AuthService {
       firstName: user.firstName,
       lastName: user.lastName,
       role: user.role,
+      roleId: user.roleId,
       tenantId: user.tenantId,
     };
   }
@@ -235,7 +263,7 @@ export class AuthService {
       }
 
       // Hash new password
-      const hashedPassword = await bcrypt.hash(newPassword, 12);
+      const hashedPassword = await this.passwords.hash(newPassword);
 
       // Update password
       await this.prisma.user.update({
@@ -317,6 +345,7 @@ export class AuthService {
       where: { id: userId },
       data: { lastLoginAt: new Date() },
     });
+    this.userStatusCache.invalidate(userId);
 
     // In a production app, you might want to blacklist the token here
     // For now, we'll just return a success message
@@ -336,13 +365,13 @@ export class AuthService {
     }
 
     // Verify old password
-    const isPasswordValid = await bcrypt.compare(oldPassword, user.passwordHash);
+    const isPasswordValid = await this.passwords.compare(oldPassword, user.passwordHash);
     if (!isPasswordValid) {
       throw new UnauthorizedException('Current password is incorrect');
     }
 
     // Hash new password
-    const hashedPassword = await bcrypt.hash(newPassword, 12);
+    const hashedPassword = await this.passwords.hash(newPassword);
 
     // Update password
     await this.prisma.user.update({
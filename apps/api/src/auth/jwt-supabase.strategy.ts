@@ -118,7 +118,7 @@ export class JwtSupabaseStrategy extends PassportStrategy(Strategy, 'jwt-supabas
           firstName: user.firstName,
           lastName: user.lastName,
           role: user.role,
-          roleId: payload.roleId,
+          roleId: user.roleId,
           tenantId: user.tenantId,
           permissions: payload.permissions || [],
           isSupabaseAuth: false,
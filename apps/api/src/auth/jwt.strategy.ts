@@ -29,7 +29,7 @@ export class JwtStrategy extends PassportStrategy(Strategy) {
       firstName: user.firstName,
       lastName: user.lastName,
       role: user.role,
-      roleId: payload.roleId,
+      roleId: user.roleId,
       tenantId: user.tenantId,
       permissions: payload.permissions || [],
     };
@@ -5,6 +5,10 @@ import {
   Logger,
 } from '@nestjs/common';
 import { CustomPrismaService } from '../prisma/custom-prisma.service';
+import { StatsCacheService } from '../cache/stats-cache.service';
+import { DocumentSequenceService } from '../sequences/document-sequence.service';
+import { DailyRollupService } from '../rollups/daily-rollup.service';
+import { pageWindow, slicePage, countTotal, pageMeta, pageCount } from '../shared/pagination/keyset-pagination';
 import {
   CreateInvoiceDto,
   UpdateInvoiceDto,
@@ -19,7 +23,12 @@ import { InvoiceStatus, PaymentStatus } from '@prisma/client';
 export class BillingService {
   private readonly logger = new Logger(BillingService.name);
 
-  constructor(private prisma: CustomPrismaService) {}
+  constructor(
+    private prisma: CustomPrismaService,
+    private statsCache: StatsCacheService,
+    private documentSequence: DocumentSequenceService,
+    private rollups: DailyRollupService,
+  ) {}
 
   // ==================== Helper Methods ====================
 
@@ -144,30 +153,8 @@ export class BillingService {
    * Format: INV-YYYYMM-XXXXXX
    */
   private async generateInvoiceNumber(tenantId: string): Promise<string> {
-    const now = new Date();
-    const year = now.getFullYear();
-    const month = String(now.getMonth() + 1).padStart(2, '0');
-    const prefix = `INV-${year}${month}`;
-
-    // Get the latest invoice for this month
-    const latestInvoice = await this.prisma.invoice.findFirst({
-      where: {
-        tenantId,
-        invoiceNumber: {
-          startsWith: prefix,
-        },
-      },
-      orderBy: {
-        createdAt: 'desc',
-      },
-    });
-
-    let sequence = 1;
-    if (latestInvoice) {
-      const lastNumber = latestInvoice.invoiceNumber.split('-')[2];
-      sequence = parseInt(lastNumber, 10) + 1;
-    }
-
+    const prefix = `INV-${this.currentPeriod()}`;
+    const sequence = await this.documentSequence.next(tenantId, prefix);
     return `${prefix}-${String(sequence).padStart(6, '0')}`;
   }
 
@@ -176,33 +163,16 @@ export class BillingService {
    * Format: PAY-YYYYMM-XXXXXX
    */
   private async generatePaymentNumber(tenantId: string): Promise<string> {
-    const now = new Date();
-    const year = now.getFullYear();
-    const month = String(now.getMonth() + 1).padStart(2, '0');
-    const prefix = `PAY-${year}${month}`;
-
-    // Get the latest payment for this month
-    const latestPayment = await this.prisma.payment.findFirst({
-      where: {
-        tenantId,
-        paymentNumber: {
-          startsWith: prefix,
-        },
-      },
-      orderBy: {
-        createdAt: 'desc',
-      },
-    });
-
-    let sequence = 1;
-    if (latestPayment) {
-      const lastNumber = latestPayment.paymentNumber.split('-')[2];
-      sequence = parseInt(lastNumber, 10) + 1;
-    }
-
+    const prefix = `PAY-${this.currentPeriod()}`;
+    const sequence = await this.documentSequence.next(tenantId, prefix);
     return `${prefix}-${String(sequence).padStart(6, '0')}`;
   }
 
+  private currentPeriod(): string {
+    const now = new Date();
+    return `${now.getFullYear()}${String(now.getMonth() + 1).padStart(2, '0')}`;
+  }
+
   /**
    * Calculate invoice totals
    */
@@ -322,6 +292,8 @@ export class BillingService {
       this.logger.log(
         `Invoice created: ${invoiceNumber} for tenant ${tenantId}`,
       );
+      await this.rollups.touch(tenantId, 'invoices', invoice.date);
+      await this.statsCache.invalidateTenant(tenantId);
       return invoice;
     } catch (error) {
       this.logger.error(
@@ -341,31 +313,31 @@ export class BillingService {
       
       const { page: rawPage, limit: rawLimit } = filters;
       const { page, limit } = this.validatePaginationParams(rawPage, rawLimit);
-      const skip = (page - 1) * limit;
 
       const where = this.buildInvoiceWhereClause(tenantId, filters);
+      const window = pageWindow(where, { page, limit, cursor: filters.cursor });
 
-      const [invoices, total] = await Promise.all([
+      const [rows, total] = await Promise.all([
         this.prisma.invoice.findMany({
-          where,
-          skip,
-          take: limit,
+          where: window.where,
+          skip: window.skip,
+          take: window.take,
           include: this.getInvoiceIncludes(),
-          orderBy: {
-            createdAt: 'desc',
-          },
+          orderBy: window.orderBy,
         }),
-        this.prisma.invoice.count({ where }),
+        countTotal(filters.count, (take) => this.prisma.invoice.count({ where, take })),
       ]);
+      const slice = slicePage(rows, window);
 
-      this.logger.log(`Found ${invoices.length} invoices out of ${total} total`);
+      this.logger.log(`Found ${slice.items.length} invoices out of ${total.total ?? 'uncounted'} total`);
       return {
-        data: invoices,
+        data: slice.items,
         meta: {
-          total,
+          total: total.total,
           page,
           limit,
-          totalPages: Math.ceil(total / limit),
+          totalPages: pageCount(total, limit),
+          ...pageMeta(slice, window, total),
         },
       };
     } catch (error) {
@@ -431,6 +403,8 @@ export class BillingService {
     });
 
     this.logger.log(`Invoice updated: ${invoice.invoiceNumber}`);
+    await this.rollups.touch(tenantId, 'invoices', invoice.date);
+    await this.statsCache.invalidateTenant(tenantId);
     return updatedInvoice;
   }
 
@@ -465,6 +439,8 @@ export class BillingService {
     });
 
     this.logger.log(`Invoice cancelled: ${invoice.invoiceNumber}`);
+    await this.rollups.touch(tenantId, 'invoices', invoice.date);
+    await this.statsCache.invalidateTenant(tenantId);
     return deletedInvoice;
   }
 
@@ -548,6 +524,9 @@ export class BillingService {
       this.logger.log(
         `Payment created: ${paymentNumber} for invoice ${invoice.invoiceNumber}`,
       );
+      await this.rollups.touch(tenantId, 'payments', payment.paymentDate);
+      await this.rollups.touch(tenantId, 'invoices', invoice.date);
+      await this.statsCache.invalidateTenant(tenantId);
       return payment;
     } catch (error) {
       this.logger.error(
@@ -567,31 +546,31 @@ export class BillingService {
       
       const { page: rawPage, limit: rawLimit } = filters;
       const { page, limit } = this.validatePaginationParams(rawPage, rawLimit);
-      const skip = (page - 1) * limit;
 
       const where = this.buildPaymentWhereClause(tenantId, filters);
+      const window = pageWindow(where, { page, limit, cursor: filters.cursor }, { field: 'paymentDate', direction: 'desc' });
 
-      const [payments, total] = await Promise.all([
+      const [rows, total] = await Promise.all([
         this.prisma.payment.findMany({
-          where,
-          skip,
-          take: limit,
+          where: window.where,
+          skip: window.skip,
+          take: window.take,
           include: this.getPaymentIncludes(),
-          orderBy: {
-            paymentDate: 'desc',
-          },
+          orderBy: window.orderBy,
         }),
-        this.prisma.payment.count({ where }),
+        countTotal(filters.count, (take) => this.prisma.payment.count({ where, take })),
       ]);
+      const slice = slicePage(rows, window);
 
-      this.logger.log(`Found ${payments.length} payments out of ${total} total`);
+      this.logger.log(`Found ${slice.items.length} payments out of ${total.total ?? 'uncounted'} total`);
       return {
-        data: payments,
+        data: slice.items,
         meta: {
-          total,
+          total: total.total,
           page,
           limit,
-          totalPages: Math.ceil(total / limit),
+          totalPages: pageCount(total, limit),
+          ...pageMeta(slice, window, total),
         },
       };
     } catch (error) {
@@ -656,6 +635,8 @@ export class BillingService {
     });
 
     this.logger.log(`Payment updated: ${payment.paymentNumber}`);
+    await this.rollups.touch(tenantId, 'payments', payment.paymentDate);
+    await this.statsCache.invalidateTenant(tenantId);
     return updatedPayment;
   }
 
@@ -13,6 +13,7 @@ import {
 import { Type } from 'class-transformer';
 import { ApiProperty, ApiPropertyOptional } from '@nestjs/swagger';
 import { InvoiceStatus, PaymentMethod, PaymentStatus } from '@prisma/client';
+import { KeysetPaginationQueryDto } from '../../shared/pagination/keyset-pagination.dto';
 
 /**
  * Enum for invoice item types
@@ -305,7 +306,7 @@ export class UpdatePaymentDto {
 /**
  * DTO for filtering invoices
  */
-export class InvoiceFilterDto {
+export class InvoiceFilterDto extends KeysetPaginationQueryDto {
   @ApiPropertyOptional({ 
     example: 'patient-uuid-123',
     description: 'Filter by patient ID'
@@ -375,7 +376,7 @@ export class InvoiceFilterDto {
 /**
  * DTO for filtering payments
  */
-export class PaymentFilterDto {
+export class PaymentFilterDto extends KeysetPaginationQueryDto {
   @ApiPropertyOptional({ 
     example: 'invoice-uuid-123',
     description: 'Filter by invoice ID'
@@ -0,0 +1,59 @@
+interface LruEntry<V> {
+  value: V;
+  expiresAt: number;
+}
+
+/**
+ * Size-bounded map with per-entry expiry. Map iteration order is insertion
+ * order, so re-inserting on read keeps the least recently used entry first.
+ */
+export class LruCache<V> {
+  private readonly entries = new Map<string, LruEntry<V>>();
+
+  constructor(private readonly maxEntries: number) {}
+
+  get(key: string): V | undefined {
+    const entry = this.entries.get(key);
+    if (!entry) {
+      return undefined;
+    }
+    this.entries.delete(key);
+    if (entry.expiresAt <= Date.now()) {
+      return undefined;
+    }
+    this.entries.set(key, entry);
+    return entry.value;
+  }
+
+  set(key: string, value: V, ttlMs: number): void {
+    this.entries.delete(key);
+    this.entries.set(key, { value, expiresAt: Date.now() + ttlMs });
+    while (this.entries.size > this.maxEntries) {
+      const oldest = this.entries.keys().next().value;
+      this.entries.delete(oldest);
+    }
+  }
+
+  delete(key: string): boolean {
+    return this.entries.delete(key);
+  }
+
+  deleteByPrefix(prefix: string): number {
+    let deleted = 0;
+    for (const key of this.entries.keys()) {
+      if (key.startsWith(prefix)) {
+        this.entries.delete(key);
+        deleted++;
+      }
+    }
+    return deleted;
+  }
+
+  clear(): void {
+    this.entries.clear();
+  }
+
+  get size(): number {
+    return this.entries.size;
+  }
+}
@@ -0,0 +1,9 @@
+import { Global, Module } from '@nestjs/common';
+import { RolePermissionCacheService } from './role-permission-cache.service';
+
+@Global()
+@Module({
+  providers: [RolePermissionCacheService],
+  exports: [RolePermissionCacheService],
+})
+export class RolePermissionCacheModule {}
@@ -0,0 +1,71 @@
+import { Injectable } from '@nestjs/common';
+import { ConfigService } from '@nestjs/config';
+import { LruCache } from './lru-cache';
+import { SingleFlight } from './single-flight';
+
+/** Active permission names of a tenant role, as loaded by the PermissionsGuard. */
+export interface CachedRolePermissions {
+  names: string[];
+  set: ReadonlySet<string>;
+}
+
+/**
+ * Short-TTL cache of each tenant role's active permissions, compiled into a
+ * Set, so the PermissionsGuard checks a request without a database round-trip.
+ *
+ * Anything that changes a role's permissions or deletes it must call
+ * invalidate(); the TTL (ROLE_PERMISSION_CACHE_TTL_MS) only bounds how long a
+ * change made outside those paths can go unnoticed.
+ */
+@Injectable()
+export class RolePermissionCacheService {
+  private readonly ttlMs: number;
+  private readonly cache: LruCache<CachedRolePermissions>;
+  private readonly loads = new SingleFlight<CachedRolePermissions | null>();
+
+  constructor(configService: ConfigService) {
+    this.ttlMs = Number(configService.get('ROLE_PERMISSION_CACHE_TTL_MS', 30000));
+    this.cache = new LruCache(Number(configService.get('ROLE_PERMISSION_CACHE_MAX_ENTRIES', 1000)));
+  }
+
+  /**
+   * Return the cached permissions, or load them once for all concurrent
+   * callers. Missing roles (null) are not cached.
+   */
+  async getOrLoad(roleId: string, load: () => Promise<string[] | null>): Promise<CachedRolePermissions | null> {
+    const compile = (names: string[] | null): CachedRolePermissions | null =>
+      names ? { names, set: new Set(names) } : null;
+
+    if (this.ttlMs <= 0) {
+      return compile(await load());
+    }
+
+    const cached = this.cache.get(roleId);
+    if (cached) {
+      return cached;
+    }
+
+    return this.loads.run(
+      roleId,
+      async () => compile(await load()),
+      (permissions) => {
+        // Missing roles are not cached
+        if (permissions) {
+          this.cache.set(roleId, permissions, this.ttlMs);
+        }
+      },
+    );
+  }
+
+  invalidate(roleId: string): void {
+    if (!roleId) {
+      return;
+    }
+    this.loads.invalidate(roleId);
+    this.cache.delete(roleId);
+  }
+
+  clear(): void {
+    this.cache.clear();
+  }
+}
@@ -0,0 +1,41 @@
+/**
+ * Shares one load per key among concurrent callers, and keeps a load that
+ * started before an invalidation from storing its now stale result.
+ *
+ * Invalidation is per scope, which defaults to the key but may be wider,
+ * e.g. a whole tenant for the stats cache.
+ */
+export class SingleFlight<V> {
+  private readonly inFlight = new Map<string, Promise<V>>();
+  private readonly generations = new Map<string, number>();
+
+  /**
+   * Join the pending load for `key`, or start one and hand its result to
+   * `store` unless `scope` was invalidated while it ran.
+   */
+  run(key: string, load: () => Promise<V>, store: (value: V) => unknown, scope = key): Promise<V> {
+    const pending = this.inFlight.get(key);
+    if (pending) {
+      return pending;
+    }
+
+    const generation = this.generations.get(scope) ?? 0;
+    const promise = (async () => {
+      try {
+        const value = await load();
+        if ((this.generations.get(scope) ?? 0) === generation) {
+          await store(value);
+        }
+        return value;
+      } finally {
+        this.inFlight.delete(key);
+      }
+    })();
+    this.inFlight.set(key, promise);
+    return promise;
+  }
+
+  invalidate(scope: string): void {
+    this.generations.set(scope, (this.generations.get(scope) ?? 0) + 1);
+  }
+}
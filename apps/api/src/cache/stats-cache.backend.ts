@@ -0,0 +1,41 @@
+import { LruCache } from './lru-cache';
+
+/**
+ * Storage behind StatsCacheService.
+ *
+ * The default MemoryStatsCacheBackend keeps entries in this process. To share
+ * cached stats between several API replicas, provide another implementation
+ * (e.g. Redis-backed) under STATS_CACHE_BACKEND in StatsCacheModule.
+ */
+export interface StatsCacheBackend {
+  get<T>(key: string): Promise<T | undefined>;
+  set<T>(key: string, value: T, ttlMs: number): Promise<void>;
+  /** Drop every entry whose key starts with prefix. */
+  deleteByPrefix(prefix: string): Promise<number>;
+}
+
+export const STATS_CACHE_BACKEND = Symbol('STATS_CACHE_BACKEND');
+
+export class MemoryStatsCacheBackend implements StatsCacheBackend {
+  private readonly cache: LruCache<unknown>;
+
+  constructor(maxEntries: number) {
+    this.cache = new LruCache(maxEntries);
+  }
+
+  async get<T>(key: string): Promise<T | undefined> {
+    return this.cache.get(key) as T | undefined;
+  }
+
+  async set<T>(key: string, value: T, ttlMs: number): Promise<void> {
+    this.cache.set(key, value, ttlMs);
+  }
+
+  async deleteByPrefix(prefix: string): Promise<number> {
+    return this.cache.deleteByPrefix(prefix);
+  }
+
+  get size(): number {
+    return this.cache.size;
+  }
+}
@@ -0,0 +1,19 @@
+import { Global, Module } from '@nestjs/common';
+import { ConfigService } from '@nestjs/config';
+import { MemoryStatsCacheBackend, STATS_CACHE_BACKEND } from './stats-cache.backend';
+import { StatsCacheService } from './stats-cache.service';
+
+@Global()
+@Module({
+  providers: [
+    {
+      provide: STATS_CACHE_BACKEND,
+      useFactory: (configService: ConfigService) =>
+        new MemoryStatsCacheBackend(Number(configService.get('STATS_CACHE_MAX_ENTRIES', 1000))),
+      inject: [ConfigService],
+    },
+    StatsCacheService,
+  ],
+  exports: [StatsCacheService],
+})
+export class StatsCacheModule {}
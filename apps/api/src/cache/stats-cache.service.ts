@@ -0,0 +1,89 @@
+import { Inject, Injectable, Logger } from '@nestjs/common';
+import { ConfigService } from '@nestjs/config';
+import { STATS_CACHE_BACKEND, StatsCacheBackend } from './stats-cache.backend';
+import { SingleFlight } from './single-flight';
+
+export interface StatsCacheKey {
+  tenantId: string;
+  endpoint: string;
+  role?: string;
+  /** Extra discriminator for per-user results, e.g. a patient's own dashboard */
+  scope?: string;
+}
+
+/**
+ * Short-lived cache for tenant dashboards and stats responses.
+ *
+ * Entries are keyed by tenant, role and endpoint, expire after
+ * STATS_CACHE_TTL_MS and are dropped for the whole tenant whenever one of the
+ * write paths calls invalidateTenant(). Concurrent misses for the same key
+ * share a single computation.
+ */
+@Injectable()
+export class StatsCacheService {
+  private readonly logger = new Logger(StatsCacheService.name);
+  private readonly ttlMs: number;
+  // Invalidated per tenant so a computation that started before a write is
+  // not stored after it
+  private readonly computations = new SingleFlight<unknown>();
+
+  constructor(
+    @Inject(STATS_CACHE_BACKEND) private readonly backend: StatsCacheBackend,
+    configService: ConfigService,
+  ) {
+    this.ttlMs = Number(configService.get('STATS_CACHE_TTL_MS', 10000));
+  }
+
+  async wrap<T>(key: StatsCacheKey, compute: () => Promise<T>): Promise<T> {
+    if (this.ttlMs <= 0) {
+      return compute();
+    }
+
+    const cacheKey = this.buildKey(key);
+    const cached = await this.safeGet<T>(cacheKey);
+    if (cached !== undefined) {
+      return cached;
+    }
+
+    return this.computations.run(
+      cacheKey,
+      compute,
+      (value) => this.safeSet(cacheKey, value),
+      key.tenantId,
+    ) as Promise<T>;
+  }
+
+  async invalidateTenant(tenantId: string): Promise<void> {
+    if (!tenantId) {
+      return;
+    }
+    this.computations.invalidate(tenantId);
+    try {
+      await this.backend.deleteByPrefix(`${tenantId}:`);
+    } catch (error) {
+      this.logger.warn(`Failed to invalidate stats cache for tenant ${tenantId}: ${error.message}`);
+    }
+  }
+
+  private buildKey({ tenantId, endpoint, role, scope }: StatsCacheKey): string {
+    return [tenantId, role || '-', endpoint, scope || '-'].join(':');
+  }
+
+  // A broken shared backend must not take the dashboards down with it
+  private async safeGet<T>(key: string): Promise<T | undefined> {
+    try {
+      return await this.backend.get<T>(key);
+    } catch (error) {
+      this.logger.warn(`Stats cache read failed for ${key}: ${error.message}`);
+      return undefined;
+    }
+  }
+
+  private async safeSet<T>(key: string, value: T): Promise<void> {
+    try {
+      await this.backend.set(key, value, this.ttlMs);
+    } catch (error) {
+      this.logger.warn(`Stats cache write failed for ${key}: ${error.message}`);
+    }
+  }
+}
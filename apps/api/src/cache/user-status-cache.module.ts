@@ -0,0 +1,9 @@
+import { Global, Module } from '@nestjs/common';
+import { UserStatusCacheService } from './user-status-cache.service';
+
+@Global()
+@Module({
+  providers: [UserStatusCacheService],
+  exports: [UserStatusCacheService],
+})
+export class UserStatusCacheModule {}
@@ -0,0 +1,74 @@
+import { Injectable } from '@nestjs/common';
+import { ConfigService } from '@nestjs/config';
+import { LruCache } from './lru-cache';
+import { SingleFlight } from './single-flight';
+
+/** What the JWT strategies need to know about a user on every request. */
+export interface CachedUserStatus {
+  id: string;
+  email: string;
+  firstName: string;
+  lastName: string;
+  role: string;
+  roleId: string | null;
+  tenantId: string;
+  isActive: boolean;
+  lockedUntil?: Date | null;
+}
+
+/**
+ * Short-TTL cache of the user row looked up by the JWT strategies, so an
+ * authenticated request does not cost a database round-trip.
+ *
+ * Anything that deactivates, locks, deletes or re-roles a user must call
+ * invalidate(); the TTL (USER_STATUS_CACHE_TTL_MS) only bounds how long a
+ * change made outside those paths can go unnoticed.
+ */
+@Injectable()
+export class UserStatusCacheService {
+  private readonly ttlMs: number;
+  private readonly cache: LruCache<CachedUserStatus>;
+  private readonly loads = new SingleFlight<CachedUserStatus | null>();
+
+  constructor(configService: ConfigService) {
+    this.ttlMs = Number(configService.get('USER_STATUS_CACHE_TTL_MS', 15000));
+    this.cache = new LruCache(Number(configService.get('USER_STATUS_CACHE_MAX_ENTRIES', 10000)));
+  }
+
+  /**
+   * Return the cached status, or load it once for all concurrent callers.
+   * Missing users (null) are not cached.
+   */
+  async getOrLoad(
+    userId: string,
+    load: () => Promise<CachedUserStatus | null>,
+  ): Promise<CachedUserStatus | null> {
+    if (this.ttlMs <= 0) {
+      return load();
+    }
+
+    const cached = this.cache.get(userId);
+    if (cached) {
+      return cached;
+    }
+
+    return this.loads.run(userId, load, (status) => {
+      // Missing users are not cached
+      if (status) {
+        this.cache.set(userId, status, this.ttlMs);
+      }
+    });
+  }
+
+  invalidate(userId: string): void {
+    if (!userId) {
+      return;
+    }
+    this.loads.invalidate(userId);
+    this.cache.delete(userId);
+  }
+
+  clear(): void {
+    this.cache.clear();
+  }
+}
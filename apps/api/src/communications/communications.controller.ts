@@ -19,12 +19,16 @@ import {
   ApiParam,
 } from '@nestjs/swagger';
 import { CommunicationsService } from './communications.service';
+import { NotificationBroadcastService } from './notification-broadcast.service';
 import { JwtAuthGuard } from '../auth/jwt-auth.guard';
+import { PermissionsGuard } from '../rbac/guards/permissions.guard';
+import { RequirePermissions } from '../rbac/decorators/require-permissions.decorator';
 import { TenantId } from '../shared/decorators/tenant-id.decorator';
 import { UserId } from '../shared/decorators/user-id.decorator';
 import {
   CreateMessageDto,
   CreateNotificationDto,
+  BroadcastNotificationDto,
   MessageQueryDto,
   NotificationQueryDto,
 } from './dto/communications.dto';
@@ -34,7 +38,10 @@ import {
 @Controller('communications')
 @UseGuards(JwtAuthGuard)
 export class CommunicationsController {
-  constructor(private readonly service: CommunicationsService) {}
+  constructor(
+    private readonly service: CommunicationsService,
+    private readonly broadcasts: NotificationBroadcastService,
+  ) {}
 
   // ==================== MESSAGE ENDPOINTS ====================
 
@@ -102,6 +109,37 @@ export class CommunicationsController {
     return this.service.createNotification(createDto, tenantId);
   }
 
+  @Post('notifications/broadcast')
+  @UseGuards(PermissionsGuard)
+  @RequirePermissions('communications.send')
+  @HttpCode(HttpStatus.ACCEPTED)
+  @ApiOperation({
+    summary: 'Broadcast a notification',
+    description:
+      'Notify every active user matching a role, department or user list (or the whole tenant). Small broadcasts finish before the response; follow larger ones with GET notifications/broadcasts/:id.',
+  })
+  @ApiResponse({ status: 202, description: 'Broadcast accepted; returns its id and progress' })
+  @ApiResponse({ status: 400, description: 'No recipients chosen' })
+  broadcastNotification(
+    @Body() dto: BroadcastNotificationDto,
+    @TenantId() tenantId: string,
+    @UserId() userId: string,
+  ) {
+    return this.broadcasts.broadcast(tenantId, dto, userId);
+  }
+
+  @Get('notifications/broadcasts/:id')
+  @ApiOperation({ summary: 'Get broadcast progress', description: 'Status and progress of a notification broadcast' })
+  @ApiResponse({ status: 200, description: 'Broadcast progress retrieved successfully' })
+  @ApiResponse({ status: 404, description: 'Broadcast not found' })
+  @ApiParam({ name: 'id', description: 'Broadcast ID' })
+  getBroadcast(
+    @Param('id') id: string,
+    @TenantId() tenantId: string,
+  ) {
+    return this.broadcasts.progress(tenantId, id);
+  }
+
   @Get('notifications')
   @ApiOperation({ summary: 'Get notifications', description: 'Get all notifications for the current user' })
   @ApiResponse({ status: 200, description: 'Notifications retrieved successfully' })
@@ -149,6 +187,16 @@ export class CommunicationsController {
     return this.service.deleteNotification(id, tenantId, userId);
   }
 
+  @Get('unread-count')
+  @ApiOperation({ summary: 'Get unread counts', description: 'Unread message and notification counts for the current user' })
+  @ApiResponse({ status: 200, description: 'Unread counts retrieved successfully' })
+  getUnreadCounts(
+    @TenantId() tenantId: string,
+    @UserId() userId: string,
+  ) {
+    return this.service.getUnreadCounts(tenantId, userId);
+  }
+
   @Get('stats')
   @ApiOperation({ summary: 'Get communication statistics', description: 'Get message and notification statistics' })
   @ApiResponse({ status: 200, description: 'Statistics retrieved successfully' })
@@ -1,11 +1,13 @@
 import { Module } from '@nestjs/common';
 import { CommunicationsController } from './communications.controller';
 import { CommunicationsService } from './communications.service';
+import { UnreadCounterService } from './unread-counter.service';
+import { NotificationBroadcastService } from './notification-broadcast.service';
 import { PrismaService } from '../prisma/prisma.service';
 
 @Module({
   controllers: [CommunicationsController],
-  providers: [CommunicationsService, PrismaService],
-  exports: [CommunicationsService],
+  providers: [CommunicationsService, UnreadCounterService, NotificationBroadcastService, PrismaService],
+  exports: [CommunicationsService, NotificationBroadcastService],
 })
 export class CommunicationsModule {}
@@ -1,5 +1,6 @@
 import { Injectable, NotFoundException, BadRequestException, Logger } from '@nestjs/common';
 import { CustomPrismaService } from '../prisma/custom-prisma.service';
+import { pageWindow, slicePage, countTotal, pageMeta, pageCount } from '../shared/pagination/keyset-pagination';
 import {
   CreateMessageDto,
   CreateNotificationDto,
@@ -8,12 +9,16 @@ import {
   MessagePriority,
   NotificationType,
 } from './dto/communications.dto';
+import { UnreadCounterService } from './unread-counter.service';
 
 @Injectable()
 export class CommunicationsService {
   private readonly logger = new Logger(CommunicationsService.name);
 
-  constructor(private prisma: CustomPrismaService) {}
+  constructor(
+    private prisma: CustomPrismaService,
+    private readonly unread: UnreadCounterService,
+  ) {}
 
   /**
    * Send a message
@@ -29,16 +34,20 @@ export class CommunicationsService {
         throw new NotFoundException('Recipient not found');
       }
 
-      const message = await this.prisma.message.create({
-        data: {
-          senderId,
-          recipientId: createDto.recipientId,
-          subject: createDto.subject,
-          body: createDto.content,
-          priority: createDto.priority || MessagePriority.NORMAL,
-          read: false,
-          tenantId,
-        },
+      const message = await this.prisma.$transaction(async (tx) => {
+        const created = await tx.message.create({
+          data: {
+            senderId,
+            recipientId: createDto.recipientId,
+            subject: createDto.subject,
+            body: createDto.content,
+            priority: createDto.priority || MessagePriority.NORMAL,
+            read: false,
+            tenantId,
+          },
+        });
+        await this.unread.adjust(tx, tenantId, createDto.recipientId, 'messages', 1);
+        return created;
       });
 
       this.logger.log(`Message sent from ${senderId} to ${createDto.recipientId}`);
@@ -54,8 +63,7 @@ export class CommunicationsService {
    */
   async getMessages(tenantId: string, userId: string, query: MessageQueryDto) {
     try {
-      const { page = 1, limit = 10, read, priority, search } = query;
-      const skip = (page - 1) * limit;
+      const { page = 1, limit = 10, read, priority, search, cursor, count } = query;
 
       const where: any = {
         tenantId,
@@ -77,24 +85,28 @@ export class CommunicationsService {
         ];
       }
 
-      const [messages, total] = await Promise.all([
+      const window = pageWindow(where, { page, limit, cursor });
+
+      const [rows, total] = await Promise.all([
         this.prisma.message.findMany({
-          where,
-          skip,
-          take: limit,
-          orderBy: { createdAt: 'desc' },
+          where: window.where,
+          skip: window.skip,
+          take: window.take,
+          orderBy: window.orderBy,
         }),
-        this.prisma.message.count({ where }),
+        countTotal(count, (take) => this.prisma.message.count({ where, take })),
       ]);
+      const slice = slicePage(rows, window);
 
       return {
         success: true,
-        data: messages,
+        data: slice.items,
         meta: {
-          total,
+          total: total.total,
           page,
           limit,
-          totalPages: Math.ceil(total / limit),
+          totalPages: pageCount(total, limit),
+          ...pageMeta(slice, window, total),
         },
       };
     } catch (error) {
@@ -116,9 +128,16 @@ export class CommunicationsService {
         throw new NotFoundException('Message not found');
       }
 
-      const updated = await this.prisma.message.update({
-        where: { id },
-        data: { read: true },
+      const updated = await this.prisma.$transaction(async (tx) => {
+        // Only the request that flips the flag moves the counter
+        const { count } = await tx.message.updateMany({
+          where: { id, read: false },
+          data: { read: true },
+        });
+        if (count) {
+          await this.unread.adjust(tx, tenantId, userId, 'messages', -1);
+        }
+        return tx.message.findUnique({ where: { id } });
       });
 
       this.logger.log(`Message ${id} marked as read by ${userId}`);
@@ -146,7 +165,12 @@ export class CommunicationsService {
         throw new NotFoundException('Message not found');
       }
 
-      await this.prisma.message.delete({ where: { id } });
+      await this.prisma.$transaction(async (tx) => {
+        const deleted = await tx.message.delete({ where: { id } });
+        if (!deleted.read) {
+          await this.unread.adjust(tx, tenantId, deleted.recipientId, 'messages', -1);
+        }
+      });
 
       this.logger.log(`Message ${id} deleted by ${userId}`);
       return { success: true, message: 'Message deleted successfully' };
@@ -170,16 +194,20 @@ export class CommunicationsService {
         throw new NotFoundException('User not found');
       }
 
-      const notification = await this.prisma.notification.create({
-        data: {
-          userId: createDto.userId,
-          title: createDto.title,
-          message: createDto.message,
-          type: createDto.type || NotificationType.INFO,
-          actionUrl: createDto.actionUrl,
-          read: false,
-          tenantId,
-        },
+      const notification = await this.prisma.$transaction(async (tx) => {
+        const created = await tx.notification.create({
+          data: {
+            userId: createDto.userId,
+            title: createDto.title,
+            message: createDto.message,
+            type: createDto.type || NotificationType.INFO,
+            actionUrl: createDto.actionUrl,
+            read: false,
+            tenantId,
+          },
+        });
+        await this.unread.adjust(tx, tenantId, createDto.userId, 'notifications', 1);
+        return created;
       });
 
       this.logger.log(`Notification created for user ${createDto.userId}`);
@@ -251,9 +279,15 @@ export class CommunicationsService {
         throw new NotFoundException('Notification not found');
       }
 
-      const updated = await this.prisma.notification.update({
-        where: { id },
-        data: { read: true },
+      const updated = await this.prisma.$transaction(async (tx) => {
+        const { count } = await tx.notification.updateMany({
+          where: { id, read: false },
+          data: { read: true },
+        });
+        if (count) {
+          await this.unread.adjust(tx, tenantId, userId, 'notifications', -1);
+        }
+        return tx.notification.findUnique({ where: { id } });
       });
 
       this.logger.log(`Notification ${id} marked as read by ${userId}`);
@@ -269,20 +303,33 @@ export class CommunicationsService {
   }
 
   /**
-   * Mark all notifications as read
+   * Mark all notifications as read. The unread counter is cleared at once
+   * and the response returns; the rows are flagged in the background, after
+   * which the counter is recounted so notifications arriving meanwhile are
+   * not lost from it.
    */
   async markAllNotificationsAsRead(tenantId: string, userId: string) {
     try {
-      const result = await this.prisma.notification.updateMany({
-        where: { tenantId, userId, read: false },
-        data: { read: true },
-      });
+      const readAt = new Date();
+      const count = await this.unread.clear(tenantId, userId, 'notifications');
+
+      this.prisma.notification
+        .updateMany({
+          where: { tenantId, userId, read: false, createdAt: { lte: readAt } },
+          data: { read: true },
+        })
+        .then((result) => {
+          this.logger.log(`${result.count} notifications marked as read for user ${userId}`);
+          return this.unread.reconcile(tenantId, userId, 'notifications');
+        })
+        .catch((error) => {
+          this.logger.error(`Failed to mark all notifications as read for user ${userId}: ${error.message}`, error.stack);
+        });
 
-      this.logger.log(`${result.count} notifications marked as read for user ${userId}`);
       return {
         success: true,
-        message: `${result.count} notifications marked as read`,
-        data: { count: result.count },
+        message: `${count} notifications marked as read`,
+        data: { count },
       };
     } catch (error) {
       this.logger.error(`Failed to mark all notifications as read: ${error.message}`, error.stack);
@@ -303,7 +350,12 @@ export class CommunicationsService {
         throw new NotFoundException('Notification not found');
       }
 
-      await this.prisma.notification.delete({ where: { id } });
+      await this.prisma.$transaction(async (tx) => {
+        const deleted = await tx.notification.delete({ where: { id } });
+        if (!deleted.read) {
+          await this.unread.adjust(tx, tenantId, deleted.userId, 'notifications', -1);
+        }
+      });
 
       this.logger.log(`Notification ${id} deleted by ${userId}`);
       return { success: true, message: 'Notification deleted successfully' };
@@ -313,31 +365,37 @@ export class CommunicationsService {
     }
   }
 
+  /**
+   * Unread message and notification counts for the bell; one row lookup
+   */
+  async getUnreadCounts(tenantId: string, userId: string) {
+    try {
+      return { success: true, data: await this.unread.get(tenantId, userId) };
+    } catch (error) {
+      this.logger.error(`Failed to get unread counts: ${error.message}`, error.stack);
+      throw new BadRequestException('Failed to fetch unread counts');
+    }
+  }
+
   /**
    * Get communication statistics
    */
   async getStats(tenantId: string, userId: string) {
     try {
       const [
-        unreadMessages,
+        unread,
         totalMessages,
-        unreadNotifications,
         totalNotifications,
         sentMessages,
         receivedMessages,
       ] = await Promise.all([
-        this.prisma.message.count({
-          where: { tenantId, recipientId: userId, read: false },
-        }),
+        this.unread.get(tenantId, userId),
         this.prisma.message.count({
           where: {
             tenantId,
             OR: [{ senderId: userId }, { recipientId: userId }],
           },
         }),
-        this.prisma.notification.count({
-          where: { tenantId, userId, read: false },
-        }),
         this.prisma.notification.count({
           where: { tenantId, userId },
         }),
@@ -352,9 +410,9 @@ export class CommunicationsService {
       return {
         success: true,
         data: {
-          unreadMessages,
+          unreadMessages: unread.messages,
           totalMessages,
-          unreadNotifications,
+          unreadNotifications: unread.notifications,
           totalNotifications,
           sentMessages,
           receivedMessages,
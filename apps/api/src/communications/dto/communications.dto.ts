@@ -1,5 +1,17 @@
-import { IsString, IsNotEmpty, IsOptional, IsEnum, IsBoolean, IsNumber, Min } from 'class-validator';
+import {
+  IsString,
+  IsNotEmpty,
+  IsOptional,
+  IsEnum,
+  IsBoolean,
+  IsNumber,
+  Min,
+  IsArray,
+  ArrayMaxSize,
+} from 'class-validator';
 import { ApiProperty, ApiPropertyOptional } from '@nestjs/swagger';
+import { Role } from '@prisma/client';
+import { KeysetPaginationQueryDto } from '../../shared/pagination/keyset-pagination.dto';
 
 export enum MessagePriority {
   LOW = 'LOW',
@@ -85,7 +97,59 @@ export class CreateNotificationDto {
   relatedId?: string;
 }
 
-export class MessageQueryDto {
+/**
+ * One notification for many users. Recipients are the tenant's active users
+ * matching any of roles, departmentIds or userIds, or all of them with
+ * allUsers.
+ */
+export class BroadcastNotificationDto {
+  @ApiProperty({ description: 'Notification title' })
+  @IsString()
+  @IsNotEmpty()
+  title: string;
+
+  @ApiProperty({ description: 'Notification message' })
+  @IsString()
+  @IsNotEmpty()
+  message: string;
+
+  @ApiPropertyOptional({ enum: NotificationType, default: NotificationType.INFO })
+  @IsEnum(NotificationType)
+  @IsOptional()
+  type?: NotificationType;
+
+  @ApiPropertyOptional({ description: 'Action URL' })
+  @IsString()
+  @IsOptional()
+  actionUrl?: string;
+
+  @ApiPropertyOptional({ enum: Role, isArray: true, description: 'Notify users with any of these roles' })
+  @IsArray()
+  @IsEnum(Role, { each: true })
+  @IsOptional()
+  roles?: Role[];
+
+  @ApiPropertyOptional({ type: [String], description: 'Notify staff of any of these departments' })
+  @IsArray()
+  @IsString({ each: true })
+  @ArrayMaxSize(100)
+  @IsOptional()
+  departmentIds?: string[];
+
+  @ApiPropertyOptional({ type: [String], description: 'Notify these users' })
+  @IsArray()
+  @IsString({ each: true })
+  @ArrayMaxSize(10000)
+  @IsOptional()
+  userIds?: string[];
+
+  @ApiPropertyOptional({ description: 'Notify every active user of the tenant' })
+  @IsBoolean()
+  @IsOptional()
+  allUsers?: boolean;
+}
+
+export class MessageQueryDto extends KeysetPaginationQueryDto {
   @ApiPropertyOptional({ description: 'Page number', default: 1 })
   @IsOptional()
   @IsNumber()
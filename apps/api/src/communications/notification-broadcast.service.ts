@@ -0,0 +1,197 @@
+import { BadRequestException, Injectable, Logger, NotFoundException, OnModuleInit } from '@nestjs/common';
+import { NotificationBroadcast, Prisma, Role } from '@prisma/client';
+import { CustomPrismaService } from '../prisma/custom-prisma.service';
+import { JobContext, JobQueueService } from '../jobs/job-queue.service';
+import { BroadcastNotificationDto, NotificationType } from './dto/communications.dto';
+import { UnreadCounterService } from './unread-counter.service';
+
+/** Notifications written per transaction */
+export const BROADCAST_CHUNK_SIZE = 1000;
+
+export const BROADCAST_JOB = 'notifications.broadcast';
+
+export interface BroadcastTarget {
+  roles?: Role[];
+  departmentIds?: string[];
+  userIds?: string[];
+  allUsers?: boolean;
+}
+
+export interface BroadcastProgress {
+  broadcastId: string;
+  status: string;
+  total: number;
+  sent: number;
+  /** Percentage of recipients notified so far */
+  progress: number;
+  error: string | null;
+  createdAt: Date;
+  completedAt: Date | null;
+}
+
+/**
+ * Notification fan-out to a role, department, explicit user list or the
+ * whole tenant (POST communications/notifications/broadcast).
+ *
+ * Recipients are resolved with one query, in id order, and written with
+ * createMany a chunk at a time; each chunk commits together with the unread
+ * counters of its recipients and the broadcast's sent count and cursor. A
+ * broadcast that fits in one chunk is delivered before the request returns;
+ * a larger one becomes a background job and its progress is read back from
+ * the "NotificationBroadcast" row. A retried job resumes after the cursor.
+ */
+@Injectable()
+export class NotificationBroadcastService implements OnModuleInit {
+  private readonly logger = new Logger(NotificationBroadcastService.name);
+
+  constructor(
+    private readonly prisma: CustomPrismaService,
+    private readonly unread: UnreadCounterService,
+    private readonly jobs: JobQueueService,
+  ) {}
+
+  onModuleInit(): void {
+    this.jobs.register<{ broadcastId: string }>(
+      BROADCAST_JOB,
+      (payload, context) => this.resume(payload.broadcastId, context),
+      { queue: 'notifications', maxAttempts: 5 },
+    );
+  }
+
+  async broadcast(tenantId: string, dto: BroadcastNotificationDto, createdById?: string): Promise<BroadcastProgress> {
+    const target: BroadcastTarget = {
+      roles: dto.roles?.length ? dto.roles : undefined,
+      departmentIds: dto.departmentIds?.length ? dto.departmentIds : undefined,
+      userIds: dto.userIds?.length ? dto.userIds : undefined,
+      allUsers: dto.allUsers || undefined,
+    };
+    if (!target.allUsers && !target.roles && !target.departmentIds && !target.userIds) {
+      throw new BadRequestException('Choose the recipients: roles, departmentIds, userIds or allUsers');
+    }
+
+    const recipients = await this.recipients(tenantId, target);
+    const broadcast = await this.prisma.notificationBroadcast.create({
+      data: {
+        tenantId,
+        title: dto.title,
+        message: dto.message,
+        type: dto.type || NotificationType.INFO,
+        actionUrl: dto.actionUrl,
+        target: target as Prisma.InputJsonValue,
+        total: recipients.length,
+        createdById,
+      },
+    });
+
+    if (recipients.length > BROADCAST_CHUNK_SIZE) {
+      await this.jobs.enqueue(BROADCAST_JOB, { broadcastId: broadcast.id }, { tenantId });
+    } else {
+      await this.deliver(broadcast, recipients).catch((error) => this.fail(broadcast.id, error));
+    }
+    return this.progress(tenantId, broadcast.id);
+  }
+
+  async progress(tenantId: string, broadcastId: string): Promise<BroadcastProgress> {
+    const broadcast = await this.prisma.notificationBroadcast.findFirst({
+      where: { id: broadcastId, tenantId },
+    });
+    if (!broadcast) {
+      throw new NotFoundException('Broadcast not found');
+    }
+
+    return {
+      broadcastId: broadcast.id,
+      status: broadcast.status,
+      total: broadcast.total,
+      sent: broadcast.sent,
+      progress: broadcast.total ? Math.floor((broadcast.sent / broadcast.total) * 100) : 100,
+      error: broadcast.error,
+      createdAt: broadcast.createdAt,
+      completedAt: broadcast.completedAt,
+    };
+  }
+
+  /** Job handler: deliver to the recipients after the broadcast's cursor */
+  private async resume(broadcastId: string, context: JobContext): Promise<{ sent: number }> {
+    const broadcast = await this.prisma.notificationBroadcast.findUnique({ where: { id: broadcastId } });
+    if (!broadcast || broadcast.status === 'COMPLETED') {
+      return { sent: broadcast?.sent ?? 0 };
+    }
+
+    try {
+      const target = broadcast.target as unknown as BroadcastTarget;
+      const recipients = await this.recipients(broadcast.tenantId, target, broadcast.cursor);
+      await this.deliver(broadcast, recipients);
+      return { sent: broadcast.sent + recipients.length };
+    } catch (error) {
+      if (context.lastAttempt) {
+        await this.fail(broadcast.id, error);
+      }
+      throw error;
+    }
+  }
+
+  /** Ids of the tenant's active users matching any part of the target, in id order, after `after` if given */
+  private async recipients(tenantId: string, target: BroadcastTarget, after?: string | null): Promise<string[]> {
+    const matches: Prisma.UserWhereInput[] = [
+      ...(target.roles ? [{ role: { in: target.roles } }] : []),
+      ...(target.departmentIds ? [{ staff: { is: { departmentId: { in: target.departmentIds } } } }] : []),
+      ...(target.userIds ? [{ id: { in: target.userIds } }] : []),
+    ];
+
+    const users = await this.prisma.user.findMany({
+      where: {
+        tenantId,
+        isActive: true,
+        ...(after ? { id: { gt: after } } : {}),
+        ...(target.allUsers ? {} : { OR: matches }),
+      },
+      select: { id: true },
+      orderBy: { id: 'asc' },
+    });
+    return users.map((user) => user.id);
+  }
+
+  private async deliver(broadcast: NotificationBroadcast, recipients: string[]): Promise<void> {
+    const { tenantId } = broadcast;
+    await this.prisma.notificationBroadcast.update({ where: { id: broadcast.id }, data: { status: 'RUNNING' } });
+
+    for (let start = 0; start < recipients.length; start += BROADCAST_CHUNK_SIZE) {
+      const chunk = recipients.slice(start, start + BROADCAST_CHUNK_SIZE);
+      await this.prisma.$transaction(
+        async (tx) => {
+          await tx.notification.createMany({
+            data: chunk.map((userId) => ({
+              userId,
+              title: broadcast.title,
+              message: broadcast.message,
+              type: broadcast.type,
+              actionUrl: broadcast.actionUrl,
+              read: false,
+              tenantId,
+            })),
+          });
+          await this.unread.adjustMany(tx, tenantId, chunk, 'notifications', 1);
+          await tx.notificationBroadcast.update({
+            where: { id: broadcast.id },
+            data: { sent: { increment: chunk.length }, cursor: chunk[chunk.length - 1] },
+          });
+        },
+        { timeout: 60000 },
+      );
+    }
+
+    await this.prisma.notificationBroadcast.update({
+      where: { id: broadcast.id },
+      data: { status: 'COMPLETED', error: null, completedAt: new Date() },
+    });
+    this.logger.log(`Broadcast ${broadcast.id} sent to ${recipients.length} users of tenant ${tenantId}`);
+  }
+
+  private async fail(broadcastId: string, error: Error): Promise<void> {
+    this.logger.error(`Broadcast ${broadcastId} failed: ${error.message}`, error.stack);
+    await this.prisma.notificationBroadcast
+      .update({ where: { id: broadcastId }, data: { status: 'FAILED', error: error.message } })
+      .catch(() => undefined);
+  }
+}
@@ -0,0 +1,109 @@
+import { Injectable } from '@nestjs/common';
+import { Prisma } from '@prisma/client';
+import { CustomPrismaService } from '../prisma/custom-prisma.service';
+
+export type UnreadKind = 'messages' | 'notifications';
+
+export interface UnreadCounts {
+  messages: number;
+  notifications: number;
+}
+
+/** Counter column of each kind. Identifiers only, never user input. */
+const COLUMNS: Record<UnreadKind, string> = {
+  messages: 'unreadMessages',
+  notifications: 'unreadNotifications',
+};
+
+/** The client of an interactive transaction, or the service itself */
+type Db = Pick<Prisma.TransactionClient, '$executeRaw' | '$queryRaw'>;
+
+/**
+ * Per-user unread message and notification counts in "UnreadCounter", one
+ * row per user, so the bell and the stats read a primary-key lookup instead
+ * of counting rows.
+ *
+ * Writers call adjust() inside the transaction that flips or creates the
+ * read flag, after the row write. The counter row lock then orders them
+ * against reconcile(), which recounts the user's unread rows under the same
+ * lock and so stays exact even with writes in flight.
+ */
+@Injectable()
+export class UnreadCounterService {
+  constructor(private readonly prisma: CustomPrismaService) {}
+
+  /** Both counts for a user; zero when the user has no counter row yet */
+  async get(tenantId: string, userId: string): Promise<UnreadCounts> {
+    const counter = await this.prisma.unreadCounter.findUnique({
+      where: { tenantId_userId: { tenantId, userId } },
+    });
+    return {
+      messages: counter?.unreadMessages ?? 0,
+      notifications: counter?.unreadNotifications ?? 0,
+    };
+  }
+
+  /** Add delta (which may be negative) to one count; never goes below zero */
+  adjust(db: Db, tenantId: string, userId: string, kind: UnreadKind, delta: number): Promise<void> {
+    return this.adjustMany(db, tenantId, [userId], kind, delta);
+  }
+
+  /** adjust() for many distinct users in one statement; pass them sorted so row locks are taken in order */
+  async adjustMany(db: Db, tenantId: string, userIds: string[], kind: UnreadKind, delta: number): Promise<void> {
+    if (userIds.length === 0) {
+      return;
+    }
+    const column = Prisma.raw(`"${COLUMNS[kind]}"`);
+    await db.$executeRaw`
+      INSERT INTO "UnreadCounter" ("tenantId", "userId", ${column}, "updatedAt")
+      SELECT ${tenantId}, "userId", GREATEST(${delta}::int, 0), NOW()
+      FROM unnest(${userIds}::text[]) AS "userId"
+      ON CONFLICT ("tenantId", "userId")
+      DO UPDATE SET
+        ${column} = GREATEST("UnreadCounter".${column} + ${delta}::int, 0),
+        "updatedAt" = NOW()
+    `;
+  }
+
+  /** Set one count to zero and return what it was */
+  async clear(tenantId: string, userId: string, kind: UnreadKind): Promise<number> {
+    const column = Prisma.raw(`"${COLUMNS[kind]}"`);
+    return this.prisma.$transaction(async (tx) => {
+      const [counter] = await tx.$queryRaw<{ count: number }[]>`
+        SELECT ${column} AS "count" FROM "UnreadCounter"
+        WHERE "tenantId" = ${tenantId} AND "userId" = ${userId}
+        FOR UPDATE
+      `;
+      if (!counter) {
+        return 0;
+      }
+      await tx.$executeRaw`
+        UPDATE "UnreadCounter" SET ${column} = 0, "updatedAt" = NOW()
+        WHERE "tenantId" = ${tenantId} AND "userId" = ${userId}
+      `;
+      return Number(counter.count);
+    });
+  }
+
+  /** Recount one of a user's counts from the read flags and return it */
+  async reconcile(tenantId: string, userId: string, kind: UnreadKind): Promise<number> {
+    const column = Prisma.raw(`"${COLUMNS[kind]}"`);
+    const unread =
+      kind === 'messages'
+        ? Prisma.sql`SELECT COUNT(*)::int FROM "Message"
+            WHERE "tenantId" = ${tenantId} AND "recipientId" = ${userId} AND "read" = false`
+        : Prisma.sql`SELECT COUNT(*)::int FROM "Notification"
+            WHERE "tenantId" = ${tenantId} AND "userId" = ${userId} AND "read" = false`;
+
+    return this.prisma.$transaction(async (tx) => {
+      // Take the row lock first, so writers in flight either commit before the count or wait for it
+      await this.adjust(tx, tenantId, userId, kind, 0);
+      const [counter] = await tx.$queryRaw<{ count: number }[]>`
+        UPDATE "UnreadCounter" SET ${column} = (${unread}), "updatedAt" = NOW()
+        WHERE "tenantId" = ${tenantId} AND "userId" = ${userId}
+        RETURNING ${column} AS "count"
+      `;
+      return Number(counter.count);
+    });
+  }
+}
@@ -2,13 +2,15 @@ import { Module } from '@nestjs/common';
 import { TypeOrmModule } from '@nestjs/typeorm';
 import { AuditLog } from './entities/audit-log.entity';
 import { AuditService } from './services/audit.service';
+import { AuditWriterService } from './services/audit-writer.service';
+import { AuditPartitionService } from './services/audit-partition.service';
 import { AuditController } from './controllers/audit.controller';
 import { AuditInterceptor } from './interceptors/audit.interceptor';
 
 @Module({
   imports: [TypeOrmModule.forFeature([AuditLog])],
   controllers: [AuditController],
-  providers: [AuditService, AuditInterceptor],
+  providers: [AuditService, AuditWriterService, AuditPartitionService, AuditInterceptor],
   exports: [AuditService, AuditInterceptor],
 })
 export class AuditModule {}
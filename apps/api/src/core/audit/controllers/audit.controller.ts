@@ -124,6 +124,17 @@ export class AuditController {
     );
   }
 
+  /**
+   * Audit writer queue depth and dropped/written counters
+   * GET /audit/writer/stats
+   */
+  @Get('writer/stats')
+  @Permissions(Permission.MANAGE_AUDIT_LOGS)
+  @ApiOperation({ summary: 'Get audit writer queue metrics' })
+  getWriterStats() {
+    return this.auditService.getWriterStats();
+  }
+
   /**
    * Mark audit log as reviewed
    * POST /audit/logs/:id/reviewed
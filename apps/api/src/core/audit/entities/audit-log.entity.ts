@@ -36,7 +36,9 @@ export enum AuditEntityType {
   SETTING = 'setting',
 }
 
-@Entity('audit_logs')
+// Partitioned by month with a (id, created_at) primary key (PartitionAuditLogs
+// migration), which synchronize cannot express
+@Entity('audit_logs', { synchronize: false })
 @Index(['tenantId', 'createdAt'])
 @Index(['userId', 'createdAt'])
 @Index(['entityType', 'entityId'])
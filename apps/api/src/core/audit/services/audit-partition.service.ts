@@ -0,0 +1,130 @@
+import { Injectable, Logger, OnModuleInit } from '@nestjs/common';
+import { InjectRepository } from '@nestjs/typeorm';
+import { Repository } from 'typeorm';
+import { AuditLog } from '../entities/audit-log.entity';
+
+/** Months of partitions kept created ahead of the current one */
+const MONTHS_AHEAD = 2;
+
+const PARTITION_NAME = /^audit_logs_p(\d{4})(\d{2})$/;
+
+/** Rows kept past retention; see AuditService.cleanup */
+const RETAINED = 'is_sensitive = true OR requires_review = true';
+
+/**
+ * Maintenance of the monthly audit_logs partitions created by the
+ * PartitionAuditLogs migration: creating upcoming months and applying
+ * retention a partition at a time.
+ */
+@Injectable()
+export class AuditPartitionService implements OnModuleInit {
+  private readonly logger = new Logger(AuditPartitionService.name);
+
+  constructor(
+    @InjectRepository(AuditLog)
+    private readonly auditLogRepository: Repository<AuditLog>,
+  ) {}
+
+  async onModuleInit(): Promise<void> {
+    try {
+      await this.ensurePartitions();
+    } catch (error) {
+      this.logger.warn(`Could not create upcoming audit_logs partitions: ${error.message}`);
+    }
+  }
+
+  /** Create the partitions for this month and the next MONTHS_AHEAD months */
+  async ensurePartitions(): Promise<void> {
+    if (!(await this.isPartitioned())) {
+      return;
+    }
+    await this.query(
+      `SELECT create_audit_logs_partition((date_trunc('month', now()) + make_interval(months => m))::date)
+       FROM generate_series(0, $1) AS m`,
+      [MONTHS_AHEAD],
+    );
+  }
+
+  /**
+   * Remove audit rows created before cutoff, except sensitive and
+   * to-be-reviewed ones. A month entirely before the cutoff is dropped
+   * outright when it holds no retained rows; otherwise its expired rows are
+   * deleted from that partition alone, so no statement touches or locks
+   * more than one month. Returns the number of rows removed.
+   */
+  async removeBefore(cutoff: Date): Promise<number> {
+    if (!(await this.isPartitioned())) {
+      return this.deleteExpired('audit_logs', cutoff);
+    }
+
+    let removed = 0;
+    for (const { name, start, end } of await this.partitions()) {
+      if (start >= cutoff) {
+        continue;
+      }
+
+      if (end <= cutoff) {
+        const [retained] = await this.query(`SELECT EXISTS (SELECT 1 FROM "${name}" WHERE ${RETAINED}) AS "exists"`);
+        if (!retained.exists) {
+          const [{ count }] = await this.query(`SELECT COUNT(*)::int AS count FROM "${name}"`);
+          await this.query(`ALTER TABLE "audit_logs" DETACH PARTITION "${name}"`);
+          await this.query(`DROP TABLE "${name}"`);
+          this.logger.log(`Dropped audit partition ${name} (${count} rows)`);
+          removed += count;
+          continue;
+        }
+      }
+      removed += await this.deleteExpired(name, cutoff);
+    }
+
+    removed += await this.deleteExpired('audit_logs_default', cutoff);
+    return removed;
+  }
+
+  private async deleteExpired(table: string, cutoff: Date): Promise<number> {
+    const [, affected] = await this.query(
+      `DELETE FROM "${table}" WHERE created_at < $1 AND NOT (${RETAINED})`,
+      [cutoff],
+    );
+    return affected || 0;
+  }
+
+  /** Monthly partitions, oldest first, with their [start, end) range */
+  private async partitions(): Promise<Array<{ name: string; start: Date; end: Date }>> {
+    const rows: Array<{ name: string }> = await this.query(
+      `SELECT child.relname AS name
+       FROM pg_inherits
+       JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+       JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+       WHERE parent.relname = 'audit_logs'`,
+    );
+
+    return rows
+      .map(({ name }) => {
+        const match = PARTITION_NAME.exec(name);
+        if (!match) {
+          return null;
+        }
+        const year = Number(match[1]);
+        const month = Number(match[2]) - 1;
+        // created_at is a timestamp without time zone; bounds are compared as UTC
+        return { name, start: new Date(Date.UTC(year, month, 1)), end: new Date(Date.UTC(year, month + 1, 1)) };
+      })
+      .filter(Boolean)
+      .sort((a, b) => a.start.getTime() - b.start.getTime());
+  }
+
+  private async isPartitioned(): Promise<boolean> {
+    const [row] = await this.query(
+      `SELECT EXISTS (
+         SELECT 1 FROM pg_partitioned_table pt JOIN pg_class c ON c.oid = pt.partrelid
+         WHERE c.relname = 'audit_logs'
+       ) AS "partitioned"`,
+    );
+    return row.partitioned;
+  }
+
+  private query(sql: string, parameters?: any[]): Promise<any> {
+    return this.auditLogRepository.manager.query(sql, parameters);
+  }
+}
@@ -0,0 +1,164 @@
+import { Injectable, Logger, OnModuleDestroy } from '@nestjs/common';
+import { ConfigService } from '@nestjs/config';
+import { InjectRepository } from '@nestjs/typeorm';
+import { Repository } from 'typeorm';
+import { AuditLog } from '../entities/audit-log.entity';
+import type { CreateAuditLogDto } from './audit.service';
+
+export interface AuditWriterStats {
+  queueDepth: number;
+  capacity: number;
+  written: number;
+  dropped: number;
+  failedFlushes: number;
+  lastFlushMs: number | null;
+}
+
+/**
+ * Buffers audit entries in memory and writes them with multi-row INSERTs,
+ * so audited requests never wait on an audit round-trip.
+ *
+ * A flush runs when AUDIT_BATCH_SIZE entries are queued or
+ * AUDIT_FLUSH_INTERVAL_MS after the first one, whichever comes first, and
+ * only one flush runs at a time. The queue holds at most AUDIT_QUEUE_CAPACITY
+ * entries: enqueue() waits for the running flush when it is full, and only
+ * drops (and counts) the entry if the queue is still full afterwards, i.e.
+ * the database is not keeping up or is unreachable. A failed batch goes back
+ * to the front of the queue for the next flush. Remaining entries are
+ * written on shutdown.
+ */
+@Injectable()
+export class AuditWriterService implements OnModuleDestroy {
+  private readonly logger = new Logger(AuditWriterService.name);
+  private readonly batchSize: number;
+  private readonly flushIntervalMs: number;
+  private readonly capacity: number;
+
+  private queue: CreateAuditLogDto[] = [];
+  private timer: NodeJS.Timeout | null = null;
+  private flushing: Promise<void> | null = null;
+  private written = 0;
+  private dropped = 0;
+  private failedFlushes = 0;
+  private lastFlushMs: number | null = null;
+
+  constructor(
+    @InjectRepository(AuditLog)
+    private readonly auditLogRepository: Repository<AuditLog>,
+    configService: ConfigService,
+  ) {
+    this.batchSize = Math.max(1, Number(configService.get('AUDIT_BATCH_SIZE', 200)));
+    this.flushIntervalMs = Math.max(1, Number(configService.get('AUDIT_FLUSH_INTERVAL_MS', 1000)));
+    this.capacity = Math.max(this.batchSize, Number(configService.get('AUDIT_QUEUE_CAPACITY', 10000)));
+  }
+
+  /** Queue an entry. Resolves once it is queued (or dropped), not when it is written. */
+  async enqueue(entry: CreateAuditLogDto): Promise<void> {
+    // Stamp now: a batched or requeued entry is written well after the event,
+    // possibly in the next month's partition
+    entry = { ...entry, createdAt: entry.createdAt ?? new Date() };
+
+    if (this.queue.length >= this.capacity) {
+      await this.flush();
+      if (this.queue.length >= this.capacity) {
+        this.drop(1);
+        return;
+      }
+    }
+
+    this.queue.push(entry);
+    if (this.queue.length >= this.batchSize) {
+      void this.flush();
+    } else if (!this.timer) {
+      this.timer = setTimeout(() => void this.flush(), this.flushIntervalMs);
+    }
+  }
+
+  /** Write one batch, or wait for the batch already being written. */
+  flush(): Promise<void> {
+    if (!this.flushing) {
+      this.flushing = this.writeBatch().then((ok) => {
+        this.flushing = null;
+        // More entries may have arrived while writing; after a failure wait
+        // for the timer instead of retrying straight away
+        if (ok && this.queue.length >= this.batchSize) {
+          void this.flush();
+        } else if (this.queue.length > 0 && !this.timer) {
+          this.timer = setTimeout(() => void this.flush(), this.flushIntervalMs);
+        }
+      });
+    }
+    return this.flushing;
+  }
+
+  stats(): AuditWriterStats {
+    return {
+      queueDepth: this.queue.length,
+      capacity: this.capacity,
+      written: this.written,
+      dropped: this.dropped,
+      failedFlushes: this.failedFlushes,
+      lastFlushMs: this.lastFlushMs,
+    };
+  }
+
+  async onModuleDestroy(): Promise<void> {
+    // Drain everything; stop at the first failure rather than spin on a dead database
+    let failures = this.failedFlushes;
+    while (this.queue.length > 0 || this.flushing) {
+      await this.flush();
+      if (this.failedFlushes > failures) {
+        break;
+      }
+      failures = this.failedFlushes;
+    }
+    if (this.timer) {
+      clearTimeout(this.timer);
+      this.timer = null;
+    }
+    if (this.queue.length > 0) {
+      this.drop(this.queue.length);
+      this.queue = [];
+    }
+  }
+
+  /** false if the batch could not be written */
+  private async writeBatch(): Promise<boolean> {
+    if (this.timer) {
+      clearTimeout(this.timer);
+      this.timer = null;
+    }
+    const batch = this.queue.splice(0, this.batchSize);
+    if (batch.length === 0) {
+      return true;
+    }
+
+    const started = Date.now();
+    try {
+      await this.auditLogRepository.insert(batch);
+      this.written += batch.length;
+      this.lastFlushMs = Date.now() - started;
+      return true;
+    } catch (error) {
+      this.failedFlushes++;
+      this.logger.error(`Failed to write ${batch.length} audit entries: ${error.message}`);
+      // Retry with the next flush, keeping the newest entries if that overflows
+      const requeued = batch.concat(this.queue);
+      const overflow = requeued.length - this.capacity;
+      if (overflow > 0) {
+        this.drop(overflow);
+      }
+      this.queue = overflow > 0 ? requeued.slice(overflow) : requeued;
+      return false;
+    }
+  }
+
+  private drop(count: number): void {
+    const before = this.dropped;
+    this.dropped += count;
+    // Warn on the first drop and then once per thousand, not per entry
+    if (before === 0 || Math.floor(before / 1000) !== Math.floor(this.dropped / 1000)) {
+      this.logger.warn(`Audit queue full: ${this.dropped} entries dropped so far`);
+    }
+  }
+}
@@ -2,6 +2,8 @@ import { Injectable } from '@nestjs/common';
 import { InjectRepository } from '@nestjs/typeorm';
 import { Repository, Between, In } from 'typeorm';
 import { AuditLog, AuditAction, AuditEntityType } from '../entities/audit-log.entity';
+import { AuditWriterService, AuditWriterStats } from './audit-writer.service';
+import { AuditPartitionService } from './audit-partition.service';
 
 export interface CreateAuditLogDto {
   userId: string;
@@ -27,6 +29,8 @@ export interface CreateAuditLogDto {
   isSuspicious?: boolean;
   requiresReview?: boolean;
   durationMs?: number;
+  /** When the event happened; defaults to when it is queued, not written */
+  createdAt?: Date;
 }
 
 export interface AuditLogQuery {
@@ -50,14 +54,23 @@ export class AuditService {
   constructor(
     @InjectRepository(AuditLog)
     private readonly auditLogRepository: Repository<AuditLog>,
+    private readonly auditWriter: AuditWriterService,
+    private readonly auditPartitions: AuditPartitionService,
   ) {}
 
   /**
-   * Create audit log entry
+   * Queue an audit log entry. It is written in the background with the next
+   * batch (see AuditWriterService), so it may not be queryable immediately.
    */
-  async log(logDto: CreateAuditLogDto): Promise<AuditLog> {
-    const auditLog = this.auditLogRepository.create(logDto);
-    return this.auditLogRepository.save(auditLog);
+  async log(logDto: CreateAuditLogDto): Promise<void> {
+    return this.auditWriter.enqueue(logDto);
+  }
+
+  /**
+   * Audit writer queue depth and dropped/written counters
+   */
+  getWriterStats(): AuditWriterStats {
+    return this.auditWriter.stats();
   }
 
   /**
@@ -71,7 +84,7 @@ export class AuditService {
     entityType: AuditEntityType,
     entityId: string,
     newValues?: Record<string, any>,
-  ): Promise<AuditLog> {
+  ): Promise<void> {
     return this.log({
       userId,
       userEmail,
@@ -94,7 +107,7 @@ export class AuditService {
     entityId: string,
     oldValues?: Record<string, any>,
     newValues?: Record<string, any>,
-  ): Promise<AuditLog> {
+  ): Promise<void> {
     return this.log({
       userId,
       userEmail,
@@ -117,7 +130,7 @@ export class AuditService {
     entityType: AuditEntityType,
     entityId: string,
     oldValues?: Record<string, any>,
-  ): Promise<AuditLog> {
+  ): Promise<void> {
     return this.log({
       userId,
       userEmail,
@@ -139,7 +152,7 @@ export class AuditService {
     entityType: AuditEntityType,
     entityId: string,
     isSensitive: boolean = false,
-  ): Promise<AuditLog> {
+  ): Promise<void> {
     return this.log({
       userId,
       userEmail,
@@ -161,7 +174,7 @@ export class AuditService {
     ipAddress?: string,
     userAgent?: string,
     success: boolean = true,
-  ): Promise<AuditLog> {
+  ): Promise<void> {
     return this.log({
       userId,
       userEmail,
@@ -314,27 +327,43 @@ export class AuditService {
     suspiciousCount: number;
     sensitiveAccessCount: number;
   }> {
-    const logs = await this.auditLogRepository.find({
-      where: {
-        tenantId,
-        createdAt: Between(startDate, endDate),
-      },
-    });
+    // At most one row per (action, entity type) pair comes back
+    const rows: Array<{
+      action: AuditAction;
+      entityType: AuditEntityType;
+      count: string;
+      suspicious: string;
+      sensitive: string;
+    }> = await this.auditLogRepository
+      .createQueryBuilder('log')
+      .select('log.action', 'action')
+      .addSelect('log.entityType', 'entityType')
+      .addSelect('COUNT(*)', 'count')
+      .addSelect('COUNT(*) FILTER (WHERE log.isSuspicious)', 'suspicious')
+      .addSelect('COUNT(*) FILTER (WHERE log.isSensitive)', 'sensitive')
+      .where('log.tenantId = :tenantId', { tenantId })
+      .andWhere('log.createdAt BETWEEN :startDate AND :endDate', { startDate, endDate })
+      .groupBy('log.action')
+      .addGroupBy('log.entityType')
+      .getRawMany();
 
     const byAction: any = {};
     const byEntityType: any = {};
+    let totalLogs = 0;
     let suspiciousCount = 0;
     let sensitiveAccessCount = 0;
 
-    logs.forEach((log) => {
-      byAction[log.action] = (byAction[log.action] || 0) + 1;
-      byEntityType[log.entityType] = (byEntityType[log.entityType] || 0) + 1;
-      if (log.isSuspicious) suspiciousCount++;
-      if (log.isSensitive) sensitiveAccessCount++;
+    rows.forEach((row) => {
+      const count = Number(row.count);
+      byAction[row.action] = (byAction[row.action] || 0) + count;
+      byEntityType[row.entityType] = (byEntityType[row.entityType] || 0) + count;
+      totalLogs += count;
+      suspiciousCount += Number(row.suspicious);
+      sensitiveAccessCount += Number(row.sensitive);
     });
 
     return {
-      totalLogs: logs.length,
+      totalLogs,
       byAction,
       byEntityType,
       suspiciousCount,
@@ -359,20 +388,14 @@ export class AuditService {
   }
 
   /**
-   * Cleanup old audit logs (retention policy)
+   * Cleanup old audit logs (retention policy). Sensitive and to-be-reviewed
+   * entries are kept; whole months are dropped where possible.
    */
   async cleanup(retentionDays: number = 90): Promise<number> {
     const cutoffDate = new Date();
     cutoffDate.setDate(cutoffDate.getDate() - retentionDays);
 
-    const result = await this.auditLogRepository
-      .createQueryBuilder()
-      .delete()
-      .where('created_at < :cutoffDate', { cutoffDate })
-      .andWhere('is_sensitive = false')
-      .andWhere('requires_review = false')
-      .execute();
-
-    return result.affected || 0;
+    await this.auditPartitions.ensurePartitions();
+    return this.auditPartitions.removeBefore(cutoffDate);
   }
 }
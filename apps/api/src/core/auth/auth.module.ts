@@ -10,10 +10,12 @@ import { TokenService } from './services/token.service';
 import { AuthController } from './controllers/auth.controller';
 import { JwtStrategy } from './strategies/jwt.strategy';
 import { JwtAuthGuard } from './guards/jwt-auth.guard';
+import { PasswordHashModule } from '../../passwords/password-hash.module';
 
 @Module({
   imports: [
     TypeOrmModule.forFeature([User]),
+    PasswordHashModule,
     PassportModule.register({ defaultStrategy: 'jwt' }),
     JwtModule.registerAsync({
       imports: [ConfigModule],
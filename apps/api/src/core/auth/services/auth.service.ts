@@ -10,6 +10,7 @@ import { Repository } from 'typeorm';
 import { User } from '../entities/user.entity';
 import { PasswordService } from './password.service';
 import { TokenService, JwtPayload, TokenPair } from './token.service';
+import { UserStatusCacheService } from '../../../cache/user-status-cache.service';
 import { getPermissionsForRole } from '../../rbac/role-permission.mapping';
 import { UserRole } from '../../rbac/enums/roles.enum';
 import * as crypto from 'crypto';
@@ -43,6 +44,7 @@ export class AuthService {
     private readonly userRepository: Repository<User>,
     private readonly passwordService: PasswordService,
     private readonly tokenService: TokenService,
+    private readonly userStatusCache: UserStatusCacheService,
   ) {}
 
   /**
@@ -73,9 +75,10 @@ export class AuthService {
     }
 
     // Verify password
-    const isPasswordValid = await this.passwordService.comparePassword(
+    const isPasswordValid = await this.passwordService.verifyPassword(
       password,
       user.passwordHash,
+      (passwordHash) => this.userRepository.update({ id: user.id, passwordHash: user.passwordHash }, { passwordHash }),
     );
 
     if (!isPasswordValid) {
@@ -88,6 +91,9 @@ export class AuthService {
       }
 
       await this.userRepository.save(user);
+      if (user.lockedUntil) {
+        this.userStatusCache.invalidate(user.id);
+      }
       throw new UnauthorizedException('Invalid credentials');
     }
 
@@ -249,6 +255,7 @@ export class AuthService {
     user.lockedUntil = null;
 
     await this.userRepository.save(user);
+    this.userStatusCache.invalidate(user.id);
   }
 
   /**
@@ -321,5 +328,6 @@ export class AuthService {
   async logout(userId: string, sessionId?: string): Promise<void> {
     // TODO: Implement token blacklisting with Redis
     // For now, client-side token removal is sufficient
+    this.userStatusCache.invalidate(userId);
   }
 }
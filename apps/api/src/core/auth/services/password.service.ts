@@ -1,23 +1,35 @@
 import { Injectable } from '@nestjs/common';
-import * as bcrypt from 'bcrypt';
 import * as crypto from 'crypto';
+import { PasswordHashService } from '../../../passwords/password-hash.service';
 
 @Injectable()
 export class PasswordService {
-  private readonly saltRounds = 12;
+  constructor(private readonly passwords: PasswordHashService) {}
 
   /**
    * Hash a plain text password
    */
   async hashPassword(password: string): Promise<string> {
-    return bcrypt.hash(password, this.saltRounds);
+    return this.passwords.hash(password);
   }
 
   /**
    * Compare a plain text password with a hash
    */
   async comparePassword(password: string, hash: string): Promise<boolean> {
-    return bcrypt.compare(password, hash);
+    return this.passwords.compare(password, hash);
+  }
+
+  /**
+   * Compare a plain text password with a hash, passing a fresh hash to
+   * `rehashed` when the stored one was made with another cost
+   */
+  async verifyPassword(
+    password: string,
+    hash: string,
+    rehashed: (hash: string) => Promise<unknown>,
+  ): Promise<boolean> {
+    return this.passwords.verify(password, hash, rehashed);
   }
 
   /**
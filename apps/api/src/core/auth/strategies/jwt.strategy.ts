@@ -6,6 +6,7 @@ import { InjectRepository } from '@nestjs/typeorm';
 import { Repository } from 'typeorm';
 import { User } from '../entities/user.entity';
 import { JwtPayload } from '../services/token.service';
+import { UserStatusCacheService } from '../../../cache/user-status-cache.service';
 
 @Injectable()
 export class JwtStrategy extends PassportStrategy(Strategy) {
@@ -13,6 +14,7 @@ export class JwtStrategy extends PassportStrategy(Strategy) {
     private readonly configService: ConfigService,
     @InjectRepository(User)
     private readonly userRepository: Repository<User>,
+    private readonly userStatusCache: UserStatusCacheService,
   ) {
     super({
       jwtFromRequest: ExtractJwt.fromAuthHeaderAsBearerToken(),
@@ -22,9 +24,25 @@ export class JwtStrategy extends PassportStrategy(Strategy) {
   }
 
   async validate(payload: JwtPayload): Promise<JwtPayload> {
-    // Verify user still exists and is active
-    const user = await this.userRepository.findOne({
-      where: { id: payload.sub },
+    // Verify user still exists and is active (cached for a few seconds)
+    const user = await this.userStatusCache.getOrLoad(payload.sub, async () => {
+      const found = await this.userRepository.findOne({
+        where: { id: payload.sub },
+      });
+      return found
+        ? {
+            id: found.id,
+            email: found.email,
+            firstName: found.firstName,
+            lastName: found.lastName,
+            role: found.role,
+            // Core users have no tenant role; PermissionsGuard resolves none for them
+            roleId: null,
+            tenantId: found.tenantId,
+            isActive: found.isActive,
+            lockedUntil: found.lockedUntil,
+          }
+        : null;
     });
 
     if (!user || !user.isActive) {
@@ -32,7 +50,7 @@ export class JwtStrategy extends PassportStrategy(Strategy) {
     }
 
     // Check if account is locked
-    if (user.isLocked) {
+    if (user.lockedUntil && new Date() < user.lockedUntil) {
       throw new UnauthorizedException('Account is locked');
     }
 
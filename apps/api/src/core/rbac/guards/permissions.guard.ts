@@ -2,7 +2,17 @@ import { Injectable, CanActivate, ExecutionContext, ForbiddenException } from '@
 import { Reflector } from '@nestjs/core';
 import { PERMISSIONS_KEY } from '../decorators/permissions.decorator';
 import { Permission } from '../enums/permissions.enum';
-import { getPermissionsForRole, roleHasAnyPermission, roleHasAllPermissions } from '../role-permission.mapping';
+import { getPermissionSetForRole } from '../role-permission.mapping';
+import { RouteMetadataCache } from '../../../shared/guards/route-metadata.cache';
+
+/**
+ * Permission requirement of a route, resolved from its decorators once
+ */
+interface RoutePermissionRequirement {
+  permissions: Permission[];
+  requireAll: boolean;
+  message: string;
+}
 
 /**
  * Permissions Guard
@@ -11,29 +21,17 @@ import { getPermissionsForRole, roleHasAnyPermission, roleHasAllPermissions } fr
  */
 @Injectable()
 export class PermissionsGuard implements CanActivate {
+  private readonly routeRequirements = new RouteMetadataCache<RoutePermissionRequirement | null>();
+
   constructor(private reflector: Reflector) {}
 
   canActivate(context: ExecutionContext): boolean {
-    // Check for regular permissions
-    const requiredPermissions = this.reflector.getAllAndOverride<Permission[]>(
-      PERMISSIONS_KEY,
-      [context.getHandler(), context.getClass()]
-    );
-
-    // Check for require all permissions
-    const requireAll = this.reflector.get<{ permissions: Permission[]; requireAll: boolean }>(
-      'require_all_permissions',
-      context.getHandler()
-    );
-
-    // Check for require any permission
-    const requireAny = this.reflector.get<{ permissions: Permission[]; requireAll: boolean }>(
-      'require_any_permission',
-      context.getHandler()
+    const requirement = this.routeRequirements.get(context, () =>
+      this.resolveRequirement(context),
     );
 
     // If no permissions required, allow access
-    if (!requiredPermissions && !requireAll && !requireAny) {
+    if (!requirement) {
       return true;
     }
 
@@ -48,45 +46,61 @@ export class PermissionsGuard implements CanActivate {
       throw new ForbiddenException('User role not found');
     }
 
-    // Get user's permissions based on their role
-    const userPermissions = getPermissionsForRole(user.role);
+    // Compiled Set of the user's role permissions
+    const userPermissions = getPermissionSetForRole(user.role);
+
+    const allowed = requirement.requireAll
+      ? requirement.permissions.every(permission => userPermissions.has(permission))
+      : requirement.permissions.some(permission => userPermissions.has(permission));
+
+    if (!allowed) {
+      throw new ForbiddenException(requirement.message);
+    }
+
+    return true;
+  }
 
-    // Handle require all permissions
+  private resolveRequirement(context: ExecutionContext): RoutePermissionRequirement | null {
+    // Check for require all permissions
+    const requireAll = this.reflector.get<{ permissions: Permission[]; requireAll: boolean }>(
+      'require_all_permissions',
+      context.getHandler()
+    );
     if (requireAll) {
-      const hasAllPermissions = roleHasAllPermissions(user.role, requireAll.permissions);
-      if (!hasAllPermissions) {
-        throw new ForbiddenException(
-          `Access denied. You must have ALL of these permissions: ${requireAll.permissions.join(', ')}`
-        );
-      }
-      return true;
+      return {
+        permissions: requireAll.permissions,
+        requireAll: true,
+        message: `Access denied. You must have ALL of these permissions: ${requireAll.permissions.join(', ')}`,
+      };
     }
 
-    // Handle require any permission
+    // Check for require any permission
+    const requireAny = this.reflector.get<{ permissions: Permission[]; requireAll: boolean }>(
+      'require_any_permission',
+      context.getHandler()
+    );
     if (requireAny) {
-      const hasAnyPermission = roleHasAnyPermission(user.role, requireAny.permissions);
-      if (!hasAnyPermission) {
-        throw new ForbiddenException(
-          `Access denied. You must have at least ONE of these permissions: ${requireAny.permissions.join(', ')}`
-        );
-      }
-      return true;
+      return {
+        permissions: requireAny.permissions,
+        requireAll: false,
+        message: `Access denied. You must have at least ONE of these permissions: ${requireAny.permissions.join(', ')}`,
+      };
     }
 
-    // Handle regular permissions (any permission is sufficient)
+    // Regular permissions (any permission is sufficient)
+    const requiredPermissions = this.reflector.getAllAndOverride<Permission[]>(
+      PERMISSIONS_KEY,
+      [context.getHandler(), context.getClass()]
+    );
     if (requiredPermissions) {
-      const hasPermission = requiredPermissions.some(permission =>
-        userPermissions.includes(permission)
-      );
-
-      if (!hasPermission) {
-        throw new ForbiddenException(
-          `Access denied. Required permissions: ${requiredPermissions.join(', ')}`
-        );
-      }
+      return {
+        permissions: requiredPermissions,
+        requireAll: false,
+        message: `Access denied. Required permissions: ${requiredPermissions.join(', ')}`,
+      };
     }
 
-    return true;
+    return null;
   }
 }
 
@@ -95,12 +109,16 @@ export class PermissionsGuard implements CanActivate {
  */
 @Injectable()
 export class UserPermissionsGuard implements CanActivate {
+  private readonly routePermissions = new RouteMetadataCache<Permission[] | undefined>();
+
   constructor(private reflector: Reflector) {}
 
   canActivate(context: ExecutionContext): boolean {
-    const requiredPermissions = this.reflector.getAllAndOverride<Permission[]>(
-      PERMISSIONS_KEY,
-      [context.getHandler(), context.getClass()]
+    const requiredPermissions = this.routePermissions.get(context, () =>
+      this.reflector.getAllAndOverride<Permission[]>(
+        PERMISSIONS_KEY,
+        [context.getHandler(), context.getClass()]
+      ),
     );
 
     if (!requiredPermissions || requiredPermissions.length === 0) {
@@ -115,11 +133,9 @@ export class UserPermissionsGuard implements CanActivate {
     }
 
     // Check if user has custom permissions assigned (overrides role permissions)
-    const userPermissions = user.permissions || getPermissionsForRole(user.role);
-
-    const hasPermission = requiredPermissions.some(permission =>
-      userPermissions.includes(permission)
-    );
+    const hasPermission = user.permissions
+      ? requiredPermissions.some(permission => user.permissions.includes(permission))
+      : requiredPermissions.some(permission => getPermissionSetForRole(user.role).has(permission));
 
     if (!hasPermission) {
       throw new ForbiddenException(
@@ -2,6 +2,7 @@ import { Injectable, CanActivate, ExecutionContext, ForbiddenException } from '@
 import { Reflector } from '@nestjs/core';
 import { ROLES_KEY } from '../decorators/roles.decorator';
 import { UserRole } from '../enums/roles.enum';
+import { RouteMetadataCache } from '../../../shared/guards/route-metadata.cache';
 
 /**
  * Roles Guard
@@ -10,15 +11,20 @@ import { UserRole } from '../enums/roles.enum';
  */
 @Injectable()
 export class RolesGuard implements CanActivate {
+  private readonly routeRoles = new RouteMetadataCache<ReadonlySet<UserRole> | null>();
+
   constructor(private reflector: Reflector) {}
 
   canActivate(context: ExecutionContext): boolean {
-    const requiredRoles = this.reflector.getAllAndOverride<UserRole[]>(
-      ROLES_KEY,
-      [context.getHandler(), context.getClass()]
-    );
+    const requiredRoles = this.routeRoles.get(context, () => {
+      const roles = this.reflector.getAllAndOverride<UserRole[]>(
+        ROLES_KEY,
+        [context.getHandler(), context.getClass()]
+      );
+      return roles && roles.length > 0 ? new Set(roles) : null;
+    });
 
-    if (!requiredRoles || requiredRoles.length === 0) {
+    if (!requiredRoles) {
       // No roles required, allow access
       return true;
     }
@@ -34,11 +40,9 @@ export class RolesGuard implements CanActivate {
       throw new ForbiddenException('User role not found');
     }
 
-    const hasRole = requiredRoles.some((role) => user.role === role);
-
-    if (!hasRole) {
+    if (!requiredRoles.has(user.role)) {
       throw new ForbiddenException(
-        `Access denied. Required roles: ${requiredRoles.join(', ')}`
+        `Access denied. Required roles: ${Array.from(requiredRoles).join(', ')}`
       );
     }
 
@@ -622,12 +622,33 @@ export const RolePermissionMapping: Record<UserRole, Permission[]> = {
   ],
 };
 
+/**
+ * RolePermissionMapping compiled once at load time into per-role Sets, so
+ * permission checks are O(1) lookups instead of scans of the role's array
+ * (for SUPER_ADMIN that array is the whole Permission enum).
+ */
+export const RolePermissionSets = Object.keys(RolePermissionMapping).reduce(
+  (sets, role) => {
+    sets[role] = new Set(RolePermissionMapping[role]);
+    return sets;
+  },
+  {} as Record<UserRole, ReadonlySet<Permission>>,
+);
+
+const EMPTY_PERMISSION_SET: ReadonlySet<Permission> = new Set();
+
+/**
+ * Helper function to get the compiled permission Set for a role
+ */
+export function getPermissionSetForRole(role: UserRole): ReadonlySet<Permission> {
+  return RolePermissionSets[role] || EMPTY_PERMISSION_SET;
+}
+
 /**
  * Helper function to check if a role has a specific permission
  */
 export function roleHasPermission(role: UserRole, permission: Permission): boolean {
-  const rolePermissions = RolePermissionMapping[role];
-  return rolePermissions.includes(permission);
+  return getPermissionSetForRole(role).has(permission);
 }
 
 /**
@@ -641,14 +662,14 @@ export function getPermissionsForRole(role: UserRole): Permission[] {
  * Helper function to check if a role has any of the specified permissions
  */
 export function roleHasAnyPermission(role: UserRole, permissions: Permission[]): boolean {
-  const rolePermissions = RolePermissionMapping[role];
-  return permissions.some(permission => rolePermissions.includes(permission));
+  const rolePermissions = getPermissionSetForRole(role);
+  return permissions.some(permission => rolePermissions.has(permission));
 }
 
 /**
  * Helper function to check if a role has all of the specified permissions
  */
 export function roleHasAllPermissions(role: UserRole, permissions: Permission[]): boolean {
-  const rolePermissions = RolePermissionMapping[role];
-  return permissions.every(permission => rolePermissions.includes(permission));
+  const rolePermissions = getPermissionSetForRole(role);
+  return permissions.every(permission => rolePermissions.has(permission));
 }
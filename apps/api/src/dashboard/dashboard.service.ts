@@ -1,138 +1,28 @@
 import { Injectable, Logger } from '@nestjs/common';
 import { CustomPrismaService } from '../prisma/custom-prisma.service';
+import { StatsCacheService } from '../cache/stats-cache.service';
 
 @Injectable()
 export class DashboardService {
   private readonly logger = new Logger(DashboardService.name);
 
-  constructor(private readonly prisma: CustomPrismaService) {}
+  constructor(
+    private readonly prisma: CustomPrismaService,
+    private readonly statsCache: StatsCacheService,
+  ) {}
 
   async getStats(tenantId: string, user: any) {
     try {
-      // Get counts based on user role
-      const isPatient = user.role === 'PATIENT';
-      
-      if (isPatient) {
-        // Patient-specific stats
-        const [appointments, bills, records, prescriptions] = await Promise.all([
-          this.prisma.appointment.count({
-            where: {
-              tenantId,
-              patient: { email: user.email },
-            },
-          }),
-          this.prisma.invoice.count({
-            where: {
-              tenantId,
-              patient: { email: user.email },
-              status: 'PENDING',
-            },
-          }),
-          this.prisma.medicalRecord.count({
-            where: {
-              tenantId,
-              patient: { email: user.email },
-            },
-          }),
-          this.prisma.prescription.count({
-            where: {
-              tenantId,
-              patient: { email: user.email },
-            },
-          }),
-        ]);
-
-        return {
-          success: true,
-          data: {
-            myAppointments: appointments,
-            pendingBills: bills,
-            medicalRecords: records,
-            prescriptions: prescriptions,
-          },
-        };
-      } else {
-        // Staff/Admin stats
-        const today = new Date();
-        today.setHours(0, 0, 0, 0);
-        const tomorrow = new Date(today);
-        tomorrow.setDate(tomorrow.getDate() + 1);
-
-        const [
-          totalPatients,
-          todaysAppointments,
-          pendingBills,
-          activeDoctors,
-          totalAppointments,
-          totalRevenue,
-          activeStaff,
-          availableBeds,
-        ] = await Promise.all([
-          this.prisma.patient.count({
-            where: { tenantId, isActive: true },
-          }),
-          this.prisma.appointment.count({
-            where: {
-              tenantId,
-              startTime: {
-                gte: today,
-                lt: tomorrow,
-              },
-            },
-          }),
-          this.prisma.invoice.count({
-            where: {
-              tenantId,
-              status: 'PENDING',
-            },
-          }),
-          this.prisma.user.count({
-            where: {
-              tenantId,
-              role: 'DOCTOR',
-              isActive: true,
-            },
-          }),
-          this.prisma.appointment.count({
-            where: { tenantId },
-          }),
-          this.prisma.payment.aggregate({
-            where: {
-              tenantId,
-              status: 'COMPLETED',
-            },
-            _sum: {
-              amount: true,
-            },
-          }),
-          this.prisma.staff.count({
-            where: {
-              tenantId,
-              isActive: true,
-            },
-          }),
-          this.prisma.bed.count({
-            where: {
-              tenantId,
-              status: 'AVAILABLE',
-            },
-          }),
-        ]);
-
-        return {
-          success: true,
-          data: {
-            totalPatients,
-            todaysAppointments,
-            pendingBills,
-            activeDoctors,
-            totalAppointments,
-            totalRevenue: totalRevenue._sum.amount || 0,
-            activeStaff,
-            availableBeds,
-          },
-        };
-      }
+      return await this.statsCache.wrap(
+        {
+          tenantId,
+          role: user.role,
+          endpoint: 'dashboard/stats',
+          // Patients only see their own records
+          scope: user.role === 'PATIENT' ? user.email : undefined,
+        },
+        () => this.computeStats(tenantId, user),
+      );
     } catch (error) {
       this.logger.error('Error fetching dashboard stats:', error);
       return {
@@ -148,6 +38,133 @@ export class DashboardService {
     }
   }
 
+  private async computeStats(tenantId: string, user: any) {
+    // Get counts based on user role
+    const isPatient = user.role === 'PATIENT';
+    
+    if (isPatient) {
+      // Patient-specific stats
+      const [appointments, bills, records, prescriptions] = await Promise.all([
+        this.prisma.appointment.count({
+          where: {
+            tenantId,
+            patient: { email: user.email },
+          },
+        }),
+        this.prisma.invoice.count({
+          where: {
+            tenantId,
+            patient: { email: user.email },
+            status: 'PENDING',
+          },
+        }),
+        this.prisma.medicalRecord.count({
+          where: {
+            tenantId,
+            patient: { email: user.email },
+          },
+        }),
+        this.prisma.prescription.count({
+          where: {
+            tenantId,
+            patient: { email: user.email },
+          },
+        }),
+      ]);
+
+      return {
+        success: true,
+        data: {
+          myAppointments: appointments,
+          pendingBills: bills,
+          medicalRecords: records,
+          prescriptions: prescriptions,
+        },
+      };
+    } else {
+      // Staff/Admin stats
+      const today = new Date();
+      today.setHours(0, 0, 0, 0);
+      const tomorrow = new Date(today);
+      tomorrow.setDate(tomorrow.getDate() + 1);
+
+      const [
+        totalPatients,
+        todaysAppointments,
+        pendingBills,
+        activeDoctors,
+        totalAppointments,
+        totalRevenue,
+        activeStaff,
+        availableBeds,
+      ] = await Promise.all([
+        this.prisma.patient.count({
+          where: { tenantId, isActive: true },
+        }),
+        this.prisma.appointment.count({
+          where: {
+            tenantId,
+            startTime: {
+              gte: today,
+              lt: tomorrow,
+            },
+          },
+        }),
+        this.prisma.invoice.count({
+          where: {
+            tenantId,
+            status: 'PENDING',
+          },
+        }),
+        this.prisma.user.count({
+          where: {
+            tenantId,
+            role: 'DOCTOR',
+            isActive: true,
+          },
+        }),
+        this.prisma.appointment.count({
+          where: { tenantId },
+        }),
+        this.prisma.payment.aggregate({
+          where: {
+            tenantId,
+            status: 'COMPLETED',
+          },
+          _sum: {
+            amount: true,
+          },
+        }),
+        this.prisma.staff.count({
+          where: {
+            tenantId,
+            isActive: true,
+          },
+        }),
+        this.prisma.bed.count({
+          where: {
+            tenantId,
+            status: 'AVAILABLE',
+          },
+        }),
+      ]);
+
+      return {
+        success: true,
+        data: {
+          totalPatients,
+          todaysAppointments,
+          pendingBills,
+          activeDoctors,
+          totalAppointments,
+          totalRevenue: totalRevenue._sum.amount || 0,
+          activeStaff,
+          availableBeds,
+        },
+      };
+    }
+  }
+
   async getRecentActivities(tenantId: string, user: any) {
     try {
       const activities = await this.prisma.auditLog.findMany({
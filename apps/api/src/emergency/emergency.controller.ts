@@ -9,7 +9,10 @@ import {
   UseGuards,
   HttpCode,
   HttpStatus,
+  Sse,
+  MessageEvent,
 } from '@nestjs/common';
+import { Observable } from 'rxjs';
 import {
   ApiTags,
   ApiOperation,
@@ -108,6 +111,14 @@ export class EmergencyController {
     return this.service.getQueue(tenantId);
   }
 
+  @Sse('queue/stream')
+  @RequirePermissions('emergency.view', 'EMERGENCY_READ', 'VIEW_EMERGENCY')
+  @ApiOperation({ summary: 'Stream the emergency queue (Server-Sent Events: snapshot, upsert, remove, heartbeat)' })
+  @ApiResponse({ status: 200, description: 'text/event-stream of queue events' })
+  streamQueue(@TenantId() tenantId: string): Observable<MessageEvent> {
+    return this.service.streamQueue(tenantId);
+  }
+
   @Get('stats')
   @RequirePermissions('emergency.view', 'EMERGENCY_READ', 'VIEW_REPORTS')
   @ApiOperation({ summary: 'Get emergency statistics' })
@@ -1,20 +1,44 @@
-import { Injectable, NotFoundException, BadRequestException, Logger } from '@nestjs/common';
+import { Injectable, NotFoundException, BadRequestException, Logger, OnModuleInit } from '@nestjs/common';
 import { CustomPrismaService } from '../prisma/custom-prisma.service';
-import { Prisma } from '@prisma/client';
+import { QueueStateService } from '../queues/queue-state.service';
+import { Prisma, TriageLevel } from '@prisma/client';
 import {
   CreateEmergencyCaseDto,
   UpdateEmergencyCaseDto,
   UpdateTriageDto,
   EmergencyFilterDto,
-  EmergencyStatus,
-  TriageLevel,
 } from './dto';
 
+/** Most to least urgent, the order Postgres sorts the enum in */
+const TRIAGE_ORDER: string[] = Object.values(TriageLevel);
+
 @Injectable()
-export class EmergencyService {
+export class EmergencyService implements OnModuleInit {
   private readonly logger = new Logger(EmergencyService.name);
 
-  constructor(private prisma: CustomPrismaService) {}
+  constructor(
+    private prisma: CustomPrismaService,
+    private queues: QueueStateService,
+  ) {}
+
+  onModuleInit() {
+    this.queues.register('emergency', {
+      load: (tenantId) =>
+        this.prisma.emergencyCase.findMany({
+          where: this.getQueueWhereClause(tenantId),
+          include: this.getQueueIncludes(),
+          orderBy: [{ triageLevel: 'asc' }, { arrivalTime: 'asc' }],
+        }),
+      find: (tenantId, id) =>
+        this.prisma.emergencyCase.findFirst({
+          where: { ...this.getQueueWhereClause(tenantId), id },
+          include: this.getQueueIncludes(),
+        }),
+      compare: (a, b) =>
+        TRIAGE_ORDER.indexOf(a.triageLevel) - TRIAGE_ORDER.indexOf(b.triageLevel) ||
+        new Date(a.arrivalTime).getTime() - new Date(b.arrivalTime).getTime(),
+    });
+  }
 
   private getEmergencyCaseIncludes() {
     return {
@@ -40,6 +64,14 @@ export class EmergencyService {
     };
   }
 
+  private getQueueWhereClause(tenantId: string): Prisma.EmergencyCaseWhereInput {
+    return { tenantId, status: { in: ['WAITING', 'IN_TREATMENT'] } };
+  }
+
+  private getQueueIncludes() {
+    return { patient: this.getEmergencyCaseIncludes().patient };
+  }
+
   private buildEmergencyWhereClause(tenantId: string, filters: EmergencyFilterDto) {
     const { status, triageLevel, search } = filters;
     const where: any = { tenantId, isActive: true };
@@ -88,6 +120,7 @@ export class EmergencyService {
       });
 
       this.logger.log(`Successfully created emergency case with ID: ${emergencyCase.id}`);
+      this.queues.touch(tenantId, 'emergency', emergencyCase.id);
       return {
         success: true,
         message: 'Emergency case created successfully',
@@ -189,6 +222,7 @@ export class EmergencyService {
       });
       
       this.logger.log(`Successfully updated emergency case: ${updated.id}`);
+      this.queues.touch(tenantId, 'emergency', updated.id);
       return { 
         success: true, 
         message: 'Emergency case updated successfully', 
@@ -221,6 +255,7 @@ export class EmergencyService {
       });
       
       this.logger.log(`Successfully updated triage level to: ${triageDto.triageLevel}`);
+      this.queues.touch(tenantId, 'emergency', updated.id);
       return { 
         success: true, 
         message: 'Triage level updated successfully', 
@@ -238,11 +273,8 @@ export class EmergencyService {
       this.logger.log(`Getting emergency queue for tenant: ${tenantId}`);
       
       const queue = await this.prisma.emergencyCase.findMany({
-        where: { 
-          tenantId, 
-          status: { in: ['WAITING', 'IN_TREATMENT'] } 
-        },
-        include: this.getEmergencyCaseIncludes(),
+        where: this.getQueueWhereClause(tenantId),
+        include: this.getQueueIncludes(),
         orderBy: [{ triageLevel: 'asc' }, { arrivalTime: 'asc' }],
         take: 50, // Limit for performance
       });
@@ -256,30 +288,28 @@ export class EmergencyService {
     }
   }
 
+  /** Live emergency queue: a snapshot followed by changes as cases are written */
+  streamQueue(tenantId: string) {
+    return this.queues.stream(tenantId, 'emergency');
+  }
+
   async getStats(tenantId: string) {
     try {
       this.logger.log(`Getting emergency stats for tenant: ${tenantId}`);
       
-      const [total, waiting, inTreatment, discharged, admitted, criticalCases] = await Promise.all([
-        this.prisma.emergencyCase.count({ where: { tenantId, isActive: true } }),
-        this.prisma.emergencyCase.count({ where: { tenantId, status: EmergencyStatus.WAITING } }),
-        this.prisma.emergencyCase.count({ where: { tenantId, status: EmergencyStatus.IN_TREATMENT } }),
-        this.prisma.emergencyCase.count({ where: { tenantId, status: EmergencyStatus.DISCHARGED } }),
-        this.prisma.emergencyCase.count({ where: { tenantId, status: EmergencyStatus.ADMITTED } }),
-        this.prisma.emergencyCase.count({ where: { tenantId, triageLevel: TriageLevel.CRITICAL } }),
-      ]);
+      const data = await this.prisma.countBuckets('EmergencyCase', tenantId, {
+        total: Prisma.sql`"isActive" = true`,
+        waiting: Prisma.sql`status = 'WAITING'`,
+        inTreatment: Prisma.sql`status = 'IN_TREATMENT'`,
+        discharged: Prisma.sql`status = 'DISCHARGED'`,
+        admitted: Prisma.sql`status = 'ADMITTED'`,
+        criticalCases: Prisma.sql`"triageLevel" = 'CRITICAL'`,
+      });
       
       this.logger.log(`Successfully retrieved emergency stats for tenant: ${tenantId}`);
       return {
         success: true,
-        data: { 
-          total, 
-          waiting, 
-          inTreatment, 
-          discharged, 
-          admitted, 
-          criticalCases 
-        },
+        data,
       };
     } catch (error) {
       this.logger.error('Error getting emergency stats:', error.message, error.stack);
@@ -0,0 +1,31 @@
+import { IsOptional, IsString, IsIn, IsDateString } from 'class-validator';
+import { ApiPropertyOptional } from '@nestjs/swagger';
+import { EXPORT_FORMATS, ExportFormat } from '../../shared/export/stream-export';
+
+export class ExportQueryDto {
+  @ApiPropertyOptional({ enum: EXPORT_FORMATS, default: 'csv' })
+  @IsOptional()
+  @IsIn(EXPORT_FORMATS)
+  format?: ExportFormat;
+
+  @ApiPropertyOptional({
+    example: '2026-01-01',
+    description: 'Inclusive lower bound on the export date (patient registration, appointment start, invoice creation or lab order date)',
+  })
+  @IsOptional()
+  @IsDateString()
+  from?: string;
+
+  @ApiPropertyOptional({
+    example: '2026-12-31',
+    description: 'Inclusive upper bound on the export date; a date without a time includes that whole day (UTC)',
+  })
+  @IsOptional()
+  @IsDateString()
+  to?: string;
+
+  @ApiPropertyOptional({ description: 'Status filter; for patients, active or inactive' })
+  @IsOptional()
+  @IsString()
+  status?: string;
+}
@@ -0,0 +1 @@
+export * from './export-query.dto';
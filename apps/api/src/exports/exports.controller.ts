@@ -0,0 +1,54 @@
+import { Controller, Get, Query, Res, UseGuards } from '@nestjs/common';
+import { ApiTags, ApiOperation, ApiResponse, ApiBearerAuth } from '@nestjs/swagger';
+import { Response } from 'express';
+import { ExportsService, ExportStream } from './exports.service';
+import { ExportQueryDto } from './dto';
+import { JwtAuthGuard } from '../auth/jwt-auth.guard';
+import { PermissionsGuard } from '../rbac/guards/permissions.guard';
+import { RequirePermissions } from '../rbac/decorators/require-permissions.decorator';
+import { TenantId } from '../shared/decorators/tenant-id.decorator';
+import { parseExportFormat, writeExport } from '../shared/export/stream-export';
+
+@ApiTags('Exports')
+@ApiBearerAuth()
+@Controller('exports')
+@UseGuards(JwtAuthGuard, PermissionsGuard)
+export class ExportsController {
+  constructor(private readonly exportsService: ExportsService) {}
+
+  @Get('patients')
+  @RequirePermissions('EXPORT_PATIENTS', 'EXPORT_DATA')
+  @ApiOperation({ summary: 'Stream patients as CSV or NDJSON' })
+  @ApiResponse({ status: 200, description: 'Patients streamed' })
+  async exportPatients(@TenantId() tenantId: string, @Query() query: ExportQueryDto, @Res() res: Response) {
+    await this.send(res, query, this.exportsService.patients(tenantId, query));
+  }
+
+  @Get('appointments')
+  @RequirePermissions('EXPORT_DATA', 'EXPORT_REPORTS')
+  @ApiOperation({ summary: 'Stream appointments as CSV or NDJSON' })
+  @ApiResponse({ status: 200, description: 'Appointments streamed' })
+  async exportAppointments(@TenantId() tenantId: string, @Query() query: ExportQueryDto, @Res() res: Response) {
+    await this.send(res, query, this.exportsService.appointments(tenantId, query));
+  }
+
+  @Get('invoices')
+  @RequirePermissions('EXPORT_DATA', 'EXPORT_REPORTS')
+  @ApiOperation({ summary: 'Stream invoices as CSV or NDJSON' })
+  @ApiResponse({ status: 200, description: 'Invoices streamed' })
+  async exportInvoices(@TenantId() tenantId: string, @Query() query: ExportQueryDto, @Res() res: Response) {
+    await this.send(res, query, this.exportsService.invoices(tenantId, query));
+  }
+
+  @Get('lab-orders')
+  @RequirePermissions('EXPORT_DATA', 'EXPORT_REPORTS')
+  @ApiOperation({ summary: 'Stream lab orders as CSV or NDJSON' })
+  @ApiResponse({ status: 200, description: 'Lab orders streamed' })
+  async exportLabOrders(@TenantId() tenantId: string, @Query() query: ExportQueryDto, @Res() res: Response) {
+    await this.send(res, query, this.exportsService.labOrders(tenantId, query));
+  }
+
+  private send(res: Response, query: ExportQueryDto, source: ExportStream): Promise<void> {
+    return writeExport(res, { format: parseExportFormat(query.format), ...source });
+  }
+}
@@ -0,0 +1,246 @@
+import { Injectable, BadRequestException } from '@nestjs/common';
+import { AppointmentStatus, InvoiceStatus, LabOrderStatus } from '@prisma/client';
+import { CustomPrismaService } from '../prisma/custom-prisma.service';
+import { ExportColumn, keysetBatches } from '../shared/export/stream-export';
+import { ExportQueryDto } from './dto';
+
+type ExportRow = Record<string, unknown>;
+
+export interface ExportStream {
+  filename: string;
+  columns: ExportColumn<ExportRow>[];
+  rows: AsyncIterable<ExportRow>;
+}
+
+function columnsOf(...keys: string[]): ExportColumn<ExportRow>[] {
+  return keys.map((key) => ({ header: key, value: (row: ExportRow) => row[key] }));
+}
+
+function fullName(person?: { firstName: string; lastName: string } | null): string | null {
+  return person ? `${person.firstName} ${person.lastName}` : null;
+}
+
+const PATIENT_COLUMNS = columnsOf(
+  'id', 'medicalRecordNumber', 'firstName', 'middleName', 'lastName', 'gender', 'dateOfBirth',
+  'bloodType', 'phone', 'email', 'city', 'state', 'country', 'isActive', 'createdAt',
+);
+
+const APPOINTMENT_COLUMNS = columnsOf(
+  'id', 'startTime', 'endTime', 'status', 'reason', 'patientId', 'medicalRecordNumber',
+  'patientName', 'doctorName', 'department',
+);
+
+const INVOICE_COLUMNS = columnsOf(
+  'id', 'invoiceNumber', 'date', 'dueDate', 'status', 'totalAmount', 'patientId',
+  'medicalRecordNumber', 'patientName',
+);
+
+const LAB_ORDER_COLUMNS = columnsOf(
+  'id', 'orderNumber', 'orderDate', 'completedDate', 'status', 'patientId', 'medicalRecordNumber',
+  'patientName', 'doctorName', 'testCount',
+);
+
+/** Patients have no status column; the filter maps onto isActive */
+const PATIENT_STATUSES = { ACTIVE: 'active', INACTIVE: 'inactive' };
+
+const DAY_MS = 24 * 60 * 60 * 1000;
+
+const DATE_ONLY = /^\d{4}-\d{2}-\d{2}$/;
+
+const PATIENT_REF = { select: { medicalRecordNumber: true, firstName: true, lastName: true } };
+const DOCTOR_REF = { select: { firstName: true, lastName: true } };
+
+/**
+ * Server-side exports of patients and clinical data.
+ *
+ * Each export reads its table in keyset batches over the same (tenantId,
+ * date, id) index the list endpoints page on, selecting only the exported
+ * fields, and flattens rows one at a time as they are consumed. Nothing is
+ * collected in memory, so the controller can stream any size of export.
+ */
+@Injectable()
+export class ExportsService {
+  constructor(private readonly prisma: CustomPrismaService) {}
+
+  patients(tenantId: string, query: ExportQueryDto): ExportStream {
+    const { status } = this.statusFilter(query.status, PATIENT_STATUSES);
+    const where = {
+      tenantId,
+      isActive: status !== PATIENT_STATUSES.INACTIVE,
+      ...this.dateRange('createdAt', query),
+    };
+    const rows = this.batches(this.prisma.patient, where, 'createdAt', {
+      medicalRecordNumber: true,
+      firstName: true,
+      middleName: true,
+      lastName: true,
+      gender: true,
+      dateOfBirth: true,
+      bloodType: true,
+      phone: true,
+      email: true,
+      city: true,
+      state: true,
+      country: true,
+      isActive: true,
+    });
+    return { filename: 'patients', columns: PATIENT_COLUMNS, rows };
+  }
+
+  appointments(tenantId: string, query: ExportQueryDto): ExportStream {
+    const where = {
+      tenantId,
+      ...this.statusFilter(query.status, AppointmentStatus),
+      ...this.dateRange('startTime', query),
+    };
+    const rows = this.batches(this.prisma.appointment, where, 'startTime', {
+      endTime: true,
+      status: true,
+      reason: true,
+      patientId: true,
+      patient: PATIENT_REF,
+      doctor: DOCTOR_REF,
+      department: { select: { name: true } },
+    });
+    return {
+      filename: 'appointments',
+      columns: APPOINTMENT_COLUMNS,
+      rows: this.map(rows, (row) => ({
+        id: row.id,
+        startTime: row.startTime,
+        endTime: row.endTime,
+        status: row.status,
+        reason: row.reason,
+        patientId: row.patientId,
+        medicalRecordNumber: row.patient?.medicalRecordNumber,
+        patientName: fullName(row.patient),
+        doctorName: fullName(row.doctor),
+        department: row.department?.name ?? null,
+      })),
+    };
+  }
+
+  invoices(tenantId: string, query: ExportQueryDto): ExportStream {
+    const where = {
+      tenantId,
+      ...this.statusFilter(query.status, InvoiceStatus),
+      ...this.dateRange('createdAt', query),
+    };
+    const rows = this.batches(this.prisma.invoice, where, 'createdAt', {
+      invoiceNumber: true,
+      date: true,
+      dueDate: true,
+      status: true,
+      totalAmount: true,
+      patientId: true,
+      patient: PATIENT_REF,
+    });
+    return {
+      filename: 'invoices',
+      columns: INVOICE_COLUMNS,
+      rows: this.map(rows, (row) => ({
+        id: row.id,
+        invoiceNumber: row.invoiceNumber,
+        date: row.date,
+        dueDate: row.dueDate,
+        status: row.status,
+        totalAmount: row.totalAmount,
+        patientId: row.patientId,
+        medicalRecordNumber: row.patient?.medicalRecordNumber,
+        patientName: fullName(row.patient),
+      })),
+    };
+  }
+
+  labOrders(tenantId: string, query: ExportQueryDto): ExportStream {
+    const where = {
+      tenantId,
+      ...this.statusFilter(query.status, LabOrderStatus),
+      ...this.dateRange('orderDate', query),
+    };
+    const rows = this.batches(this.prisma.labOrder, where, 'orderDate', {
+      orderNumber: true,
+      completedDate: true,
+      status: true,
+      patientId: true,
+      patient: PATIENT_REF,
+      doctor: DOCTOR_REF,
+      _count: { select: { tests: true } },
+    });
+    return {
+      filename: 'lab-orders',
+      columns: LAB_ORDER_COLUMNS,
+      rows: this.map(rows, (row) => ({
+        id: row.id,
+        orderNumber: row.orderNumber,
+        orderDate: row.orderDate,
+        completedDate: row.completedDate,
+        status: row.status,
+        patientId: row.patientId,
+        medicalRecordNumber: row.patient?.medicalRecordNumber,
+        patientName: fullName(row.patient),
+        doctorName: fullName(row.doctor),
+        testCount: row._count.tests,
+      })),
+    };
+  }
+
+  private statusFilter(status: string | undefined, allowed: Record<string, string>) {
+    if (!status) {
+      return {};
+    }
+    if (!Object.values(allowed).includes(status)) {
+      throw new BadRequestException(`status must be one of: ${Object.values(allowed).join(', ')}`);
+    }
+    return { status };
+  }
+
+  private dateRange(field: string, { from, to }: ExportQueryDto) {
+    if (!from && !to) {
+      return {};
+    }
+    return {
+      [field]: {
+        ...(from ? { gte: new Date(from) } : {}),
+        // A date-only `to` covers that whole day
+        ...(to
+          ? DATE_ONLY.test(to)
+            ? { lt: new Date(new Date(to).getTime() + DAY_MS) }
+            : { lte: new Date(to) }
+          : {}),
+      },
+    };
+  }
+
+  /** All rows matching where, ascending by (field, id), read EXPORT_BATCH_SIZE at a time */
+  private batches(delegate: any, where: any, field: string, select: any): AsyncGenerator<any> {
+    return keysetBatches(
+      (after: { value: Date; id: string } | undefined, take) =>
+        delegate.findMany({
+          where: after
+            ? {
+                AND: [
+                  where,
+                  {
+                    OR: [
+                      { [field]: { gt: after.value } },
+                      { [field]: after.value, id: { gt: after.id } },
+                    ],
+                  },
+                ],
+              }
+            : where,
+          select: { ...select, id: true, [field]: true },
+          orderBy: [{ [field]: 'asc' }, { id: 'asc' }],
+          take,
+        }),
+      (row: any) => ({ value: row[field], id: row.id }),
+    );
+  }
+
+  private async *map(rows: AsyncIterable<any>, transform: (row: any) => ExportRow): AsyncGenerator<ExportRow> {
+    for await (const row of rows) {
+      yield transform(row);
+    }
+  }
+}
@@ -9,18 +9,22 @@ import {
   UseGuards,
   HttpCode,
   HttpStatus,
+  Res,
 } from '@nestjs/common';
+import { Response } from 'express';
 import {
   ApiTags,
   ApiOperation,
   ApiResponse,
   ApiBearerAuth,
+  ApiQuery,
 } from '@nestjs/swagger';
-import { FinanceService } from './finance.service';
+import { FinanceService, OUTSTANDING_EXPORT_COLUMNS } from './finance.service';
 import { JwtAuthGuard } from '../auth/jwt-auth.guard';
 import { PermissionsGuard } from '../rbac/guards/permissions.guard';
 import { RequirePermissions } from '../rbac/decorators/require-permissions.decorator';
 import { TenantId } from '../shared/decorators/tenant-id.decorator';
+import { parseExportFormat, writeExport } from '../shared/export/stream-export';
 
 @ApiTags('Finance')
 @ApiBearerAuth()
@@ -87,8 +91,28 @@ export class FinanceController {
   @RequirePermissions('finance.view', 'FINANCE_READ', 'VIEW_REPORTS')
   @ApiOperation({ summary: 'Get outstanding payments report' })
   @ApiResponse({ status: 200, description: 'Outstanding report retrieved successfully' })
-  getOutstandingReport(@TenantId() tenantId: string) {
-    return this.financeService.getOutstandingReport(tenantId);
+  @ApiQuery({ name: 'limit', required: false, description: 'Page size (max 1000); enables paging' })
+  @ApiQuery({ name: 'cursor', required: false, description: 'nextCursor from the previous page' })
+  getOutstandingReport(@TenantId() tenantId: string, @Query() query: any) {
+    return this.financeService.getOutstandingReport(tenantId, query);
+  }
+
+  @Get('reports/outstanding/export')
+  @RequirePermissions('finance.view', 'FINANCE_READ', 'VIEW_REPORTS')
+  @ApiOperation({ summary: 'Stream the outstanding payments report as CSV or NDJSON' })
+  @ApiQuery({ name: 'format', required: false, enum: ['csv', 'ndjson'] })
+  @ApiResponse({ status: 200, description: 'Outstanding invoices streamed' })
+  async exportOutstandingReport(
+    @TenantId() tenantId: string,
+    @Query('format') format: string,
+    @Res() res: Response,
+  ) {
+    await writeExport(res, {
+      format: parseExportFormat(format),
+      filename: 'outstanding-invoices',
+      columns: OUTSTANDING_EXPORT_COLUMNS,
+      rows: this.financeService.exportOutstandingInvoices(tenantId),
+    });
   }
 
   @Get('stats')
@@ -1,9 +1,74 @@
 import { Injectable, NotFoundException } from '@nestjs/common';
+import { Prisma } from '@prisma/client';
 import { PrismaService } from '../prisma/prisma.service';
+import { encodeCursor, decodeCursor } from '../shared/pagination/keyset-pagination';
+import { ExportColumn, keysetBatches } from '../shared/export/stream-export';
+import { DailyRollupService, RollupPeriod, RollupTotal } from '../rollups/daily-rollup.service';
+
+const REVENUE_PERIODS: RollupPeriod[] = ['day', 'month', 'year'];
+const OUTSTANDING_STATUSES = ['PENDING', 'PARTIALLY_PAID'];
+
+interface OutstandingRow {
+  invoiceId: string;
+  invoiceNumber: string;
+  patientId: string;
+  firstName: string;
+  lastName: string;
+  totalAmount: number;
+  paidAmount: number;
+  dueDate: Date;
+}
+
+export interface OutstandingInvoice {
+  invoiceId: string;
+  invoiceNumber: string;
+  patient: { id: string; name: string };
+  totalAmount: number;
+  paidAmount: number;
+  outstanding: number;
+  dueDate: Date;
+  overdue: boolean;
+}
+
+export const OUTSTANDING_EXPORT_COLUMNS: ExportColumn<OutstandingInvoice>[] = [
+  { header: 'invoiceNumber', value: (row) => row.invoiceNumber },
+  { header: 'patientId', value: (row) => row.patient.id },
+  { header: 'patientName', value: (row) => row.patient.name },
+  { header: 'totalAmount', value: (row) => row.totalAmount },
+  { header: 'paidAmount', value: (row) => row.paidAmount },
+  { header: 'outstanding', value: (row) => row.outstanding },
+  { header: 'dueDate', value: (row) => row.dueDate },
+  { header: 'overdue', value: (row) => row.overdue },
+];
+
+function toOutstandingInvoice(row: OutstandingRow, now: Date): OutstandingInvoice {
+  return {
+    invoiceId: row.invoiceId,
+    invoiceNumber: row.invoiceNumber,
+    patient: {
+      id: row.patientId,
+      name: `${row.firstName} ${row.lastName}`,
+    },
+    totalAmount: row.totalAmount,
+    paidAmount: row.paidAmount,
+    outstanding: row.totalAmount - row.paidAmount,
+    dueDate: row.dueDate,
+    overdue: now > row.dueDate,
+  };
+}
+
+function sumRollups(rows: RollupTotal[], field: 'count' | 'amount', dimensions?: string[]): number {
+  return rows
+    .filter((row) => !dimensions || dimensions.includes(row.dimension))
+    .reduce((sum, row) => sum + row[field], 0);
+}
 
 @Injectable()
 export class FinanceService {
-  constructor(private prisma: PrismaService) {}
+  constructor(
+    private prisma: PrismaService,
+    private rollups: DailyRollupService,
+  ) {}
 
   async findAllInvoices(tenantId: string, query: any) {
     const {
@@ -113,6 +178,9 @@ export class FinanceService {
       data: { status: newStatus },
     });
 
+    await this.rollups.touch(tenantId, 'payments', payment.paymentDate);
+    await this.rollups.touch(tenantId, 'invoices', invoice.date);
+
     return {
       success: true,
       message: 'Payment recorded successfully',
@@ -192,45 +260,22 @@ export class FinanceService {
 
   async getRevenueReport(tenantId: string, query: any) {
     const { startDate, endDate, groupBy = 'day' } = query;
+    const period = REVENUE_PERIODS.includes(groupBy) ? groupBy : 'day';
 
-    const where: any = { tenantId, status: 'COMPLETED' };
-    if (startDate || endDate) {
-      where.paymentDate = {};
-      if (startDate) where.paymentDate.gte = new Date(startDate);
-      if (endDate) where.paymentDate.lte = new Date(endDate);
-    }
-
-    const payments = await this.prisma.payment.findMany({
-      where,
-      select: {
-        amount: true,
-        paymentDate: true,
-        paymentMethod: true,
-      },
-      orderBy: { paymentDate: 'asc' },
+    // Read from the daily payment rollups: one row per (period, method)
+    const rows = await this.rollups.buckets(tenantId, 'payments', period, {
+      from: startDate,
+      to: endDate,
     });
 
-    // Group by date/month/year
-    const grouped = payments.reduce((acc: any, payment) => {
-      const date = new Date(payment.paymentDate);
-      let key: string;
-
-      if (groupBy === 'month') {
-        key = `${date.getFullYear()}-${String(date.getMonth() + 1).padStart(2, '0')}`;
-      } else if (groupBy === 'year') {
-        key = `${date.getFullYear()}`;
-      } else {
-        key = date.toISOString().split('T')[0];
-      }
-
-      if (!acc[key]) {
-        acc[key] = { total: 0, count: 0, methods: {} };
+    const grouped = rows.reduce((acc: any, row) => {
+      if (!acc[row.period]) {
+        acc[row.period] = { total: 0, count: 0, methods: {} };
       }
 
-      acc[key].total += payment.amount;
-      acc[key].count += 1;
-      acc[key].methods[payment.paymentMethod] =
-        (acc[key].methods[payment.paymentMethod] || 0) + payment.amount;
+      acc[row.period].total += row.amount;
+      acc[row.period].count += row.count;
+      acc[row.period].methods[row.dimension] = row.amount;
 
       return acc;
     }, {});
@@ -241,118 +286,117 @@ export class FinanceService {
     };
   }
 
-  async getOutstandingReport(tenantId: string) {
-    const outstandingInvoices = await this.prisma.invoice.findMany({
-      where: {
-        tenantId,
-        status: { in: ['PENDING', 'PARTIALLY_PAID'] },
-      },
-      include: {
-        patient: true,
-        payments: {
-          where: { status: 'COMPLETED' },
-        },
-      },
-    });
-
-    const report = outstandingInvoices.map((invoice) => {
-      const paidAmount = invoice.payments.reduce((sum, p) => sum + p.amount, 0);
-      const outstanding = invoice.totalAmount - paidAmount;
-
-      return {
-        invoiceId: invoice.id,
-        invoiceNumber: invoice.invoiceNumber,
-        patient: {
-          id: invoice.patient.id,
-          name: `${invoice.patient.firstName} ${invoice.patient.lastName}`,
-        },
-        totalAmount: invoice.totalAmount,
-        paidAmount,
-        outstanding,
-        dueDate: invoice.dueDate,
-        overdue: new Date() > new Date(invoice.dueDate),
-      };
-    });
+  /**
+   * Invoices still owed (PENDING/PARTIALLY_PAID), oldest due date first.
+   *
+   * Balances are computed in SQL. Without cursor/limit the whole list is
+   * returned as before; with them it is paged by (dueDate, id) and meta
+   * carries nextCursor/hasMore. Use exportOutstandingInvoices() for exports.
+   */
+  async getOutstandingReport(tenantId: string, query: any = {}) {
+    const paged = query.cursor !== undefined || query.limit !== undefined;
+    const limit = Math.min(Math.max(Number(query.limit) || 100, 1), 1000);
+    const after = query.cursor ? decodeCursor(query.cursor) : undefined;
+
+    const [rows, summary] = await Promise.all([
+      this.outstandingRows(tenantId, after, paged ? limit + 1 : undefined),
+      this.outstandingSummary(tenantId),
+    ]);
 
-    const totalOutstanding = report.reduce((sum, r) => sum + r.outstanding, 0);
+    const hasMore = paged && rows.length > limit;
+    const page = hasMore ? rows.slice(0, limit) : rows;
+    const last = page[page.length - 1];
+    const now = new Date();
 
     return {
       success: true,
       data: {
-        invoices: report,
-        summary: {
-          totalInvoices: report.length,
-          totalOutstanding,
-        },
+        invoices: page.map((row) => toOutstandingInvoice(row, now)),
+        summary,
+        ...(paged
+          ? { meta: { limit, hasMore, nextCursor: hasMore ? encodeCursor(last.dueDate, last.invoiceId) : null } }
+          : {}),
       },
     };
   }
 
+  /** Every outstanding invoice, read from the database in keyset batches */
+  async *exportOutstandingInvoices(tenantId: string): AsyncGenerator<OutstandingInvoice> {
+    const now = new Date();
+    const rows = keysetBatches(
+      (after: { value: Date; id: string } | undefined, take) => this.outstandingRows(tenantId, after, take),
+      (row) => ({ value: row.dueDate, id: row.invoiceId }),
+    );
+    for await (const row of rows) {
+      yield toOutstandingInvoice(row, now);
+    }
+  }
+
+  private outstandingRows(
+    tenantId: string,
+    after?: { value: Date; id: string },
+    limit?: number,
+  ): Promise<OutstandingRow[]> {
+    return this.prisma.$queryRaw<OutstandingRow[]>`
+      SELECT i."id" AS "invoiceId", i."invoiceNumber", i."patientId",
+             p."firstName", p."lastName", i."totalAmount", i."dueDate",
+             COALESCE(paid."amount", 0)::float8 AS "paidAmount"
+      FROM "Invoice" i
+      JOIN "patients" p ON p."id" = i."patientId"
+      LEFT JOIN LATERAL (
+        SELECT SUM(pay."amount") AS "amount"
+        FROM "Payment" pay
+        WHERE pay."invoiceId" = i."id" AND pay."status" = 'COMPLETED'
+      ) paid ON TRUE
+      WHERE i."tenantId" = ${tenantId}
+        AND i."status" IN ('PENDING', 'PARTIALLY_PAID')
+        ${after ? Prisma.sql`AND (i."dueDate", i."id") > (${after.value}, ${after.id})` : Prisma.empty}
+      ORDER BY i."dueDate", i."id"
+      ${limit ? Prisma.sql`LIMIT ${limit}` : Prisma.empty}
+    `;
+  }
+
+  private async outstandingSummary(tenantId: string) {
+    const [summary] = await this.prisma.$queryRaw<
+      { totalInvoices: number; totalOutstanding: number; overdueInvoices: number }[]
+    >`
+      SELECT COUNT(*)::int AS "totalInvoices",
+             COALESCE(SUM(i."totalAmount" - COALESCE(paid."amount", 0)), 0)::float8 AS "totalOutstanding",
+             (COUNT(*) FILTER (WHERE i."dueDate" < NOW()))::int AS "overdueInvoices"
+      FROM "Invoice" i
+      LEFT JOIN LATERAL (
+        SELECT SUM(pay."amount") AS "amount"
+        FROM "Payment" pay
+        WHERE pay."invoiceId" = i."id" AND pay."status" = 'COMPLETED'
+      ) paid ON TRUE
+      WHERE i."tenantId" = ${tenantId}
+        AND i."status" IN ('PENDING', 'PARTIALLY_PAID')
+    `;
+    return summary;
+  }
+
   async getStats(tenantId: string, query: any) {
     const { startDate, endDate } = query;
+    const range = { from: startDate, to: endDate };
 
-    const dateFilter: any = {};
-    if (startDate || endDate) {
-      if (startDate) dateFilter.gte = new Date(startDate);
-      if (endDate) dateFilter.lte = new Date(endDate);
-    }
-
-    const [
-      totalInvoices,
-      paidInvoices,
-      pendingInvoices,
-      totalRevenue,
-      outstandingAmount,
-    ] = await Promise.all([
-      this.prisma.invoice.count({
-        where: {
-          tenantId,
-          ...(Object.keys(dateFilter).length > 0 ? { date: dateFilter } : {}),
-        },
-      }),
-      this.prisma.invoice.count({
-        where: {
-          tenantId,
-          status: 'PAID',
-          ...(Object.keys(dateFilter).length > 0 ? { date: dateFilter } : {}),
-        },
-      }),
-      this.prisma.invoice.count({
-        where: {
-          tenantId,
-          status: { in: ['PENDING', 'PARTIALLY_PAID'] },
-        },
-      }),
-      this.prisma.payment.aggregate({
-        where: {
-          tenantId,
-          status: 'COMPLETED',
-          ...(Object.keys(dateFilter).length > 0
-            ? { paymentDate: dateFilter }
-            : {}),
-        },
-        _sum: { amount: true },
-      }),
-      this.prisma.invoice.aggregate({
-        where: {
-          tenantId,
-          status: { in: ['PENDING', 'PARTIALLY_PAID'] },
-        },
-        _sum: { totalAmount: true },
-      }),
+    // Pending/outstanding figures are current state, so they span all days
+    const [invoicesInRange, allInvoices, payments] = await Promise.all([
+      this.rollups.totals(tenantId, 'invoices', range),
+      this.rollups.totals(tenantId, 'invoices'),
+      this.rollups.totals(tenantId, 'payments', range),
     ]);
 
     return {
       success: true,
       data: {
         invoices: {
-          total: totalInvoices,
-          paid: paidInvoices,
-          pending: pendingInvoices,
+          total: sumRollups(invoicesInRange, 'count'),
+          paid: sumRollups(invoicesInRange, 'count', ['PAID']),
+          pending: sumRollups(allInvoices, 'count', OUTSTANDING_STATUSES),
         },
         revenue: {
-          total: totalRevenue._sum.amount || 0,
-          outstanding: outstandingAmount._sum.totalAmount || 0,
+          total: sumRollups(payments, 'amount'),
+          outstanding: sumRollups(allInvoices, 'amount', OUTSTANDING_STATUSES),
         },
       },
     };
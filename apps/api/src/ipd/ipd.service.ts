@@ -1,6 +1,9 @@
 import { Injectable, NotFoundException, BadRequestException, Logger } from '@nestjs/common';
 import { CustomPrismaService } from '../prisma/custom-prisma.service';
-import { Prisma } from '@prisma/client';
+import { StatsCacheService } from '../cache/stats-cache.service';
+import { DailyRollupService } from '../rollups/daily-rollup.service';
+import { Prisma, AppointmentKind } from '@prisma/client';
+import { SLOT_UNAVAILABLE, isSlotConflict } from '../appointments/appointment-slots.service';
 import {
   CreateWardDto,
   UpdateWardDto,
@@ -21,7 +24,11 @@ import {
 export class IpdService {
   private readonly logger = new Logger(IpdService.name);
 
-  constructor(private prisma: CustomPrismaService) {}
+  constructor(
+    private prisma: CustomPrismaService,
+    private statsCache: StatsCacheService,
+    private rollups: DailyRollupService,
+  ) {}
 
   // ==================== Helper Methods ====================
 
@@ -139,6 +146,7 @@ export class IpdService {
       });
 
       this.logger.log(`Successfully created ward with ID: ${ward.id}`);
+      await this.statsCache.invalidateTenant(tenantId);
       return { 
         success: true, 
         message: 'Ward created successfully', 
@@ -246,6 +254,7 @@ export class IpdService {
       });
 
       this.logger.log(`Successfully updated ward: ${updated.name}`);
+      await this.statsCache.invalidateTenant(tenantId);
       return {
         success: true,
         message: 'Ward updated successfully',
@@ -290,6 +299,7 @@ export class IpdService {
       });
 
       this.logger.log(`Successfully created bed with ID: ${bed.id}`);
+      await this.statsCache.invalidateTenant(tenantId);
       return { 
         success: true, 
         message: 'Bed created successfully', 
@@ -400,6 +410,7 @@ export class IpdService {
       });
 
       this.logger.log(`Successfully updated bed ${bed.bedNumber} status to ${updateBedStatusDto.status}`);
+      await this.statsCache.invalidateTenant(tenantId);
       return { 
         success: true, 
         message: 'Bed status updated successfully', 
@@ -512,6 +523,8 @@ export class IpdService {
           startTime: new Date(),
           endTime: createDto.expectedDischargeDate ? new Date(createDto.expectedDischargeDate) : null,
           status: 'SCHEDULED' as any, // IPD admission - using appointment status
+          // Admissions span days and are exempt from the doctor overlap constraint
+          kind: AppointmentKind.ADMISSION,
           reason: createDto.diagnosis,
           notes: createDto.notes,
           tenantId,
@@ -530,6 +543,8 @@ export class IpdService {
       });
 
       this.logger.log(`Successfully created admission with ID: ${admission.id}`);
+      await this.rollups.touch(tenantId, 'appointments', admission.startTime);
+      await this.statsCache.invalidateTenant(tenantId);
       return {
         success: true,
         message: 'Admission created successfully',
@@ -539,6 +554,9 @@ export class IpdService {
       if (error instanceof NotFoundException || error instanceof BadRequestException) {
         throw error;
       }
+      if (isSlotConflict(error)) {
+        throw new BadRequestException(SLOT_UNAVAILABLE);
+      }
       this.logger.error('Error creating admission:', error.message, error.stack);
       throw new BadRequestException('Failed to create admission');
     }
@@ -656,6 +674,8 @@ export class IpdService {
         },
       });
 
+      await this.rollups.touch(tenantId, 'appointments', updated.startTime);
+      await this.statsCache.invalidateTenant(tenantId);
       return {
         success: true,
         message: 'Admission updated successfully',
@@ -663,6 +683,7 @@ export class IpdService {
       };
     } catch (error) {
       if (error instanceof NotFoundException) throw error;
+      if (isSlotConflict(error)) throw new BadRequestException(SLOT_UNAVAILABLE);
       this.logger.error('Error updating admission:', error.message, error.stack);
       throw new BadRequestException('Failed to update admission');
     }
@@ -707,6 +728,8 @@ export class IpdService {
         });
       }
 
+      await this.rollups.touch(tenantId, 'appointments', discharged.startTime);
+      await this.statsCache.invalidateTenant(tenantId);
       return {
         success: true,
         message: 'Patient discharged successfully',
@@ -749,6 +772,8 @@ export class IpdService {
         });
       }
 
+      await this.rollups.touch(tenantId, 'appointments', admission.startTime);
+      await this.statsCache.invalidateTenant(tenantId);
       return {
         success: true,
         message: 'Admission cancelled successfully',
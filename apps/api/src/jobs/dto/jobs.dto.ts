@@ -0,0 +1,28 @@
+import { IsIn, IsInt, IsOptional, IsString, Max, Min } from 'class-validator';
+import { ApiPropertyOptional } from '@nestjs/swagger';
+import { Type } from 'class-transformer';
+
+export class JobQueryDto {
+  @ApiPropertyOptional({ example: 'notifications' })
+  @IsOptional()
+  @IsString()
+  queue?: string;
+
+  @ApiPropertyOptional({ example: 'notifications.broadcast' })
+  @IsOptional()
+  @IsString()
+  name?: string;
+
+  @ApiPropertyOptional({ enum: ['PENDING', 'RUNNING', 'COMPLETED', 'FAILED'] })
+  @IsOptional()
+  @IsIn(['PENDING', 'RUNNING', 'COMPLETED', 'FAILED'])
+  status?: 'PENDING' | 'RUNNING' | 'COMPLETED' | 'FAILED';
+
+  @ApiPropertyOptional({ default: 20, minimum: 1, maximum: 100 })
+  @IsOptional()
+  @Type(() => Number)
+  @IsInt()
+  @Min(1)
+  @Max(100)
+  limit?: number;
+}
@@ -0,0 +1,365 @@
+import { Injectable, Logger, NotFoundException, BadRequestException, OnModuleDestroy, OnModuleInit } from '@nestjs/common';
+import { ConfigService } from '@nestjs/config';
+import { Job, Prisma } from '@prisma/client';
+import { hostname } from 'os';
+import { CustomPrismaService } from '../prisma/custom-prisma.service';
+import { CronExpression } from '../shared/scheduling/cron';
+
+export type JobStatus = 'PENDING' | 'RUNNING' | 'COMPLETED' | 'FAILED';
+
+export const DEFAULT_QUEUE = 'default';
+
+/** First retry delay; doubles with every further attempt */
+const RETRY_BASE_MS = 30 * 1000;
+const RETRY_MAX_MS = 60 * 60 * 1000;
+
+/** How often stale locks are released and schedules checked, at most */
+const MAINTENANCE_MS = 60 * 1000;
+
+export interface JobContext {
+  jobId: string;
+  tenantId: string | null;
+  attempt: number;
+  maxAttempts: number;
+  /** Whether a failure now is final */
+  lastAttempt: boolean;
+}
+
+/** Runs one job; the resolved value is stored as the job's result */
+export type JobHandler<T = any> = (payload: T, context: JobContext) => Promise<unknown>;
+
+export interface JobHandlerOptions {
+  queue?: string;
+  /** Jobs of the queue one instance runs at once; defaults to JOBS_CONCURRENCY */
+  concurrency?: number;
+  maxAttempts?: number;
+}
+
+export interface EnqueueOptions {
+  tenantId?: string;
+  /** Higher runs first */
+  priority?: number;
+  runAt?: Date;
+  maxAttempts?: number;
+  /** Enqueueing the same key again returns the existing job */
+  uniqueKey?: string;
+}
+
+export interface JobListQuery {
+  queue?: string;
+  name?: string;
+  status?: JobStatus;
+  limit?: number;
+}
+
+interface RegisteredHandler {
+  queue: string;
+  handler: JobHandler;
+  maxAttempts: number;
+}
+
+interface Schedule {
+  name: string;
+  cron: CronExpression;
+  jobName: string;
+  payload: unknown;
+  nextRun: Date;
+}
+
+/**
+ * In-process background jobs backed by the "Job" table, so slow and
+ * periodic work leaves the request path without new infrastructure.
+ *
+ * Every API instance polls each queue it has handlers for every
+ * JOBS_POLL_MS, claiming due jobs (highest priority, then earliest runAt)
+ * with FOR UPDATE SKIP LOCKED so instances never take the same job, up to
+ * the queue's concurrency. A failed job is retried with exponential backoff
+ * until maxAttempts. Running jobs have their lock refreshed on every poll;
+ * a lock older than JOBS_LOCK_TIMEOUT_MS means its instance died, and the
+ * job is released for another attempt.
+ *
+ * Cron schedules enqueue one job per occurrence; the occurrence is the
+ * job's uniqueKey, so with several instances it still runs once.
+ */
+@Injectable()
+export class JobQueueService implements OnModuleInit, OnModuleDestroy {
+  private readonly logger = new Logger(JobQueueService.name);
+  private readonly handlers = new Map<string, RegisteredHandler>();
+  private readonly concurrency = new Map<string, number>();
+  private readonly schedules = new Map<string, Schedule>();
+  private readonly running = new Map<string, string>();
+  private readonly workerId = `${hostname()}:${process.pid}`;
+  private readonly enabled: boolean;
+  private readonly pollMs: number;
+  private readonly defaultConcurrency: number;
+  private readonly lockTimeoutMs: number;
+  private readonly retentionDays: number;
+  private timer: NodeJS.Timeout | null = null;
+  private polling: Promise<void> | null = null;
+  private maintainedAt = 0;
+
+  constructor(
+    private readonly prisma: CustomPrismaService,
+    configService: ConfigService,
+  ) {
+    this.enabled = String(configService.get('JOBS_ENABLED', 'true')) !== 'false';
+    this.pollMs = Math.max(100, Number(configService.get('JOBS_POLL_MS', 1000)));
+    this.defaultConcurrency = Math.max(1, Number(configService.get('JOBS_CONCURRENCY', 2)));
+    this.lockTimeoutMs = Math.max(this.pollMs * 10, Number(configService.get('JOBS_LOCK_TIMEOUT_MS', 300000)));
+    this.retentionDays = Math.max(1, Number(configService.get('JOBS_RETENTION_DAYS', 7)));
+
+    this.register('jobs.cleanup', () => this.removeFinished(), { queue: 'maintenance', concurrency: 1 });
+    this.schedule('jobs.cleanup', '30 2 * * *', 'jobs.cleanup');
+  }
+
+  register<T>(name: string, handler: JobHandler<T>, options: JobHandlerOptions = {}): void {
+    const queue = options.queue || DEFAULT_QUEUE;
+    this.handlers.set(name, { queue, handler, maxAttempts: options.maxAttempts || 3 });
+    if (options.concurrency || !this.concurrency.has(queue)) {
+      this.concurrency.set(queue, options.concurrency || this.defaultConcurrency);
+    }
+  }
+
+  /** Enqueue jobName at every match of the (UTC) cron expression */
+  schedule(name: string, cron: string, jobName: string, payload: unknown = {}): void {
+    const expression = new CronExpression(cron);
+    this.schedules.set(name, { name, cron: expression, jobName, payload, nextRun: expression.next(new Date()) });
+  }
+
+  async enqueue<T>(name: string, payload: T, options: EnqueueOptions = {}): Promise<Job> {
+    const registered = this.handlers.get(name);
+    if (!registered) {
+      throw new Error(`No handler registered for job ${name}`);
+    }
+
+    let job: Job;
+    try {
+      job = await this.prisma.job.create({
+        data: {
+          tenantId: options.tenantId,
+          queue: registered.queue,
+          name,
+          payload: (payload ?? {}) as Prisma.InputJsonValue,
+          priority: options.priority || 0,
+          runAt: options.runAt || new Date(),
+          maxAttempts: options.maxAttempts || registered.maxAttempts,
+          uniqueKey: options.uniqueKey,
+        },
+      });
+    } catch (error) {
+      if (options.uniqueKey && error.code === 'P2002') {
+        return this.prisma.job.findUnique({ where: { uniqueKey: options.uniqueKey } });
+      }
+      throw error;
+    }
+
+    if (job.runAt.getTime() <= Date.now()) {
+      this.wake();
+    }
+    return job;
+  }
+
+  async get(tenantId: string, id: string): Promise<Job> {
+    const job = await this.prisma.job.findFirst({ where: { id, tenantId } });
+    if (!job) {
+      throw new NotFoundException('Job not found');
+    }
+    return job;
+  }
+
+  /** The tenant's latest jobs */
+  list(tenantId: string, query: JobListQuery = {}): Promise<Job[]> {
+    return this.prisma.job.findMany({
+      where: {
+        tenantId,
+        ...(query.queue ? { queue: query.queue } : {}),
+        ...(query.name ? { name: query.name } : {}),
+        ...(query.status ? { status: query.status } : {}),
+      },
+      orderBy: { createdAt: 'desc' },
+      take: query.limit || 20,
+    });
+  }
+
+  /** Job counts of the tenant per queue and status */
+  async summary(tenantId: string): Promise<Array<{ queue: string; status: string; count: number }>> {
+    const groups = await this.prisma.job.groupBy({
+      by: ['queue', 'status'],
+      where: { tenantId },
+      _count: { _all: true },
+      orderBy: [{ queue: 'asc' }, { status: 'asc' }],
+    });
+    return groups.map((group) => ({ queue: group.queue, status: group.status, count: group._count._all }));
+  }
+
+  /** Run a failed job again, with a fresh set of attempts */
+  async retry(tenantId: string, id: string): Promise<Job> {
+    const job = await this.get(tenantId, id);
+    if (job.status !== 'FAILED') {
+      throw new BadRequestException('Only failed jobs can be retried');
+    }
+    const retried = await this.prisma.job.update({
+      where: { id },
+      data: { status: 'PENDING', attempts: 0, runAt: new Date(), lastError: null, completedAt: null },
+    });
+    this.wake();
+    return retried;
+  }
+
+  onModuleInit(): void {
+    if (!this.enabled) {
+      this.logger.log('Background jobs are disabled on this instance (JOBS_ENABLED=false)');
+      return;
+    }
+    this.timer = setInterval(() => this.wake(), this.pollMs);
+    this.timer.unref();
+  }
+
+  onModuleDestroy(): void {
+    if (this.timer) {
+      clearInterval(this.timer);
+      this.timer = null;
+    }
+  }
+
+  /** Poll now, unless a poll is already under way */
+  private wake(): void {
+    if (!this.timer || this.polling) {
+      return;
+    }
+    this.polling = this.poll()
+      .catch((error) => this.logger.warn(`Job poll failed: ${error.message}`))
+      .finally(() => {
+        this.polling = null;
+      });
+  }
+
+  private async poll(): Promise<void> {
+    if (Date.now() - this.maintainedAt >= MAINTENANCE_MS) {
+      this.maintainedAt = Date.now();
+      await this.releaseStale();
+      await this.enqueueDue();
+    }
+
+    if (this.running.size > 0) {
+      await this.prisma.job.updateMany({
+        where: { id: { in: Array.from(this.running.keys()) }, lockedBy: this.workerId },
+        data: { lockedAt: new Date() },
+      });
+    }
+
+    for (const [queue, limit] of this.concurrency) {
+      const busy = Array.from(this.running.values()).filter((running) => running === queue).length;
+      if (busy < limit) {
+        for (const job of await this.claim(queue, limit - busy)) {
+          this.running.set(job.id, queue);
+          void this.run(job).finally(() => this.running.delete(job.id));
+        }
+      }
+    }
+  }
+
+  /** Lock up to `count` due jobs of the queue for this instance */
+  private claim(queue: string, count: number): Promise<Job[]> {
+    const names = Array.from(this.handlers)
+      .filter(([, registered]) => registered.queue === queue)
+      .map(([name]) => name);
+
+    return this.prisma.$queryRaw<Job[]>`
+      UPDATE "Job"
+      SET "status" = 'RUNNING', "lockedBy" = ${this.workerId}, "lockedAt" = NOW(),
+          "attempts" = "attempts" + 1, "updatedAt" = NOW()
+      WHERE "id" IN (
+        SELECT "id" FROM "Job"
+        WHERE "queue" = ${queue} AND "status" = 'PENDING' AND "runAt" <= NOW()
+          AND "name" IN (${Prisma.join(names)})
+        ORDER BY "priority" DESC, "runAt"
+        LIMIT ${count}
+        FOR UPDATE SKIP LOCKED
+      )
+      RETURNING *
+    `;
+  }
+
+  private async run(job: Job): Promise<void> {
+    const context: JobContext = {
+      jobId: job.id,
+      tenantId: job.tenantId,
+      attempt: job.attempts,
+      maxAttempts: job.maxAttempts,
+      lastAttempt: job.attempts >= job.maxAttempts,
+    };
+
+    try {
+      const result = await this.handlers.get(job.name).handler(job.payload, context);
+      await this.prisma.job.updateMany({
+        where: { id: job.id, lockedBy: this.workerId },
+        data: {
+          status: 'COMPLETED',
+          result: (result ?? undefined) as Prisma.InputJsonValue,
+          lockedBy: null,
+          lockedAt: null,
+          lastError: null,
+          completedAt: new Date(),
+        },
+      });
+    } catch (error) {
+      const delay = Math.min(RETRY_BASE_MS * 2 ** (job.attempts - 1), RETRY_MAX_MS);
+      this.logger.warn(
+        `Job ${job.name} (${job.id}) failed on attempt ${job.attempts}/${job.maxAttempts}: ${error.message}`,
+      );
+      await this.prisma.job
+        .updateMany({
+          where: { id: job.id, lockedBy: this.workerId },
+          data: {
+            status: context.lastAttempt ? 'FAILED' : 'PENDING',
+            runAt: new Date(Date.now() + delay),
+            lockedBy: null,
+            lockedAt: null,
+            lastError: String(error.message || error),
+            completedAt: context.lastAttempt ? new Date() : null,
+          },
+        })
+        .catch((updateError) => this.logger.error(`Failed to record failure of job ${job.id}: ${updateError.message}`));
+    }
+  }
+
+  /** Jobs whose instance stopped refreshing their lock go back to the queue */
+  private async releaseStale(): Promise<void> {
+    const released = await this.prisma.$executeRaw`
+      UPDATE "Job"
+      SET "status" = CASE WHEN "attempts" >= "maxAttempts" THEN 'FAILED' ELSE 'PENDING' END,
+          "lockedBy" = NULL, "lockedAt" = NULL, "updatedAt" = NOW(),
+          "lastError" = 'Worker stopped responding'
+      WHERE "status" = 'RUNNING' AND "lockedAt" < ${new Date(Date.now() - this.lockTimeoutMs)}
+    `;
+    if (released > 0) {
+      this.logger.warn(`Released ${released} jobs left running by a stopped worker`);
+    }
+  }
+
+  private async enqueueDue(): Promise<void> {
+    const now = new Date();
+    for (const schedule of this.schedules.values()) {
+      if (schedule.nextRun > now) {
+        continue;
+      }
+      const occurrence = schedule.nextRun;
+      schedule.nextRun = schedule.cron.next(now);
+      await this.enqueue(schedule.jobName, schedule.payload, {
+        runAt: occurrence,
+        uniqueKey: `schedule:${schedule.name}:${occurrence.toISOString()}`,
+      }).catch((error) => this.logger.warn(`Failed to enqueue scheduled job ${schedule.name}: ${error.message}`));
+    }
+  }
+
+  private async removeFinished(): Promise<{ removed: number }> {
+    const { count } = await this.prisma.job.deleteMany({
+      where: {
+        status: { in: ['COMPLETED', 'FAILED'] },
+        completedAt: { lt: new Date(Date.now() - this.retentionDays * 24 * 60 * 60 * 1000) },
+      },
+    });
+    return { removed: count };
+  }
+}
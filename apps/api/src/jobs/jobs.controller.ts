@@ -0,0 +1,51 @@
+import { Controller, Get, Post, Param, Query, UseGuards } from '@nestjs/common';
+import { ApiTags, ApiOperation, ApiResponse, ApiBearerAuth, ApiParam } from '@nestjs/swagger';
+import { JwtAuthGuard } from '../auth/jwt-auth.guard';
+import { PermissionsGuard } from '../rbac/guards/permissions.guard';
+import { RequirePermissions } from '../rbac/decorators/require-permissions.decorator';
+import { TenantId } from '../shared/decorators/tenant-id.decorator';
+import { JobQueueService } from './job-queue.service';
+import { JobQueryDto } from './dto/jobs.dto';
+
+@ApiTags('Jobs')
+@ApiBearerAuth()
+@Controller('jobs')
+@UseGuards(JwtAuthGuard, PermissionsGuard)
+export class JobsController {
+  constructor(private readonly jobs: JobQueueService) {}
+
+  @Get()
+  @RequirePermissions('settings.manage')
+  @ApiOperation({ summary: 'List background jobs', description: "The tenant's latest jobs, newest first" })
+  @ApiResponse({ status: 200, description: 'Jobs retrieved successfully' })
+  async list(@TenantId() tenantId: string, @Query() query: JobQueryDto) {
+    return { success: true, data: await this.jobs.list(tenantId, query) };
+  }
+
+  @Get('summary')
+  @ApiOperation({ summary: 'Job counts', description: 'Number of jobs per queue and status' })
+  @ApiResponse({ status: 200, description: 'Summary retrieved successfully' })
+  async summary(@TenantId() tenantId: string) {
+    return { success: true, data: await this.jobs.summary(tenantId) };
+  }
+
+  @Get(':id')
+  @RequirePermissions('settings.manage')
+  @ApiOperation({ summary: 'Get a background job', description: 'Status, attempts, last error and result of a job' })
+  @ApiResponse({ status: 200, description: 'Job retrieved successfully' })
+  @ApiResponse({ status: 404, description: 'Job not found' })
+  @ApiParam({ name: 'id', description: 'Job ID' })
+  async get(@Param('id') id: string, @TenantId() tenantId: string) {
+    return { success: true, data: await this.jobs.get(tenantId, id) };
+  }
+
+  @Post(':id/retry')
+  @RequirePermissions('settings.manage')
+  @ApiOperation({ summary: 'Retry a failed job' })
+  @ApiResponse({ status: 201, description: 'Job queued again' })
+  @ApiResponse({ status: 400, description: 'Job has not failed' })
+  @ApiParam({ name: 'id', description: 'Job ID' })
+  async retry(@Param('id') id: string, @TenantId() tenantId: string) {
+    return { success: true, data: await this.jobs.retry(tenantId, id) };
+  }
+}
@@ -0,0 +1,11 @@
+import { Global, Module } from '@nestjs/common';
+import { JobQueueService } from './job-queue.service';
+import { JobsController } from './jobs.controller';
+
+@Global()
+@Module({
+  controllers: [JobsController],
+  providers: [JobQueueService],
+  exports: [JobQueueService],
+})
+export class JobsModule {}
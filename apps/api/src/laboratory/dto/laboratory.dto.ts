@@ -13,6 +13,7 @@ import {
 } from 'class-validator';
 import { ApiProperty, ApiPropertyOptional } from '@nestjs/swagger';
 import { Type } from 'class-transformer';
+import { KeysetPaginationQueryDto } from '../../shared/pagination/keyset-pagination.dto';
 
 // Enums for Laboratory module
 export enum LabTestCategory {
@@ -205,7 +206,7 @@ export class UpdateLabTestResultDto {
 }
 
 // Query DTOs
-export class LabOrderQueryDto {
+export class LabOrderQueryDto extends KeysetPaginationQueryDto {
   @ApiPropertyOptional({ example: 1, description: 'Page number' })
   @IsOptional()
   @Type(() => Number)
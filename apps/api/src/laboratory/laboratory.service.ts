@@ -5,6 +5,10 @@ import {
   Logger,
 } from '@nestjs/common';
 import { CustomPrismaService } from '../prisma/custom-prisma.service';
+import { Prisma } from '@prisma/client';
+import { DocumentSequenceService } from '../sequences/document-sequence.service';
+import { DailyRollupService } from '../rollups/daily-rollup.service';
+import { pageWindow, slicePage, countTotal, pageMeta, pageCount } from '../shared/pagination/keyset-pagination';
 import {
   CreateLabTestDto,
   UpdateLabTestDto,
@@ -19,7 +23,11 @@ import {
 export class LaboratoryService {
   private readonly logger = new Logger(LaboratoryService.name);
 
-  constructor(private readonly prisma: CustomPrismaService) {}
+  constructor(
+    private readonly prisma: CustomPrismaService,
+    private readonly documentSequence: DocumentSequenceService,
+    private readonly rollups: DailyRollupService,
+  ) {}
 
   // ==================== Lab Tests Management ====================
 
@@ -194,6 +202,7 @@ export class LaboratoryService {
       });
 
       this.logger.log(`Lab order created: ${labOrder.id} for tenant: ${tenantId}`);
+      await this.rollups.touch(tenantId, 'lab_orders', labOrder.orderDate);
 
       return {
         success: true,
@@ -207,30 +216,33 @@ export class LaboratoryService {
   }
 
   async findAllLabOrders(tenantId: string, query: LabOrderQueryDto = {}) {
-    const { page = 1, limit = 10 } = query;
-    const skip = (page - 1) * limit;
+    const page = parseInt((query.page ?? 1).toString());
+    const limit = parseInt((query.limit ?? 10).toString());
     const where = this.buildLabOrderWhereClause(tenantId, query);
+    const window = pageWindow(where, { page, limit, cursor: query.cursor }, { field: 'orderDate', direction: 'desc' });
 
-    const [orders, total] = await Promise.all([
+    const [rows, total] = await Promise.all([
       this.prisma.labOrder.findMany({
-        where,
-        skip,
-        take: parseInt(limit.toString()),
-        orderBy: { orderDate: 'desc' },
+        where: window.where,
+        skip: window.skip,
+        take: window.take,
+        orderBy: window.orderBy,
         include: this.getLabOrderIncludes(),
       }),
-      this.prisma.labOrder.count({ where }),
+      countTotal(query.count, (take) => this.prisma.labOrder.count({ where, take })),
     ]);
+    const slice = slicePage(rows, window);
 
     return {
       success: true,
       data: {
-        orders,
+        orders: slice.items,
         pagination: {
-          total,
-          page: parseInt(page.toString()),
-          limit: parseInt(limit.toString()),
-          pages: Math.ceil(total / limit),
+          total: total.total,
+          page,
+          limit,
+          pages: pageCount(total, limit),
+          ...pageMeta(slice, window, total),
         },
       },
     };
@@ -276,6 +288,7 @@ export class LaboratoryService {
           },
         },
       });
+      await this.rollups.touch(tenantId, 'lab_orders', order.orderDate);
 
       return {
         success: true,
@@ -334,13 +347,14 @@ export class LaboratoryService {
 
       // If all tests are completed, update the order status
       if (allCompleted) {
-        await this.prisma.labOrder.update({
+        const order = await this.prisma.labOrder.update({
           where: { id: orderId },
           data: {
             status: 'COMPLETED',
             completedDate: new Date(),
           },
         });
+        await this.rollups.touch(tenantId, 'lab_orders', order.orderDate);
       }
 
       return {
@@ -358,10 +372,11 @@ export class LaboratoryService {
 
   async cancelLabOrder(id: string, tenantId: string) {
     try {
-      await this.prisma.labOrder.update({
+      const order = await this.prisma.labOrder.update({
         where: { id, tenantId },
         data: { status: 'CANCELLED' },
       });
+      await this.rollups.touch(tenantId, 'lab_orders', order.orderDate);
 
       return {
         success: true,
@@ -374,45 +389,36 @@ export class LaboratoryService {
   }
 
   async getLabStats(tenantId: string) {
-    const [
-      totalOrders,
-      pendingOrders,
-      inProgressOrders,
-      completedOrders,
-      totalTests,
-      activeTests,
-      todayOrders,
-    ] = await Promise.all([
-      this.prisma.labOrder.count({ where: { tenantId } }),
-      this.prisma.labOrder.count({ where: { tenantId, status: 'PENDING' } }),
-      this.prisma.labOrder.count({
-        where: { tenantId, status: 'IN_PROGRESS' },
+    const startOfDay = new Date(new Date().setHours(0, 0, 0, 0));
+    const [orders, tests] = await Promise.all([
+      this.prisma.countBuckets('LabOrder', tenantId, {
+        totalOrders: Prisma.sql`TRUE`,
+        pendingOrders: Prisma.sql`status = 'PENDING'`,
+        inProgressOrders: Prisma.sql`status = 'IN_PROGRESS'`,
+        completedOrders: Prisma.sql`status = 'COMPLETED'`,
+        todayOrders: Prisma.sql`"orderDate" >= ${startOfDay}`,
       }),
-      this.prisma.labOrder.count({ where: { tenantId, status: 'COMPLETED' } }),
-      this.prisma.labTest.count({ where: { tenantId } }),
-      this.prisma.labTest.count({ where: { tenantId, isActive: true } }),
-      this.prisma.labOrder.count({
-        where: {
-          tenantId,
-          orderDate: {
-            gte: new Date(new Date().setHours(0, 0, 0, 0)),
-          },
-        },
+      this.prisma.countBuckets('LabTest', tenantId, {
+        totalTests: Prisma.sql`TRUE`,
+        activeTests: Prisma.sql`"isActive" = true`,
       }),
     ]);
 
     return {
       success: true,
       data: {
-        totalOrders,
-        pendingOrders,
-        inProgressOrders,
-        completedOrders,
+        totalOrders: orders.totalOrders,
+        pendingOrders: orders.pendingOrders,
+        inProgressOrders: orders.inProgressOrders,
+        completedOrders: orders.completedOrders,
         cancelledOrders:
-          totalOrders - pendingOrders - inProgressOrders - completedOrders,
-        totalTests,
-        activeTests,
-        todayOrders,
+          orders.totalOrders -
+          orders.pendingOrders -
+          orders.inProgressOrders -
+          orders.completedOrders,
+        totalTests: tests.totalTests,
+        activeTests: tests.activeTests,
+        todayOrders: orders.todayOrders,
       },
     };
   }
@@ -520,9 +526,9 @@ export class LaboratoryService {
   }
 
   private async generateOrderNumber(tenantId: string): Promise<string> {
-    const count = await this.prisma.labOrder.count({ where: { tenantId } });
+    const sequence = await this.documentSequence.next(tenantId, 'LAB');
     const year = new Date().getFullYear();
     const month = String(new Date().getMonth() + 1).padStart(2, '0');
-    return `LAB${year}${month}${String(count + 1).padStart(5, '0')}`;
+    return `LAB${year}${month}${String(sequence).padStart(5, '0')}`;
   }
 }
@@ -93,6 +93,9 @@ async function bootstrap() {
     logger.log('🚀 Starting with database operations enabled');
   }
 
+  // Run onModuleDestroy hooks (e.g. buffered writers flushing) on SIGTERM/SIGINT
+  app.enableShutdownHooks();
+
   await app.listen(port, host);
 
   logger.log(`🚀 HMS SaaS API is running on: http://${host}:${port}`);
@@ -0,0 +1,77 @@
+import { MigrationInterface, QueryRunner } from "typeorm";
+
+/**
+ * Turns audit_logs into a table range-partitioned by month on created_at,
+ * so retention can drop whole months instead of DELETEing across the table.
+ *
+ * Partitions are named audit_logs_pYYYYMM. create_audit_logs_partition()
+ * creates one on demand; AuditPartitionService keeps the coming months
+ * created. audit_logs_default only catches rows outside every partition.
+ * The primary key becomes (id, created_at), since a partitioned table's
+ * unique constraints must include the partition key.
+ */
+export class PartitionAuditLogs1792238400000 implements MigrationInterface {
+    name = 'PartitionAuditLogs1792238400000'
+
+    public async up(queryRunner: QueryRunner): Promise<void> {
+        await queryRunner.query(`ALTER TABLE "audit_logs" RENAME TO "audit_logs_unpartitioned"`);
+        await queryRunner.query(`ALTER TABLE "audit_logs_unpartitioned" RENAME CONSTRAINT "PK_1bb179d048bbc581caa3b013439" TO "PK_audit_logs_unpartitioned"`);
+        await queryRunner.query(`CREATE TABLE "audit_logs" (LIKE "audit_logs_unpartitioned" INCLUDING DEFAULTS INCLUDING CONSTRAINTS, CONSTRAINT "PK_1bb179d048bbc581caa3b013439" PRIMARY KEY ("id", "created_at")) PARTITION BY RANGE ("created_at")`);
+        await queryRunner.query(`CREATE TABLE "audit_logs_default" PARTITION OF "audit_logs" DEFAULT`);
+
+        await queryRunner.query(`
+            CREATE OR REPLACE FUNCTION create_audit_logs_partition(month date) RETURNS text AS $$
+            DECLARE
+                start_at date := date_trunc('month', month)::date;
+                part_name text := 'audit_logs_p' || to_char(start_at, 'YYYYMM');
+            BEGIN
+                EXECUTE format(
+                    'CREATE TABLE IF NOT EXISTS %I PARTITION OF "audit_logs" FOR VALUES FROM (%L) TO (%L)',
+                    part_name, start_at, (start_at + interval '1 month')::date
+                );
+                RETURN part_name;
+            END;
+            $$ LANGUAGE plpgsql
+        `);
+
+        // One partition per month with data, plus the current and next two
+        await queryRunner.query(`
+            SELECT create_audit_logs_partition(month::date)
+            FROM generate_series(
+                date_trunc('month', LEAST(COALESCE((SELECT MIN("created_at") FROM "audit_logs_unpartitioned"), now()), now())),
+                date_trunc('month', now()) + interval '2 months',
+                interval '1 month'
+            ) AS month
+        `);
+        await queryRunner.query(`INSERT INTO "audit_logs" SELECT * FROM "audit_logs_unpartitioned"`);
+        await queryRunner.query(`DROP TABLE "audit_logs_unpartitioned"`);
+
+        await queryRunner.query(`CREATE INDEX "IDX_6f18d459490bb48923b1f40bdb" ON "audit_logs" ("tenant_id") `);
+        await queryRunner.query(`CREATE INDEX "IDX_bd2726fd31b35443f2245b93ba" ON "audit_logs" ("user_id") `);
+        await queryRunner.query(`CREATE INDEX "IDX_cee5459245f652b75eb2759b4c" ON "audit_logs" ("action") `);
+        await queryRunner.query(`CREATE INDEX "IDX_ea9ba3dfb39050f831ee3be40d" ON "audit_logs" ("entity_type") `);
+        await queryRunner.query(`CREATE INDEX "IDX_8e5e23ee6fccba37f99df331d1" ON "audit_logs" ("ip_address") `);
+        await queryRunner.query(`CREATE INDEX "IDX_7421efc125d95e413657efa3c6" ON "audit_logs" ("entity_type", "entity_id") `);
+        await queryRunner.query(`CREATE INDEX "IDX_2f68e345c05e8166ff9deea1ab" ON "audit_logs" ("user_id", "created_at") `);
+        await queryRunner.query(`CREATE INDEX "IDX_898d14750b88319b89b1ab66cd" ON "audit_logs" ("tenant_id", "created_at") `);
+    }
+
+    public async down(queryRunner: QueryRunner): Promise<void> {
+        await queryRunner.query(`ALTER TABLE "audit_logs" RENAME TO "audit_logs_partitioned"`);
+        await queryRunner.query(`ALTER TABLE "audit_logs_partitioned" RENAME CONSTRAINT "PK_1bb179d048bbc581caa3b013439" TO "PK_audit_logs_partitioned"`);
+        await queryRunner.query(`CREATE TABLE "audit_logs" (LIKE "audit_logs_partitioned" INCLUDING DEFAULTS INCLUDING CONSTRAINTS, CONSTRAINT "PK_1bb179d048bbc581caa3b013439" PRIMARY KEY ("id"))`);
+        await queryRunner.query(`INSERT INTO "audit_logs" SELECT * FROM "audit_logs_partitioned"`);
+        await queryRunner.query(`DROP TABLE "audit_logs_partitioned" CASCADE`);
+        await queryRunner.query(`DROP FUNCTION IF EXISTS create_audit_logs_partition(date)`);
+
+        await queryRunner.query(`CREATE INDEX "IDX_6f18d459490bb48923b1f40bdb" ON "audit_logs" ("tenant_id") `);
+        await queryRunner.query(`CREATE INDEX "IDX_bd2726fd31b35443f2245b93ba" ON "audit_logs" ("user_id") `);
+        await queryRunner.query(`CREATE INDEX "IDX_cee5459245f652b75eb2759b4c" ON "audit_logs" ("action") `);
+        await queryRunner.query(`CREATE INDEX "IDX_ea9ba3dfb39050f831ee3be40d" ON "audit_logs" ("entity_type") `);
+        await queryRunner.query(`CREATE INDEX "IDX_8e5e23ee6fccba37f99df331d1" ON "audit_logs" ("ip_address") `);
+        await queryRunner.query(`CREATE INDEX "IDX_7421efc125d95e413657efa3c6" ON "audit_logs" ("entity_type", "entity_id") `);
+        await queryRunner.query(`CREATE INDEX "IDX_2f68e345c05e8166ff9deea1ab" ON "audit_logs" ("user_id", "created_at") `);
+        await queryRunner.query(`CREATE INDEX "IDX_898d14750b88319b89b1ab66cd" ON "audit_logs" ("tenant_id", "created_at") `);
+    }
+
+}
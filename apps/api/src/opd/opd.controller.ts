@@ -10,7 +10,10 @@ import {
   UseGuards,
   HttpCode,
   HttpStatus,
+  Sse,
+  MessageEvent,
 } from '@nestjs/common';
+import { Observable } from 'rxjs';
 import {
   ApiTags,
   ApiOperation,
@@ -201,6 +204,26 @@ export class OpdController {
     return this.opdService.getQueue(tenantId, filters);
   }
 
+  /**
+   * Stream the OPD queue
+   */
+  @Sse('queue/stream')
+  @RequirePermissions('opd.view', 'OPD_READ', 'VIEW_OPD')
+  @ApiOperation({ 
+    summary: 'Stream the OPD queue',
+    description: 'Server-Sent Events: a snapshot event with the current queue, then upsert/remove events as visits change and periodic heartbeats'
+  })
+  @ApiResponse({ 
+    status: 200, 
+    description: 'text/event-stream of queue events'
+  })
+  streamQueue(
+    @Query() filters: OpdQueueFilterDto,
+    @TenantId() tenantId: string,
+  ): Observable<MessageEvent> {
+    return this.opdService.streamQueue(tenantId, filters);
+  }
+
   /**
    * Get OPD statistics
    */
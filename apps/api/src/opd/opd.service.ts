@@ -1,6 +1,9 @@
-import { Injectable, NotFoundException, BadRequestException, Logger } from '@nestjs/common';
+import { Injectable, NotFoundException, BadRequestException, Logger, OnModuleInit } from '@nestjs/common';
 import { CustomPrismaService } from '../prisma/custom-prisma.service';
-import { Prisma, AppointmentStatus } from '@prisma/client';
+import { DailyRollupService } from '../rollups/daily-rollup.service';
+import { QueueStateService } from '../queues/queue-state.service';
+import { Prisma, AppointmentKind, AppointmentStatus } from '@prisma/client';
+import { SLOT_UNAVAILABLE, isSlotConflict } from '../appointments/appointment-slots.service';
 import {
   CreateOpdVisitDto,
   UpdateOpdVisitDto,
@@ -10,10 +13,32 @@ import {
 } from './dto';
 
 @Injectable()
-export class OpdService {
+export class OpdService implements OnModuleInit {
   private readonly logger = new Logger(OpdService.name);
 
-  constructor(private prisma: CustomPrismaService) {}
+  constructor(
+    private prisma: CustomPrismaService,
+    private rollups: DailyRollupService,
+    private queues: QueueStateService,
+  ) {}
+
+  onModuleInit() {
+    this.queues.register('opd', {
+      load: (tenantId) =>
+        this.prisma.appointment.findMany({
+          where: this.getQueueWhereClause(tenantId),
+          orderBy: { startTime: 'asc' },
+          include: this.getQueueIncludes(),
+        }),
+      find: (tenantId, id) =>
+        this.prisma.appointment.findFirst({
+          where: { ...this.getQueueWhereClause(tenantId), id },
+          include: this.getQueueIncludes(),
+        }),
+      period: () => new Date().toDateString(),
+      compare: (a, b) => new Date(a.startTime).getTime() - new Date(b.startTime).getTime(),
+    });
+  }
 
   // ==================== Helper Methods ====================
 
@@ -52,6 +77,51 @@ export class OpdService {
     };
   }
 
+  /**
+   * Today's waiting, arrived and in-consultation visits
+   */
+  private getQueueWhereClause(tenantId: string): Prisma.AppointmentWhereInput {
+    const today = new Date();
+    today.setHours(0, 0, 0, 0);
+    const tomorrow = new Date(today);
+    tomorrow.setDate(tomorrow.getDate() + 1);
+
+    return {
+      tenantId,
+      startTime: {
+        gte: today,
+        lt: tomorrow,
+      },
+      status: {
+        in: ['SCHEDULED', 'ARRIVED', 'IN_PROGRESS'],
+      },
+    };
+  }
+
+  /**
+   * Get OPD queue include options
+   */
+  private getQueueIncludes() {
+    return {
+      patient: {
+        select: {
+          id: true,
+          firstName: true,
+          lastName: true,
+          medicalRecordNumber: true,
+        },
+      },
+      doctor: {
+        select: {
+          id: true,
+          firstName: true,
+          lastName: true,
+          specialization: true,
+        },
+      },
+    };
+  }
+
   /**
    * Build where clause for OPD visit queries
    */
@@ -166,6 +236,8 @@ export class OpdService {
           startTime: new Date(),
           endTime: new Date(Date.now() + 30 * 60000), // 30 min default
           status: appointmentStatus,
+          // Walk-ins are exempt from the doctor overlap constraint
+          kind: AppointmentKind.WALK_IN,
           reason: createDto.chiefComplaint,
           notes: createDto.notes,
           tenantId,
@@ -174,6 +246,8 @@ export class OpdService {
       });
 
       this.logger.log(`Successfully created OPD visit with ID: ${visit.id}`);
+      await this.rollups.touch(tenantId, 'appointments', visit.startTime);
+      this.queues.touch(tenantId, 'opd', visit.id);
       return {
         success: true,
         message: 'OPD visit created successfully',
@@ -183,6 +257,9 @@ export class OpdService {
       if (error instanceof NotFoundException) {
         throw error;
       }
+      if (isSlotConflict(error)) {
+        throw new BadRequestException(SLOT_UNAVAILABLE);
+      }
       this.logger.error('Error creating OPD visit:', error.message, error.stack);
       throw new BadRequestException(
         error.message || 'Failed to create OPD visit',
@@ -290,6 +367,8 @@ export class OpdService {
       });
 
       this.logger.log(`Successfully updated OPD visit: ${visit.id}`);
+      await this.rollups.touch(tenantId, 'appointments', visit.startTime);
+      this.queues.touch(tenantId, 'opd', visit.id);
       return {
         success: true,
         message: 'OPD visit updated successfully',
@@ -300,6 +379,9 @@ export class OpdService {
       if (error.code === 'P2025') {
         throw new NotFoundException('OPD visit not found');
       }
+      if (isSlotConflict(error)) {
+        throw new BadRequestException(SLOT_UNAVAILABLE);
+      }
       throw new BadRequestException('Failed to update OPD visit');
     }
   }
@@ -311,12 +393,14 @@ export class OpdService {
     try {
       this.logger.log(`Cancelling OPD visit with ID: ${id} for tenant: ${tenantId}`);
       
-      await this.prisma.appointment.update({
+      const visit = await this.prisma.appointment.update({
         where: { id, tenantId },
         data: {
           status: OpdVisitStatus.CANCELLED as any,
         },
       });
+      await this.rollups.touch(tenantId, 'appointments', visit.startTime);
+      this.queues.touch(tenantId, 'opd', visit.id);
 
       this.logger.log(`Successfully cancelled OPD visit: ${id}`);
       return {
@@ -339,21 +423,7 @@ export class OpdService {
     try {
       this.logger.log(`Getting OPD queue for tenant: ${tenantId} with filters:`, filters);
       
-      const today = new Date();
-      today.setHours(0, 0, 0, 0);
-      const tomorrow = new Date(today);
-      tomorrow.setDate(tomorrow.getDate() + 1);
-
-      const where: any = {
-        tenantId,
-        startTime: {
-          gte: today,
-          lt: tomorrow,
-        },
-        status: {
-          in: ['SCHEDULED', 'ARRIVED', 'IN_PROGRESS'],
-        },
-      };
+      const where: Prisma.AppointmentWhereInput = this.getQueueWhereClause(tenantId);
 
       if (filters.doctorId) {
         where.doctorId = filters.doctorId;
@@ -366,24 +436,7 @@ export class OpdService {
       const queue = await this.prisma.appointment.findMany({
         where,
         orderBy: { startTime: 'asc' },
-        include: {
-          patient: {
-            select: {
-              id: true,
-              firstName: true,
-              lastName: true,
-              medicalRecordNumber: true,
-            },
-          },
-          doctor: {
-            select: {
-              id: true,
-              firstName: true,
-              lastName: true,
-              specialization: true,
-            },
-          },
-        },
+        include: this.getQueueIncludes(),
         take: 50, // Limit to 50 for performance
       });
 
@@ -410,6 +463,19 @@ export class OpdService {
     }
   }
 
+  /**
+   * Live OPD queue: a snapshot followed by changes as visits are written
+   */
+  streamQueue(tenantId: string, filters: OpdQueueFilterDto = {}) {
+    return this.queues.stream(
+      tenantId,
+      'opd',
+      (visit) =>
+        (!filters.doctorId || visit.doctorId === filters.doctorId) &&
+        (!filters.departmentId || visit.departmentId === filters.departmentId),
+    );
+  }
+
   /**
    * Get OPD statistics
    */
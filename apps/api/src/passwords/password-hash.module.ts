@@ -0,0 +1,9 @@
+import { Global, Module } from '@nestjs/common';
+import { PasswordHashService } from './password-hash.service';
+
+@Global()
+@Module({
+  providers: [PasswordHashService],
+  exports: [PasswordHashService],
+})
+export class PasswordHashModule {}
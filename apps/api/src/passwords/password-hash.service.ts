@@ -0,0 +1,267 @@
+import { Injectable, Logger, OnModuleDestroy, OnModuleInit, ServiceUnavailableException } from '@nestjs/common';
+import { ConfigService } from '@nestjs/config';
+import { cpus } from 'os';
+import { join } from 'path';
+import { Worker } from 'worker_threads';
+
+export interface HashRequest {
+  id: number;
+  op: 'hash' | 'compare';
+  password: string;
+  rounds?: number;
+  hash?: string;
+}
+
+export interface HashResponse {
+  id: number;
+  value?: string | boolean;
+  error?: string;
+}
+
+export interface PasswordHashMetrics {
+  workers: number;
+  busy: number;
+  queued: number;
+  queueLimit: number;
+  rounds: number;
+  hashed: number;
+  compared: number;
+  rehashed: number;
+  /** Turned away because the queue was full */
+  rejected: number;
+  /** Waited longer than PASSWORD_HASH_QUEUE_TIMEOUT_MS for a worker */
+  timedOut: number;
+  failed: number;
+  /** Over the last LATENCY_SAMPLES operations, queueing included */
+  latencyMs: { p50: number; p99: number; max: number };
+}
+
+interface Task {
+  request: HashRequest;
+  queuedAt: number;
+  timer?: NodeJS.Timeout;
+  resolve: (value: string | boolean) => void;
+  reject: (error: Error) => void;
+}
+
+interface PoolWorker {
+  worker: Worker;
+  task: Task | null;
+  served: number;
+}
+
+const WORKER_FILE = join(__dirname, 'password-hash.worker.js');
+
+const LATENCY_SAMPLES = 1024;
+
+const BCRYPT_COST = /^\$2[aby]?\$(\d{2})\$/;
+
+function busyError(): ServiceUnavailableException {
+  return new ServiceUnavailableException('Password processing is busy, please retry in a few seconds');
+}
+
+/**
+ * bcrypt hashing and comparison on a dedicated pool of worker threads.
+ *
+ * Each worker runs one operation at a time with the synchronous bcrypt
+ * calls, so a login storm occupies PASSWORD_HASH_WORKERS threads and never
+ * the event loop or the libuv threadpool other requests depend on. Work
+ * beyond the pool waits in a queue of at most PASSWORD_HASH_QUEUE_LIMIT
+ * entries for at most PASSWORD_HASH_QUEUE_TIMEOUT_MS; past either limit the
+ * call fails at once with 503, which bounds the latency of every login.
+ *
+ * verify() also upgrades hashes made with a different cost than
+ * BCRYPT_ROUNDS, after a successful comparison and only when the pool is
+ * idle enough to spare the work.
+ */
+@Injectable()
+export class PasswordHashService implements OnModuleInit, OnModuleDestroy {
+  readonly rounds: number;
+  private readonly logger = new Logger(PasswordHashService.name);
+  private readonly size: number;
+  private readonly queueLimit: number;
+  private readonly queueTimeoutMs: number;
+  private readonly workers: PoolWorker[] = [];
+  private readonly queue: Task[] = [];
+  private readonly latencies: number[] = [];
+  private readonly counters = { hashed: 0, compared: 0, rehashed: 0, rejected: 0, timedOut: 0, failed: 0 };
+  private nextId = 1;
+  private stopped = false;
+
+  constructor(configService: ConfigService) {
+    this.rounds = Number(configService.get('BCRYPT_ROUNDS', 12));
+    this.size = Math.max(
+      1,
+      Number(configService.get('PASSWORD_HASH_WORKERS', Math.min(4, Math.max(1, cpus().length - 1)))),
+    );
+    this.queueLimit = Math.max(0, Number(configService.get('PASSWORD_HASH_QUEUE_LIMIT', 100)));
+    this.queueTimeoutMs = Math.max(100, Number(configService.get('PASSWORD_HASH_QUEUE_TIMEOUT_MS', 5000)));
+  }
+
+  onModuleInit(): void {
+    this.fill();
+  }
+
+  async onModuleDestroy(): Promise<void> {
+    this.stopped = true;
+    this.queue.splice(0).forEach((task) => {
+      clearTimeout(task.timer);
+      task.reject(busyError());
+    });
+    await Promise.all(this.workers.map(({ worker }) => worker.terminate()));
+  }
+
+  async hash(password: string): Promise<string> {
+    const value = await this.submit({ op: 'hash', password, rounds: this.rounds });
+    this.counters.hashed++;
+    return value as string;
+  }
+
+  async compare(password: string, hash: string): Promise<boolean> {
+    if (!password || !hash) {
+      return false;
+    }
+    const value = await this.submit({ op: 'compare', password, hash });
+    this.counters.compared++;
+    return value as boolean;
+  }
+
+  /**
+   * compare(), and when the password matches a hash of another cost, hash it
+   * again with BCRYPT_ROUNDS in the background and hand the result to
+   * `rehashed` to store. The caller never waits for the rehash, so
+   * `rehashed` should only replace `hash` itself: the password may have been
+   * changed in the meantime.
+   */
+  async verify(password: string, hash: string, rehashed?: (hash: string) => Promise<unknown>): Promise<boolean> {
+    const valid = await this.compare(password, hash);
+    if (valid && rehashed && this.needsRehash(hash) && this.queue.length === 0) {
+      this.hash(password)
+        .then(rehashed)
+        .then(() => this.counters.rehashed++)
+        .catch((error) => this.logger.warn(`Password rehash skipped: ${error.message}`));
+    }
+    return valid;
+  }
+
+  /** Whether the hash was made with a different cost than BCRYPT_ROUNDS */
+  needsRehash(hash: string): boolean {
+    const match = BCRYPT_COST.exec(hash || '');
+    return Boolean(match) && Number(match[1]) !== this.rounds;
+  }
+
+  metrics(): PasswordHashMetrics {
+    const sorted = [...this.latencies].sort((a, b) => a - b);
+    const percentile = (p: number) =>
+      sorted.length ? sorted[Math.min(sorted.length - 1, Math.floor(sorted.length * p))] : 0;
+    return {
+      workers: this.workers.length,
+      busy: this.workers.filter((pooled) => pooled.task).length,
+      queued: this.queue.length,
+      queueLimit: this.queueLimit,
+      rounds: this.rounds,
+      ...this.counters,
+      latencyMs: { p50: percentile(0.5), p99: percentile(0.99), max: sorted.length ? sorted[sorted.length - 1] : 0 },
+    };
+  }
+
+  private submit(request: Omit<HashRequest, 'id'>): Promise<string | boolean> {
+    if (this.workers.length < this.size) {
+      this.fill();
+    }
+
+    return new Promise((resolve, reject) => {
+      const task: Task = { request: { ...request, id: this.nextId++ }, queuedAt: Date.now(), resolve, reject };
+      const idle = !this.stopped && this.workers.find((pooled) => !pooled.task);
+      if (idle) {
+        this.dispatch(idle, task);
+        return;
+      }
+      if (this.stopped || this.queue.length >= this.queueLimit) {
+        this.counters.rejected++;
+        reject(busyError());
+        return;
+      }
+
+      task.timer = setTimeout(() => {
+        const index = this.queue.indexOf(task);
+        if (index >= 0) {
+          this.queue.splice(index, 1);
+          this.counters.timedOut++;
+          reject(busyError());
+        }
+      }, this.queueTimeoutMs);
+      this.queue.push(task);
+    });
+  }
+
+  private dispatch(pooled: PoolWorker, task: Task): void {
+    clearTimeout(task.timer);
+    pooled.task = task;
+    pooled.worker.postMessage(task.request);
+  }
+
+  private settle(pooled: PoolWorker, response: HashResponse | null, failure?: Error): void {
+    const task = pooled.task;
+    pooled.task = null;
+    if (task) {
+      this.latencies.push(Date.now() - task.queuedAt);
+      if (this.latencies.length > LATENCY_SAMPLES) {
+        this.latencies.shift();
+      }
+      if (failure || response.error) {
+        this.counters.failed++;
+        task.reject(failure || new Error(response.error));
+      } else {
+        task.resolve(response.value);
+      }
+    }
+
+    const next = this.workers.includes(pooled) && this.queue.shift();
+    if (next) {
+      this.dispatch(pooled, next);
+    }
+  }
+
+  /** Start workers up to the pool size, giving each a queued task if there is one */
+  private fill(): void {
+    while (!this.stopped && this.workers.length < this.size) {
+      const pooled = this.spawn();
+      this.workers.push(pooled);
+      const next = this.queue.shift();
+      if (next) {
+        this.dispatch(pooled, next);
+      }
+    }
+  }
+
+  private spawn(): PoolWorker {
+    // Under ts-node (scripts) the worker is still TypeScript and is loaded through it
+    const source = JSON.stringify(WORKER_FILE.replace(/\.js$/, '.ts'));
+    const worker = __filename.endsWith('.ts')
+      ? new Worker(`require('ts-node/register/transpile-only'); require(${source});`, { eval: true })
+      : new Worker(WORKER_FILE);
+    const pooled: PoolWorker = { worker, task: null, served: 0 };
+
+    worker.on('message', (response: HashResponse) => {
+      pooled.served++;
+      this.settle(pooled, response);
+    });
+    worker.on('error', (error) => this.logger.error(`Password hash worker failed: ${error.message}`, error.stack));
+    worker.on('exit', () => {
+      const index = this.workers.indexOf(pooled);
+      if (index < 0 || this.stopped) {
+        return;
+      }
+      // Fail only the operation it was running. A worker that never answered
+      // (bcrypt failed to load, say) is not replaced here, to avoid a crash
+      // loop; the next operation starts a new one and fails on its own.
+      this.workers.splice(index, 1);
+      this.settle(pooled, null, new Error('Password hash worker exited'));
+      if (pooled.served > 0) {
+        this.fill();
+      }
+    });
+    return pooled;
+  }
+}
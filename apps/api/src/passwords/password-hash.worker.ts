@@ -0,0 +1,20 @@
+import { parentPort } from 'worker_threads';
+import * as bcrypt from 'bcrypt';
+import type { HashRequest, HashResponse } from './password-hash.service';
+
+// One bcrypt operation at a time, synchronously: the pool only sends a
+// worker its next request after the previous response, and blocking here
+// keeps the work off both the event loop and the libuv threadpool.
+parentPort.on('message', (request: HashRequest) => {
+  let response: HashResponse;
+  try {
+    const value =
+      request.op === 'hash'
+        ? bcrypt.hashSync(request.password, request.rounds)
+        : bcrypt.compareSync(request.password, request.hash);
+    response = { id: request.id, value };
+  } catch (error) {
+    response = { id: request.id, error: error.message };
+  }
+  parentPort.postMessage(response);
+});
@@ -3,11 +3,16 @@ import {
   NotFoundException,
   ConflictException,
 } from '@nestjs/common';
-import { PrismaService } from '../prisma/prisma.service';
+import { Prisma } from '@prisma/client';
+import { CustomPrismaService } from '../prisma/custom-prisma.service';
+import { DailyRollupService } from '../rollups/daily-rollup.service';
 
 @Injectable()
 export class PathologyService {
-  constructor(private prisma: PrismaService) {}
+  constructor(
+    private prisma: CustomPrismaService,
+    private rollups: DailyRollupService,
+  ) {}
 
   // Lab Tests
   async createTest(createDto: any, tenantId: string) {
@@ -152,6 +157,7 @@ export class PathologyService {
       },
     });
 
+    await this.rollups.touch(tenantId, 'lab_orders', order.orderDate);
     return {
       success: true,
       message: 'Lab order created successfully',
@@ -244,6 +250,7 @@ export class PathologyService {
       },
     });
 
+    await this.rollups.touch(tenantId, 'lab_orders', order.orderDate, updated.orderDate);
     return {
       success: true,
       message: 'Lab order updated successfully',
@@ -264,6 +271,7 @@ export class PathologyService {
       where: { id },
       data: { status: 'CANCELLED' },
     });
+    await this.rollups.touch(tenantId, 'lab_orders', order.orderDate);
 
     return {
       success: true,
@@ -311,13 +319,14 @@ export class PathologyService {
     const allCompleted = allTests.every((t) => t.status === 'COMPLETED');
 
     if (allCompleted) {
-      await this.prisma.labOrder.update({
+      const order = await this.prisma.labOrder.update({
         where: { id: orderId },
         data: {
           status: 'COMPLETED',
           completedDate: new Date(),
         },
       });
+      await this.rollups.touch(tenantId, 'lab_orders', order.orderDate);
     }
 
     return {
@@ -328,36 +337,23 @@ export class PathologyService {
   }
 
   async getStats(tenantId: string) {
-    const [
-      totalTests,
-      activeTests,
-      totalOrders,
-      pendingOrders,
-      completedOrders,
-    ] = await Promise.all([
-      this.prisma.labTest.count({ where: { tenantId } }),
-      this.prisma.labTest.count({ where: { tenantId, isActive: true } }),
-      this.prisma.labOrder.count({ where: { tenantId } }),
-      this.prisma.labOrder.count({
-        where: { tenantId, status: { in: ['PENDING', 'IN_PROGRESS'] } },
+    const [tests, orders] = await Promise.all([
+      this.prisma.countBuckets('LabTest', tenantId, {
+        total: Prisma.sql`TRUE`,
+        active: Prisma.sql`"isActive" = true`,
       }),
-      this.prisma.labOrder.count({
-        where: { tenantId, status: 'COMPLETED' },
+      this.prisma.countBuckets('LabOrder', tenantId, {
+        total: Prisma.sql`TRUE`,
+        pending: Prisma.sql`status IN ('PENDING', 'IN_PROGRESS')`,
+        completed: Prisma.sql`status = 'COMPLETED'`,
       }),
     ]);
 
     return {
       success: true,
       data: {
-        tests: {
-          total: totalTests,
-          active: activeTests,
-        },
-        orders: {
-          total: totalOrders,
-          pending: pendingOrders,
-          completed: completedOrders,
-        },
+        tests,
+        orders,
       },
     };
   }
@@ -16,6 +16,8 @@ import {
   ApiBearerAuth,
 } from '@nestjs/swagger';
 import { PatientPortalService } from './patient-portal.service';
+import { AppointmentsService } from '../appointments/appointments.service';
+import { NextAvailableSlotQueryDto } from '../appointments/dto/appointment.dto';
 import { JwtAuthGuard } from '../auth/jwt-auth.guard';
 import { PermissionsGuard } from '../rbac/guards/permissions.guard';
 import { RequirePermissions } from '../rbac/decorators/require-permissions.decorator';
@@ -27,7 +29,10 @@ import { CurrentUser } from '../shared/decorators/current-user.decorator';
 @Controller('patient-portal')
 @UseGuards(JwtAuthGuard, PermissionsGuard)
 export class PatientPortalController {
-  constructor(private readonly service: PatientPortalService) {}
+  constructor(
+    private readonly service: PatientPortalService,
+    private readonly appointments: AppointmentsService,
+  ) {}
 
   @Get('my-profile')
   @RequirePermissions('patient.view.own', 'PATIENT_PORTAL_ACCESS')
@@ -61,6 +66,17 @@ export class PatientPortalController {
     return this.service.getMyAppointments(user.id, tenantId, query);
   }
 
+  @Get('available-slots')
+  @RequirePermissions('appointment.create.own', 'PATIENT_PORTAL_ACCESS', 'BOOK_ONLINE')
+  @ApiOperation({ summary: 'Find the next available appointment slots' })
+  @ApiResponse({ status: 200, description: 'Next available slots retrieved' })
+  getAvailableSlots(
+    @TenantId() tenantId: string,
+    @Query() query: NextAvailableSlotQueryDto
+  ) {
+    return this.appointments.findNextAvailable(tenantId, query);
+  }
+
   @Post('book-appointment')
   @RequirePermissions('appointment.create.own', 'PATIENT_PORTAL_ACCESS', 'BOOK_ONLINE')
   @ApiOperation({ summary: 'Book an appointment' })
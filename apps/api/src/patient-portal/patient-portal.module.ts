@@ -2,8 +2,10 @@ import { Module } from '@nestjs/common';
 import { PatientPortalController } from './patient-portal.controller';
 import { PatientPortalService } from './patient-portal.service';
 import { PrismaService } from '../prisma/prisma.service';
+import { AppointmentsModule } from '../appointments/appointments.module';
 
 @Module({
+  imports: [AppointmentsModule],
   controllers: [PatientPortalController],
   providers: [PatientPortalService, PrismaService],
   exports: [PatientPortalService],
@@ -1,9 +1,15 @@
-import { Injectable, NotFoundException } from '@nestjs/common';
+import { BadRequestException, Injectable, NotFoundException } from '@nestjs/common';
 import { PrismaService } from '../prisma/prisma.service';
+import { DailyRollupService } from '../rollups/daily-rollup.service';
+import { AppointmentKind } from '@prisma/client';
+import { SLOT_UNAVAILABLE, isSlotConflict } from '../appointments/appointment-slots.service';
 
 @Injectable()
 export class PatientPortalService {
-  constructor(private prisma: PrismaService) {}
+  constructor(
+    private prisma: PrismaService,
+    private rollups: DailyRollupService,
+  ) {}
 
   async getProfile(userId: string, tenantId: string) {
     const patient = await this.prisma.patient.findFirst({
@@ -47,15 +53,23 @@ export class PatientPortalService {
     });
     if (!patient) throw new NotFoundException('Patient not found');
 
-    const appointment = await this.prisma.appointment.create({
-      data: {
-        ...createDto,
-        patientId: patient.id,
-        tenantId,
-      },
-      include: { doctor: true },
-    });
-
+    const appointment = await this.prisma.appointment
+      .create({
+        data: {
+          ...createDto,
+          kind: AppointmentKind.SCHEDULED,
+          patientId: patient.id,
+          tenantId,
+        },
+        include: { doctor: true },
+      })
+      .catch((error) => {
+        throw isSlotConflict(error)
+          ? new BadRequestException(SLOT_UNAVAILABLE)
+          : error;
+      });
+
+    await this.rollups.touch(tenantId, 'appointments', appointment.startTime);
     return { success: true, message: 'Appointment booked', data: appointment };
   }
 
@@ -0,0 +1,31 @@
+import { IsOptional, IsString, IsIn, MaxLength } from 'class-validator';
+import { ApiPropertyOptional } from '@nestjs/swagger';
+import { CreatePatientDto } from './create-patient.dto';
+import { IMPORT_FORMATS, ImportFormat } from '../../shared/import/record-reader';
+
+/** One record of a bulk import: the create fields plus the legacy system's id */
+export class ImportPatientDto extends CreatePatientDto {
+  @ApiPropertyOptional({ example: 'LEGACY-000123', description: 'Patient id in the source system' })
+  @IsOptional()
+  @IsString()
+  @MaxLength(100)
+  externalId?: string;
+}
+
+export class ImportPatientsQueryDto {
+  @ApiPropertyOptional({ enum: IMPORT_FORMATS, default: 'csv' })
+  @IsOptional()
+  @IsIn(IMPORT_FORMATS)
+  format?: ImportFormat;
+
+  @ApiPropertyOptional({ description: 'Resume this import: rows up to its checkpoint are skipped' })
+  @IsOptional()
+  @IsString()
+  importId?: string;
+
+  @ApiPropertyOptional({ example: 'legacy-his-2026-10.csv', description: 'Name of the source, kept on the import record' })
+  @IsOptional()
+  @IsString()
+  @MaxLength(255)
+  source?: string;
+}
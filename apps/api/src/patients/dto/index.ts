@@ -1,3 +1,4 @@
 export * from './create-patient.dto';
 export * from './update-patient.dto';
 export * from './patient-query.dto';
+export * from './import-patient.dto';
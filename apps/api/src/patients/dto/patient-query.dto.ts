@@ -1,13 +1,14 @@
 import { IsOptional, IsString, IsInt, Min, Max, IsEnum } from 'class-validator';
 import { Type } from 'class-transformer';
 import { ApiPropertyOptional } from '@nestjs/swagger';
+import { KeysetPaginationQueryDto } from '../../shared/pagination/keyset-pagination.dto';
 
 export enum PatientStatus {
   ACTIVE = 'active',
   INACTIVE = 'inactive',
 }
 
-export class PatientQueryDto {
+export class PatientQueryDto extends KeysetPaginationQueryDto {
   @ApiPropertyOptional({ example: 1, minimum: 1 })
   @IsOptional()
   @Type(() => Number)
@@ -0,0 +1,274 @@
+import { Injectable, Logger, NotFoundException } from '@nestjs/common';
+import { plainToInstance } from 'class-transformer';
+import { validate } from 'class-validator';
+import { CustomPrismaService } from '../prisma/custom-prisma.service';
+import { StatsCacheService } from '../cache/stats-cache.service';
+import { DocumentSequenceService } from '../sequences/document-sequence.service';
+import { SourceRecord } from '../shared/import/record-reader';
+import { ImportPatientDto } from './dto';
+import { MEDICAL_RECORD_NUMBER_KEY, formatMedicalRecordNumber } from './patients.service';
+
+export const IMPORT_BATCH_SIZE = 1000;
+
+/** Row errors kept in the result; onError still sees every one */
+const MAX_REPORTED_ERRORS = 1000;
+
+/** Globally unique patient columns an imported row can collide on */
+const UNIQUE_FIELDS = ['email', 'aadharNumber', 'externalId'] as const;
+
+const ENUM_FIELDS = ['gender', 'bloodType', 'maritalStatus'];
+const LIST_FIELDS = ['allergies', 'chronicConditions', 'currentMedications'];
+
+export interface ImportRowError {
+  row: number;
+  errors: string[];
+}
+
+export interface PatientImportOptions {
+  /** Resume an earlier import: rows up to its checkpoint are skipped */
+  importId?: string;
+  source?: string;
+  batchSize?: number;
+  onError?: (error: ImportRowError) => void;
+  /** Called after each committed batch */
+  onBatch?: (progress: PatientImportResult) => void;
+}
+
+export interface PatientImportResult {
+  importId: string;
+  checkpoint: number;
+  processed: number;
+  imported: number;
+  failed: number;
+  errors: ImportRowError[];
+  errorsTruncated: boolean;
+}
+
+/**
+ * CSV cells are all strings: blanks become undefined, enum values are
+ * upper-cased and list fields accept a JSON array or "a; b; c".
+ */
+function normalizeRecord(record: Record<string, unknown>): Record<string, unknown> {
+  const normalized: Record<string, unknown> = {};
+  for (const [key, raw] of Object.entries(record)) {
+    let value = typeof raw === 'string' ? raw.trim() : raw;
+    if (value === '' || value === null) {
+      continue;
+    }
+    if (typeof value === 'string' && ENUM_FIELDS.includes(key)) {
+      value = value.toUpperCase();
+    } else if (typeof value === 'string' && LIST_FIELDS.includes(key)) {
+      try {
+        value = value.startsWith('[') ? JSON.parse(value) : value.split(';').map((item) => item.trim()).filter(Boolean);
+      } catch (error) {
+        // Left as a string and stored as-is
+      }
+    }
+    normalized[key] = value;
+  }
+  return normalized;
+}
+
+/**
+ * Bulk patient import (POST /patients/import and `npm run patients:import`).
+ *
+ * Records are validated against the create DTO a batch at a time, checked
+ * for collisions on the globally unique columns, given MRNs from one
+ * reserved sequence range per batch and inserted with createMany. A bad row
+ * is reported and skipped; it never fails its batch. Each batch commits
+ * together with the import's checkpoint, so rerunning the same source with
+ * the importId resumes exactly after the last committed row.
+ */
+@Injectable()
+export class PatientImportService {
+  private readonly logger = new Logger(PatientImportService.name);
+
+  constructor(
+    private readonly prisma: CustomPrismaService,
+    private readonly documentSequence: DocumentSequenceService,
+    private readonly statsCache: StatsCacheService,
+  ) {}
+
+  async import(
+    tenantId: string,
+    records: AsyncIterable<SourceRecord>,
+    options: PatientImportOptions = {},
+  ): Promise<PatientImportResult> {
+    const job = options.importId
+      ? await this.prisma.patientImport.findFirst({ where: { id: options.importId, tenantId } })
+      : await this.prisma.patientImport.create({ data: { tenantId, source: options.source } });
+    if (!job) {
+      throw new NotFoundException('Patient import not found');
+    }
+
+    const batchSize = options.batchSize || IMPORT_BATCH_SIZE;
+    const result: PatientImportResult = {
+      importId: job.id,
+      checkpoint: job.checkpoint,
+      processed: 0,
+      imported: 0,
+      failed: 0,
+      errors: [],
+      errorsTruncated: false,
+    };
+    const report = (error: ImportRowError) => {
+      result.failed++;
+      if (result.errors.length < MAX_REPORTED_ERRORS) {
+        result.errors.push(error);
+      } else {
+        result.errorsTruncated = true;
+      }
+      options.onError?.(error);
+    };
+
+    let batch: SourceRecord[] = [];
+    const flush = async () => {
+      await this.importBatch(tenantId, job.id, batch, result, report);
+      batch = [];
+      options.onBatch?.(result);
+    };
+
+    try {
+      for await (const record of records) {
+        if (record.row <= job.checkpoint) {
+          continue;
+        }
+        batch.push(record);
+        if (batch.length >= batchSize) {
+          await flush();
+        }
+      }
+      if (batch.length > 0) {
+        await flush();
+      }
+    } finally {
+      if (result.imported > 0) {
+        await this.statsCache.invalidateTenant(tenantId);
+      }
+    }
+
+    this.logger.log(
+      `Patient import ${job.id} for tenant ${tenantId}: ${result.imported} imported, ${result.failed} failed, checkpoint ${result.checkpoint}`,
+    );
+    return result;
+  }
+
+  private async importBatch(
+    tenantId: string,
+    importId: string,
+    batch: SourceRecord[],
+    result: PatientImportResult,
+    report: (error: ImportRowError) => void,
+  ): Promise<void> {
+    const rejected: ImportRowError[] = [];
+    const checked = await Promise.all(batch.map((source) => this.validateRecord(source)));
+    const valid: Array<{ row: number; patient: ImportPatientDto }> = [];
+    checked.forEach((item) => ('errors' in item ? rejected.push(item) : valid.push(item)));
+
+    // Collisions with existing patients and within the batch itself
+    const taken = await this.takenUniqueValues(valid.map((item) => item.patient));
+    const accepted = valid.filter(({ row, patient }) => {
+      const clashes = UNIQUE_FIELDS.filter((field) => patient[field] && taken.has(`${field}:${patient[field]}`));
+      if (clashes.length > 0) {
+        rejected.push({ row, errors: clashes.map((field) => `${field} already belongs to another patient`) });
+        return false;
+      }
+      UNIQUE_FIELDS.forEach((field) => patient[field] && taken.add(`${field}:${patient[field]}`));
+      return true;
+    });
+
+    const firstSequence = accepted.length
+      ? await this.documentSequence.reserveRange(tenantId, MEDICAL_RECORD_NUMBER_KEY, accepted.length)
+      : 0;
+    const issuedAt = new Date();
+    const data = accepted.map(({ patient }, i) => ({
+      ...patient,
+      medicalRecordNumber: formatMedicalRecordNumber(firstSequence + i, issuedAt),
+      tenantId,
+      country: patient.country || 'India',
+      dateOfBirth: patient.dateOfBirth ? new Date(patient.dateOfBirth) : undefined,
+    }));
+    const checkpoint = batch[batch.length - 1].row;
+
+    const { inserted, conflicts } = await this.prisma.$transaction(
+      async (tx) => {
+        const { count } = data.length
+          ? await tx.patient.createMany({ data, skipDuplicates: true })
+          : { count: 0 };
+
+        // Rows lost to a concurrent writer between the check above and the insert
+        let conflicts: ImportRowError[] = [];
+        if (count < data.length) {
+          const stored = await tx.patient.findMany({
+            where: { tenantId, medicalRecordNumber: { in: data.map((patient) => patient.medicalRecordNumber) } },
+            select: { medicalRecordNumber: true },
+          });
+          const storedNumbers = new Set(stored.map((patient) => patient.medicalRecordNumber));
+          conflicts = accepted
+            .filter((_, i) => !storedNumbers.has(data[i].medicalRecordNumber))
+            .map(({ row }) => ({ row, errors: ['Conflicts with an existing patient'] }));
+        }
+
+        await tx.patientImport.update({
+          where: { id: importId },
+          data: {
+            checkpoint,
+            imported: { increment: count },
+            failed: { increment: rejected.length + conflicts.length },
+          },
+        });
+        return { inserted: count, conflicts };
+      },
+      { timeout: 60000 },
+    );
+
+    [...rejected, ...conflicts].sort((a, b) => a.row - b.row).forEach(report);
+    result.processed += batch.length;
+    result.imported += inserted;
+    result.checkpoint = checkpoint;
+  }
+
+  private async validateRecord(
+    source: SourceRecord,
+  ): Promise<ImportRowError | { row: number; patient: ImportPatientDto }> {
+    if (source.error) {
+      return { row: source.row, errors: [source.error] };
+    }
+
+    const patient = plainToInstance(ImportPatientDto, normalizeRecord(source.record));
+    // Unknown columns are dropped rather than rejected: legacy exports carry extras
+    const failures = await validate(patient, { whitelist: true });
+    if (failures.length > 0) {
+      return {
+        row: source.row,
+        errors: failures.reduce(
+          (messages, failure) => messages.concat(Object.values(failure.constraints || {})),
+          [] as string[],
+        ),
+      };
+    }
+    return { row: source.row, patient };
+  }
+
+  /** "<field>:<value>" for every unique value in the batch that is already stored */
+  private async takenUniqueValues(patients: ImportPatientDto[]): Promise<Set<string>> {
+    const conditions = UNIQUE_FIELDS.map((field) => ({
+      field,
+      values: patients.map((patient) => patient[field]).filter(Boolean),
+    })).filter(({ values }) => values.length > 0);
+
+    if (conditions.length === 0) {
+      return new Set();
+    }
+
+    const existing = await this.prisma.patient.findMany({
+      where: { OR: conditions.map(({ field, values }) => ({ [field]: { in: values } })) },
+      select: { email: true, aadharNumber: true, externalId: true },
+    });
+    const taken = new Set<string>();
+    existing.forEach((patient) =>
+      UNIQUE_FIELDS.forEach((field) => patient[field] && taken.add(`${field}:${patient[field]}`)),
+    );
+    return taken;
+  }
+}
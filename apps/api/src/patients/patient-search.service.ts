@@ -0,0 +1,92 @@
+import { Injectable } from '@nestjs/common';
+import { Prisma } from '@prisma/client';
+import { CustomPrismaService } from '../prisma/custom-prisma.service';
+
+export interface PatientSearchHit {
+  id: string;
+  medicalRecordNumber: string;
+  firstName: string;
+  lastName: string;
+  phone: string | null;
+  email: string | null;
+  dateOfBirth: Date | null;
+  gender: string;
+  rank: number;
+}
+
+/** Escape LIKE wildcards in user input */
+function escapeLike(value: string): string {
+  return value.replace(/[\\%_]/g, '\\$&');
+}
+
+/**
+ * Ranked patient lookup used by the front desk (GET /patients/search).
+ *
+ * MRN and phone match by prefix (MRN upper-cased, phone on its digits only),
+ * names token by token and email by substring. Every branch is served by an
+ * index from the add_patient_search_indexes migration, so the expressions
+ * below must stay identical to the indexed ones. Exact and prefix MRN/phone
+ * hits rank first, then name similarity.
+ */
+@Injectable()
+export class PatientSearchService {
+  constructor(private readonly prisma: CustomPrismaService) {}
+
+  async search(tenantId: string, term: string, limit = 10): Promise<PatientSearchHit[]> {
+    const text = term.trim();
+    const upper = text.toUpperCase();
+    const digits = text.replace(/\D/g, '');
+    const tokens = text.split(/\s+/).filter(Boolean);
+    if (tokens.length === 0) {
+      return [];
+    }
+
+    const mrnPrefix = `${escapeLike(upper)}%`;
+    const phonePrefix = `${escapeLike(digits)}%`;
+    // Trigram indexes need three characters for a substring match, but can
+    // serve a shorter prefix match since word starts are padded
+    const namePatterns = tokens.map((token) =>
+      token.length >= 3 ? `%${escapeLike(token)}%` : `${escapeLike(token)}%`,
+    );
+
+    const matches = [
+      Prisma.sql`upper(p."medicalRecordNumber") LIKE ${mrnPrefix}`,
+      Prisma.sql`(${Prisma.join(
+        namePatterns.map(
+          (pattern) => Prisma.sql`(p."firstName" ILIKE ${pattern} OR p."lastName" ILIKE ${pattern})`,
+        ),
+        ' AND ',
+      )})`,
+    ];
+    if (digits.length >= 3) {
+      matches.push(Prisma.sql`regexp_replace(p."phone", '[^0-9]', '', 'g') LIKE ${phonePrefix}`);
+    }
+    if (text.length >= 3) {
+      matches.push(Prisma.sql`p."email" ILIKE ${`%${escapeLike(text)}%`}`);
+    }
+
+    const phoneRank =
+      digits.length >= 3
+        ? Prisma.sql`CASE WHEN regexp_replace(p."phone", '[^0-9]', '', 'g') LIKE ${phonePrefix} THEN 2 ELSE 0 END`
+        : Prisma.sql`0`;
+
+    const rows = await this.prisma.$queryRaw<PatientSearchHit[]>`
+      SELECT p."id", p."medicalRecordNumber", p."firstName", p."lastName", p."phone",
+             p."email", p."dateOfBirth", p."gender",
+             (CASE
+                WHEN upper(p."medicalRecordNumber") = ${upper} THEN 3
+                WHEN upper(p."medicalRecordNumber") LIKE ${mrnPrefix} THEN 2
+                ELSE 0
+              END
+              + ${phoneRank}
+              + word_similarity(${text}, p."firstName" || ' ' || p."lastName"))::float8 AS "rank"
+      FROM "patients" p
+      WHERE p."tenantId" = ${tenantId}
+        AND p."isActive" = true
+        AND (${Prisma.join(matches, ' OR ')})
+      ORDER BY "rank" DESC, p."lastName", p."firstName"
+      LIMIT ${limit}
+    `;
+    return rows.map((row) => ({ ...row, rank: Number(row.rank) }));
+  }
+}
@@ -10,16 +10,21 @@ import {
   UseGuards,
   HttpCode,
   HttpStatus,
+  Req,
 } from '@nestjs/common';
+import { Request } from 'express';
 import {
   ApiTags,
   ApiOperation,
   ApiResponse,
   ApiBearerAuth,
+  ApiConsumes,
 } from '@nestjs/swagger';
 import { PatientsService } from './patients.service';
+import { PatientImportService } from './patient-import.service';
 import { JwtAuthGuard } from '../auth/jwt-auth.guard';
-import { CreatePatientDto, UpdatePatientDto, PatientQueryDto } from './dto';
+import { CreatePatientDto, UpdatePatientDto, PatientQueryDto, ImportPatientsQueryDto } from './dto';
+import { parseImportFormat, readRecords } from '../shared/import/record-reader';
 import { CurrentUser } from '../shared/decorators/current-user.decorator';
 import { TenantId } from '../shared/decorators/tenant-id.decorator';
 import { PermissionsGuard } from '../rbac/guards/permissions.guard';
@@ -37,7 +42,10 @@ interface User {
 @Controller('patients')
 @UseGuards(JwtAuthGuard, PermissionsGuard)
 export class PatientsController {
-  constructor(private readonly patientsService: PatientsService) {}
+  constructor(
+    private readonly patientsService: PatientsService,
+    private readonly patientImport: PatientImportService,
+  ) {}
 
   @Post()
   @RequirePermissions('patient.create', 'PATIENT_CREATE')
@@ -52,6 +60,27 @@ export class PatientsController {
     return this.patientsService.create(createPatientDto, tenantId);
   }
 
+  @Post('import')
+  @RequirePermissions('patient.create', 'PATIENT_CREATE')
+  @ApiOperation({
+    summary: 'Bulk import patients from a CSV or NDJSON request body',
+    description:
+      'Bad rows are reported and skipped. Pass the returned importId to resend the same file and resume after its checkpoint.',
+  })
+  @ApiConsumes('text/csv', 'application/x-ndjson')
+  @ApiResponse({ status: 201, description: 'Import finished; see imported/failed and the row errors' })
+  async importPatients(
+    @Req() req: Request,
+    @Query() query: ImportPatientsQueryDto,
+    @TenantId() tenantId: string,
+  ) {
+    const result = await this.patientImport.import(tenantId, readRecords(req, parseImportFormat(query.format)), {
+      importId: query.importId,
+      source: query.source,
+    });
+    return { success: true, data: result };
+  }
+
   @Get()
   @RequirePermissions('patient.view', 'PATIENT_READ', 'VIEW_PATIENTS')
   @ApiOperation({ summary: 'Get all patients with pagination' })
@@ -65,7 +94,7 @@ export class PatientsController {
 
   @Get('search')
   @RequirePermissions('patient.view', 'PATIENT_READ', 'VIEW_PATIENTS')
-  @ApiOperation({ summary: 'Search patients by query' })
+  @ApiOperation({ summary: 'Search patients by MRN or phone prefix, name or email, best matches first' })
   @ApiResponse({ status: 200, description: 'Search results retrieved' })
   async search(@TenantId() tenantId: string, @Query('q') query: string) {
     return this.patientsService.search(tenantId, query);
@@ -1,11 +1,13 @@
 import { Module } from '@nestjs/common';
 import { PatientsController } from './patients.controller';
 import { PatientsService } from './patients.service';
+import { PatientSearchService } from './patient-search.service';
+import { PatientImportService } from './patient-import.service';
 
 @Module({
   imports: [],
   controllers: [PatientsController],
-  providers: [PatientsService],
-  exports: [PatientsService],
+  providers: [PatientsService, PatientSearchService, PatientImportService],
+  exports: [PatientsService, PatientImportService],
 })
 export class PatientsModule {}
@@ -5,13 +5,32 @@ import {
   Logger,
 } from '@nestjs/common';
 import { CustomPrismaService } from '../prisma/custom-prisma.service';
+import { StatsCacheService } from '../cache/stats-cache.service';
+import { DocumentSequenceService } from '../sequences/document-sequence.service';
+import { pageWindow, slicePage, countTotal, pageMeta, pageCount } from '../shared/pagination/keyset-pagination';
 import { CreatePatientDto, UpdatePatientDto, PatientQueryDto } from './dto';
+import { PatientSearchService } from './patient-search.service';
+
+/** DocumentSequence key MRNs are allocated from */
+export const MEDICAL_RECORD_NUMBER_KEY = 'MRN';
+
+/** MRN<yy><mm><sequence padded to 6 digits>, dated by when it is issued */
+export function formatMedicalRecordNumber(sequence: number, date = new Date()): string {
+  const year = date.getFullYear().toString().slice(-2);
+  const month = (date.getMonth() + 1).toString().padStart(2, '0');
+  return `${MEDICAL_RECORD_NUMBER_KEY}${year}${month}${sequence.toString().padStart(6, '0')}`;
+}
 
 @Injectable()
 export class PatientsService {
   private readonly logger = new Logger(PatientsService.name);
 
-  constructor(private readonly prisma: CustomPrismaService) {}
+  constructor(
+    private readonly prisma: CustomPrismaService,
+    private readonly statsCache: StatsCacheService,
+    private readonly documentSequence: DocumentSequenceService,
+    private readonly patientSearch: PatientSearchService,
+  ) {}
 
   async create(createPatientDto: CreatePatientDto, tenantId: string) {
     try {
@@ -109,6 +128,7 @@ export class PatientsService {
         totalVisits: patientRaw._count?.appointments || 0,
       };
 
+      await this.statsCache.invalidateTenant(tenantId);
       return {
         success: true,
         message: 'Patient created successfully',
@@ -121,8 +141,7 @@ export class PatientsService {
   }
 
   async findAll(tenantId: string, query: PatientQueryDto) {
-    const { page = 1, limit = 10, search, status = 'active' } = query;
-    const skip = (page - 1) * limit;
+    const { page = 1, limit = 10, search, status = 'active', cursor, count } = query;
 
     const where: any = {
       tenantId,
@@ -139,12 +158,14 @@ export class PatientsService {
       ];
     }
 
-    const [patientsRaw, total] = await Promise.all([
+    const window = pageWindow(where, { page, limit, cursor });
+
+    const [rows, total] = await Promise.all([
       this.prisma.patient.findMany({
-        where,
-        skip,
-        take: limit,
-        orderBy: { createdAt: 'desc' },
+        where: window.where,
+        skip: window.skip,
+        take: window.take,
+        orderBy: window.orderBy,
         select: {
           id: true,
           medicalRecordNumber: true,
@@ -188,11 +209,12 @@ export class PatientsService {
           },
         },
       }),
-      this.prisma.patient.count({ where }),
+      countTotal(count, (take) => this.prisma.patient.count({ where, take })),
     ]);
+    const slice = slicePage(rows, window);
 
     // Transform patients to match frontend expected structure
-    const patients = patientsRaw.map((patient) => {
+    const patients = slice.items.map((patient) => {
       const age = patient.dateOfBirth
         ? Math.floor(
             (new Date().getTime() - new Date(patient.dateOfBirth).getTime()) /
@@ -270,10 +292,11 @@ export class PatientsService {
       data: {
         patients,
         pagination: {
-          total,
+          total: total.total,
           page: page,
           limit: limit,
-          pages: Math.ceil(total / limit),
+          pages: pageCount(total, limit),
+          ...pageMeta(slice, window, total),
         },
       },
     };
@@ -284,29 +307,7 @@ export class PatientsService {
       return { success: true, data: [] };
     }
 
-    const patients = await this.prisma.patient.findMany({
-      where: {
-        tenantId,
-        isActive: true,
-        OR: [
-          { firstName: { contains: query } },
-          { lastName: { contains: query } },
-          { email: { contains: query } },
-          // { phoneNumber: { contains: query } },
-          { medicalRecordNumber: { contains: query } },
-        ],
-      },
-      take: 10,
-      select: {
-        id: true,
-        medicalRecordNumber: true,
-        firstName: true,
-        lastName: true,
-        phone: true,
-        dateOfBirth: true,
-        gender: true,
-      },
-    });
+    const patients = await this.patientSearch.search(tenantId, query);
 
     return {
       success: true,
@@ -465,6 +466,7 @@ export class PatientsService {
         totalVisits: patientRaw._count?.appointments || 0,
       };
 
+      await this.statsCache.invalidateTenant(tenantId);
       return {
         success: true,
         message: 'Patient updated successfully',
@@ -488,6 +490,7 @@ export class PatientsService {
 
       this.logger.log(`Patient soft deleted: ${id} for tenant: ${tenantId}`);
 
+      await this.statsCache.invalidateTenant(tenantId);
       return {
         success: true,
         message: 'Patient deleted successfully',
@@ -533,17 +536,9 @@ export class PatientsService {
   }
 
   private async generateMedicalRecordNumber(tenantId: string): Promise<string> {
-    const prefix = 'MRN';
-    const date = new Date();
-    const year = date.getFullYear().toString().slice(-2);
-    const month = (date.getMonth() + 1).toString().padStart(2, '0');
-
-    // Get the count of patients for this tenant to generate sequential number
-    const patientCount = await this.prisma.patient.count({
-      where: { tenantId },
-    });
-    const sequence = (patientCount + 1).toString().padStart(6, '0');
-
-    return `${prefix}${year}${month}${sequence}`;
+    // Tenant-wide sequence, so MRNs keep counting across months
+    return formatMedicalRecordNumber(
+      await this.documentSequence.next(tenantId, MEDICAL_RECORD_NUMBER_KEY),
+    );
   }
 }
@@ -1,9 +1,13 @@
 import { Injectable, NotFoundException } from '@nestjs/common';
 import { PrismaService } from '../prisma/prisma.service';
+import { DailyRollupService } from '../rollups/daily-rollup.service';
 
 @Injectable()
 export class PharmacyManagementService {
-  constructor(private prisma: PrismaService) {}
+  constructor(
+    private prisma: PrismaService,
+    private rollups: DailyRollupService,
+  ) {}
 
   async createMedication(createDto: any, tenantId: string) {
     const medication = await this.prisma.medication.create({
@@ -72,6 +76,7 @@ export class PharmacyManagementService {
       where: { id },
       data: { status: 'DISPENSED', dispensedDate: new Date() },
     });
+    await this.rollups.touch(tenantId, 'pharmacy_orders', updated.orderDate);
     return { success: true, message: 'Order dispensed', data: updated };
   }
 
@@ -16,12 +16,18 @@ import {
   PharmacyOrderStatus,
 } from './dto/pharmacy.dto';
 import { Prisma } from '@prisma/client';
+import { DocumentSequenceService } from '../sequences/document-sequence.service';
+import { DailyRollupService } from '../rollups/daily-rollup.service';
 
 @Injectable()
 export class PharmacyService {
   private readonly logger = new Logger(PharmacyService.name);
 
-  constructor(private prisma: CustomPrismaService) {}
+  constructor(
+    private prisma: CustomPrismaService,
+    private documentSequence: DocumentSequenceService,
+    private rollups: DailyRollupService,
+  ) {}
 
   // ==================== Helper Methods ====================
 
@@ -326,6 +332,7 @@ export class PharmacyService {
       });
 
       this.logger.log(`Successfully created pharmacy order with ID: ${pharmacyOrder.id}, order number: ${orderNumber}`);
+      await this.rollups.touch(tenantId, 'pharmacy_orders', pharmacyOrder.orderDate);
       return {
         success: true,
         message: 'Pharmacy order created successfully',
@@ -465,6 +472,7 @@ export class PharmacyService {
       });
 
       this.logger.log(`Successfully updated pharmacy order: ${order.orderNumber}`);
+      await this.rollups.touch(tenantId, 'pharmacy_orders', order.orderDate);
       return {
         success: true,
         message: 'Pharmacy order updated successfully',
@@ -521,7 +529,7 @@ export class PharmacyService {
 
       // Update order status accordingly
       if (allDispensed) {
-        await this.prisma.pharmacyOrder.update({
+        const order = await this.prisma.pharmacyOrder.update({
           where: { id: orderId },
           data: {
             status: PharmacyOrderStatus.DISPENSED,
@@ -529,12 +537,14 @@ export class PharmacyService {
           },
         });
         this.logger.log(`Updated order ${orderId} status to DISPENSED - all items dispensed`);
+        await this.rollups.touch(tenantId, 'pharmacy_orders', order.orderDate);
       } else if (someDispensed) {
-        await this.prisma.pharmacyOrder.update({
+        const order = await this.prisma.pharmacyOrder.update({
           where: { id: orderId },
           data: { status: PharmacyOrderStatus.PARTIALLY_DISPENSED },
         });
         this.logger.log(`Updated order ${orderId} status to PARTIALLY_DISPENSED`);
+        await this.rollups.touch(tenantId, 'pharmacy_orders', order.orderDate);
       }
 
       this.logger.log(`Successfully updated pharmacy order item: ${itemId}`);
@@ -558,10 +568,11 @@ export class PharmacyService {
     try {
       this.logger.log(`Cancelling pharmacy order with ID: ${id} for tenant: ${tenantId}`);
       
-      await this.prisma.pharmacyOrder.update({
+      const order = await this.prisma.pharmacyOrder.update({
         where: { id, tenantId },
         data: { status: PharmacyOrderStatus.CANCELLED },
       });
+      await this.rollups.touch(tenantId, 'pharmacy_orders', order.orderDate);
 
       this.logger.log(`Successfully cancelled pharmacy order with ID: ${id}`);
       return {
@@ -581,38 +592,19 @@ export class PharmacyService {
     try {
       this.logger.log(`Getting pharmacy stats for tenant: ${tenantId}`);
       
-      const [
-        totalOrders,
-        pendingOrders,
-        dispensedOrders,
-        completedOrders,
-        cancelledOrders,
-        totalMedications,
-        activeMedications,
-        todayOrders,
-      ] = await Promise.all([
-        this.prisma.pharmacyOrder.count({ where: { tenantId } }),
-        this.prisma.pharmacyOrder.count({
-          where: { tenantId, status: PharmacyOrderStatus.PENDING },
-        }),
-        this.prisma.pharmacyOrder.count({
-          where: { tenantId, status: PharmacyOrderStatus.DISPENSED },
+      const startOfDay = new Date(new Date().setHours(0, 0, 0, 0));
+      const [orders, medications] = await Promise.all([
+        this.prisma.countBuckets('PharmacyOrder', tenantId, {
+          totalOrders: Prisma.sql`TRUE`,
+          pendingOrders: Prisma.sql`status = 'PENDING'`,
+          dispensedOrders: Prisma.sql`status = 'DISPENSED'`,
+          completedOrders: Prisma.sql`status = 'COMPLETED'`,
+          cancelledOrders: Prisma.sql`status = 'CANCELLED'`,
+          todayOrders: Prisma.sql`"orderDate" >= ${startOfDay}`,
         }),
-        this.prisma.pharmacyOrder.count({
-          where: { tenantId, status: PharmacyOrderStatus.COMPLETED },
-        }),
-        this.prisma.pharmacyOrder.count({
-          where: { tenantId, status: PharmacyOrderStatus.CANCELLED },
-        }),
-        this.prisma.medication.count({ where: { tenantId } }),
-        this.prisma.medication.count({ where: { tenantId, isActive: true } }),
-        this.prisma.pharmacyOrder.count({
-          where: {
-            tenantId,
-            orderDate: {
-              gte: new Date(new Date().setHours(0, 0, 0, 0)),
-            },
-          },
+        this.prisma.countBuckets('Medication', tenantId, {
+          totalMedications: Prisma.sql`TRUE`,
+          activeMedications: Prisma.sql`"isActive" = true`,
         }),
       ]);
 
@@ -620,14 +612,14 @@ export class PharmacyService {
       return {
         success: true,
         data: {
-          totalOrders,
-          pendingOrders,
-          dispensedOrders,
-          completedOrders,
-          cancelledOrders,
-          totalMedications,
-          activeMedications,
-          todayOrders,
+          totalOrders: orders.totalOrders,
+          pendingOrders: orders.pendingOrders,
+          dispensedOrders: orders.dispensedOrders,
+          completedOrders: orders.completedOrders,
+          cancelledOrders: orders.cancelledOrders,
+          totalMedications: medications.totalMedications,
+          activeMedications: medications.activeMedications,
+          todayOrders: orders.todayOrders,
         },
       };
     } catch (error) {
@@ -638,12 +630,10 @@ export class PharmacyService {
 
   private async generateOrderNumber(tenantId: string): Promise<string> {
     try {
-      const count = await this.prisma.pharmacyOrder.count({
-        where: { tenantId },
-      });
+      const sequence = await this.documentSequence.next(tenantId, 'PH');
       const year = new Date().getFullYear();
       const month = String(new Date().getMonth() + 1).padStart(2, '0');
-      const orderNumber = `PH${year}${month}${String(count + 1).padStart(5, '0')}`;
+      const orderNumber = `PH${year}${month}${String(sequence).padStart(5, '0')}`;
       
       this.logger.log(`Generated order number: ${orderNumber} for tenant: ${tenantId}`);
       return orderNumber;
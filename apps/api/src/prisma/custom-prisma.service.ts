@@ -4,7 +4,9 @@ import {
   OnModuleDestroy,
   Logger,
 } from '@nestjs/common';
-import { PrismaClient as BasePrismaClient } from '@prisma/client';
+import { Prisma, PrismaClient as BasePrismaClient } from '@prisma/client';
+
+const SQL_IDENTIFIER = /^[A-Za-z_][A-Za-z0-9_]*$/;
 
 // This is a custom Prisma client that includes our custom methods
 @Injectable()
@@ -142,6 +144,41 @@ export class CustomPrismaService
 
     return result.count;
   }
+
+  /**
+   * Count several buckets of a tenant's rows in one table scan.
+   *
+   * Each bucket is a SQL predicate evaluated as `COUNT(*) FILTER (WHERE ...)`,
+   * so a stats endpoint needs one query per table instead of one count() per
+   * status value. Enum columns compare against plain literals, e.g.
+   * Prisma.sql`status = 'PENDING'`; use Prisma.sql`TRUE` for the table total.
+   */
+  async countBuckets<K extends string>(
+    table: string,
+    tenantId: string,
+    buckets: Record<K, Prisma.Sql>,
+  ): Promise<Record<K, number>> {
+    const keys = Object.keys(buckets) as K[];
+    if (!SQL_IDENTIFIER.test(table) || !keys.every((key) => SQL_IDENTIFIER.test(key))) {
+      throw new Error(`Invalid stats table or bucket name for ${table}`);
+    }
+
+    const columns = keys.map(
+      (key) =>
+        Prisma.sql`(COUNT(*) FILTER (WHERE ${buckets[key]}))::int AS ${Prisma.raw(`"${key}"`)}`,
+    );
+    const rows = await this.$queryRaw<Record<K, number>[]>`
+      SELECT ${Prisma.join(columns)}
+      FROM ${Prisma.raw(`"${table}"`)}
+      WHERE "tenantId" = ${tenantId}
+    `;
+
+    const counts = {} as Record<K, number>;
+    for (const key of keys) {
+      counts[key] = Number(rows[0]?.[key] ?? 0);
+    }
+    return counts;
+  }
 }
 
 // This is the type that will be used throughout the app
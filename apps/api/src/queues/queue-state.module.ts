@@ -0,0 +1,9 @@
+import { Global, Module } from '@nestjs/common';
+import { QueueStateService } from './queue-state.service';
+
+@Global()
+@Module({
+  providers: [QueueStateService],
+  exports: [QueueStateService],
+})
+export class QueueStateModule {}
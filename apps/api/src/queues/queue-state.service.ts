@@ -0,0 +1,244 @@
+import { Injectable, Logger, MessageEvent, OnModuleDestroy } from '@nestjs/common';
+import { ConfigService } from '@nestjs/config';
+import { Observable, Subject } from 'rxjs';
+
+export type QueueName = 'opd' | 'emergency';
+
+export interface QueueEntry {
+  id: string;
+  [field: string]: any;
+}
+
+/** How a queue is read; registered by the module that owns it */
+export interface QueueSource {
+  /** Every entry currently in the tenant's queue */
+  load(tenantId: string): Promise<QueueEntry[]>;
+  /** One entry, or null when it is not (or no longer) in the queue */
+  find(tenantId: string, id: string): Promise<QueueEntry | null>;
+  /** Changes when the queue's membership rule does, e.g. the day for OPD; triggers a resync */
+  period?(): string;
+  /** Orders snapshot entries the way `load` does; entries arrive in change order otherwise */
+  compare?(a: QueueEntry, b: QueueEntry): number;
+}
+
+/** Limits the entries one subscriber sees, e.g. a single doctor's screen */
+export type QueueFilter = (entry: QueueEntry) => boolean;
+
+interface QueueChange {
+  id: string;
+  entry: QueueEntry | null;
+  previous: QueueEntry | null;
+}
+
+interface QueueState {
+  tenantId: string;
+  queue: QueueName;
+  entries: Map<string, QueueEntry>;
+  version: number;
+  period: string;
+  syncedAt: number;
+  subscribers: number;
+  changes: Subject<QueueChange | 'heartbeat'>;
+  /** Loads and changes apply one at a time, in order */
+  chain: Promise<void>;
+}
+
+/**
+ * In-memory state of the OPD and emergency queues, pushed to waiting-room
+ * screens and triage desks over Server-Sent Events instead of being polled.
+ *
+ * A tenant's queue is loaded when its first subscriber connects and dropped
+ * with its last one. Writers call touch() with the id of the row they
+ * changed; only that row is re-read and the difference goes out to every
+ * subscriber as an upsert or remove event, so one write costs one small
+ * query however many screens are open. A subscriber gets a snapshot first
+ * and a heartbeat every QUEUE_HEARTBEAT_MS. Every QUEUE_RESYNC_MS, and when
+ * the source's period changes, the queue is reloaded and diffed, which also
+ * picks up writes made by other API instances.
+ */
+@Injectable()
+export class QueueStateService implements OnModuleDestroy {
+  private readonly logger = new Logger(QueueStateService.name);
+  private readonly sources = new Map<QueueName, QueueSource>();
+  private readonly states = new Map<string, QueueState>();
+  private readonly heartbeatMs: number;
+  private readonly resyncMs: number;
+  private readonly timer: NodeJS.Timeout;
+
+  constructor(configService: ConfigService) {
+    this.heartbeatMs = Math.max(1000, Number(configService.get('QUEUE_HEARTBEAT_MS', 25000)));
+    this.resyncMs = Math.max(this.heartbeatMs, Number(configService.get('QUEUE_RESYNC_MS', 300000)));
+    this.timer = setInterval(() => this.tick(), this.heartbeatMs);
+    this.timer.unref();
+  }
+
+  register(queue: QueueName, source: QueueSource): void {
+    this.sources.set(queue, source);
+  }
+
+  /**
+   * Record that a queue row was written. Never waits for or fails the
+   * write; does nothing unless someone is subscribed to the tenant's queue.
+   */
+  touch(tenantId: string, queue: QueueName, id: string): void {
+    const state = this.states.get(this.key(tenantId, queue));
+    if (!state) {
+      return;
+    }
+    this.enqueue(state, async () => {
+      const entry = await this.sources.get(queue).find(tenantId, id);
+      this.apply(state, id, entry);
+    });
+  }
+
+  /** SSE stream: a snapshot, then upsert/remove events and heartbeats */
+  stream(tenantId: string, queue: QueueName, filter: QueueFilter = () => true): Observable<MessageEvent> {
+    return new Observable<MessageEvent>((subscriber) => {
+      const state = this.attach(tenantId, queue);
+      let unsubscribe: () => void = () => undefined;
+
+      this.enqueue(state, async () => {
+        if (subscriber.closed) {
+          return;
+        }
+        // Snapshot and subscription happen in one step, so no change falls between them
+        subscriber.next(this.snapshot(state, filter));
+        const subscription = state.changes.subscribe((change) => {
+          const event = change === 'heartbeat'
+            ? { type: 'heartbeat', data: { version: state.version } }
+            : this.toEvent(state, change, filter);
+          if (event) {
+            subscriber.next(event);
+          }
+        });
+        unsubscribe = () => subscription.unsubscribe();
+      });
+
+      return () => {
+        unsubscribe();
+        this.detach(state);
+      };
+    });
+  }
+
+  onModuleDestroy(): void {
+    clearInterval(this.timer);
+    this.states.forEach((state) => state.changes.complete());
+    this.states.clear();
+  }
+
+  private attach(tenantId: string, queue: QueueName): QueueState {
+    const key = this.key(tenantId, queue);
+    let state = this.states.get(key);
+    if (!state) {
+      const source = this.sources.get(queue);
+      if (!source) {
+        throw new Error(`No source registered for the ${queue} queue`);
+      }
+      state = {
+        tenantId,
+        queue,
+        entries: new Map(),
+        version: 0,
+        period: source.period?.() ?? '',
+        syncedAt: 0,
+        subscribers: 0,
+        changes: new Subject(),
+        chain: Promise.resolve(),
+      };
+      this.states.set(key, state);
+      this.enqueue(state, () => this.resync(state));
+    }
+    state.subscribers++;
+    return state;
+  }
+
+  private detach(state: QueueState): void {
+    state.subscribers--;
+    if (state.subscribers <= 0) {
+      state.changes.complete();
+      this.states.delete(this.key(state.tenantId, state.queue));
+    }
+  }
+
+  /** Reload the whole queue and emit the differences */
+  private async resync(state: QueueState): Promise<void> {
+    const source = this.sources.get(state.queue);
+    state.period = source.period?.() ?? '';
+    const fresh = await source.load(state.tenantId);
+    state.syncedAt = Date.now();
+
+    const seen = new Set<string>();
+    for (const entry of fresh) {
+      seen.add(entry.id);
+      this.apply(state, entry.id, entry);
+    }
+    for (const id of Array.from(state.entries.keys())) {
+      if (!seen.has(id)) {
+        this.apply(state, id, null);
+      }
+    }
+  }
+
+  private apply(state: QueueState, id: string, entry: QueueEntry | null): void {
+    const previous = state.entries.get(id) || null;
+    if (!entry && !previous) {
+      return;
+    }
+    if (entry && previous && JSON.stringify(entry) === JSON.stringify(previous)) {
+      return;
+    }
+
+    if (entry) {
+      state.entries.set(id, entry);
+    } else {
+      state.entries.delete(id);
+    }
+    state.version++;
+    state.changes.next({ id, entry, previous });
+  }
+
+  private toEvent(state: QueueState, change: QueueChange, filter: QueueFilter): MessageEvent | null {
+    if (change.entry && filter(change.entry)) {
+      return { type: 'upsert', data: { version: state.version, entry: change.entry } };
+    }
+    // Left the queue, or moved out of this subscriber's view
+    if (change.previous && filter(change.previous)) {
+      return { type: 'remove', data: { version: state.version, id: change.id } };
+    }
+    return null;
+  }
+
+  private snapshot(state: QueueState, filter: QueueFilter): MessageEvent {
+    const queue = Array.from(state.entries.values()).filter(filter);
+    const compare = this.sources.get(state.queue).compare;
+    if (compare) {
+      queue.sort(compare);
+    }
+    return {
+      type: 'snapshot',
+      data: { version: state.version, queue, count: queue.length, timestamp: new Date().toISOString() },
+    };
+  }
+
+  private tick(): void {
+    const now = Date.now();
+    for (const state of this.states.values()) {
+      state.changes.next('heartbeat');
+      const source = this.sources.get(state.queue);
+      if (now - state.syncedAt >= this.resyncMs || (source.period?.() ?? '') !== state.period) {
+        this.enqueue(state, () => this.resync(state));
+      }
+    }
+  }
+
+  private enqueue(state: QueueState, step: () => Promise<void>): void {
+    state.chain = state.chain.then(step).catch((error) => {
+      this.logger.warn(`Failed to update the ${state.queue} queue of tenant ${state.tenantId}: ${error.message}`);
+    });
+  }
+
+  private key(tenantId: string, queue: QueueName): string {
+    return `${tenantId}:${queue}`;
+  }
+}
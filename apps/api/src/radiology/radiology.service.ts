@@ -1,5 +1,6 @@
 import { Injectable, NotFoundException, Logger, BadRequestException } from '@nestjs/common';
 import { CustomPrismaService } from '../prisma/custom-prisma.service';
+import { Prisma } from '@prisma/client';
 import {
   CreateStudyDto,
   UpdateStudyDto,
@@ -504,43 +505,27 @@ export class RadiologyService {
   }
 
   async getStats(tenantId: string) {
-    const [
-      totalStudies,
-      pendingStudies,
-      completedStudies,
-      totalReports,
-      pendingReports,
-      totalOrders,
-    ] = await Promise.all([
-      this.prisma.study.count({ where: { tenantId, isActive: true } }),
-      this.prisma.study.count({
-        where: { tenantId, isActive: true, status: 'SCHEDULED' },
+    const [studies, reports, orders] = await Promise.all([
+      this.prisma.countBuckets('Study', tenantId, {
+        total: Prisma.sql`"isActive" = true`,
+        pending: Prisma.sql`"isActive" = true AND status = 'SCHEDULED'`,
+        completed: Prisma.sql`"isActive" = true AND status = 'COMPLETED'`,
       }),
-      this.prisma.study.count({
-        where: { tenantId, isActive: true, status: 'COMPLETED' },
+      this.prisma.countBuckets('RadReport', tenantId, {
+        total: Prisma.sql`"isActive" = true`,
+        pending: Prisma.sql`"isActive" = true AND status = 'DRAFT'`,
       }),
-      this.prisma.radReport.count({ where: { tenantId, isActive: true } }),
-      this.prisma.radReport.count({
-        where: { tenantId, isActive: true, status: 'DRAFT' },
+      this.prisma.countBuckets('RadiologyOrder', tenantId, {
+        total: Prisma.sql`"isActive" = true`,
       }),
-      this.prisma.radiologyOrder.count({ where: { tenantId, isActive: true } }),
     ]);
 
     return {
       success: true,
       data: {
-        studies: {
-          total: totalStudies,
-          pending: pendingStudies,
-          completed: completedStudies,
-        },
-        reports: {
-          total: totalReports,
-          pending: pendingReports,
-        },
-        orders: {
-          total: totalOrders,
-        },
+        studies,
+        reports,
+        orders,
       },
     };
   }
@@ -2,19 +2,33 @@ import { Injectable, CanActivate, ExecutionContext, ForbiddenException } from '@
 import { Reflector } from '@nestjs/core';
 import { PERMISSIONS_KEY } from '../decorators/require-permissions.decorator';
 import { CustomPrismaService } from '../../prisma/custom-prisma.service';
+import { RolePermissionCacheService } from '../../cache/role-permission-cache.service';
+import { RouteMetadataCache } from '../../shared/guards/route-metadata.cache';
 
+/**
+ * Requires at least one of the route's @RequirePermissions() permissions.
+ *
+ * The route's requirement is read once per handler, and the role's active
+ * permissions come from RolePermissionCacheService as a Set, so a request
+ * normally costs no database round-trip.
+ */
 @Injectable()
 export class PermissionsGuard implements CanActivate {
+  private readonly routePermissions = new RouteMetadataCache<string[] | undefined>();
+
   constructor(
     private reflector: Reflector,
     private prisma: CustomPrismaService,
+    private rolePermissions: RolePermissionCacheService,
   ) {}
 
   async canActivate(context: ExecutionContext): Promise<boolean> {
-    const requiredPermissions = this.reflector.getAllAndOverride<string[]>(PERMISSIONS_KEY, [
-      context.getHandler(),
-      context.getClass(),
-    ]);
+    const requiredPermissions = this.routePermissions.get(context, () =>
+      this.reflector.getAllAndOverride<string[]>(PERMISSIONS_KEY, [
+        context.getHandler(),
+        context.getClass(),
+      ]),
+    );
 
     // If no permissions required, allow access
     if (!requiredPermissions || requiredPermissions.length === 0) {
@@ -33,40 +47,22 @@ export class PermissionsGuard implements CanActivate {
       return true;
     }
 
-    // Get user with role and permissions
-    const userWithPermissions = await this.prisma.user.findUnique({
-      where: { id: user.userId },
-      include: {
-        tenantRole: {
-          include: {
-            rolePermissions: {
-              include: {
-                permission: true,
-              },
-              where: {
-                permission: {
-                  isActive: true,
-                },
-              },
-            },
-          },
-        },
-      },
-    });
+    // The JWT strategy resolves roleId through the user status cache
+    const roleId =
+      user.roleId !== undefined
+        ? user.roleId
+        : (await this.prisma.user.findUnique({ where: { id: user.userId }, select: { roleId: true } }))?.roleId;
+
+    const rolePermissions = roleId
+      ? await this.rolePermissions.getOrLoad(roleId, () => this.loadRolePermissions(roleId))
+      : null;
 
-    if (!userWithPermissions || !userWithPermissions.tenantRole) {
+    if (!rolePermissions) {
       throw new ForbiddenException('User has no role assigned');
     }
 
-    // Get user's permission names
-    const userPermissions = userWithPermissions.tenantRole.rolePermissions.map(
-      (rp) => rp.permission.name,
-    );
-
     // Check if user has at least one of the required permissions (OR logic)
-    const hasPermission = requiredPermissions.some((permission) =>
-      userPermissions.includes(permission),
-    );
+    const hasPermission = requiredPermissions.some((permission) => rolePermissions.set.has(permission));
 
     if (!hasPermission) {
       throw new ForbiddenException(
@@ -75,8 +71,22 @@ export class PermissionsGuard implements CanActivate {
     }
 
     // Attach permissions to request for later use
-    request.user.permissions = userPermissions;
+    request.user.permissions = rolePermissions.names;
 
     return true;
   }
+
+  /** Active permission names of a role, or null if it no longer exists */
+  private async loadRolePermissions(roleId: string): Promise<string[] | null> {
+    const role = await this.prisma.tenantRole.findUnique({
+      where: { id: roleId },
+      select: {
+        rolePermissions: {
+          where: { permission: { isActive: true } },
+          select: { permission: { select: { name: true } } },
+        },
+      },
+    });
+    return role ? role.rolePermissions.map((rp) => rp.permission.name) : null;
+  }
 }
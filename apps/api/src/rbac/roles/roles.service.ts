@@ -5,12 +5,18 @@ import {
   ForbiddenException,
 } from '@nestjs/common';
 import { CustomPrismaService } from '../../prisma/custom-prisma.service';
+import { RolePermissionCacheService } from '../../cache/role-permission-cache.service';
+import { UserStatusCacheService } from '../../cache/user-status-cache.service';
 import { CreateRoleDto } from './dto/create-role.dto';
 import { UpdateRoleDto } from './dto/update-role.dto';
 
 @Injectable()
 export class RolesService {
-  constructor(private readonly prisma: CustomPrismaService) {}
+  constructor(
+    private readonly prisma: CustomPrismaService,
+    private readonly rolePermissionCache: RolePermissionCacheService,
+    private readonly userStatusCache: UserStatusCacheService,
+  ) {}
 
   /**
    * Create a new role for a tenant
@@ -186,6 +192,7 @@ export class RolesService {
       if (permissionIds.length > 0) {
         await this.assignPermissions(roleId, permissionIds);
       }
+      this.rolePermissionCache.invalidate(roleId);
     }
 
     // Log audit
@@ -226,6 +233,7 @@ export class RolesService {
     await this.prisma.tenantRole.delete({
       where: { id: roleId },
     });
+    this.rolePermissionCache.invalidate(roleId);
 
     // Log audit
     await this.prisma.auditLog.create({
@@ -268,6 +276,7 @@ export class RolesService {
       data: rolePermissions,
       skipDuplicates: true,
     });
+    this.rolePermissionCache.invalidate(roleId);
 
     return permissions;
   }
@@ -320,6 +329,7 @@ export class RolesService {
         },
       },
     });
+    this.userStatusCache.invalidate(userId);
 
     // Log audit
     await this.prisma.auditLog.create({
@@ -357,6 +367,7 @@ export class RolesService {
       where: { id: userId },
       data: { roleId: null },
     });
+    this.userStatusCache.invalidate(userId);
 
     // Log audit
     await this.prisma.auditLog.create({
@@ -1,11 +1,24 @@
 import { Injectable } from '@nestjs/common';
 import { PrismaService } from '../prisma/prisma.service';
+import { StatsCacheService } from '../cache/stats-cache.service';
+import { DailyRollupService, RollupMetric } from '../rollups/daily-rollup.service';
 
 @Injectable()
 export class ReportsService {
-  constructor(private prisma: PrismaService) {}
+  constructor(
+    private prisma: PrismaService,
+    private statsCache: StatsCacheService,
+    private rollups: DailyRollupService,
+  ) {}
 
   async getDashboard(tenantId: string) {
+    return this.statsCache.wrap(
+      { tenantId, endpoint: 'reports/dashboard' },
+      () => this.computeDashboard(tenantId),
+    );
+  }
+
+  private async computeDashboard(tenantId: string) {
     const [
       totalPatients,
       todayAppointments,
@@ -123,13 +136,8 @@ export class ReportsService {
       if (endDate) where.startTime.lte = new Date(endDate);
     }
 
-    const [total, byStatus, byDoctor] = await Promise.all([
-      this.prisma.appointment.count({ where }),
-      this.prisma.appointment.groupBy({
-        by: ['status'],
-        where,
-        _count: true,
-      }),
+    const [{ total, byStatus }, byDoctor] = await Promise.all([
+      this.statusTotals(tenantId, 'appointments', startDate, endDate),
       this.prisma.appointment.groupBy({
         by: ['doctorId'],
         where,
@@ -148,28 +156,16 @@ export class ReportsService {
   }
 
   async getRevenueReport(tenantId: string, query: any) {
-    const { startDate, endDate, groupBy = 'day' } = query;
-
-    const where: any = { tenantId, status: 'COMPLETED' };
-    if (startDate || endDate) {
-      where.paymentDate = {};
-      if (startDate) where.paymentDate.gte = new Date(startDate);
-      if (endDate) where.paymentDate.lte = new Date(endDate);
-    }
+    const { startDate, endDate } = query;
 
-    const payments = await this.prisma.payment.findMany({
-      where,
-      select: {
-        amount: true,
-        paymentDate: true,
-        paymentMethod: true,
-      },
-      orderBy: { paymentDate: 'asc' },
+    const methods = await this.rollups.totals(tenantId, 'payments', {
+      from: startDate,
+      to: endDate,
     });
 
-    const totalRevenue = payments.reduce((sum, p) => sum + p.amount, 0);
-    const byMethod = payments.reduce((acc: any, p) => {
-      acc[p.paymentMethod] = (acc[p.paymentMethod] || 0) + p.amount;
+    const totalRevenue = methods.reduce((sum, m) => sum + m.amount, 0);
+    const byMethod = methods.reduce((acc: any, m) => {
+      acc[m.dimension] = m.amount;
       return acc;
     }, {});
 
@@ -178,7 +174,7 @@ export class ReportsService {
       data: {
         totalRevenue,
         byMethod,
-        count: payments.length,
+        count: methods.reduce((sum, m) => sum + m.count, 0),
       },
     };
   }
@@ -186,20 +182,8 @@ export class ReportsService {
   async getLabReport(tenantId: string, query: any) {
     const { startDate, endDate } = query;
 
-    const where: any = { tenantId };
-    if (startDate || endDate) {
-      where.orderDate = {};
-      if (startDate) where.orderDate.gte = new Date(startDate);
-      if (endDate) where.orderDate.lte = new Date(endDate);
-    }
-
-    const [total, byStatus, topTests] = await Promise.all([
-      this.prisma.labOrder.count({ where }),
-      this.prisma.labOrder.groupBy({
-        by: ['status'],
-        where,
-        _count: true,
-      }),
+    const [{ total, byStatus }, topTests] = await Promise.all([
+      this.statusTotals(tenantId, 'lab_orders', startDate, endDate),
       this.prisma.labOrderTest.groupBy({
         by: ['testId'],
         where: { tenantId },
@@ -222,20 +206,8 @@ export class ReportsService {
   async getPharmacyReport(tenantId: string, query: any) {
     const { startDate, endDate } = query;
 
-    const where: any = { tenantId };
-    if (startDate || endDate) {
-      where.orderDate = {};
-      if (startDate) where.orderDate.gte = new Date(startDate);
-      if (endDate) where.orderDate.lte = new Date(endDate);
-    }
-
-    const [total, byStatus, topMedications] = await Promise.all([
-      this.prisma.pharmacyOrder.count({ where }),
-      this.prisma.pharmacyOrder.groupBy({
-        by: ['status'],
-        where,
-        _count: true,
-      }),
+    const [{ total, byStatus }, topMedications] = await Promise.all([
+      this.statusTotals(tenantId, 'pharmacy_orders', startDate, endDate),
       this.prisma.pharmacyOrderItem.groupBy({
         by: ['medicationId'],
         where: { tenantId },
@@ -254,4 +226,13 @@ export class ReportsService {
       },
     };
   }
+
+  /** Total and per-status counts from the daily rollups, shaped like a groupBy on status */
+  private async statusTotals(tenantId: string, metric: RollupMetric, startDate?: string, endDate?: string) {
+    const rows = await this.rollups.totals(tenantId, metric, { from: startDate, to: endDate });
+    return {
+      total: rows.reduce((sum, row) => sum + row.count, 0),
+      byStatus: rows.map((row) => ({ status: row.dimension, _count: row.count })),
+    };
+  }
 }
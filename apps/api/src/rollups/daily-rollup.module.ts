@@ -0,0 +1,9 @@
+import { Global, Module } from '@nestjs/common';
+import { DailyRollupService } from './daily-rollup.service';
+
+@Global()
+@Module({
+  providers: [DailyRollupService],
+  exports: [DailyRollupService],
+})
+export class DailyRollupModule {}
@@ -0,0 +1,234 @@
+import { Injectable, Logger, OnModuleInit } from '@nestjs/common';
+import { Prisma } from '@prisma/client';
+import { CustomPrismaService } from '../prisma/custom-prisma.service';
+import { JobQueueService } from '../jobs/job-queue.service';
+
+export type RollupMetric =
+  | 'payments'
+  | 'invoices'
+  | 'appointments'
+  | 'lab_orders'
+  | 'pharmacy_orders';
+
+export type RollupPeriod = 'day' | 'month' | 'year';
+
+/** Where each metric comes from. Identifiers only, never user input. */
+interface RollupSource {
+  table: string;
+  dayColumn: string;
+  dimension: string;
+  amount: string;
+  filter?: string;
+}
+
+const ROLLUP_SOURCES: Record<RollupMetric, RollupSource> = {
+  payments: {
+    table: 'Payment',
+    dayColumn: 'paymentDate',
+    dimension: 'paymentMethod',
+    amount: 'SUM(src."amount")',
+    filter: `src."status" = 'COMPLETED'`,
+  },
+  invoices: { table: 'Invoice', dayColumn: 'date', dimension: 'status', amount: 'SUM(src."totalAmount")' },
+  appointments: { table: 'Appointment', dayColumn: 'startTime', dimension: 'status', amount: '0' },
+  lab_orders: { table: 'LabOrder', dayColumn: 'orderDate', dimension: 'status', amount: '0' },
+  pharmacy_orders: { table: 'PharmacyOrder', dayColumn: 'orderDate', dimension: 'status', amount: '0' },
+};
+
+/** Days back the nightly rebuild recomputes, to repair any touch() that failed */
+const NIGHTLY_REBUILD_DAYS = 3;
+
+const PERIOD_FORMATS: Record<RollupPeriod, string> = {
+  day: 'YYYY-MM-DD',
+  month: 'YYYY-MM',
+  year: 'YYYY',
+};
+
+export interface RollupRange {
+  /** Inclusive; anything new Date() accepts. Only the (UTC) day is used. */
+  from?: string | Date;
+  to?: string | Date;
+}
+
+export interface RollupTotal {
+  dimension: string;
+  count: number;
+  amount: number;
+}
+
+export interface RollupBucket extends RollupTotal {
+  period: string;
+}
+
+function toDay(value: string | Date): string {
+  return new Date(value).toISOString().slice(0, 10);
+}
+
+/**
+ * Per-tenant daily summaries of payments, invoices, appointments and
+ * lab/pharmacy orders, so reports over long ranges read one row per day and
+ * dimension instead of every source row.
+ *
+ * Writers call touch() with the day(s) a row was on before and after the
+ * write; that day's summary is recomputed from the source table, which keeps
+ * status changes and deletes correct without tracking deltas. rebuild()
+ * recomputes everything and backs the `rollups:rebuild` command; a nightly
+ * job also rebuilds the last NIGHTLY_REBUILD_DAYS days.
+ */
+@Injectable()
+export class DailyRollupService implements OnModuleInit {
+  private readonly logger = new Logger(DailyRollupService.name);
+
+  constructor(
+    private readonly prisma: CustomPrismaService,
+    private readonly jobs: JobQueueService,
+  ) {}
+
+  onModuleInit(): void {
+    this.jobs.register(
+      'rollups.rebuild-recent',
+      () => this.rebuild({ from: new Date(Date.now() - NIGHTLY_REBUILD_DAYS * 24 * 60 * 60 * 1000) }),
+      { queue: 'maintenance', concurrency: 1 },
+    );
+    this.jobs.schedule('rollups.rebuild-recent', '0 1 * * *', 'rollups.rebuild-recent');
+  }
+
+  /**
+   * Recompute the metric for the days of the given dates. Failures are
+   * logged, not thrown, so a rollup problem never fails the write itself.
+   */
+  async touch(
+    tenantId: string,
+    metric: RollupMetric,
+    ...dates: Array<Date | string | null | undefined>
+  ): Promise<void> {
+    const days = Array.from(new Set(dates.filter(Boolean).map(toDay)));
+    try {
+      for (const day of days) {
+        await this.refreshDay(tenantId, metric, day);
+      }
+    } catch (error) {
+      this.logger.warn(
+        `Failed to refresh ${metric} rollup for tenant ${tenantId} (${days.join(', ')}): ${error.message}`,
+      );
+    }
+  }
+
+  /** Recompute rollups from the source tables, optionally for one tenant and/or a day range. */
+  async rebuild(
+    options: RollupRange & { tenantId?: string; metrics?: RollupMetric[] } = {},
+  ): Promise<Record<string, number>> {
+    const metrics = options.metrics || (Object.keys(ROLLUP_SOURCES) as RollupMetric[]);
+    const rebuilt: Record<string, number> = {};
+
+    for (const metric of metrics) {
+      const source = ROLLUP_SOURCES[metric];
+      const day = Prisma.raw(`src."${source.dayColumn}"::date`);
+      const sourceFilters = [
+        Prisma.sql`TRUE`,
+        ...(source.filter ? [Prisma.raw(source.filter)] : []),
+        ...(options.tenantId ? [Prisma.sql`src."tenantId" = ${options.tenantId}`] : []),
+        ...(options.from ? [Prisma.sql`${day} >= ${toDay(options.from)}::date`] : []),
+        ...(options.to ? [Prisma.sql`${day} <= ${toDay(options.to)}::date`] : []),
+      ];
+      const rollupFilters = [
+        Prisma.sql`"metric" = ${metric}`,
+        ...(options.tenantId ? [Prisma.sql`"tenantId" = ${options.tenantId}`] : []),
+        ...(options.from ? [Prisma.sql`"day" >= ${toDay(options.from)}::date`] : []),
+        ...(options.to ? [Prisma.sql`"day" <= ${toDay(options.to)}::date`] : []),
+      ];
+
+      const [, inserted] = await this.prisma.$transaction([
+        this.prisma.$executeRaw`DELETE FROM "DailyRollup" WHERE ${Prisma.join(rollupFilters, ' AND ')}`,
+        this.prisma.$executeRaw`
+          INSERT INTO "DailyRollup" ("tenantId", "day", "metric", "dimension", "count", "amount", "updatedAt")
+          SELECT src."tenantId", ${day}, ${metric}, src.${Prisma.raw(`"${source.dimension}"`)}::text,
+                 COUNT(*)::int, COALESCE(${Prisma.raw(source.amount)}, 0)::float8, NOW()
+          FROM ${Prisma.raw(`"${source.table}"`)} src
+          WHERE ${Prisma.join(sourceFilters, ' AND ')}
+          GROUP BY 1, 2, 4
+        `,
+      ]);
+      rebuilt[metric] = inserted;
+    }
+
+    return rebuilt;
+  }
+
+  /** Totals per dimension over the range */
+  async totals(tenantId: string, metric: RollupMetric, range: RollupRange = {}): Promise<RollupTotal[]> {
+    return this.prisma.$queryRaw<RollupTotal[]>`
+      SELECT "dimension", SUM("count")::int AS "count", SUM("amount")::float8 AS "amount"
+      FROM "DailyRollup"
+      WHERE ${this.rangeFilter(tenantId, metric, range)}
+      GROUP BY "dimension"
+      ORDER BY "dimension"
+    `;
+  }
+
+  /** Totals per (period, dimension) over the range, in period order */
+  async buckets(
+    tenantId: string,
+    metric: RollupMetric,
+    period: RollupPeriod,
+    range: RollupRange = {},
+  ): Promise<RollupBucket[]> {
+    return this.prisma.$queryRaw<RollupBucket[]>`
+      SELECT to_char(date_trunc(${period}, "day"::timestamp), ${PERIOD_FORMATS[period]}) AS "period",
+             "dimension", SUM("count")::int AS "count", SUM("amount")::float8 AS "amount"
+      FROM "DailyRollup"
+      WHERE ${this.rangeFilter(tenantId, metric, range)}
+      GROUP BY 1, 2
+      ORDER BY 1, 2
+    `;
+  }
+
+  private rangeFilter(tenantId: string, metric: RollupMetric, range: RollupRange): Prisma.Sql {
+    return Prisma.join(
+      [
+        Prisma.sql`"tenantId" = ${tenantId}`,
+        Prisma.sql`"metric" = ${metric}`,
+        ...(range.from ? [Prisma.sql`"day" >= ${toDay(range.from)}::date`] : []),
+        ...(range.to ? [Prisma.sql`"day" <= ${toDay(range.to)}::date`] : []),
+      ],
+      ' AND ',
+    );
+  }
+
+  private async refreshDay(tenantId: string, metric: RollupMetric, day: string): Promise<void> {
+    const source = ROLLUP_SOURCES[metric];
+    const column = Prisma.raw(`src."${source.dayColumn}"`);
+    const start = new Date(`${day}T00:00:00.000Z`);
+    const end = new Date(start.getTime() + 24 * 60 * 60 * 1000);
+
+    // Upsert the day's fresh totals and drop dimensions that no longer have
+    // rows. The advisory lock serializes refreshes of the same day, so each
+    // one aggregates on a snapshot taken after the previous one committed and
+    // a refresh that started earlier cannot overwrite newer totals.
+    await this.prisma.$transaction(async (tx) => {
+      await tx.$executeRaw`SELECT pg_advisory_xact_lock(hashtext(${`${tenantId}:${metric}:${day}`}))`;
+      await tx.$executeRaw`
+        WITH fresh AS (
+          SELECT src.${Prisma.raw(`"${source.dimension}"`)}::text AS "dimension",
+                 COUNT(*)::int AS "count",
+                 COALESCE(${Prisma.raw(source.amount)}, 0)::float8 AS "amount"
+          FROM ${Prisma.raw(`"${source.table}"`)} src
+          WHERE src."tenantId" = ${tenantId}
+            AND ${column} >= ${start} AND ${column} < ${end}
+            ${source.filter ? Prisma.sql`AND ${Prisma.raw(source.filter)}` : Prisma.empty}
+          GROUP BY 1
+        ),
+        stale AS (
+          DELETE FROM "DailyRollup"
+          WHERE "tenantId" = ${tenantId} AND "metric" = ${metric} AND "day" = ${day}::date
+            AND "dimension" NOT IN (SELECT "dimension" FROM fresh)
+        )
+        INSERT INTO "DailyRollup" ("tenantId", "day", "metric", "dimension", "count", "amount", "updatedAt")
+        SELECT ${tenantId}, ${day}::date, ${metric}, "dimension", "count", "amount", NOW()
+        FROM fresh
+        ON CONFLICT ("tenantId", "metric", "day", "dimension")
+        DO UPDATE SET "count" = EXCLUDED."count", "amount" = EXCLUDED."amount", "updatedAt" = NOW()
+      `;
+    });
+  }
+}
@@ -0,0 +1,88 @@
+import { Injectable } from '@nestjs/common';
+import { ConfigService } from '@nestjs/config';
+import { CustomPrismaService } from '../prisma/custom-prisma.service';
+
+interface ReservedBlock {
+  next: number;
+  last: number;
+}
+
+/**
+ * Allocates per-tenant document numbers (invoice, payment, orders, MRN).
+ *
+ * Each (tenantId, key) pair is one row in "DocumentSequence", incremented
+ * with a single upsert, so allocation is O(1) regardless of table size and
+ * concurrent requests (across replicas too) never get the same value.
+ *
+ * Numbers are unique and increasing but not gapless: the upsert commits on
+ * its own, before the document that uses the number is written, so a create
+ * that fails afterwards still consumes its number.
+ *
+ * With DOCUMENT_SEQUENCE_BLOCK_SIZE > 1 a process reserves that many values
+ * per round-trip and hands them out from memory, trading more gaps (numbers
+ * left in a block when the process stops are skipped) for fewer writes.
+ */
+@Injectable()
+export class DocumentSequenceService {
+  private readonly blockSize: number;
+  private readonly blocks = new Map<string, ReservedBlock>();
+  private readonly refills = new Map<string, Promise<ReservedBlock>>();
+
+  constructor(
+    private readonly prisma: CustomPrismaService,
+    configService: ConfigService,
+  ) {
+    this.blockSize = Math.max(1, Number(configService.get('DOCUMENT_SEQUENCE_BLOCK_SIZE', 1)));
+  }
+
+  async next(tenantId: string, key: string): Promise<number> {
+    if (this.blockSize === 1) {
+      return this.reserve(tenantId, key, 1);
+    }
+
+    const blockKey = `${tenantId}:${key}`;
+    for (;;) {
+      const block = this.blocks.get(blockKey);
+      if (block && block.next <= block.last) {
+        return block.next++;
+      }
+
+      // Concurrent callers wait for one refill instead of each reserving a block
+      let refill = this.refills.get(blockKey);
+      if (!refill) {
+        refill = this.reserve(tenantId, key, this.blockSize)
+          .then((last) => {
+            const reserved = { next: last - this.blockSize + 1, last };
+            this.blocks.set(blockKey, reserved);
+            return reserved;
+          })
+          .finally(() => this.refills.delete(blockKey));
+        this.refills.set(blockKey, refill);
+      }
+      await refill;
+    }
+  }
+
+  /**
+   * Reserve count consecutive values in one round-trip and return the first,
+   * for bulk allocation such as imports. Independent of the in-memory block.
+   */
+  async reserveRange(tenantId: string, key: string, count: number): Promise<number> {
+    const last = await this.reserve(tenantId, key, count);
+    return last - count + 1;
+  }
+
+  /** Increment the counter by count and return the new (highest reserved) value. */
+  private async reserve(tenantId: string, key: string, count: number): Promise<number> {
+    const rows = await this.prisma.$queryRaw<{ value: number }[]>`
+      INSERT INTO "DocumentSequence" ("tenantId", "key", "value", "updatedAt")
+      VALUES (${tenantId}, ${key}, ${count}, NOW())
+      ON CONFLICT ("tenantId", "key")
+      DO UPDATE SET
+        "value" = "DocumentSequence"."value" + EXCLUDED."value",
+        "updatedAt" = NOW()
+      RETURNING "value"
+    `;
+    return Number(rows[0].value);
+  }
+}
@@ -0,0 +1,144 @@
+import { BadRequestException, Logger } from '@nestjs/common';
+import { Readable, Transform } from 'stream';
+import { pipeline } from 'stream/promises';
+import { Response } from 'express';
+
+export type ExportFormat = 'csv' | 'ndjson';
+
+export const EXPORT_FORMATS: ExportFormat[] = ['csv', 'ndjson'];
+
+export interface ExportColumn<T> {
+  header: string;
+  value: (row: T) => unknown;
+}
+
+const logger = new Logger('StreamExport');
+
+/** Flush to the socket once this much output is buffered */
+const FLUSH_BYTES = 64 * 1024;
+
+const CONTENT_TYPES: Record<ExportFormat, string> = {
+  csv: 'text/csv; charset=utf-8',
+  ndjson: 'application/x-ndjson; charset=utf-8',
+};
+
+export function parseExportFormat(format?: string): ExportFormat {
+  const value = (format || 'csv').toLowerCase() as ExportFormat;
+  if (!EXPORT_FORMATS.includes(value)) {
+    throw new BadRequestException(`format must be one of: ${EXPORT_FORMATS.join(', ')}`);
+  }
+  return value;
+}
+
+export function csvCell(value: unknown): string {
+  if (value === null || value === undefined) {
+    return '';
+  }
+  const text = value instanceof Date ? value.toISOString() : String(value);
+  return /[",\r\n]/.test(text) ? `"${text.replace(/"/g, '""')}"` : text;
+}
+
+function exportLine<T>(format: ExportFormat, columns: ExportColumn<T>[], row: T): string {
+  return format === 'csv'
+    ? `${columns.map((column) => csvCell(column.value(row))).join(',')}\n`
+    : `${JSON.stringify(row)}\n`;
+}
+
+/**
+ * Object-mode rows in, CSV/NDJSON text out. NDJSON lines are the row objects
+ * themselves; CSV uses the given columns. Lines are coalesced into chunks of
+ * about FLUSH_BYTES so the socket is not written once per row.
+ */
+export function exportTransform<T>(format: ExportFormat, columns: ExportColumn<T>[]): Transform {
+  let buffer = format === 'csv' ? `${columns.map((column) => csvCell(column.header)).join(',')}\n` : '';
+
+  return new Transform({
+    writableObjectMode: true,
+    transform(row: T, _encoding, callback) {
+      try {
+        buffer += exportLine(format, columns, row);
+      } catch (error) {
+        return callback(error);
+      }
+      if (buffer.length >= FLUSH_BYTES) {
+        this.push(buffer);
+        buffer = '';
+      }
+      callback();
+    },
+    flush(callback) {
+      callback(null, buffer || undefined);
+    },
+  });
+}
+
+async function* resume<T>(first: IteratorResult<T>, iterator: AsyncIterator<T>): AsyncGenerator<T> {
+  try {
+    for (let next = first; !next.done; next = await iterator.next()) {
+      yield next.value;
+    }
+  } finally {
+    // Stop the source (e.g. further batch queries) if the client went away
+    await iterator.return?.();
+  }
+}
+
+/**
+ * Stream rows to the response as CSV or NDJSON.
+ *
+ * The iterator is piped through exportTransform into the response, so rows
+ * are pulled only as fast as the client reads them and memory stays flat
+ * however large the export is; a client disconnect stops the iteration.
+ * Errors from the first batch surface as a normal error response; after
+ * that a failure can only cut the response short.
+ */
+export async function writeExport<T>(
+  res: Response,
+  options: { format: ExportFormat; filename: string; columns: ExportColumn<T>[]; rows: AsyncIterable<T> },
+): Promise<void> {
+  const { format, filename, columns, rows } = options;
+
+  // Read the first row before committing to a 200, so a failing query still
+  // reaches the exception filter as a normal error response
+  const iterator = rows[Symbol.asyncIterator]();
+  const first = await iterator.next();
+
+  res.status(200);
+  res.setHeader('Content-Type', CONTENT_TYPES[format]);
+  res.setHeader('Content-Disposition', `attachment; filename="${filename}.${format}"`);
+  res.setHeader('Cache-Control', 'no-store');
+
+  try {
+    await pipeline(Readable.from(resume(first, iterator)), exportTransform(format, columns), res);
+  } catch (error) {
+    if (error.code !== 'ERR_STREAM_PREMATURE_CLOSE') {
+      logger.error(`Export ${filename}.${format} failed: ${error.message}`);
+    }
+  }
+}
+
+/** Rows read per query by keysetBatches */
+export const EXPORT_BATCH_SIZE = 1000;
+
+/**
+ * Read a whole result set in keyset batches and yield it row by row.
+ * fetchBatch gets the key of the last row read (undefined for the first
+ * batch) and the batch size; keyOf extracts that key from a row.
+ */
+export async function* keysetBatches<T, K>(
+  fetchBatch: (after: K | undefined, take: number) => Promise<T[]>,
+  keyOf: (row: T) => K,
+  batchSize = EXPORT_BATCH_SIZE,
+): AsyncGenerator<T> {
+  let after: K | undefined;
+  while (true) {
+    const rows = await fetchBatch(after, batchSize);
+    for (const row of rows) {
+      yield row;
+    }
+    if (rows.length < batchSize) {
+      return;
+    }
+    after = keyOf(rows[rows.length - 1]);
+  }
+}
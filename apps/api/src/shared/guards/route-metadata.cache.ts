@@ -0,0 +1,31 @@
+import { ExecutionContext } from '@nestjs/common';
+
+/**
+ * Per-route memo for guard metadata.
+ *
+ * Decorator metadata is fixed once the app has booted, so a guard only needs
+ * to read it through the Reflector (and compile it) the first time a handler
+ * is hit. Entries are keyed by controller class and handler, which is what
+ * getAllAndOverride() resolves against.
+ */
+export class RouteMetadataCache<T> {
+  private readonly byClass = new WeakMap<Function, WeakMap<Function, T>>();
+
+  get(context: ExecutionContext, resolve: () => T): T {
+    const cls = context.getClass();
+    const handler = context.getHandler();
+
+    let byHandler = this.byClass.get(cls);
+    if (!byHandler) {
+      byHandler = new WeakMap();
+      this.byClass.set(cls, byHandler);
+    }
+
+    if (byHandler.has(handler)) {
+      return byHandler.get(handler);
+    }
+    const value = resolve();
+    byHandler.set(handler, value);
+    return value;
+  }
+}
@@ -0,0 +1,80 @@
+import { parseCsvLine, readRecords, SourceRecord } from './record-reader';
+
+async function* chunked(data: Buffer, size: number): AsyncGenerator<Buffer> {
+  for (let i = 0; i < data.length; i += size) {
+    yield data.subarray(i, i + size);
+  }
+}
+
+async function collect(records: AsyncIterable<SourceRecord>): Promise<SourceRecord[]> {
+  const all: SourceRecord[] = [];
+  for await (const record of records) {
+    all.push(record);
+  }
+  return all;
+}
+
+describe('parseCsvLine', () => {
+  it('splits plain fields, keeping empty ones', () => {
+    expect(parseCsvLine('a,b,,d,')).toEqual(['a', 'b', '', 'd', '']);
+  });
+
+  it('keeps commas and newlines inside quotes and unescapes doubled quotes', () => {
+    expect(parseCsvLine('"Sharma, Ram","line 1\nline 2","say ""hi"""')).toEqual([
+      'Sharma, Ram',
+      'line 1\nline 2',
+      'say "hi"',
+    ]);
+  });
+});
+
+describe('readRecords', () => {
+  it('maps CSV rows onto the header and numbers data rows from 1', async () => {
+    const csv = Buffer.from('firstName,lastName\r\nRam,Sharma\r\n\r\nSita,"Devi, K"\r\n');
+
+    expect(await collect(readRecords(chunked(csv, 4), 'csv'))).toEqual([
+      { row: 1, record: { firstName: 'Ram', lastName: 'Sharma' } },
+      { row: 2, record: { firstName: 'Sita', lastName: 'Devi, K' } },
+    ]);
+  });
+
+  it('keeps a quoted field that spans lines in one record', async () => {
+    const csv = Buffer.from('name,notes\nRam,"first\nsecond"\n');
+
+    expect(await collect(readRecords(chunked(csv, 3), 'csv'))).toEqual([
+      { row: 1, record: { name: 'Ram', notes: 'first\nsecond' } },
+    ]);
+  });
+
+  it('reports rows with the wrong field count without stopping', async () => {
+    const csv = Buffer.from('a,b\n1\n2,3\n');
+
+    expect(await collect(readRecords(chunked(csv, 64), 'csv'))).toEqual([
+      { row: 1, error: 'Expected 2 fields, found 1' },
+      { row: 2, record: { a: '2', b: '3' } },
+    ]);
+  });
+
+  it('decodes multi-byte characters split across chunks', async () => {
+    const csv = Buffer.from('firstName,lastName\nराम,शर्मा\nসীতা,দেবী\n', 'utf8');
+
+    // Every chunk size up to 7 splits some 3-byte character
+    for (let size = 1; size <= 7; size++) {
+      expect(await collect(readRecords(chunked(csv, size), 'csv'))).toEqual([
+        { row: 1, record: { firstName: 'राम', lastName: 'शर्मा' } },
+        { row: 2, record: { firstName: 'সীতা', lastName: 'দেবী' } },
+      ]);
+    }
+  });
+
+  it('reads NDJSON objects and flags lines that are not objects', async () => {
+    const ndjson = Buffer.from('{"name":"राम"}\n[1]\n{bad\n{"name":"Sita"}');
+
+    const records = await collect(readRecords(chunked(ndjson, 5), 'ndjson'));
+    expect(records[0]).toEqual({ row: 1, record: { name: 'राम' } });
+    expect(records[1]).toEqual({ row: 2, error: 'Line is not a JSON object' });
+    expect(records[2].row).toBe(3);
+    expect(records[2].error).toMatch(/^Invalid JSON/);
+    expect(records[3]).toEqual({ row: 4, record: { name: 'Sita' } });
+  });
+});
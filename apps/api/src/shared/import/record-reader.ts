@@ -0,0 +1,128 @@
+import { BadRequestException } from '@nestjs/common';
+import { StringDecoder } from 'string_decoder';
+
+export type ImportFormat = 'csv' | 'ndjson';
+
+export const IMPORT_FORMATS: ImportFormat[] = ['csv', 'ndjson'];
+
+export interface SourceRecord {
+  /** 1-based position among the data records (the CSV header is not counted) */
+  row: number;
+  record?: Record<string, unknown>;
+  error?: string;
+}
+
+export function parseImportFormat(format?: string): ImportFormat {
+  const value = (format || 'csv').toLowerCase() as ImportFormat;
+  if (!IMPORT_FORMATS.includes(value)) {
+    throw new BadRequestException(`format must be one of: ${IMPORT_FORMATS.join(', ')}`);
+  }
+  return value;
+}
+
+/** Split a text stream into lines, keeping quoted CSV fields that span lines together */
+async function* splitLines(chunks: AsyncIterable<Buffer | string>, quoted: boolean): AsyncGenerator<string> {
+  // Holds back a multi-byte character split across chunks until it is complete
+  const decoder = new StringDecoder('utf8');
+  let pending = '';
+  let inQuotes = false;
+  let scanned = 0;
+
+  for await (const chunk of chunks) {
+    pending += typeof chunk === 'string' ? chunk : decoder.write(chunk);
+    let start = 0;
+    for (let i = scanned; i < pending.length; i++) {
+      const char = pending[i];
+      if (quoted && char === '"') {
+        inQuotes = !inQuotes;
+      } else if (char === '\n' && !inQuotes) {
+        yield pending.slice(start, i).replace(/\r$/, '');
+        start = i + 1;
+      }
+    }
+    pending = pending.slice(start);
+    scanned = pending.length;
+  }
+  pending += decoder.end();
+  if (pending.trim()) {
+    yield pending.replace(/\r$/, '');
+  }
+}
+
+/** Fields of one CSV record (RFC 4180 quoting) */
+export function parseCsvLine(line: string): string[] {
+  const fields: string[] = [];
+  let field = '';
+  let inQuotes = false;
+
+  for (let i = 0; i < line.length; i++) {
+    const char = line[i];
+    if (inQuotes) {
+      if (char === '"' && line[i + 1] === '"') {
+        field += '"';
+        i++;
+      } else if (char === '"') {
+        inQuotes = false;
+      } else {
+        field += char;
+      }
+    } else if (char === '"') {
+      inQuotes = true;
+    } else if (char === ',') {
+      fields.push(field);
+      field = '';
+    } else {
+      field += char;
+    }
+  }
+  fields.push(field);
+  return fields;
+}
+
+/**
+ * Read CSV (header row first) or NDJSON records from a byte stream, one at a
+ * time. Malformed records are yielded with an error instead of stopping the
+ * read; blank lines are skipped and not counted.
+ */
+export async function* readRecords(
+  chunks: AsyncIterable<Buffer | string>,
+  format: ImportFormat,
+): AsyncGenerator<SourceRecord> {
+  let header: string[] | undefined;
+  let row = 0;
+
+  for await (const line of splitLines(chunks, format === 'csv')) {
+    if (!line.trim()) {
+      continue;
+    }
+
+    if (format === 'ndjson') {
+      row++;
+      try {
+        const record = JSON.parse(line);
+        yield record && typeof record === 'object' && !Array.isArray(record)
+          ? { row, record }
+          : { row, error: 'Line is not a JSON object' };
+      } catch (error) {
+        yield { row, error: `Invalid JSON: ${error.message}` };
+      }
+      continue;
+    }
+
+    const fields = parseCsvLine(line);
+    if (!header) {
+      header = fields.map((name) => name.trim());
+      continue;
+    }
+    row++;
+    if (fields.length !== header.length) {
+      yield { row, error: `Expected ${header.length} fields, found ${fields.length}` };
+      continue;
+    }
+    const record: Record<string, unknown> = {};
+    header.forEach((name, i) => {
+      record[name] = fields[i];
+    });
+    yield { row, record };
+  }
+}
@@ -0,0 +1,31 @@
+import { IsOptional, IsString, IsEnum } from 'class-validator';
+import { ApiPropertyOptional } from '@nestjs/swagger';
+
+export enum TotalCountMode {
+  EXACT = 'exact',
+  APPROXIMATE = 'approximate',
+  NONE = 'none',
+}
+
+/**
+ * Query fields shared by list endpoints that support keyset pagination.
+ * List DTOs extend this so the fields pass the whitelisting ValidationPipe.
+ */
+export class KeysetPaginationQueryDto {
+  @ApiPropertyOptional({
+    description:
+      'Opaque cursor from a previous response (nextCursor). Send an empty value to fetch the first page in cursor mode; page is ignored when a cursor is given.',
+  })
+  @IsOptional()
+  @IsString()
+  cursor?: string;
+
+  @ApiPropertyOptional({
+    enum: TotalCountMode,
+    default: TotalCountMode.EXACT,
+    description: 'How to compute the total: exact, approximate (capped) or none (skip the count query)',
+  })
+  @IsOptional()
+  @IsEnum(TotalCountMode)
+  count?: TotalCountMode;
+}
@@ -0,0 +1,136 @@
+import { BadRequestException } from '@nestjs/common';
+import { TotalCountMode } from './keyset-pagination.dto';
+import {
+  APPROXIMATE_COUNT_LIMIT,
+  countTotal,
+  decodeCursor,
+  encodeCursor,
+  pageMeta,
+  pageWindow,
+  slicePage,
+} from './keyset-pagination';
+
+const at = (iso: string) => new Date(iso);
+
+describe('keyset pagination', () => {
+  describe('cursors', () => {
+    it('round-trip the sort value and id', () => {
+      const cursor = encodeCursor(at('2026-10-17T10:00:00.000Z'), 'patient-1');
+
+      expect(decodeCursor(cursor)).toEqual({ value: at('2026-10-17T10:00:00.000Z'), id: 'patient-1' });
+    });
+
+    it('reject malformed input', () => {
+      expect(() => decodeCursor('not-a-cursor')).toThrow(BadRequestException);
+      expect(() => decodeCursor(Buffer.from('garbage|id').toString('base64url'))).toThrow(BadRequestException);
+    });
+  });
+
+  describe('pageWindow', () => {
+    const where = { tenantId: 't1' };
+
+    it('uses skip/take without a cursor', () => {
+      const window = pageWindow(where, { page: 3, limit: 20 });
+
+      expect(window).toEqual({
+        where,
+        orderBy: [{ createdAt: 'desc' }, { id: 'desc' }],
+        skip: 40,
+        take: 20,
+        cursorMode: false,
+        order: { field: 'createdAt', direction: 'desc' },
+        limit: 20,
+      });
+    });
+
+    it('starts from the top with an empty cursor and fetches one extra row', () => {
+      const window = pageWindow(where, { limit: 10, cursor: '' });
+
+      expect(window.where).toBe(where);
+      expect(window.skip).toBeUndefined();
+      expect(window.take).toBe(11);
+      expect(window.cursorMode).toBe(true);
+    });
+
+    it('reads after the cursor by (field, id) in the sort direction', () => {
+      const value = at('2026-10-17T10:00:00.000Z');
+      const cursor = encodeCursor(value, 'p5');
+
+      expect(pageWindow(where, { limit: 10, cursor }).where).toEqual({
+        AND: [where, { OR: [{ createdAt: { lt: value } }, { createdAt: value, id: { lt: 'p5' } }] }],
+      });
+      expect(pageWindow(where, { limit: 10, cursor }, { field: 'startTime', direction: 'asc' }).where).toEqual({
+        AND: [where, { OR: [{ startTime: { gt: value } }, { startTime: value, id: { gt: 'p5' } }] }],
+      });
+    });
+  });
+
+  describe('slicePage', () => {
+    const rows = [1, 2, 3].map((n) => ({ id: `p${n}`, createdAt: at(`2026-10-0${n}T00:00:00.000Z`) }));
+
+    it('trims the look-ahead row and points the cursor at the last item kept', () => {
+      const window = pageWindow({}, { limit: 2, cursor: '' });
+      const slice = slicePage(rows, window);
+
+      expect(slice.items).toEqual(rows.slice(0, 2));
+      expect(slice.hasMore).toBe(true);
+      expect(decodeCursor(slice.nextCursor)).toEqual({ value: rows[1].createdAt, id: 'p2' });
+    });
+
+    it('has no next cursor on the last page or in page mode', () => {
+      expect(slicePage(rows, pageWindow({}, { limit: 3, cursor: '' }))).toEqual({
+        items: rows,
+        nextCursor: null,
+        hasMore: false,
+      });
+      expect(slicePage(rows, pageWindow({}, { limit: 2 })).nextCursor).toBeNull();
+    });
+  });
+
+  describe('countTotal', () => {
+    it('counts exactly by default', async () => {
+      const takes: (number | undefined)[] = [];
+      const total = await countTotal(undefined, async (take) => {
+        takes.push(take);
+        return 12345;
+      });
+
+      expect(total).toEqual({ total: 12345, totalIsExact: true });
+      expect(takes).toEqual([undefined]);
+    });
+
+    it('caps approximate counts and flags a capped total as inexact', async () => {
+      const capped = async (take?: number) => Math.min(take ?? Infinity, 50000);
+
+      expect(await countTotal(TotalCountMode.APPROXIMATE, capped)).toEqual({
+        total: APPROXIMATE_COUNT_LIMIT,
+        totalIsExact: false,
+      });
+      expect(await countTotal(TotalCountMode.APPROXIMATE, async () => 42)).toEqual({ total: 42, totalIsExact: true });
+    });
+
+    it('skips the count query in none mode', async () => {
+      let called = false;
+      const total = await countTotal(TotalCountMode.NONE, async () => {
+        called = true;
+        return 1;
+      });
+
+      expect(total).toEqual({ total: null, totalIsExact: false });
+      expect(called).toBe(false);
+    });
+  });
+
+  describe('pageMeta', () => {
+    it('adds cursor fields only in cursor mode and totalIsExact only when inexact', () => {
+      const slice = { items: [], nextCursor: 'abc', hasMore: true };
+
+      expect(pageMeta(slice, pageWindow({}, { limit: 1 }), { total: 5, totalIsExact: true })).toEqual({});
+      expect(pageMeta(slice, pageWindow({}, { limit: 1, cursor: '' }), { total: null, totalIsExact: false })).toEqual({
+        nextCursor: 'abc',
+        hasMore: true,
+        totalIsExact: false,
+      });
+    });
+  });
+});
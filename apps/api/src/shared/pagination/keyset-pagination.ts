@@ -0,0 +1,139 @@
+import { BadRequestException } from '@nestjs/common';
+import { TotalCountMode } from './keyset-pagination.dto';
+
+/** Approximate counts stop here; a total equal to it means "at least this many". */
+export const APPROXIMATE_COUNT_LIMIT = 10000;
+
+/** Sort key of a list. The row id is always appended as the tie-breaker. */
+export interface KeysetOrder {
+  field: string;
+  direction: 'asc' | 'desc';
+}
+
+export const CREATED_AT_DESC: KeysetOrder = { field: 'createdAt', direction: 'desc' };
+
+export interface PageWindow {
+  /** List filter, combined with the keyset condition in cursor mode */
+  where: any;
+  orderBy: any[];
+  skip?: number;
+  take: number;
+  cursorMode: boolean;
+  order: KeysetOrder;
+  limit: number;
+}
+
+export interface PageSlice<T> {
+  items: T[];
+  nextCursor: string | null;
+  hasMore: boolean;
+}
+
+export interface PageTotal {
+  total: number | null;
+  totalIsExact: boolean;
+}
+
+export function encodeCursor(value: Date, id: string): string {
+  return Buffer.from(`${value.toISOString()}|${id}`).toString('base64url');
+}
+
+export function decodeCursor(cursor: string): { value: Date; id: string } {
+  const [iso, id] = Buffer.from(cursor, 'base64url').toString('utf8').split('|');
+  const value = new Date(iso);
+  if (!id || isNaN(value.getTime())) {
+    throw new BadRequestException('Invalid pagination cursor');
+  }
+  return { value, id };
+}
+
+/**
+ * Build the findMany window for a list query.
+ *
+ * Without a cursor this is the usual skip/take over page. With one (an empty
+ * cursor starts from the top) rows are read after the cursor position by
+ * (order.field, id), so deep pages cost the same as the first one and rows
+ * inserted meanwhile do not shift the results. One extra row is fetched to
+ * tell whether another page exists.
+ */
+export function pageWindow(
+  where: any,
+  { page = 1, limit = 10, cursor }: { page?: number; limit?: number; cursor?: string },
+  order: KeysetOrder = CREATED_AT_DESC,
+): PageWindow {
+  const orderBy = [{ [order.field]: order.direction }, { id: order.direction }];
+
+  if (cursor === undefined) {
+    return { where, orderBy, skip: (page - 1) * limit, take: limit, cursorMode: false, order, limit };
+  }
+
+  let keysetWhere: any = where;
+  if (cursor) {
+    const after = decodeCursor(cursor);
+    const op = order.direction === 'desc' ? 'lt' : 'gt';
+    keysetWhere = {
+      AND: [
+        where,
+        {
+          OR: [
+            { [order.field]: { [op]: after.value } },
+            { [order.field]: after.value, id: { [op]: after.id } },
+          ],
+        },
+      ],
+    };
+  }
+
+  return { where: keysetWhere, orderBy, take: limit + 1, cursorMode: true, order, limit };
+}
+
+/** Trim the look-ahead row and derive the cursor for the next page. */
+export function slicePage<T extends { id: string }>(rows: T[], window: PageWindow): PageSlice<T> {
+  if (!window.cursorMode) {
+    return { items: rows, nextCursor: null, hasMore: false };
+  }
+
+  const hasMore = rows.length > window.limit;
+  const items = hasMore ? rows.slice(0, window.limit) : rows;
+  const last = items[items.length - 1];
+  return {
+    items,
+    nextCursor: hasMore ? encodeCursor((last as any)[window.order.field], last.id) : null,
+    hasMore,
+  };
+}
+
+/**
+ * Total for the list filter. count receives the row cap to apply (undefined
+ * for an exact count), e.g. (take) => prisma.patient.count({ where, take }).
+ */
+export async function countTotal(
+  mode: TotalCountMode | undefined,
+  count: (take?: number) => Promise<number>,
+): Promise<PageTotal> {
+  switch (mode) {
+    case TotalCountMode.NONE:
+      return { total: null, totalIsExact: false };
+    case TotalCountMode.APPROXIMATE: {
+      const total = await count(APPROXIMATE_COUNT_LIMIT);
+      return { total, totalIsExact: total < APPROXIMATE_COUNT_LIMIT };
+    }
+    default:
+      return { total: await count(), totalIsExact: true };
+  }
+}
+
+/**
+ * Extra pagination fields, merged into each endpoint's existing meta object:
+ * cursor fields in cursor mode, and totalIsExact when the total is capped or skipped.
+ */
+export function pageMeta(slice: PageSlice<unknown>, window: PageWindow, total: PageTotal) {
+  return {
+    ...(window.cursorMode ? { nextCursor: slice.nextCursor, hasMore: slice.hasMore } : {}),
+    ...(total.totalIsExact ? {} : { totalIsExact: false }),
+  };
+}
+
+export function pageCount(total: PageTotal, limit: number): number | null {
+  return total.total === null ? null : Math.ceil(total.total / limit);
+}
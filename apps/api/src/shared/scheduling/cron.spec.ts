@@ -0,0 +1,93 @@
+import { CronExpression } from './cron';
+
+/** The next `count` run times after `from`, as ISO strings */
+function runs(source: string, from: string, count = 1): string[] {
+  const cron = new CronExpression(source);
+  const times: string[] = [];
+  let after = new Date(from);
+  for (let i = 0; i < count; i++) {
+    after = cron.next(after);
+    times.push(after.toISOString());
+  }
+  return times;
+}
+
+describe('CronExpression', () => {
+  it('returns a time strictly after the given one, at the start of a minute', () => {
+    expect(runs('* * * * *', '2026-10-17T10:15:00.000Z')).toEqual(['2026-10-17T10:16:00.000Z']);
+    expect(runs('* * * * *', '2026-10-17T10:15:42.500Z')).toEqual(['2026-10-17T10:16:00.000Z']);
+  });
+
+  it('evaluates in UTC and rolls over days, months and years', () => {
+    expect(runs('0 3 * * *', '2026-10-17T03:00:00.000Z', 2)).toEqual([
+      '2026-10-18T03:00:00.000Z',
+      '2026-10-19T03:00:00.000Z',
+    ]);
+    expect(runs('30 0 1 1 *', '2026-10-17T00:00:00.000Z')).toEqual(['2027-01-01T00:30:00.000Z']);
+  });
+
+  it('supports lists, ranges and steps', () => {
+    expect(runs('*/20 * * * *', '2026-10-17T10:05:00.000Z', 3)).toEqual([
+      '2026-10-17T10:20:00.000Z',
+      '2026-10-17T10:40:00.000Z',
+      '2026-10-17T11:00:00.000Z',
+    ]);
+    expect(runs('0 9-17/4 * * *', '2026-10-17T10:00:00.000Z', 3)).toEqual([
+      '2026-10-17T13:00:00.000Z',
+      '2026-10-17T17:00:00.000Z',
+      '2026-10-18T09:00:00.000Z',
+    ]);
+    expect(runs('5,50 1 * * *', '2026-10-17T01:05:00.000Z', 2)).toEqual([
+      '2026-10-17T01:50:00.000Z',
+      '2026-10-18T01:05:00.000Z',
+    ]);
+    // A stepped single value runs from it to the end of the range
+    expect(runs('0 20/2 * * *', '2026-10-17T20:00:00.000Z', 2)).toEqual([
+      '2026-10-17T22:00:00.000Z',
+      '2026-10-18T20:00:00.000Z',
+    ]);
+  });
+
+  it('treats day of week 0 and 7 as Sunday', () => {
+    // 2026-10-17 is a Saturday
+    expect(runs('0 0 * * 7', '2026-10-17T00:00:00.000Z')).toEqual(['2026-10-18T00:00:00.000Z']);
+    expect(runs('0 0 * * 0', '2026-10-17T00:00:00.000Z')).toEqual(['2026-10-18T00:00:00.000Z']);
+    expect(runs('0 0 * * 1-5', '2026-10-17T00:00:00.000Z')).toEqual(['2026-10-19T00:00:00.000Z']);
+  });
+
+  it('runs on days matching either day field when both are restricted', () => {
+    // The 1st of the month or any Monday
+    expect(runs('0 0 1 * 1', '2026-10-17T00:00:00.000Z', 3)).toEqual([
+      '2026-10-19T00:00:00.000Z',
+      '2026-10-26T00:00:00.000Z',
+      '2026-11-01T00:00:00.000Z',
+    ]);
+  });
+
+  it('requires both day fields when only one is restricted', () => {
+    expect(runs('0 0 13 * *', '2026-10-17T00:00:00.000Z')).toEqual(['2026-11-13T00:00:00.000Z']);
+    expect(runs('0 0 * 2 1', '2026-10-17T00:00:00.000Z')).toEqual(['2027-02-01T00:00:00.000Z']);
+  });
+
+  it('skips months too short for the day of month', () => {
+    expect(runs('0 0 31 * *', '2026-10-31T00:00:00.000Z', 2)).toEqual([
+      '2026-12-31T00:00:00.000Z',
+      '2027-01-31T00:00:00.000Z',
+    ]);
+    expect(runs('0 0 29 2 *', '2026-10-17T00:00:00.000Z')).toEqual(['2028-02-29T00:00:00.000Z']);
+  });
+
+  it('throws for an expression that never matches', () => {
+    expect(() => runs('0 0 31 2 *', '2026-10-17T00:00:00.000Z')).toThrow('never matches');
+  });
+
+  it('rejects malformed expressions', () => {
+    expect(() => new CronExpression('* * * *')).toThrow('must have 5 fields');
+    expect(() => new CronExpression('60 * * * *')).toThrow('Invalid cron minute');
+    expect(() => new CronExpression('* 5-2 * * *')).toThrow('Invalid cron hour');
+    expect(() => new CronExpression('*/0 * * * *')).toThrow('Invalid cron minute');
+    expect(() => new CronExpression('* * 0 * *')).toThrow('Invalid cron day of month');
+    expect(() => new CronExpression('* * * * 8')).toThrow('Invalid cron day of week');
+    expect(() => new CronExpression('* * * jan *')).toThrow('Invalid cron month');
+  });
+});
@@ -0,0 +1,96 @@
+const FIELDS = [
+  { name: 'minute', min: 0, max: 59 },
+  { name: 'hour', min: 0, max: 23 },
+  { name: 'day of month', min: 1, max: 31 },
+  { name: 'month', min: 1, max: 12 },
+  { name: 'day of week', min: 0, max: 7 },
+];
+
+const MINUTE_MS = 60 * 1000;
+
+/** Give up looking for the next run after this many years (e.g. "0 0 31 2 *") */
+const SEARCH_YEARS = 5;
+
+function parseField(text: string, field: (typeof FIELDS)[number]): Set<number> {
+  const values = new Set<number>();
+  for (const part of text.split(',')) {
+    const [range, stepText] = part.split('/');
+    const step = stepText === undefined ? 1 : Number(stepText);
+    let [low, high] = [field.min, field.max];
+    if (range !== '*') {
+      const bounds = range.split('-').map(Number);
+      low = bounds[0];
+      high = bounds.length > 1 ? bounds[1] : stepText === undefined ? low : field.max;
+    }
+    if (![low, high, step].every(Number.isInteger) || step < 1 || low < field.min || high > field.max || low > high) {
+      throw new Error(`Invalid cron ${field.name} "${part}"`);
+    }
+    for (let value = low; value <= high; value += step) {
+      values.add(value);
+    }
+  }
+  return values;
+}
+
+/**
+ * Five-field cron expression ("minute hour day-of-month month day-of-week"),
+ * evaluated in UTC. Fields take *, values, ranges, lists and /steps; day of
+ * week is 0-7 with both 0 and 7 meaning Sunday. As in cron, when both day
+ * fields are restricted a day matching either one runs.
+ */
+export class CronExpression {
+  private readonly minutes: Set<number>;
+  private readonly hours: Set<number>;
+  private readonly daysOfMonth: Set<number>;
+  private readonly months: Set<number>;
+  private readonly daysOfWeek: Set<number>;
+  private readonly anyDayOfMonth: boolean;
+  private readonly anyDayOfWeek: boolean;
+
+  constructor(readonly source: string) {
+    const parts = source.trim().split(/\s+/);
+    if (parts.length !== FIELDS.length) {
+      throw new Error(`Cron expression "${source}" must have ${FIELDS.length} fields`);
+    }
+    [this.minutes, this.hours, this.daysOfMonth, this.months, this.daysOfWeek] = parts.map((part, i) =>
+      parseField(part, FIELDS[i]),
+    );
+    if (this.daysOfWeek.has(7)) {
+      this.daysOfWeek.add(0);
+    }
+    this.anyDayOfMonth = parts[2] === '*';
+    this.anyDayOfWeek = parts[4] === '*';
+  }
+
+  /** The first time strictly after `after` that the expression matches */
+  next(after: Date): Date {
+    const time = new Date(Math.floor(after.getTime() / MINUTE_MS) * MINUTE_MS + MINUTE_MS);
+    const limit = after.getUTCFullYear() + SEARCH_YEARS;
+
+    while (time.getUTCFullYear() <= limit) {
+      if (!this.months.has(time.getUTCMonth() + 1)) {
+        time.setUTCMonth(time.getUTCMonth() + 1, 1);
+        time.setUTCHours(0, 0);
+      } else if (!this.matchesDay(time)) {
+        time.setUTCDate(time.getUTCDate() + 1);
+        time.setUTCHours(0, 0);
+      } else if (!this.hours.has(time.getUTCHours())) {
+        time.setUTCHours(time.getUTCHours() + 1, 0);
+      } else if (!this.minutes.has(time.getUTCMinutes())) {
+        time.setUTCMinutes(time.getUTCMinutes() + 1);
+      } else {
+        return time;
+      }
+    }
+    throw new Error(`Cron expression "${this.source}" never matches`);
+  }
+
+  private matchesDay(time: Date): boolean {
+    const dayOfMonth = this.daysOfMonth.has(time.getUTCDate());
+    const dayOfWeek = this.daysOfWeek.has(time.getUTCDay());
+    if (this.anyDayOfMonth || this.anyDayOfWeek) {
+      return dayOfMonth && dayOfWeek;
+    }
+    return dayOfMonth || dayOfWeek;
+  }
+}
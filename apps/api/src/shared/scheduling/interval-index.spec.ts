@@ -0,0 +1,124 @@
+import { IntervalIndex } from './interval-index';
+
+describe('IntervalIndex', () => {
+  describe('construction', () => {
+    it('merges overlapping and touching intervals but keeps separated ones apart', () => {
+      const index = new IntervalIndex([
+        { start: 50, end: 60 },
+        { start: 10, end: 20 },
+        { start: 15, end: 30 },
+        { start: 30, end: 40 },
+        { start: 41, end: 45 },
+      ]);
+
+      expect(index.size).toBe(3);
+      expect(index.intersecting(0, 100)).toEqual([
+        { start: 10, end: 40 },
+        { start: 41, end: 45 },
+        { start: 50, end: 60 },
+      ]);
+    });
+
+    it('drops empty and inverted intervals', () => {
+      const index = new IntervalIndex([
+        { start: 10, end: 10 },
+        { start: 20, end: 15 },
+      ]);
+
+      expect(index.size).toBe(0);
+      expect(index.overlaps(0, 100)).toBe(false);
+    });
+
+    it('keeps an interval swallowed by an earlier, longer one inside it', () => {
+      const index = new IntervalIndex([
+        { start: 0, end: 100 },
+        { start: 10, end: 20 },
+      ]);
+
+      expect(index.intersecting(0, 200)).toEqual([{ start: 0, end: 100 }]);
+    });
+  });
+
+  describe('overlaps', () => {
+    const index = new IntervalIndex([
+      { start: 10, end: 20 },
+      { start: 30, end: 40 },
+    ]);
+
+    it('treats intervals as half-open, so touching ends do not overlap', () => {
+      expect(index.overlaps(0, 10)).toBe(false);
+      expect(index.overlaps(20, 30)).toBe(false);
+      expect(index.overlaps(40, 50)).toBe(false);
+    });
+
+    it('detects partial, enclosing and enclosed overlaps', () => {
+      expect(index.overlaps(5, 11)).toBe(true);
+      expect(index.overlaps(19, 21)).toBe(true);
+      expect(index.overlaps(0, 100)).toBe(true);
+      expect(index.overlaps(32, 33)).toBe(true);
+    });
+  });
+
+  describe('covers', () => {
+    const index = new IntervalIndex([
+      { start: 10, end: 20 },
+      { start: 20, end: 30 },
+      { start: 40, end: 50 },
+    ]);
+
+    it('accepts ranges inside one (merged) interval, ends included', () => {
+      expect(index.covers(10, 30)).toBe(true);
+      expect(index.covers(15, 25)).toBe(true);
+    });
+
+    it('rejects ranges crossing a gap or an edge', () => {
+      expect(index.covers(25, 45)).toBe(false);
+      expect(index.covers(5, 15)).toBe(false);
+      expect(index.covers(45, 55)).toBe(false);
+    });
+  });
+
+  describe('nextGap', () => {
+    const index = new IntervalIndex([
+      { start: 10, end: 20 },
+      { start: 20, end: 30 },
+      { start: 35, end: 40 },
+      { start: 50, end: 60 },
+    ]);
+
+    it('returns from when the slot is already free', () => {
+      expect(index.nextGap(0, 10)).toBe(0);
+      expect(index.nextGap(60, 100)).toBe(60);
+    });
+
+    it('skips adjacent bookings as one block', () => {
+      expect(index.nextGap(12, 5)).toBe(30);
+    });
+
+    it('skips gaps that are too short for the length', () => {
+      expect(index.nextGap(12, 6)).toBe(40);
+      expect(index.nextGap(12, 11)).toBe(60);
+    });
+
+    it('fits a slot that ends exactly where the next booking starts', () => {
+      expect(index.nextGap(40, 10)).toBe(40);
+      expect(index.nextGap(30, 5)).toBe(30);
+    });
+  });
+
+  describe('intersecting', () => {
+    it('returns whole intervals, not clipped to the query range', () => {
+      const index = new IntervalIndex([
+        { start: 0, end: 10 },
+        { start: 20, end: 30 },
+        { start: 40, end: 50 },
+      ]);
+
+      expect(index.intersecting(5, 25)).toEqual([
+        { start: 0, end: 10 },
+        { start: 20, end: 30 },
+      ]);
+      expect(index.intersecting(10, 20)).toEqual([]);
+    });
+  });
+});
@@ -0,0 +1,80 @@
+/** Half-open [start, end) in epoch milliseconds */
+export interface Interval {
+  start: number;
+  end: number;
+}
+
+/**
+ * Sorted, non-overlapping set of intervals. Overlapping and touching inputs
+ * are merged on construction, so both starts and ends are sorted and every
+ * lookup is a binary search: O(log n) per query after an O(n log n) build.
+ */
+export class IntervalIndex {
+  private readonly starts: number[] = [];
+  private readonly ends: number[] = [];
+
+  constructor(intervals: Iterable<Interval> = []) {
+    const sorted = Array.from(intervals)
+      .filter((interval) => interval.end > interval.start)
+      .sort((a, b) => a.start - b.start);
+
+    for (const { start, end } of sorted) {
+      const last = this.ends.length - 1;
+      if (last >= 0 && start <= this.ends[last]) {
+        this.ends[last] = Math.max(this.ends[last], end);
+      } else {
+        this.starts.push(start);
+        this.ends.push(end);
+      }
+    }
+  }
+
+  get size(): number {
+    return this.starts.length;
+  }
+
+  /** Whether anything in the index intersects [start, end) */
+  overlaps(start: number, end: number): boolean {
+    const i = this.firstEndingAfter(start);
+    return i < this.size && this.starts[i] < end;
+  }
+
+  /** Whether [start, end) lies entirely inside one interval */
+  covers(start: number, end: number): boolean {
+    const i = this.firstEndingAfter(start);
+    return i < this.size && this.starts[i] <= start && this.ends[i] >= end;
+  }
+
+  /** Earliest time at or after `from` where `length` ms fit without overlapping anything */
+  nextGap(from: number, length: number): number {
+    let time = from;
+    for (let i = this.firstEndingAfter(from); i < this.size && this.starts[i] < time + length; i++) {
+      time = Math.max(time, this.ends[i]);
+    }
+    return time;
+  }
+
+  /** The intervals intersecting [start, end), unclipped, in order */
+  intersecting(start: number, end: number): Interval[] {
+    const found: Interval[] = [];
+    for (let i = this.firstEndingAfter(start); i < this.size && this.starts[i] < end; i++) {
+      found.push({ start: this.starts[i], end: this.ends[i] });
+    }
+    return found;
+  }
+
+  /** Index of the first interval ending after `time`, or size if none */
+  private firstEndingAfter(time: number): number {
+    let low = 0;
+    let high = this.size;
+    while (low < high) {
+      const mid = (low + high) >>> 1;
+      if (this.ends[mid] <= time) {
+        low = mid + 1;
+      } else {
+        high = mid;
+      }
+    }
+    return low;
+  }
+}
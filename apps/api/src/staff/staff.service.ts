@@ -5,14 +5,19 @@ import {
   Logger,
 } from '@nestjs/common';
 import { CustomPrismaService } from '../prisma/custom-prisma.service';
+import { UserStatusCacheService } from '../cache/user-status-cache.service';
 import { CreateStaffDto, UpdateStaffDto, StaffQueryDto } from './dto';
-import * as bcrypt from 'bcrypt';
+import { PasswordHashService } from '../passwords/password-hash.service';
 
 @Injectable()
 export class StaffService {
   private readonly logger = new Logger(StaffService.name);
 
-  constructor(private readonly prisma: CustomPrismaService) {}
+  constructor(
+    private readonly prisma: CustomPrismaService,
+    private readonly userStatusCache: UserStatusCacheService,
+    private readonly passwords: PasswordHashService,
+  ) {}
 
   async create(createStaffDto: CreateStaffDto, tenantId: string) {
     try {
@@ -20,7 +25,7 @@ export class StaffService {
 
       // If userId not provided, create a new user
       if (!userId && createStaffDto.email && createStaffDto.password) {
-        const hashedPassword = await bcrypt.hash(createStaffDto.password, 10);
+        const hashedPassword = await this.passwords.hash(createStaffDto.password);
 
         const userData: any = {
           email: createStaffDto.email,
@@ -173,6 +178,7 @@ export class StaffService {
             licenseNumber: updateStaffDto.licenseNumber,
           },
         });
+        this.userStatusCache.invalidate(staff.userId);
       }
 
       // Update staff details
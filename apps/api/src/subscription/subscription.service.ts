@@ -1,15 +1,25 @@
-import { Injectable, NotFoundException, BadRequestException } from '@nestjs/common';
+import { Injectable, NotFoundException, BadRequestException, OnModuleInit } from '@nestjs/common';
 import { CustomPrismaService } from '../prisma/custom-prisma.service';
+import { JobQueueService } from '../jobs/job-queue.service';
 import { CreateSubscriptionDto, UpdateSubscriptionDto } from './dto/subscription.dto';
 import { StripeService } from './stripe.service';
 
 @Injectable()
-export class SubscriptionService {
+export class SubscriptionService implements OnModuleInit {
   constructor(
     private readonly prisma: CustomPrismaService,
     private readonly stripeService: StripeService,
+    private readonly jobs: JobQueueService,
   ) {}
 
+  onModuleInit() {
+    this.jobs.register('subscriptions.expire-lapsed', () => this.expireLapsedSubscriptions(), {
+      queue: 'maintenance',
+      concurrency: 1,
+    });
+    this.jobs.schedule('subscriptions.expire-lapsed', '15 * * * *', 'subscriptions.expire-lapsed');
+  }
+
   /**
    * Get current active subscription for a tenant
    */
@@ -222,6 +232,21 @@ export class SubscriptionService {
     });
   }
 
+  /**
+   * Cancel subscriptions that were set to cancel at period end once that
+   * period is over. Renewals are left alone: the payment webhooks do not
+   * move currentPeriodEnd yet, so a lapsed end date says nothing about
+   * whether the tenant paid.
+   */
+  async expireLapsedSubscriptions() {
+    const cancelled = await this.prisma.subscription.updateMany({
+      where: { status: { in: ['ACTIVE', 'TRIALING'] }, cancelAtPeriodEnd: true, currentPeriodEnd: { lt: new Date() } },
+      data: { status: 'CANCELLED' },
+    });
+
+    return { cancelled: cancelled.count };
+  }
+
   /**
    * Check if subscription is active and not expired
    */
@@ -5,8 +5,9 @@ import {
   BadRequestException,
 } from '@nestjs/common';
 import { CustomPrismaService } from '../prisma/custom-prisma.service';
+import { UserStatusCacheService } from '../cache/user-status-cache.service';
 import { Prisma } from '@prisma/client';
-import * as bcrypt from 'bcryptjs';
+import { PasswordHashService } from '../passwords/password-hash.service';
 import {
   CreateUserDto,
   UpdateUserDto,
@@ -17,7 +18,11 @@ import {
 
 @Injectable()
 export class UsersService {
-  constructor(private readonly prisma: CustomPrismaService) {}
+  constructor(
+    private readonly prisma: CustomPrismaService,
+    private readonly userStatusCache: UserStatusCacheService,
+    private readonly passwords: PasswordHashService,
+  ) {}
 
   async create(tenantId: string, createDto: CreateUserDto) {
     // Check if email already exists
@@ -30,7 +35,7 @@ export class UsersService {
     }
 
     // Hash password
-    const hashedPassword = await bcrypt.hash(createDto.password, 12);
+    const hashedPassword = await this.passwords.hash(createDto.password);
 
     // Create user
     const user = await this.prisma.user.create({
@@ -237,6 +242,8 @@ export class UsersService {
       },
     });
 
+    this.userStatusCache.invalidate(userId);
+
     return {
       success: true,
       message: 'User updated successfully',
@@ -271,6 +278,8 @@ export class UsersService {
       },
     });
 
+    this.userStatusCache.invalidate(userId);
+
     return {
       success: true,
       message: 'User deleted successfully',
@@ -292,7 +301,7 @@ export class UsersService {
     }
 
     // Hash new password
-    const hashedPassword = await bcrypt.hash(dto.newPassword, 12);
+    const hashedPassword = await this.passwords.hash(dto.newPassword);
 
     // Update password
     await this.prisma.user.update({
@@ -355,6 +364,8 @@ export class UsersService {
       },
     });
 
+    this.userStatusCache.invalidate(userId);
+
     return {
       success: true,
       message: 'Role assigned successfully',
@@ -86,6 +86,14 @@ export interface CommunicationStatsResponse {
   };
 }
 
+export interface UnreadCountsResponse {
+  success: boolean;
+  data: {
+    messages: number;
+    notifications: number;
+  };
+}
+
 const communicationsService = {
   // ==================== MESSAGE OPERATIONS ====================
 
@@ -154,6 +162,13 @@ const communicationsService = {
     return enhancedApiClient.delete(`/communications/notifications/${id}`);
   },
 
+  /**
+   * Get unread message and notification counts
+   */
+  getUnreadCounts: async (): Promise<UnreadCountsResponse> => {
+    return enhancedApiClient.get('/communications/unread-count');
+  },
+
   /**
    * Get communication statistics
    */
@@ -0,0 +1,211 @@
+"""
+Database helpers for the API benchmarks: connection, tenant seeding, cleanup.
+
+Seeding goes straight to Postgres with INSERT ... SELECT generate_series so a
+1M-row tenant takes minutes instead of the days it would take through the API.
+Every seeded row id starts with ``bench-<tag>-`` so a run can be removed again
+with ``cleanup`` without touching real data.
+
+Requires psycopg2 (``pip install psycopg2-binary``) and DATABASE_URL pointing
+at a local/staging database -- never production.
+"""
+
+import os
+import re
+import time
+
+try:
+    import psycopg2
+except ImportError:  # pragma: no cover - optional dependency
+    psycopg2 = None
+
+SCALES = {"10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+
+# Small reference tables; their size does not grow with the scale
+DOCTORS = 50
+# Half-hour appointment slots from 09:00
+SLOTS_PER_DAY = 16
+MEDICATIONS = 500
+LAB_TESTS = 100
+WARDS = 20
+BEDS_PER_WARD = 25
+
+# (table, id column prefix) for every table the seeder writes to, in
+# dependency order so cleanup can walk it backwards
+SEEDED_TABLES = [
+    ('"User"', "doc"),
+    ('"patients"', "pat"),
+    ('"Medication"', "med"),
+    ('"LabTest"', "lt"),
+    ('"Ward"', "ward"),
+    ('"Bed"', "bed"),
+    ('"Appointment"', "apt"),
+    ('"Invoice"', "inv"),
+    ('"Payment"', "pay"),
+    ('"LabOrder"', "lo"),
+    ('"PharmacyOrder"', "po"),
+    ('"EmergencyCase"', "er"),
+    ('"Message"', "msg"),
+    ('"Notification"', "ntf"),
+]
+
+
+def parse_scale(value):
+    value = str(value).lower()
+    if value in SCALES:
+        return SCALES[value]
+    match = re.fullmatch(r"(\d+)([km]?)", value)
+    if not match:
+        raise ValueError(f"Unrecognised scale: {value}")
+    return int(match.group(1)) * {"": 1, "k": 1_000, "m": 1_000_000}[match.group(2)]
+
+
+def connect(database_url=None):
+    if psycopg2 is None:
+        raise RuntimeError("psycopg2 is required for seeding: pip install psycopg2-binary")
+    url = database_url or os.environ.get("DATABASE_URL")
+    if not url:
+        raise RuntimeError("DATABASE_URL is not set")
+    # Prisma-only query parameters are not understood by libpq
+    url = re.sub(r"[?&](schema|connection_limit|pool_timeout|pgbouncer)=[^&]*", "", url)
+    return psycopg2.connect(url)
+
+
+def _enum_pick(values, expr="g"):
+    """SQL expression cycling deterministically through an enum's values."""
+    quoted = ",".join(f"'{v}'" for v in values)
+    return f"(ARRAY[{quoted}])[1 + ({expr} % {len(values)})]"
+
+
+def seed_statements(rows):
+    """Ordered (label, sql) pairs seeding one tenant with `rows` rows per fact table."""
+    days = 730  # spread history over two years so date-range reports have work to do
+    statements = [
+        ("doctors", f"""
+            INSERT INTO "User" (id, email, "passwordHash", "firstName", "lastName", role, "tenantId", "isActive", "updatedAt")
+            SELECT 'bench-' || %(tag)s || '-doc-' || g, 'bench-' || %(tag)s || '-doc-' || g || '@bench.local',
+                   'not-a-login', 'Doctor', 'Bench' || g, 'DOCTOR', %(tenant)s, true, now()
+            FROM generate_series(1, {DOCTORS}) g"""),
+        ("patients", f"""
+            INSERT INTO "patients" (id, "medicalRecordNumber", "firstName", "lastName", phone, gender, "tenantId", "isActive", "createdAt", "updatedAt")
+            SELECT 'bench-' || %(tag)s || '-pat-' || g, 'BMRN-' || %(tag)s || '-' || lpad(g::text, 7, '0'),
+                   (ARRAY['Asha','Ravi','Meera','Arjun','Priya','Kiran','Neha','Vikram'])[1 + g % 8],
+                   'Bench' || g, '+91' || lpad((9000000000 + g)::text, 10, '0'),
+                   {_enum_pick(['MALE', 'FEMALE', 'OTHER'])}::"Gender", %(tenant)s, g % 20 <> 0,
+                   now() - ((g % {days}) || ' days')::interval, now()
+            FROM generate_series(1, %(rows)s) g"""),
+        ("medications", f"""
+            INSERT INTO "Medication" (id, name, "genericName", "isActive", "tenantId", "updatedAt")
+            SELECT 'bench-' || %(tag)s || '-med-' || g, 'Medication ' || g, 'Generic ' || g, g % 10 <> 0, %(tenant)s, now()
+            FROM generate_series(1, {MEDICATIONS}) g"""),
+        ("lab tests", f"""
+            INSERT INTO "LabTest" (id, name, code, category, "isActive", "tenantId", "updatedAt")
+            SELECT 'bench-' || %(tag)s || '-lt-' || g, 'Lab Test ' || g, 'BENCH-' || %(tag)s || '-' || g,
+                   (ARRAY['Hematology','Biochemistry','Microbiology'])[1 + g % 3], g % 10 <> 0, %(tenant)s, now()
+            FROM generate_series(1, {LAB_TESTS}) g"""),
+        ("wards", f"""
+            INSERT INTO "Ward" (id, name, capacity, "tenantId", "updatedAt")
+            SELECT 'bench-' || %(tag)s || '-ward-' || g, 'Ward ' || g, {BEDS_PER_WARD}, %(tenant)s, now()
+            FROM generate_series(1, {WARDS}) g"""),
+        ("beds", f"""
+            INSERT INTO "Bed" (id, "bedNumber", "wardId", status, "tenantId", "updatedAt")
+            SELECT 'bench-' || %(tag)s || '-bed-' || g, 'B' || g,
+                   'bench-' || %(tag)s || '-ward-' || (1 + g % {WARDS}),
+                   {_enum_pick(['AVAILABLE', 'OCCUPIED', 'OCCUPIED', 'MAINTENANCE', 'RESERVED'])}::"BedStatus",
+                   %(tenant)s, now()
+            FROM generate_series(1, {WARDS * BEDS_PER_WARD}) g"""),
+        # Each doctor gets one booking per (day, slot) so the rows satisfy the
+        # Appointment_doctor_no_overlap constraint: g % DOCTORS picks the doctor
+        # and g / DOCTORS walks that doctor's days, then slots. Rows beyond
+        # DOCTORS * days * SLOTS_PER_DAY reuse slots as OPD walk-ins, which the
+        # constraint exempts.
+        ("appointments", f"""
+            INSERT INTO "Appointment" (id, "patientId", "doctorId", "startTime", "endTime", status, kind, reason, "tenantId", "createdAt", "updatedAt")
+            SELECT 'bench-' || %(tag)s || '-apt-' || g,
+                   'bench-' || %(tag)s || '-pat-' || (1 + g % %(rows)s),
+                   'bench-' || %(tag)s || '-doc-' || (1 + g % {DOCTORS}),
+                   date_trunc('day', now()) - ((g / {DOCTORS} % {days}) || ' days')::interval
+                     + ((9 * 60 + (g / {DOCTORS} / {days} % {SLOTS_PER_DAY}) * 30) || ' minutes')::interval,
+                   date_trunc('day', now()) - ((g / {DOCTORS} % {days}) || ' days')::interval
+                     + ((9 * 60 + (g / {DOCTORS} / {days} % {SLOTS_PER_DAY}) * 30 + 30) || ' minutes')::interval,
+                   {_enum_pick(['SCHEDULED', 'ARRIVED', 'IN_PROGRESS', 'COMPLETED', 'COMPLETED', 'CANCELLED', 'NO_SHOW'])}::"AppointmentStatus",
+                   (CASE WHEN g / {DOCTORS} / {days} < {SLOTS_PER_DAY} THEN 'SCHEDULED' ELSE 'WALK_IN' END)::"AppointmentKind",
+                   'Benchmark visit', %(tenant)s, now() - ((g / {DOCTORS} % {days}) || ' days')::interval, now()
+            FROM generate_series(1, %(rows)s) g"""),
+        ("invoices", f"""
+            INSERT INTO "Invoice" (id, "invoiceNumber", "patientId", date, "dueDate", status, "subTotal", "totalAmount", "tenantId", "createdAt", "updatedAt")
+            SELECT 'bench-' || %(tag)s || '-inv-' || g, 'BINV-' || %(tag)s || '-' || g,
+                   'bench-' || %(tag)s || '-pat-' || (1 + g % %(rows)s),
+                   now() - ((g % {days}) || ' days')::interval, now() - ((g % {days}) || ' days')::interval + interval '30 days',
+                   {_enum_pick(['PENDING', 'PAID', 'PAID', 'PARTIALLY_PAID', 'CANCELLED'])}::"InvoiceStatus",
+                   100 + g % 900, 100 + g % 900, %(tenant)s, now() - ((g % {days}) || ' days')::interval, now()
+            FROM generate_series(1, %(rows)s) g"""),
+        ("payments", f"""
+            INSERT INTO "Payment" (id, "paymentNumber", "invoiceId", amount, "paymentDate", "paymentMethod", status, "tenantId", "createdAt", "updatedAt")
+            SELECT 'bench-' || %(tag)s || '-pay-' || g, 'BPAY-' || %(tag)s || '-' || g,
+                   'bench-' || %(tag)s || '-inv-' || g, 50 + g % 500, now() - ((g % {days}) || ' days')::interval,
+                   {_enum_pick(['CASH', 'CREDIT_CARD', 'DEBIT_CARD', 'UPI', 'NET_BANKING'])}::"PaymentMethod",
+                   {_enum_pick(['COMPLETED', 'COMPLETED', 'COMPLETED', 'PENDING', 'FAILED'])}::"PaymentStatus",
+                   %(tenant)s, now() - ((g % {days}) || ' days')::interval, now()
+            FROM generate_series(1, %(rows)s) g"""),
+        ("lab orders", f"""
+            INSERT INTO "LabOrder" (id, "orderNumber", "patientId", "doctorId", status, "orderDate", "tenantId", "createdAt", "updatedAt")
+            SELECT 'bench-' || %(tag)s || '-lo-' || g, 'BLAB-' || %(tag)s || '-' || g,
+                   'bench-' || %(tag)s || '-pat-' || (1 + g % %(rows)s),
+                   'bench-' || %(tag)s || '-doc-' || (1 + g % {DOCTORS}),
+                   {_enum_pick(['PENDING', 'IN_PROGRESS', 'COMPLETED', 'COMPLETED', 'CANCELLED'])}::"LabOrderStatus",
+                   now() - ((g % {days}) || ' days')::interval, %(tenant)s, now() - ((g % {days}) || ' days')::interval, now()
+            FROM generate_series(1, %(rows)s) g"""),
+        ("pharmacy orders", f"""
+            INSERT INTO "PharmacyOrder" (id, "orderNumber", "patientId", "doctorId", status, "orderDate", "tenantId", "createdAt", "updatedAt")
+            SELECT 'bench-' || %(tag)s || '-po-' || g, 'BPH-' || %(tag)s || '-' || g,
+                   'bench-' || %(tag)s || '-pat-' || (1 + g % %(rows)s),
+                   'bench-' || %(tag)s || '-doc-' || (1 + g % {DOCTORS}),
+                   {_enum_pick(['PENDING', 'DISPENSED', 'PARTIALLY_DISPENSED', 'COMPLETED', 'CANCELLED'])}::"PharmacyOrderStatus",
+                   now() - ((g % {days}) || ' days')::interval, %(tenant)s, now() - ((g % {days}) || ' days')::interval, now()
+            FROM generate_series(1, %(rows)s) g"""),
+        ("emergency cases", f"""
+            INSERT INTO "EmergencyCase" (id, "patientId", "triageLevel", "chiefComplaint", status, "arrivalTime", "tenantId", "createdAt", "updatedAt")
+            SELECT 'bench-' || %(tag)s || '-er-' || g, 'bench-' || %(tag)s || '-pat-' || (1 + g % %(rows)s),
+                   {_enum_pick(['CRITICAL', 'URGENT', 'SEMI_URGENT', 'NON_URGENT'])}::"TriageLevel", 'Benchmark complaint',
+                   {_enum_pick(['WAITING', 'IN_TREATMENT', 'ADMITTED', 'DISCHARGED', 'TRANSFERRED'])}::"EmergencyCaseStatus",
+                   now() - ((g % {days}) || ' days')::interval, %(tenant)s, now() - ((g % {days}) || ' days')::interval, now()
+            FROM generate_series(1, %(rows)s) g"""),
+        ("messages", f"""
+            INSERT INTO "Message" (id, "senderId", "recipientId", subject, body, read, "tenantId", "createdAt", "updatedAt")
+            SELECT 'bench-' || %(tag)s || '-msg-' || g,
+                   'bench-' || %(tag)s || '-doc-' || (1 + g % {DOCTORS}),
+                   'bench-' || %(tag)s || '-doc-' || (1 + (g + 1) % {DOCTORS}),
+                   'Benchmark', 'Benchmark message body', g % 3 = 0, %(tenant)s,
+                   now() - ((g % {days}) || ' days')::interval, now()
+            FROM generate_series(1, %(rows)s) g"""),
+        ("notifications", f"""
+            INSERT INTO "Notification" (id, "userId", title, message, type, read, "tenantId", "createdAt", "updatedAt")
+            SELECT 'bench-' || %(tag)s || '-ntf-' || g, 'bench-' || %(tag)s || '-doc-' || (1 + g % {DOCTORS}),
+                   'Benchmark', 'Benchmark notification',
+                   {_enum_pick(['INFO', 'WARNING', 'SUCCESS', 'REMINDER'])}::"NotificationType", g % 3 = 0, %(tenant)s,
+                   now() - ((g % {days}) || ' days')::interval, now()
+            FROM generate_series(1, %(rows)s) g"""),
+    ]
+    # The statements are run with pyformat parameters, so SQL modulo needs escaping
+    return [(label, sql.replace(" % ", " %% ")) for label, sql in statements]
+
+
+def seed_tenant(conn, tenant_id, rows, tag, log=print):
+    params = {"tenant": tenant_id, "rows": rows, "tag": tag}
+    with conn.cursor() as cur:
+        for label, sql in seed_statements(rows):
+            start = time.perf_counter()
+            cur.execute(sql, params)
+            conn.commit()
+            log(f"  seeded {label:<16} {cur.rowcount:>9} rows in {time.perf_counter() - start:6.1f}s")
+        cur.execute("ANALYZE")
+    conn.commit()
+
+
+def cleanup(conn, tag, log=print):
+    with conn.cursor() as cur:
+        for table, prefix in reversed(SEEDED_TABLES):
+            cur.execute(f"DELETE FROM {table} WHERE id LIKE %s", (f"bench-{tag}-{prefix}-%",))
+            log(f"  removed {cur.rowcount:>9} rows from {table}")
+    conn.commit()
@@ -0,0 +1,155 @@
+"""
+Throughput benchmark for the streaming exports (GET /exports/* and
+GET /finance/reports/outstanding/export).
+
+Each export is downloaded in full, counting rows and bytes as they arrive,
+and reported as rows/sec together with the time to first byte. With --pid
+(the API process on this machine) the server's resident memory is sampled
+during every download; a streaming export should finish with a peak close
+to the starting RSS however many rows it writes.
+
+Usage:
+    pip install requests psycopg2-binary
+    export DATABASE_URL=postgresql://...   # local/staging database only
+    python stats_benchmark.py seed --scale 1m --tag s1m
+    python export_benchmark.py --format csv --pid $(pgrep -f "node dist/main") --out baselines/export-1m.json
+    python stats_benchmark.py cleanup --tag s1m
+"""
+
+import argparse
+import datetime
+import json
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "testsprite_tests"))
+
+import shared_session  # noqa: E402
+from stats_benchmark import BASE_URL, BENCH_CREDENTIALS, git_revision  # noqa: E402
+
+EXPORT_ROUTES = [
+    "/exports/patients",
+    "/exports/appointments",
+    "/exports/invoices",
+    "/exports/lab-orders",
+    "/finance/reports/outstanding/export",
+]
+
+CHUNK_BYTES = 256 * 1024
+
+
+def rss_mb(pid):
+    """Resident set size of a local process in MB (Linux /proc)."""
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024.0
+    return None
+
+
+class RssSampler(threading.Thread):
+    def __init__(self, pid, interval=0.1):
+        super().__init__(daemon=True)
+        self.pid = pid
+        self.interval = interval
+        self.start_mb = rss_mb(pid)
+        self.peak_mb = self.start_mb
+        self._done = threading.Event()
+
+    def run(self):
+        while not self._done.is_set():
+            self.peak_mb = max(self.peak_mb, rss_mb(self.pid) or 0)
+            self._done.wait(self.interval)
+
+    def stop(self):
+        self._done.set()
+        self.join()
+
+
+def download(http, url, headers, csv_header, pid=None):
+    sampler = RssSampler(pid) if pid else None
+    if sampler:
+        sampler.start()
+
+    started = time.perf_counter()
+    first_byte = None
+    size = 0
+    lines = 0
+    try:
+        with http.get(url, headers=headers, stream=True, timeout=(10, 600)) as response:
+            status = response.status_code
+            for chunk in response.iter_content(chunk_size=CHUNK_BYTES):
+                if first_byte is None:
+                    first_byte = time.perf_counter() - started
+                size += len(chunk)
+                lines += chunk.count(b"\n")
+    finally:
+        if sampler:
+            sampler.stop()
+    elapsed = time.perf_counter() - started
+
+    rows = lines - 1 if csv_header and lines else lines
+    result = {
+        "status": status,
+        "rows": rows,
+        "bytes": size,
+        "seconds": round(elapsed, 3),
+        "first_byte_ms": round((first_byte or elapsed) * 1000, 1),
+        "rows_per_sec": round(rows / elapsed, 1) if elapsed else None,
+    }
+    if sampler:
+        result["rss_start_mb"] = round(sampler.start_mb, 1)
+        result["rss_peak_mb"] = round(sampler.peak_mb, 1)
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark streaming exports")
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--format", choices=["csv", "ndjson"], default="csv")
+    parser.add_argument("--route", action="append", help="Only these routes (repeatable)")
+    parser.add_argument("--pid", type=int, help="Local API process to sample RSS from")
+    parser.add_argument("--out", help="Write the JSON results here")
+    args = parser.parse_args(argv)
+
+    session = shared_session.SharedSession(base_url=args.base_url)
+    headers = session.auth_headers(BENCH_CREDENTIALS)
+
+    results = {}
+    failures = 0
+    for route in args.route or EXPORT_ROUTES:
+        url = f"{session.base_url}{route}?format={args.format}"
+        result = download(session.session, url, headers, args.format == "csv", args.pid)
+        results[route] = result
+        failures += result["status"] != 200
+        memory = ""
+        if "rss_peak_mb" in result:
+            memory = f"  rss {result['rss_start_mb']:.0f} -> {result['rss_peak_mb']:.0f} MB"
+        print(
+            f"{route:<40} {result['rows']:>9} rows  {result['seconds']:>8.2f} s"
+            f"  {result['rows_per_sec']:>10.0f} rows/s  ttfb {result['first_byte_ms']:.0f} ms{memory}"
+            + ("" if result["status"] == 200 else f"  HTTP {result['status']}")
+        )
+
+    if args.out:
+        report = {
+            "meta": {
+                "base_url": session.base_url,
+                "format": args.format,
+                "git_revision": git_revision(),
+                "recorded_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            },
+            "routes": results,
+        }
+        os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to {args.out}")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
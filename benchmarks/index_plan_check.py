@@ -0,0 +1,160 @@
+"""
+Query-plan regression check for the tenant-leading indexes.
+
+Every service query filters on "tenantId" first. This script EXPLAINs the
+canonical query of each hot access path (stats by status, a doctor's day,
+the OPD and triage queues, revenue by date, unread counters, ...) against a
+tenant seeded by bench_db and fails if any of them falls back to a
+sequential scan of a table. Tables smaller than --min-rows are reported but
+not failed, since scanning a few hundred rows is the right plan.
+
+Usage:
+    pip install psycopg2-binary
+    export DATABASE_URL=postgresql://...   # local/staging database only
+    python stats_benchmark.py seed --scale 100k --tag s100k
+    python index_plan_check.py --tag s100k
+    python index_plan_check.py --tag s100k --verbose   # print every plan
+
+The tenant is the one the seeded rows belong to unless --tenant-id is given.
+"""
+
+import argparse
+import datetime
+import json
+import sys
+
+import bench_db
+
+# (label, query) mirroring the Prisma queries of each service
+CANONICAL_QUERIES = [
+    ("appointments by status", """SELECT COUNT(*) FROM "Appointment"
+        WHERE "tenantId" = %(tenant)s AND "status" = 'SCHEDULED'"""),
+    ("appointments today", """SELECT COUNT(*) FROM "Appointment"
+        WHERE "tenantId" = %(tenant)s AND "startTime" >= %(today)s AND "startTime" < %(tomorrow)s"""),
+    ("doctor's day", """SELECT id FROM "Appointment"
+        WHERE "tenantId" = %(tenant)s AND "doctorId" = %(doctor)s
+          AND "startTime" >= %(today)s AND "startTime" < %(tomorrow)s
+        ORDER BY "startTime" """),
+    ("opd queue", """SELECT id FROM "Appointment"
+        WHERE "tenantId" = %(tenant)s AND "startTime" >= %(today)s AND "startTime" < %(tomorrow)s
+          AND "status" IN ('SCHEDULED', 'ARRIVED', 'IN_PROGRESS')
+        ORDER BY "startTime" LIMIT 50"""),
+    ("invoices by status", """SELECT COUNT(*) FROM "Invoice"
+        WHERE "tenantId" = %(tenant)s AND "status" = 'PENDING'"""),
+    ("payments by status", """SELECT COUNT(*) FROM "Payment"
+        WHERE "tenantId" = %(tenant)s AND "status" = 'PENDING'"""),
+    ("revenue this month", """SELECT SUM("amount") FROM "Payment"
+        WHERE "tenantId" = %(tenant)s AND "paymentDate" >= %(month_start)s AND "status" = 'COMPLETED'"""),
+    ("beds by status", """SELECT COUNT(*) FROM "Bed"
+        WHERE "tenantId" = %(tenant)s AND "isActive" = true AND "status" = 'AVAILABLE'"""),
+    ("beds of a ward", """SELECT id FROM "Bed"
+        WHERE "tenantId" = %(tenant)s AND "wardId" = %(ward)s"""),
+    ("triage queue", """SELECT id FROM "EmergencyCase"
+        WHERE "tenantId" = %(tenant)s AND "status" IN ('WAITING', 'IN_TREATMENT')
+        ORDER BY "triageLevel", "arrivalTime" LIMIT 50"""),
+    ("emergency arrivals today", """SELECT COUNT(*) FROM "EmergencyCase"
+        WHERE "tenantId" = %(tenant)s AND "arrivalTime" >= %(today)s"""),
+    ("inventory list", """SELECT id FROM "InventoryItem"
+        WHERE "tenantId" = %(tenant)s AND "isActive" = true ORDER BY "name" LIMIT 20"""),
+    ("inventory by category", """SELECT id FROM "InventoryItem"
+        WHERE "tenantId" = %(tenant)s AND "category" = 'Consumables' LIMIT 20"""),
+    ("unread messages", """SELECT COUNT(*) FROM "Message"
+        WHERE "tenantId" = %(tenant)s AND "recipientId" = %(doctor)s AND "read" = false"""),
+    ("sent messages", """SELECT id FROM "Message"
+        WHERE "tenantId" = %(tenant)s AND "senderId" = %(doctor)s ORDER BY "createdAt" DESC LIMIT 20"""),
+    ("unread notifications", """SELECT COUNT(*) FROM "Notification"
+        WHERE "tenantId" = %(tenant)s AND "userId" = %(doctor)s AND "read" = false"""),
+    ("notification list", """SELECT id FROM "Notification"
+        WHERE "tenantId" = %(tenant)s AND "userId" = %(doctor)s ORDER BY "createdAt" DESC LIMIT 20"""),
+]
+
+TABLES = sorted({sql.split('FROM "', 1)[1].split('"', 1)[0] for _, sql in CANONICAL_QUERIES})
+
+
+def plan_nodes(node):
+    """Every node of an EXPLAIN (FORMAT JSON) plan tree, depth first."""
+    yield node
+    for child in node.get("Plans", []):
+        yield from plan_nodes(child)
+
+
+def scan_summary(nodes):
+    scans = [n for n in nodes if "Scan" in n["Node Type"] and "Relation Name" in n]
+    return ", ".join(
+        f"{n['Node Type']}" + (f" using {n['Index Name']}" if "Index Name" in n else f" on {n['Relation Name']}")
+        for n in scans
+    )
+
+
+def query_params(cur, args):
+    tenant_id = args.tenant_id
+    if not tenant_id:
+        cur.execute('SELECT "tenantId" FROM "User" WHERE id = %s', (f"bench-{args.tag}-doc-1",))
+        row = cur.fetchone()
+        if not row:
+            raise RuntimeError(f"No seeded rows for tag {args.tag}; seed first or pass --tenant-id")
+        tenant_id = row[0]
+
+    today = datetime.datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    return {
+        "tenant": tenant_id,
+        "doctor": f"bench-{args.tag}-doc-1",
+        "ward": f"bench-{args.tag}-ward-1",
+        "today": today,
+        "tomorrow": today + datetime.timedelta(days=1),
+        "month_start": today.replace(day=1),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fail if a canonical tenant query scans a table sequentially")
+    parser.add_argument("--tag", required=True, help="Tag of the seeding run")
+    parser.add_argument("--tenant-id", default=None)
+    parser.add_argument("--min-rows", type=int, default=10_000,
+                        help="Sequential scans of tables estimated below this size are allowed")
+    parser.add_argument("--no-analyze", action="store_true", help="Skip ANALYZE of the tables first")
+    parser.add_argument("--verbose", action="store_true", help="Print every plan")
+    args = parser.parse_args(argv)
+
+    failures = 0
+    conn = bench_db.connect()
+    try:
+        conn.autocommit = True
+        with conn.cursor() as cur:
+            if not args.no_analyze:
+                # Fresh statistics, so the plans reflect the seeded volume
+                for table in TABLES:
+                    cur.execute(f'ANALYZE "{table}"')
+            params = query_params(cur, args)
+
+            cur.execute("SELECT relname, reltuples::bigint FROM pg_class WHERE relname = ANY(%s)", (TABLES,))
+            sizes = dict(cur.fetchall())
+
+            for label, sql in CANONICAL_QUERIES:
+                cur.execute("EXPLAIN (FORMAT JSON) " + sql, params)
+                plan = cur.fetchone()[0]
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+                nodes = list(plan_nodes(plan[0]["Plan"]))
+
+                seq_scans = [n["Relation Name"] for n in nodes if n["Node Type"] == "Seq Scan"]
+                large = [t for t in seq_scans if sizes.get(t, 0) >= args.min_rows]
+                if large:
+                    status = "SEQ SCAN"
+                    failures += 1
+                elif seq_scans:
+                    status = "small table"
+                else:
+                    status = "ok"
+                print(f"{label:<26} {status:<11} {scan_summary(nodes)}")
+                if args.verbose or large:
+                    print(json.dumps(plan[0]["Plan"], indent=2, default=str))
+    finally:
+        conn.close()
+
+    print(f"\n{failures} of {len(CANONICAL_QUERIES)} quer{'y' if failures == 1 else 'ies'} scanned a table sequentially")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
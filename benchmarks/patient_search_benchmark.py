@@ -0,0 +1,153 @@
+"""
+Benchmark for patient lookup (GET /patients/search and GET /patients?search=).
+
+Front-desk lookup has a budget of 50 ms per request on a tenant with a million
+patients. This script times a fixed set of lookups (MRN and phone prefixes,
+names, short prefixes) against a tenant seeded by bench_db, fails when a
+lookup's p95 is over budget, and can EXPLAIN the indexed predicates directly
+to show that none of them falls back to a sequential scan.
+
+Usage:
+    pip install requests psycopg2-binary
+    export DATABASE_URL=postgresql://...   # local/staging database only
+    python stats_benchmark.py seed --scale 1m --tag s1m
+    python patient_search_benchmark.py run --tag s1m --budget-ms 50 --out baselines/search-1m.json
+    python patient_search_benchmark.py explain --tag s1m
+    python stats_benchmark.py cleanup --tag s1m
+"""
+
+import argparse
+import datetime
+import json
+import os
+import sys
+from urllib.parse import urlencode
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "testsprite_tests"))
+
+import shared_session  # noqa: E402
+import bench_db  # noqa: E402
+from stats_benchmark import BASE_URL, BENCH_CREDENTIALS, git_revision, tenant_from_token, time_route  # noqa: E402
+
+
+def lookups(tag):
+    """(label, route) pairs matching rows written by bench_db.seed_statements."""
+    cases = [
+        ("mrn exact", "/patients/search", {"q": f"BMRN-{tag}-0004242"}),
+        ("mrn prefix", "/patients/search", {"q": f"bmrn-{tag}-00042"}),
+        ("phone prefix", "/patients/search", {"q": "9190000042"}),
+        ("full name", "/patients/search", {"q": "Meera Bench4242"}),
+        ("last name", "/patients/search", {"q": "Bench4242"}),
+        ("short prefix", "/patients/search", {"q": "Ra"}),
+        ("list search", "/patients", {"search": "Bench4242", "limit": 10}),
+        ("list search, no count", "/patients", {"search": "Bench4242", "limit": 10, "count": "none"}),
+    ]
+    return [(label, f"{path}?{urlencode(params)}") for label, path, params in cases]
+
+
+# The predicates of PatientSearchService, one per index they rely on
+EXPLAIN_QUERIES = [
+    ("mrn prefix", """SELECT id FROM "patients" WHERE "tenantId" = %(tenant)s
+        AND upper("medicalRecordNumber") LIKE %(mrn)s LIMIT 10"""),
+    ("phone prefix", """SELECT id FROM "patients" WHERE "tenantId" = %(tenant)s
+        AND regexp_replace("phone", '[^0-9]', '', 'g') LIKE %(phone)s LIMIT 10"""),
+    ("name substring", """SELECT id FROM "patients" WHERE "tenantId" = %(tenant)s
+        AND ("firstName" ILIKE %(name)s OR "lastName" ILIKE %(name)s) LIMIT 10"""),
+    ("list search", """SELECT id FROM "patients" WHERE "tenantId" = %(tenant)s AND (
+        "firstName" ILIKE %(name)s OR "lastName" ILIKE %(name)s OR "email" ILIKE %(name)s
+        OR "phone" ILIKE %(name)s OR "medicalRecordNumber" ILIKE %(name)s) LIMIT 10"""),
+]
+
+
+def cmd_run(args):
+    session = shared_session.SharedSession(base_url=args.base_url)
+    headers = session.auth_headers(BENCH_CREDENTIALS)
+
+    results = {}
+    over_budget = 0
+    for label, route in lookups(args.tag):
+        result = time_route(session.session, session.base_url, route, headers, args.warmup, args.repeat)
+        result["route"] = route
+        results[label] = result
+        flag = ""
+        if result["status"] != 200 or result["p95_ms"] > args.budget_ms:
+            flag = "  OVER BUDGET" if result["status"] == 200 else f"  HTTP {result['status']}"
+            over_budget += 1
+        print(f"{label:<24} median {result['median_ms']:>8.2f} ms  p95 {result['p95_ms']:>8.2f} ms{flag}")
+
+    if args.out:
+        report = {
+            "meta": {
+                "tag": args.tag,
+                "base_url": session.base_url,
+                "budget_ms": args.budget_ms,
+                "warmup": args.warmup,
+                "repeat": args.repeat,
+                "git_revision": git_revision(),
+                "recorded_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            },
+            "routes": results,
+        }
+        os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to {args.out}")
+
+    print(f"\n{over_budget} lookup(s) over the {args.budget_ms} ms p95 budget")
+    return 1 if over_budget else 0
+
+
+def cmd_explain(args):
+    session = shared_session.SharedSession(base_url=args.base_url)
+    tenant_id = args.tenant_id or tenant_from_token(session.get_token(BENCH_CREDENTIALS))
+    params = {
+        "tenant": tenant_id,
+        "mrn": f"BMRN-{args.tag.upper()}-00042%",
+        "phone": "9190000042%",
+        "name": "%Bench4242%",
+    }
+
+    seq_scans = 0
+    conn = bench_db.connect()
+    try:
+        with conn.cursor() as cur:
+            for label, sql in EXPLAIN_QUERIES:
+                cur.execute("EXPLAIN (ANALYZE, BUFFERS) " + sql, params)
+                plan = [row[0] for row in cur.fetchall()]
+                seq_scan = any("Seq Scan on patients" in line for line in plan)
+                seq_scans += seq_scan
+                print(f"== {label}{'  SEQ SCAN' if seq_scan else ''}")
+                print("\n".join(f"   {line}" for line in plan))
+    finally:
+        conn.close()
+
+    print(f"\n{seq_scans} predicate(s) scanned the patients table")
+    return 1 if seq_scans else 0
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark patient search")
+    parser.add_argument("--base-url", default=BASE_URL)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="Time the lookups over HTTP")
+    run.add_argument("--tag", required=True, help="Tag of the seeding run to search for")
+    run.add_argument("--budget-ms", type=float, default=50.0, help="Allowed p95 per lookup")
+    run.add_argument("--warmup", type=int, default=3)
+    run.add_argument("--repeat", type=int, default=50)
+    run.add_argument("--out", help="Write the JSON results here")
+
+    explain = sub.add_parser("explain", help="EXPLAIN ANALYZE the indexed predicates")
+    explain.add_argument("--tag", required=True)
+    explain.add_argument("--tenant-id", default=None)
+
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    return {"run": cmd_run, "explain": cmd_explain}[args.command](args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,275 @@
+"""
+Reproducible benchmark for the per-module /stats endpoints.
+
+Dashboards poll these routes constantly and each one fans out several count()
+queries, so they are the first thing to regress when a table grows. This
+script seeds the benchmark user's tenant at a fixed scale, times every stats
+route, writes a JSON baseline and diffs later runs against it.
+
+Usage:
+    pip install requests psycopg2-binary
+    export DATABASE_URL=postgresql://...   # local/staging database only
+    python stats_benchmark.py seed --scale 100k --tag s100k
+    python stats_benchmark.py run --scale 100k --out baselines/stats-100k.json
+    python stats_benchmark.py compare baselines/stats-100k.json current.json --threshold 15
+    python stats_benchmark.py cleanup --tag s100k
+
+The benchmark logs in as BENCH_EMAIL/BENCH_PASSWORD (default: the testsprite
+SUPER_ADMIN) and seeds into that user's tenant unless --tenant-id is given.
+
+The API's global ThrottlerGuard allows 3 requests/s, 20 per 10 s and 100/min
+per IP. Run against an instance with those limits raised, or pass --pace 0.6
+to stay under them. Only 2xx samples count towards the timings, and a route
+that was throttled (429) at any point fails the run.
+"""
+
+import argparse
+import base64
+import datetime
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "testsprite_tests"))
+
+import shared_session  # noqa: E402
+import bench_db  # noqa: E402
+
+BASE_URL = shared_session.BASE_URL
+TIMEOUT = 60
+
+BENCH_CREDENTIALS = {
+    "email": os.environ.get("BENCH_EMAIL", shared_session.ROLE_CREDENTIALS["SUPER_ADMIN"]["email"]),
+    "password": os.environ.get("BENCH_PASSWORD", shared_session.ROLE_CREDENTIALS["SUPER_ADMIN"]["password"]),
+}
+
+STATS_ROUTES = [
+    "/dashboard/stats",
+    "/reports/dashboard",
+    "/patients/stats",
+    "/appointments/stats",
+    "/billing/invoices/stats",
+    "/finance/stats",
+    "/laboratory/orders/stats",
+    "/pathology/stats",
+    "/radiology/stats",
+    "/pharmacy/orders/stats",
+    "/pharmacy-management/stats",
+    "/emergency/stats",
+    "/opd/stats",
+    "/ipd/stats",
+    "/communications/stats",
+    "/staff/stats",
+    "/users/stats",
+    "/hr/stats",
+    "/shifts/stats",
+    "/surgery/stats",
+    "/inventory/stats",
+    "/insurance/stats",
+    "/emr/stats",
+    "/telemedicine/stats",
+    "/quality/stats",
+    "/research/stats",
+    "/integration/stats",
+]
+
+
+def tenant_from_token(token):
+    payload = token.split(".")[1]
+    payload += "=" * (-len(payload) % 4)
+    return json.loads(base64.urlsafe_b64decode(payload)).get("tenantId")
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def time_route(http, base_url, route, headers, warmup, repeat, pace=0.0):
+    def get():
+        if pace:
+            time.sleep(pace)
+        return http.get(f"{base_url}{route}", headers=headers, timeout=TIMEOUT)
+
+    throttled = 0
+    for _ in range(warmup):
+        throttled += get().status_code == 429
+
+    samples = []
+    statuses = {}
+    for _ in range(repeat):
+        start = time.perf_counter()
+        resp = get()
+        elapsed_ms = (time.perf_counter() - start) * 1000.0
+        statuses[resp.status_code] = statuses.get(resp.status_code, 0) + 1
+        throttled += resp.status_code == 429
+        if 200 <= resp.status_code < 300:
+            samples.append(elapsed_ms)
+
+    # A route passes only if every timed request succeeded and none was rate limited
+    if throttled:
+        status = 429
+    elif len(samples) == repeat:
+        status = 200
+    else:
+        status = max(statuses, key=statuses.get)
+
+    result = {
+        "status": status,
+        "statuses": {str(k): v for k, v in sorted(statuses.items())},
+        "throttled": throttled,
+        "samples": len(samples),
+    }
+    if not samples:
+        return {**result, "min_ms": None, "median_ms": None, "mean_ms": None, "p95_ms": None, "max_ms": None}
+
+    ordered = sorted(samples)
+    p95_index = max(0, int(round(0.95 * len(ordered))) - 1)
+    return {
+        **result,
+        "min_ms": round(ordered[0], 2),
+        "median_ms": round(statistics.median(ordered), 2),
+        "mean_ms": round(statistics.fmean(ordered), 2),
+        "p95_ms": round(ordered[p95_index], 2),
+        "max_ms": round(ordered[-1], 2),
+    }
+
+
+def cmd_seed(args):
+    session = shared_session.SharedSession(base_url=args.base_url)
+    tenant_id = args.tenant_id or tenant_from_token(session.get_token(BENCH_CREDENTIALS))
+    rows = bench_db.parse_scale(args.scale)
+    print(f"Seeding tenant {tenant_id} with {rows} rows per table (tag {args.tag})")
+    conn = bench_db.connect()
+    try:
+        bench_db.seed_tenant(conn, tenant_id, rows, args.tag)
+    finally:
+        conn.close()
+    return 0
+
+
+def cmd_cleanup(args):
+    conn = bench_db.connect()
+    try:
+        bench_db.cleanup(conn, args.tag)
+    finally:
+        conn.close()
+    return 0
+
+
+def cmd_run(args):
+    session = shared_session.SharedSession(base_url=args.base_url)
+    headers = session.auth_headers(BENCH_CREDENTIALS)
+    routes = args.route or STATS_ROUTES
+
+    results = {}
+    for route in routes:
+        result = time_route(session.session, session.base_url, route, headers, args.warmup, args.repeat, args.pace)
+        results[route] = result
+        if result["samples"]:
+            print(f"{route:<32} {result['status']!s:>4}  median {result['median_ms']:>9.2f} ms"
+                  f"  p95 {result['p95_ms']:>9.2f} ms  ({result['samples']}/{args.repeat} ok)")
+        else:
+            print(f"{route:<32} {result['status']!s:>4}  no successful samples {result['statuses']}")
+
+    throttled = [route for route, r in results.items() if r["throttled"]]
+    if throttled:
+        print(f"\n{len(throttled)} route(s) were rate limited (429); raise the API's throttler limits "
+              f"or pass --pace 0.6", file=sys.stderr)
+
+    report = {
+        "meta": {
+            "scale": args.scale,
+            "rows": bench_db.parse_scale(args.scale) if args.scale else None,
+            "base_url": session.base_url,
+            "warmup": args.warmup,
+            "repeat": args.repeat,
+            "pace": args.pace,
+            "git_revision": git_revision(),
+            "recorded_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        },
+        "routes": results,
+    }
+    if args.out:
+        os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nBaseline written to {args.out}")
+    return 0 if all(r["status"] == 200 for r in results.values()) else 1
+
+
+def cmd_compare(args):
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.current) as f:
+        current = json.load(f)
+
+    regressions = 0
+    print(f"{'route':<32}{'baseline':>12}{'current':>12}{'change':>10}")
+    for route, base in baseline["routes"].items():
+        cur = current["routes"].get(route)
+        if base.get("median_ms") is None:
+            print(f"{route:<32}{'no data':>12}")
+            continue
+        if cur is None or cur.get("median_ms") is None:
+            print(f"{route:<32}{base['median_ms']:>12.2f}{'missing':>12}")
+            continue
+        change = (cur["median_ms"] - base["median_ms"]) / base["median_ms"] * 100.0 if base["median_ms"] else 0.0
+        flag = ""
+        if change > args.threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        print(f"{route:<32}{base['median_ms']:>12.2f}{cur['median_ms']:>12.2f}{change:>9.1f}%{flag}")
+    for route in sorted(set(current["routes"]) - set(baseline["routes"])):
+        median = current["routes"][route].get("median_ms")
+        print(f"{route:<32}{'new':>12}{median if median is not None else 'no data':>12}")
+
+    print(f"\n{regressions} route(s) regressed by more than {args.threshold}%")
+    return 1 if regressions else 0
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the /stats endpoints")
+    parser.add_argument("--base-url", default=BASE_URL)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    seed = sub.add_parser("seed", help="Seed the benchmark tenant")
+    seed.add_argument("--scale", default="10k", help="Rows per table: 10k, 100k, 1m or a number")
+    seed.add_argument("--tag", default=None, help="Id prefix for the seeded rows (default s<scale>)")
+    seed.add_argument("--tenant-id", default=None)
+
+    cleanup = sub.add_parser("cleanup", help="Remove the rows of a seeding run")
+    cleanup.add_argument("--tag", required=True)
+
+    run = sub.add_parser("run", help="Time every stats route")
+    run.add_argument("--scale", default=None, help="Scale label recorded in the baseline")
+    run.add_argument("--warmup", type=int, default=3)
+    run.add_argument("--repeat", type=int, default=20)
+    run.add_argument("--pace", type=float, default=0.0,
+                     help="Seconds to wait before each request (0.6 keeps under the default throttler limits)")
+    run.add_argument("--route", action="append", help="Only time this route (repeatable)")
+    run.add_argument("--out", help="Write the JSON baseline here")
+
+    compare = sub.add_parser("compare", help="Diff two baselines")
+    compare.add_argument("baseline")
+    compare.add_argument("current")
+    compare.add_argument("--threshold", type=float, default=10.0, help="Allowed median slowdown in percent")
+
+    args = parser.parse_args(argv)
+    if args.command == "seed" and not args.tag:
+        args.tag = f"s{args.scale.lower()}"
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    return {"seed": cmd_seed, "cleanup": cmd_cleanup, "run": cmd_run, "compare": cmd_compare}[args.command](args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,13 @@
 import requests
 import traceback
 
-BASE_URL = "http://localhost:3001"
+import shared_session
+
+BASE_URL = shared_session.BASE_URL
 TIMEOUT = 30
 
+http = shared_session.get_session()
+
 # Assuming RBAC is enforced and JWT token is required for authorization.
 # For the test, we authenticate as a user with "ADMIN" role to test patient management.
 # Replace these credentials with valid test credentials in your environment.
@@ -14,15 +18,7 @@ AUTH_CREDENTIALS = {
 
 def authenticate():
     try:
-        resp = requests.post(
-            f"{BASE_URL}/auth/login",
-            json=AUTH_CREDENTIALS,
-            timeout=TIMEOUT
-        )
-        resp.raise_for_status()
-        token = resp.json().get("accessToken") or resp.json().get("access_token") or resp.json().get("token")
-        assert token, "Authentication token not found in response"
-        return token
+        return shared_session.get_token(AUTH_CREDENTIALS)
     except Exception as e:
         raise RuntimeError(f"Authentication failed: {e}")
 
@@ -46,14 +42,14 @@ def test_patient_management_endpoints():
             "address": "123 Health St, Wellness City",
             "medicalHistory": ["Hypertension"]
         }
-        create_resp = requests.post(f"{BASE_URL}/patients", json=create_payload, headers=headers, timeout=TIMEOUT)
+        create_resp = http.post(f"{BASE_URL}/patients", json=create_payload, headers=headers, timeout=TIMEOUT)
         create_resp.raise_for_status()
         patient_data = create_resp.json()
         assert "id" in patient_data, f"Patient creation response missing 'id': {patient_data}"
         patient_id = patient_data["id"]
 
         # 2) Retrieve the patient (GET /patients/:id)
-        get_resp = requests.get(f"{BASE_URL}/patients/{patient_id}", headers=headers, timeout=TIMEOUT)
+        get_resp = http.get(f"{BASE_URL}/patients/{patient_id}", headers=headers, timeout=TIMEOUT)
         get_resp.raise_for_status()
         retrieved_patient = get_resp.json()
         assert retrieved_patient["id"] == patient_id, "Retrieved patient ID mismatch"
@@ -70,7 +66,7 @@ def test_patient_management_endpoints():
             "contactNumber": "+1987654321",
             "address": "456 Recovery Rd, Healthtown"
         }
-        update_resp = requests.put(f"{BASE_URL}/patients/{patient_id}", json=update_payload, headers=headers, timeout=TIMEOUT)
+        update_resp = http.put(f"{BASE_URL}/patients/{patient_id}", json=update_payload, headers=headers, timeout=TIMEOUT)
         update_resp.raise_for_status()
         updated_patient = update_resp.json()
         for key, value in update_payload.items():
@@ -78,18 +74,12 @@ def test_patient_management_endpoints():
 
         # 4) Validate RBAC: Attempt accessing patient list with insufficient permissions (simulate DOCTOR role)
         # Authenticate as DOCTOR role user to test access control
-        doctor_login_resp = requests.post(
-            f"{BASE_URL}/auth/login",
-            json={"username": "doctor_user", "password": "doctor_password"},
-            timeout=TIMEOUT
-        )
-        doctor_login_resp.raise_for_status()
-        doctor_token = doctor_login_resp.json().get("accessToken") or doctor_login_resp.json().get("access_token") or doctor_login_resp.json().get("token")
+        doctor_token = shared_session.get_token({"username": "doctor_user", "password": "doctor_password"})
         assert doctor_token, "Doctor authentication token missing"
         doctor_headers = {"Authorization": f"Bearer {doctor_token}", "Content-Type": "application/json"}
 
         # Test that DOCTOR role can access GET /patients/:id (allowed)
-        doctor_get_resp = requests.get(f"{BASE_URL}/patients/{patient_id}", headers=doctor_headers, timeout=TIMEOUT)
+        doctor_get_resp = http.get(f"{BASE_URL}/patients/{patient_id}", headers=doctor_headers, timeout=TIMEOUT)
         if doctor_get_resp.status_code == 200:
             doctor_patient = doctor_get_resp.json()
             assert doctor_patient["id"] == patient_id, "Doctor role: patient record fetch failed"
@@ -98,16 +88,16 @@ def test_patient_management_endpoints():
             assert doctor_get_resp.status_code == 403, f"Unexpected status for doctor GET patient: {doctor_get_resp.status_code}"
 
         # Test that DOCTOR role cannot delete patient (assuming only ADMIN/SUPER_ADMIN can delete)
-        doctor_delete_resp = requests.delete(f"{BASE_URL}/patients/{patient_id}", headers=doctor_headers, timeout=TIMEOUT)
+        doctor_delete_resp = http.delete(f"{BASE_URL}/patients/{patient_id}", headers=doctor_headers, timeout=TIMEOUT)
         assert doctor_delete_resp.status_code in [403, 401], f"Doctor role should not be able to delete patient, got {doctor_delete_resp.status_code}"
 
         # 5) Delete patient record (DELETE /patients/:id)
-        delete_resp = requests.delete(f"{BASE_URL}/patients/{patient_id}", headers=headers, timeout=TIMEOUT)
+        delete_resp = http.delete(f"{BASE_URL}/patients/{patient_id}", headers=headers, timeout=TIMEOUT)
         # Depending on implementation, 200 or 204 No Content is acceptable
         assert delete_resp.status_code in [200, 204], f"Patient deletion failed with status {delete_resp.status_code}"
 
         # Confirm deletion by trying to GET again
-        get_after_delete_resp = requests.get(f"{BASE_URL}/patients/{patient_id}", headers=headers, timeout=TIMEOUT)
+        get_after_delete_resp = http.get(f"{BASE_URL}/patients/{patient_id}", headers=headers, timeout=TIMEOUT)
         assert get_after_delete_resp.status_code == 404, f"Deleted patient record still accessible, got {get_after_delete_resp.status_code}"
 
     except requests.exceptions.RequestException as re:
@@ -123,7 +113,7 @@ def test_patient_management_endpoints():
         # Cleanup: Ensure patient is deleted if test fails before deletion step
         if headers and patient_id:
             try:
-                requests.delete(f"{BASE_URL}/patients/{patient_id}", headers=headers, timeout=TIMEOUT)
+                http.delete(f"{BASE_URL}/patients/{patient_id}", headers=headers, timeout=TIMEOUT)
             except Exception:
                 pass
 
@@ -1,18 +1,15 @@
-import requests
 import uuid
 
-BASE_URL = "http://localhost:3001"
+import shared_session
+
+BASE_URL = shared_session.BASE_URL
 TIMEOUT = 30
 
-# For this test we assume we have a valid JWT token for a user with appropriate RBAC permissions
-# In real case, fetch or configure securely
-JWT_TOKEN = "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9.fake_token_for_testing_purposes"
+http = shared_session.get_session()
 
-HEADERS = {
-    "Authorization": f"Bearer {JWT_TOKEN}",
-    "Content-Type": "application/json",
-    "Accept": "application/json"
-}
+# Token for a user with appropriate RBAC permissions, logged in once per run
+# and shared with the other TC scripts through shared_session
+HEADERS = shared_session.auth_headers("SUPER_ADMIN", {"Accept": "application/json"})
 
 def test_appointment_scheduling_endpoints():
     # Create a new appointment resource first for testing get, put, and cleanup
@@ -26,7 +23,7 @@ def test_appointment_scheduling_endpoints():
 
     try:
         # Book appointment (POST /appointments)
-        resp_post = requests.post(
+        resp_post = http.post(
             f"{BASE_URL}/appointments",
             headers=HEADERS,
             json=appointment_data,
@@ -38,7 +35,7 @@ def test_appointment_scheduling_endpoints():
         appointment_id = post_resp_json["id"]
 
         # Retrieve the appointment (GET /appointments/:id)
-        resp_get = requests.get(
+        resp_get = http.get(
             f"{BASE_URL}/appointments/{appointment_id}",
             headers=HEADERS,
             timeout=TIMEOUT
@@ -54,7 +51,7 @@ def test_appointment_scheduling_endpoints():
             "reason": "Updated reason for visit",
             "scheduledAt": "2024-08-01T11:00:00Z"
         }
-        resp_put = requests.put(
+        resp_put = http.put(
             f"{BASE_URL}/appointments/{appointment_id}",
             headers=HEADERS,
             json=update_data,
@@ -66,7 +63,7 @@ def test_appointment_scheduling_endpoints():
         assert put_resp_json["scheduledAt"] == update_data["scheduledAt"], "Update scheduledAt mismatch"
 
         # Get all appointments (GET /appointments)
-        resp_list = requests.get(
+        resp_list = http.get(
             f"{BASE_URL}/appointments",
             headers=HEADERS,
             timeout=TIMEOUT
@@ -78,7 +75,7 @@ def test_appointment_scheduling_endpoints():
         assert any(appt["id"] == appointment_id for appt in list_resp_json), "Created appointment not found in appointments list"
 
         # Check calendar view (GET /appointments/calendar)
-        resp_calendar = requests.get(
+        resp_calendar = http.get(
             f"{BASE_URL}/appointments/calendar",
             headers=HEADERS,
             timeout=TIMEOUT
@@ -89,7 +86,7 @@ def test_appointment_scheduling_endpoints():
 
         # Check availability (GET /appointments/availability)
         params_avail = {"doctorId": appointment_data["doctorId"], "date": "2024-08-01"}
-        resp_availability = requests.get(
+        resp_availability = http.get(
             f"{BASE_URL}/appointments/availability",
             headers=HEADERS,
             params=params_avail,
@@ -104,7 +101,7 @@ def test_appointment_scheduling_endpoints():
         if appointment_id:
             try:
                 # Cleanup - delete the appointment if API supports it, to not clutter test environment
-                resp_delete = requests.delete(
+                resp_delete = http.delete(
                     f"{BASE_URL}/appointments/{appointment_id}",
                     headers=HEADERS,
                     timeout=TIMEOUT
@@ -1,8 +1,12 @@
 import requests
 
-BASE_URL = "http://localhost:3001"
+import shared_session
+
+BASE_URL = shared_session.BASE_URL
 TIMEOUT = 30
 
+http = shared_session.get_session()
+
 # Assuming a SUPER_ADMIN user for full RBAC permissions in billing tests
 AUTH_CREDENTIALS = {
     "email": "superadmin@example.com",
@@ -11,16 +15,8 @@ AUTH_CREDENTIALS = {
 
 def get_auth_token():
     try:
-        resp = requests.post(
-            f"{BASE_URL}/auth/login",
-            json={"email": AUTH_CREDENTIALS["email"], "password": AUTH_CREDENTIALS["password"]},
-            timeout=TIMEOUT
-        )
-        resp.raise_for_status()
-        token = resp.json().get("accessToken")
-        assert token, "Login succeeded but no accessToken in response"
-        return token
-    except requests.RequestException as e:
+        return shared_session.get_token(AUTH_CREDENTIALS)
+    except (requests.RequestException, shared_session.AuthError) as e:
         raise Exception(f"Authentication failed: {e}")
 
 def test_billing_and_invoicing_endpoints():
@@ -42,7 +38,7 @@ def test_billing_and_invoicing_endpoints():
 
     try:
         # POST /billing/invoices - Generate invoice
-        resp = requests.post(
+        resp = http.post(
             f"{BASE_URL}/billing/invoices",
             headers=headers,
             json=invoice_payload,
@@ -54,7 +50,7 @@ def test_billing_and_invoicing_endpoints():
         assert invoice_id, "Invoice ID missing in response"
 
         # GET /billing/invoices - Retrieve list of invoices and confirm new invoice present
-        resp = requests.get(
+        resp = http.get(
             f"{BASE_URL}/billing/invoices",
             headers=headers,
             timeout=TIMEOUT
@@ -70,7 +66,7 @@ def test_billing_and_invoicing_endpoints():
             "paymentMethod": "CREDIT_CARD",
             "transactionId": "txn_test_001"
         }
-        resp = requests.post(
+        resp = http.post(
             f"{BASE_URL}/billing/payments",
             headers=headers,
             json=payment_payload,
@@ -85,7 +81,7 @@ def test_billing_and_invoicing_endpoints():
         assert abs(payment.get("amount", 0) - 150.0) < 0.0001, "Payment amount mismatch"
 
         # GET /billing/invoices/stats - Get invoice statistics
-        resp = requests.get(
+        resp = http.get(
             f"{BASE_URL}/billing/invoices/stats",
             headers=headers,
             timeout=TIMEOUT
@@ -99,7 +95,7 @@ def test_billing_and_invoicing_endpoints():
             assert isinstance(stats[key], int), f"Stat {key} is not int"
 
         # GET /billing/invoices/reports/revenue - Get revenue report
-        resp = requests.get(
+        resp = http.get(
             f"{BASE_URL}/billing/invoices/reports/revenue",
             headers=headers,
             timeout=TIMEOUT
@@ -115,18 +111,12 @@ def test_billing_and_invoicing_endpoints():
         # RBAC Permission Checks
         # Attempt an unauthorized action with lower role - e.g., DOCTOR role
         # Login as DOCTOR
-        resp = requests.post(
-            f"{BASE_URL}/auth/login",
-            json={"email": "doctor_user@example.com", "password": "DoctorPass123!"},
-            timeout=TIMEOUT
-        )
-        assert resp.status_code == 200, "Doctor login failed"
-        doctor_token = resp.json().get("accessToken")
+        doctor_token = shared_session.get_token({"email": "doctor_user@example.com", "password": "DoctorPass123!"})
         assert doctor_token, "Doctor token missing"
         doctor_headers = {"Authorization": f"Bearer {doctor_token}", "Content-Type": "application/json"}
 
         # Doctor tries to create invoice - should be forbidden or unauthorized
-        resp = requests.post(
+        resp = http.post(
             f"{BASE_URL}/billing/invoices",
             headers=doctor_headers,
             json=invoice_payload,
@@ -138,7 +128,7 @@ def test_billing_and_invoicing_endpoints():
         # Cleanup: delete created payment if API allows
         if payment_id:
             try:
-                resp = requests.delete(
+                resp = http.delete(
                     f"{BASE_URL}/billing/payments/{payment_id}",
                     headers=headers,
                     timeout=TIMEOUT
@@ -151,7 +141,7 @@ def test_billing_and_invoicing_endpoints():
         # Cleanup: delete created invoice if API allows
         if invoice_id:
             try:
-                resp = requests.delete(
+                resp = http.delete(
                     f"{BASE_URL}/billing/invoices/{invoice_id}",
                     headers=headers,
                     timeout=TIMEOUT
@@ -1,8 +1,12 @@
 import requests
 
-BASE_URL = "http://localhost:3001"
+import shared_session
+
+BASE_URL = shared_session.BASE_URL
 TIMEOUT = 30
 
+http = shared_session.get_session()
+
 # Assumed test user credentials with LAB_TECHNICIAN role for RBAC compliance
 AUTH_CREDENTIALS = {
     "email": "labtech_test_user@example.com",
@@ -12,12 +16,8 @@ AUTH_CREDENTIALS = {
 def authenticate():
     """Authenticate and return JWT token for LAB_TECHNICIAN."""
     try:
-        resp = requests.post(f"{BASE_URL}/auth/login", json=AUTH_CREDENTIALS, timeout=TIMEOUT)
-        resp.raise_for_status()
-        token = resp.json().get("accessToken")
-        assert token, "Authentication failed: No accessToken received"
-        return token
-    except requests.RequestException as e:
+        return shared_session.get_token(AUTH_CREDENTIALS)
+    except (requests.RequestException, shared_session.AuthError) as e:
         assert False, f"Authentication request failed: {e}"
 
 def test_laboratory_endpoints():
@@ -35,7 +35,7 @@ def test_laboratory_endpoints():
             ],
             "requestedBy": "labtech_test_user"
         }
-        response_create = requests.post(f"{BASE_URL}/laboratory/orders", json=order_payload, headers=headers, timeout=TIMEOUT)
+        response_create = http.post(f"{BASE_URL}/laboratory/orders", json=order_payload, headers=headers, timeout=TIMEOUT)
         assert response_create.status_code == 201, f"Expected 201 Created but got {response_create.status_code}"
         order_data = response_create.json()
         order_id = order_data.get("id")
@@ -50,13 +50,13 @@ def test_laboratory_endpoints():
             "status": "completed",
             "updatedBy": "labtech_test_user"
         }
-        response_update = requests.put(f"{BASE_URL}/laboratory/orders/{order_id}/results", json=update_payload, headers=headers, timeout=TIMEOUT)
+        response_update = http.put(f"{BASE_URL}/laboratory/orders/{order_id}/results", json=update_payload, headers=headers, timeout=TIMEOUT)
         assert response_update.status_code == 200, f"Expected 200 OK on update but got {response_update.status_code}"
         update_data = response_update.json()
         assert update_data.get("status") == "completed", "Order status not updated to 'completed'"
 
         # 3) Retrieve lab test orders (GET /laboratory/orders)
-        response_get = requests.get(f"{BASE_URL}/laboratory/orders", headers=headers, timeout=TIMEOUT)
+        response_get = http.get(f"{BASE_URL}/laboratory/orders", headers=headers, timeout=TIMEOUT)
         assert response_get.status_code == 200, f"Expected 200 OK on get orders but got {response_get.status_code}"
         orders_list = response_get.json()
         assert isinstance(orders_list, list), "Orders response should be a list"
@@ -67,7 +67,7 @@ def test_laboratory_endpoints():
         if order_id:
             try:
                 # If DELETE endpoint exists, otherwise skip.
-                del_resp = requests.delete(f"{BASE_URL}/laboratory/orders/{order_id}", headers=headers, timeout=TIMEOUT)
+                del_resp = http.delete(f"{BASE_URL}/laboratory/orders/{order_id}", headers=headers, timeout=TIMEOUT)
                 if del_resp.status_code not in [200, 204, 404]:
                     print(f"Warning: Unexpected status code on order deletion: {del_resp.status_code}")
             except requests.RequestException:
@@ -1,6 +1,6 @@
-import requests
+import shared_session
 
-BASE_URL = "http://localhost:3001"
+BASE_URL = shared_session.BASE_URL
 TIMEOUT = 30
 
 # Use valid pharmacist credentials for RBAC permission validation
@@ -10,24 +10,17 @@ PHARMACIST_CREDENTIALS = {
 }
 
 def test_pharmacy_endpoints():
-    session = requests.Session()
-    session.headers.update({"Content-Type": "application/json"})
+    session = shared_session.get_session()
     try:
-        # Authenticate as pharmacist - get JWT token
-        login_resp = session.post(
-            f"{BASE_URL}/auth/login",
-            json=PHARMACIST_CREDENTIALS,
-            timeout=TIMEOUT
-        )
-        assert login_resp.status_code == 200, "Login failed for pharmacist"
-        token = login_resp.json().get("accessToken")
+        # Authenticate as pharmacist - get JWT token (cached across the run)
+        token = shared_session.get_token(PHARMACIST_CREDENTIALS)
         assert token, "No access token returned on login"
 
-        auth_header = {"Authorization": f"Bearer {token}"}
-        session.headers.update(auth_header)
+        # Per-request headers: the session is shared by every script of the run
+        auth_header = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
 
         # 1) Test GET /pharmacy/orders - should succeed with pharmacist role and DB connection
-        get_orders_resp = session.get(f"{BASE_URL}/pharmacy/orders", timeout=TIMEOUT)
+        get_orders_resp = session.get(f"{BASE_URL}/pharmacy/orders", headers=auth_header, timeout=TIMEOUT)
         assert get_orders_resp.status_code == 200, f"Failed to get pharmacy orders, status {get_orders_resp.status_code}"
         orders_list = get_orders_resp.json()
         assert isinstance(orders_list, list), "Response for pharmacy orders is not a list"
@@ -42,14 +35,14 @@ def test_pharmacy_endpoints():
             "notes": "Test order"
         }
 
-        post_order_resp = session.post(f"{BASE_URL}/pharmacy/orders", json=new_order_payload, timeout=TIMEOUT)
+        post_order_resp = session.post(f"{BASE_URL}/pharmacy/orders", json=new_order_payload, headers=auth_header, timeout=TIMEOUT)
         assert post_order_resp.status_code == 201, f"Failed to create pharmacy order, status {post_order_resp.status_code}"
         created_order = post_order_resp.json()
         order_id = created_order.get("id")
         assert order_id, "Created order response missing id"
 
         # 3) Test GET /pharmacy-management/inventory - get pharmacy inventory with correct RBAC
-        get_inventory_resp = session.get(f"{BASE_URL}/pharmacy-management/inventory", timeout=TIMEOUT)
+        get_inventory_resp = session.get(f"{BASE_URL}/pharmacy-management/inventory", headers=auth_header, timeout=TIMEOUT)
         assert get_inventory_resp.status_code == 200, f"Failed to get pharmacy inventory, status {get_inventory_resp.status_code}"
         inventory = get_inventory_resp.json()
         assert isinstance(inventory, list), "Pharmacy inventory response is not a list"
@@ -57,27 +50,29 @@ def test_pharmacy_endpoints():
         # 4) Additional validation: Attempt access with insufficient role, e.g. PATIENT
         # Login as patient to confirm RBAC enforcement
         patient_credentials = {"username": "patient_user", "password": "patient_password"}
-        patient_login = session.post(f"{BASE_URL}/auth/login", json=patient_credentials, timeout=TIMEOUT)
-        assert patient_login.status_code == 200, "Patient login failed"
-        patient_token = patient_login.json().get("accessToken")
+        patient_token = shared_session.get_token(patient_credentials)
         assert patient_token, "Patient access token missing"
 
-        session.headers.update({"Authorization": f"Bearer {patient_token}"})
+        patient_header = {"Authorization": f"Bearer {patient_token}", "Content-Type": "application/json"}
 
-        patient_get_orders = session.get(f"{BASE_URL}/pharmacy/orders", timeout=TIMEOUT)
+        patient_get_orders = session.get(f"{BASE_URL}/pharmacy/orders", headers=patient_header, timeout=TIMEOUT)
         assert patient_get_orders.status_code in (401, 403), "Patient role should not access pharmacy orders"
 
-        patient_post_order = session.post(f"{BASE_URL}/pharmacy/orders", json=new_order_payload, timeout=TIMEOUT)
+        patient_post_order = session.post(
+            f"{BASE_URL}/pharmacy/orders", json=new_order_payload, headers=patient_header, timeout=TIMEOUT
+        )
         assert patient_post_order.status_code in (401, 403), "Patient role should not create pharmacy orders"
 
-        patient_get_inventory = session.get(f"{BASE_URL}/pharmacy-management/inventory", timeout=TIMEOUT)
+        patient_get_inventory = session.get(
+            f"{BASE_URL}/pharmacy-management/inventory", headers=patient_header, timeout=TIMEOUT
+        )
         assert patient_get_inventory.status_code in (401, 403), "Patient role should not access pharmacy inventory"
 
     finally:
         # Cleanup: Delete the created pharmacy order to avoid test data pollution
         if 'order_id' in locals():
-            session.headers.update(auth_header)  # Reset to pharmacist token to allow deletion
-            del_resp = session.delete(f"{BASE_URL}/pharmacy/orders/{order_id}", timeout=TIMEOUT)
+            # Pharmacist token, to allow deletion
+            del_resp = session.delete(f"{BASE_URL}/pharmacy/orders/{order_id}", headers=auth_header, timeout=TIMEOUT)
             # It's non-critical if deletion fails, but assert 200 or 204
             assert del_resp.status_code in (200, 204), f"Cleanup failed: unable to delete pharmacy order {order_id}"
 
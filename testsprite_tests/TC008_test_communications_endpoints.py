@@ -1,8 +1,12 @@
 import requests
 
-BASE_URL = "http://localhost:3001"
+import shared_session
+
+BASE_URL = shared_session.BASE_URL
 TIMEOUT = 30
 
+http = shared_session.get_session()
+
 # Replace these with valid credentials for a user with messaging permissions (e.g., DOCTOR)
 AUTH_CREDENTIALS = {
     "username": "doctor1",
@@ -11,17 +15,8 @@ AUTH_CREDENTIALS = {
 
 def authenticate():
     try:
-        resp = requests.post(
-            f"{BASE_URL}/auth/login",
-            json={"username": AUTH_CREDENTIALS["username"], "password": AUTH_CREDENTIALS["password"]},
-            timeout=TIMEOUT,
-        )
-        resp.raise_for_status()
-        token = resp.json().get("accessToken") or resp.json().get("token")
-        if not token:
-            raise Exception("Authentication token not found in login response")
-        return token
-    except requests.RequestException as e:
+        return shared_session.get_token(AUTH_CREDENTIALS)
+    except (requests.RequestException, shared_session.AuthError) as e:
         raise Exception(f"Authentication failed: {e}")
 
 def test_communications_endpoints():
@@ -42,7 +37,7 @@ def test_communications_endpoints():
 
     try:
         # 1. Send a message - POST /communications/messages
-        send_resp = requests.post(
+        send_resp = http.post(
             f"{BASE_URL}/communications/messages",
             json=message_payload,
             headers=headers,
@@ -55,7 +50,7 @@ def test_communications_endpoints():
         created_message_id = send_resp_json["id"]
 
         # 2. Retrieve messages - GET /communications/messages
-        get_messages_resp = requests.get(
+        get_messages_resp = http.get(
             f"{BASE_URL}/communications/messages",
             headers=headers,
             timeout=TIMEOUT,
@@ -72,7 +67,7 @@ def test_communications_endpoints():
         assert found, "Sent message not found in retrieved messages"
 
         # 3. Retrieve notifications - GET /communications/notifications
-        get_notifs_resp = requests.get(
+        get_notifs_resp = http.get(
             f"{BASE_URL}/communications/notifications",
             headers=headers,
             timeout=TIMEOUT,
@@ -87,13 +82,7 @@ def test_communications_endpoints():
         # Authenticate as patient
         patient_token = None
         try:
-            patient_login_resp = requests.post(
-                f"{BASE_URL}/auth/login",
-                json={"username": "patient1", "password": "PatientPass123"},
-                timeout=TIMEOUT,
-            )
-            patient_login_resp.raise_for_status()
-            patient_token = patient_login_resp.json().get("accessToken") or patient_login_resp.json().get("token")
+            patient_token = shared_session.get_token({"username": "patient1", "password": "PatientPass123"})
             assert patient_token, "Patient auth token missing"
         except Exception:
             patient_token = None
@@ -104,7 +93,7 @@ def test_communications_endpoints():
                 "Content-Type": "application/json",
                 "Accept": "application/json",
             }
-            restricted_send_resp = requests.post(
+            restricted_send_resp = http.post(
                 f"{BASE_URL}/communications/messages",
                 json=message_payload,
                 headers=patient_headers,
@@ -118,7 +107,7 @@ def test_communications_endpoints():
         # Cleanup: Delete created message if API supports DELETE /communications/messages/:id
         if created_message_id:
             try:
-                del_resp = requests.delete(
+                del_resp = http.delete(
                     f"{BASE_URL}/communications/messages/{created_message_id}",
                     headers=headers,
                     timeout=TIMEOUT,
@@ -0,0 +1,152 @@
+"""
+Load-test scenarios mirroring the TC00x_test_*.py API flows.
+
+The TC scripts execute their flow at import time, so instead of importing them
+each flow is described here as an ordered list of HTTP steps. A step path may
+reference values captured from earlier responses with ``{name}`` placeholders,
+and its ``label`` is what latency is aggregated under (so every virtual user's
+``GET /patients/<id>`` lands in the same ``GET /patients/{patient_id}`` bucket).
+A step body may be a callable, called for every request, so the scenarios are
+built once and each run still gets unique payloads.
+"""
+
+import uuid
+from dataclasses import dataclass, field
+
+
+@dataclass
+class Step:
+    method: str
+    path: str
+    # A dict, or a callable returning a fresh one per request
+    json: object = None
+    params: dict = None
+    # Name under which the "id" of the JSON response is stored for later steps
+    capture: str = None
+    # Status codes that count as success for this step
+    expect: tuple = (200, 201, 204)
+
+    @property
+    def label(self):
+        return f"{self.method} {self.path}"
+
+    def body(self):
+        return self.json() if callable(self.json) else self.json
+
+
+@dataclass
+class Scenario:
+    name: str
+    source: str
+    steps: list = field(default_factory=list)
+    weight: int = 1
+
+
+def extract_id(body):
+    """Pull an entity id from either a bare entity or a {success, data} envelope."""
+    if not isinstance(body, dict):
+        return None
+    if "id" in body:
+        return body["id"]
+    data = body.get("data")
+    if isinstance(data, dict):
+        return data.get("id")
+    return None
+
+
+def _patient_payload():
+    suffix = uuid.uuid4().hex[:8]
+    return {
+        "firstName": "Load",
+        "lastName": f"Patient{suffix}",
+        "dateOfBirth": "1980-01-01",
+        "gender": "OTHER",
+        "phone": "+1234567890",
+        "email": f"load.patient.{suffix}@example.com",
+        "address": "123 Health St, Wellness City",
+    }
+
+
+def build_scenarios():
+    """Build the scenarios; payload bodies are generated per request."""
+    return {
+        "patients": Scenario(
+            name="patients",
+            source="TC002_test_patient_management_endpoints.py",
+            weight=2,
+            steps=[
+                Step("POST", "/patients", json=_patient_payload, capture="patient_id"),
+                Step("GET", "/patients/{patient_id}"),
+                Step("PATCH", "/patients/{patient_id}", json={"address": "456 Recovery Rd, Healthtown"}),
+                Step("GET", "/patients", params={"page": 1, "limit": 10}),
+                Step("DELETE", "/patients/{patient_id}"),
+            ],
+        ),
+        "appointments": Scenario(
+            name="appointments",
+            source="TC003_test_appointment_scheduling_endpoints.py",
+            weight=3,
+            steps=[
+                Step("GET", "/appointments", params={"page": 1, "limit": 10}),
+                Step("GET", "/appointments/calendar"),
+                Step("GET", "/appointments/stats"),
+            ],
+        ),
+        "billing": Scenario(
+            name="billing",
+            source="TC004_test_billing_and_invoicing_endpoints.py",
+            weight=2,
+            steps=[
+                Step("GET", "/billing/invoices", params={"page": 1, "limit": 10}),
+                Step("GET", "/billing/invoices/stats"),
+                Step("GET", "/billing/invoices/reports/revenue"),
+                Step("GET", "/billing/payments", params={"page": 1, "limit": 10}),
+            ],
+        ),
+        "staff": Scenario(
+            name="staff",
+            source="TC005_test_staff_management_endpoints.py",
+            steps=[
+                Step("GET", "/staff"),
+                Step("GET", "/staff/stats"),
+            ],
+        ),
+        "laboratory": Scenario(
+            name="laboratory",
+            source="TC006_test_laboratory_endpoints.py",
+            steps=[
+                Step("GET", "/laboratory/orders"),
+                Step("GET", "/laboratory/orders/stats"),
+            ],
+        ),
+        "pharmacy": Scenario(
+            name="pharmacy",
+            source="TC007_test_pharmacy_endpoints.py",
+            steps=[
+                Step("GET", "/pharmacy/orders"),
+                Step("GET", "/pharmacy/orders/stats"),
+                Step("GET", "/pharmacy/medications"),
+            ],
+        ),
+        "communications": Scenario(
+            name="communications",
+            source="TC008_test_communications_endpoints.py",
+            weight=2,
+            steps=[
+                Step("GET", "/communications/messages"),
+                Step("GET", "/communications/notifications"),
+                Step("GET", "/communications/stats"),
+            ],
+        ),
+        "rbac": Scenario(
+            name="rbac",
+            source="TC009_test_rbac_system_endpoints.py",
+            steps=[
+                Step("GET", "/roles"),
+                Step("GET", "/permissions"),
+            ],
+        ),
+    }
+
+
+SCENARIO_NAMES = list(build_scenarios().keys())
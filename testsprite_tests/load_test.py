@@ -0,0 +1,241 @@
+"""
+Concurrent load generator for the testsprite API scenarios.
+
+Runs the flows from load_scenarios.py with N concurrent virtual users sharing
+one pooled async HTTP client, then reports throughput and p50/p95/p99 latency
+per endpoint.
+
+Usage:
+    pip install httpx
+    python load_test.py --users 50 --duration 60
+    python load_test.py --users 20 --iterations 100 --scenario patients --scenario billing
+    python load_test.py --users 50 --duration 60 --json load_report.json
+
+Every virtual user shares one client IP, so run this against an API whose
+ThrottlerModule limits (app.module.ts: 3 req/s, 100 req/min per IP) are raised
+or disabled; otherwise the numbers describe the rate limiter. Throttled (429)
+responses are reported in their own column and left out of the latencies.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from collections import defaultdict
+
+import shared_session
+from load_scenarios import SCENARIO_NAMES, build_scenarios, extract_id
+
+BASE_URL = shared_session.BASE_URL
+TIMEOUT = 30
+
+AUTH_CREDENTIALS = {
+    "email": os.environ.get("LOAD_TEST_EMAIL", "superadmin@example.com"),
+    "password": os.environ.get("LOAD_TEST_PASSWORD", "SuperAdminPass123!"),
+}
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(pct / 100.0 * len(sorted_values))))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class LoadStats:
+    """Latency/outcome samples bucketed by endpoint label."""
+
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.throttled = defaultdict(int)
+        self.statuses = defaultdict(lambda: defaultdict(int))
+        self.iterations = 0
+        self.failed_iterations = 0
+        self.started_at = None
+        self.finished_at = None
+
+    def record(self, label, elapsed_ms, status, ok):
+        self.statuses[label][status] += 1
+        if status == 429:
+            # Turned away by the rate limiter before reaching the endpoint
+            self.throttled[label] += 1
+            return
+        self.latencies[label].append(elapsed_ms)
+        if not ok:
+            self.errors[label] += 1
+
+    @property
+    def elapsed(self):
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.perf_counter()) - self.started_at
+
+    def summary(self):
+        elapsed = self.elapsed or 1e-9
+        endpoints = {}
+        for label in sorted(self.statuses):
+            ordered = sorted(self.latencies[label])
+            endpoints[label] = {
+                "requests": len(ordered),
+                "errors": self.errors[label],
+                "throttled": self.throttled[label],
+                "throughput_rps": round(len(ordered) / elapsed, 2),
+                "mean_ms": round(sum(ordered) / len(ordered), 2) if ordered else 0.0,
+                "p50_ms": round(percentile(ordered, 50), 2),
+                "p95_ms": round(percentile(ordered, 95), 2),
+                "p99_ms": round(percentile(ordered, 99), 2),
+                "max_ms": round(ordered[-1], 2) if ordered else 0.0,
+                "statuses": {str(k): v for k, v in self.statuses[label].items()},
+            }
+        total_requests = sum(e["requests"] for e in endpoints.values())
+        return {
+            "elapsed_s": round(elapsed, 2),
+            "iterations": self.iterations,
+            "failed_iterations": self.failed_iterations,
+            "total_requests": total_requests,
+            "total_throttled": sum(e["throttled"] for e in endpoints.values()),
+            "throughput_rps": round(total_requests / elapsed, 2),
+            "endpoints": endpoints,
+        }
+
+
+async def run_scenario(client, scenario, headers, stats):
+    """Execute one pass of a scenario; stop at the first failing step."""
+    captured = {}
+    for step in scenario.steps:
+        try:
+            path = step.path.format(**captured)
+        except KeyError:
+            # An earlier capture failed, nothing sensible left to call
+            return False
+
+        start = time.perf_counter()
+        try:
+            resp = await client.request(
+                step.method, path, json=step.body(), params=step.params, headers=headers
+            )
+            status = resp.status_code
+        except httpx.HTTPError as e:
+            resp = None
+            status = type(e).__name__
+        elapsed_ms = (time.perf_counter() - start) * 1000.0
+
+        ok = resp is not None and status in step.expect
+        stats.record(step.label, elapsed_ms, status, ok)
+        if not ok:
+            return False
+
+        if step.capture:
+            try:
+                captured[step.capture] = extract_id(resp.json())
+            except ValueError:
+                captured[step.capture] = None
+            if not captured[step.capture]:
+                return False
+    return True
+
+
+async def virtual_user(client, scenarios, names, weights, headers, stats, deadline, budget):
+    while time.perf_counter() < deadline:
+        if budget is not None:
+            if budget["remaining"] <= 0:
+                return
+            budget["remaining"] -= 1
+        name = random.choices(names, weights=weights)[0]
+        scenario = scenarios[name]
+        ok = await run_scenario(client, scenario, headers, stats)
+        stats.iterations += 1
+        if not ok:
+            stats.failed_iterations += 1
+
+
+async def run_load(args):
+    scenarios = build_scenarios()
+    names = args.scenario or SCENARIO_NAMES
+    weights = [scenarios[n].weight for n in names]
+
+    # Log in (or reuse the run's cached token) before the clock starts so the
+    # report measures the endpoints, not bcrypt
+    token = shared_session.SharedSession(base_url=args.base_url).get_token(AUTH_CREDENTIALS)
+
+    limits = httpx.Limits(max_connections=args.users, max_keepalive_connections=args.users)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout, limits=limits) as client:
+        headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
+
+        stats = LoadStats()
+        budget = {"remaining": args.iterations} if args.iterations else None
+        deadline = time.perf_counter() + (args.duration if args.duration else float("inf"))
+
+        stats.started_at = time.perf_counter()
+        users = []
+        for i in range(args.users):
+            users.append(asyncio.create_task(
+                virtual_user(client, scenarios, names, weights, headers, stats, deadline, budget)
+            ))
+            if args.ramp_up and i < args.users - 1:
+                await asyncio.sleep(args.ramp_up / args.users)
+        await asyncio.gather(*users)
+        stats.finished_at = time.perf_counter()
+    return stats
+
+
+def print_report(summary, users):
+    print(f"\nVirtual users: {users}   elapsed: {summary['elapsed_s']}s   "
+          f"iterations: {summary['iterations']} ({summary['failed_iterations']} failed)")
+    print(f"Total requests: {summary['total_requests']}   throughput: {summary['throughput_rps']} req/s\n")
+    header = f"{'endpoint':<48}{'reqs':>7}{'errs':>6}{'429s':>6}{'rps':>9}{'p50':>9}{'p95':>9}{'p99':>9}"
+    print(header)
+    print("-" * len(header))
+    for label, e in summary["endpoints"].items():
+        print(f"{label:<48}{e['requests']:>7}{e['errors']:>6}{e['throttled']:>6}{e['throughput_rps']:>9}"
+              f"{e['p50_ms']:>9}{e['p95_ms']:>9}{e['p99_ms']:>9}")
+    print("\nLatencies in milliseconds, throttled (429) responses excluded.")
+    if summary["total_throttled"]:
+        print(f"WARNING: {summary['total_throttled']} requests were rate limited; raise or disable the "
+              "API's ThrottlerModule limits for meaningful numbers.")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run testsprite API scenarios under concurrent load")
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--users", type=int, default=10, help="Concurrent virtual users")
+    parser.add_argument("--duration", type=float, default=None, help="Run for this many seconds")
+    parser.add_argument("--iterations", type=int, default=None, help="Total scenario runs across all users")
+    parser.add_argument("--ramp-up", type=float, default=0, help="Seconds over which users are started")
+    parser.add_argument("--timeout", type=float, default=TIMEOUT)
+    parser.add_argument("--scenario", action="append", choices=SCENARIO_NAMES,
+                        help="Scenario to include (repeatable, default: all)")
+    parser.add_argument("--json", dest="json_path", help="Write the summary to this file")
+    args = parser.parse_args(argv)
+    if not args.duration and not args.iterations:
+        args.duration = 30
+    return args
+
+
+def main(argv=None):
+    if httpx is None:
+        print("load_test.py requires httpx: pip install httpx", file=sys.stderr)
+        return 2
+    args = parse_args(argv)
+    stats = asyncio.run(run_load(args))
+    summary = stats.summary()
+    print_report(summary, args.users)
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump({"users": args.users, "base_url": args.base_url, **summary}, f, indent=2)
+        print(f"Summary written to {args.json_path}")
+    return 0 if summary["total_requests"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,253 @@
+"""
+Shared authenticated session for the testsprite API scripts.
+
+Every TC00x_test_*.py used to POST /auth/login on each run. Login is
+deliberately expensive (bcrypt, cost 12) and counts against the API's 'short'
+throttler bucket, so the suite ended up measuring bcrypt and 429s instead of
+the endpoints under test. This module:
+
+- logs in once per identity and caches the access (and refresh, if issued)
+  token in memory and in a small on-disk cache shared by every script process
+  of the run,
+- refreshes tokens through POST /auth/refresh shortly before they expire and
+  only falls back to a full login when the refresh is rejected,
+- hands out one keep-alive ``requests.Session`` (pooled connections) per
+  process.
+
+Usage from a TC script:
+
+    import shared_session
+
+    http = shared_session.get_session()
+    headers = shared_session.auth_headers(AUTH_CREDENTIALS)
+    http.get(f"{BASE_URL}/patients", headers=headers, timeout=TIMEOUT)
+
+Environment:
+    BASE_URL                   API base URL (default http://localhost:3001)
+    TESTSPRITE_TOKEN_CACHE     Cache file path, or "off" to keep tokens in memory only
+    TESTSPRITE_<ROLE>_EMAIL    Override credentials for a role in ROLE_CREDENTIALS
+    TESTSPRITE_<ROLE>_PASSWORD
+"""
+
+import base64
+import json
+import os
+import tempfile
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+BASE_URL = os.environ.get("BASE_URL", "http://localhost:3001")
+TIMEOUT = 30
+
+# Refresh this many seconds before the access token's exp claim
+REFRESH_SKEW_SECONDS = 60
+# Used when a token carries no readable exp claim
+DEFAULT_TOKEN_TTL_SECONDS = 15 * 60
+POOL_SIZE = 20
+
+CACHE_PATH = os.environ.get(
+    "TESTSPRITE_TOKEN_CACHE",
+    os.path.join(tempfile.gettempdir(), "testsprite_token_cache.json"),
+)
+
+
+def _role_credentials(role, email, password):
+    prefix = f"TESTSPRITE_{role}_"
+    return {
+        "email": os.environ.get(prefix + "EMAIL", email),
+        "password": os.environ.get(prefix + "PASSWORD", password),
+    }
+
+
+ROLE_CREDENTIALS = {
+    "SUPER_ADMIN": _role_credentials("SUPER_ADMIN", "superadmin@example.com", "SuperAdminPass123!"),
+    "ADMIN": _role_credentials("ADMIN", "admin@example.com", "AdminPass123!"),
+    "DOCTOR": _role_credentials("DOCTOR", "doctor_user@example.com", "DoctorPass123!"),
+    "LAB_TECHNICIAN": _role_credentials("LAB_TECHNICIAN", "labtech_test_user@example.com", "labtech_password123"),
+    "PHARMACIST": _role_credentials("PHARMACIST", "pharmacist@example.com", "PharmacistPass123!"),
+    "PATIENT": _role_credentials("PATIENT", "patient@example.com", "PatientPass123!"),
+}
+
+
+class AuthError(Exception):
+    pass
+
+
+def _identity(credentials):
+    return credentials.get("email") or credentials.get("username")
+
+
+def _token_expiry(token):
+    """Read the exp claim of a JWT without verifying it."""
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        exp = json.loads(base64.urlsafe_b64decode(payload)).get("exp")
+        if exp:
+            return float(exp)
+    except (IndexError, ValueError, AttributeError):
+        pass
+    return time.time() + DEFAULT_TOKEN_TTL_SECONDS
+
+
+def _tokens_from_response(body):
+    access = body.get("accessToken") or body.get("access_token") or body.get("token")
+    refresh = body.get("refreshToken") or body.get("refresh_token")
+    data = body.get("data")
+    if not access and isinstance(data, dict):
+        access = data.get("accessToken") or data.get("access_token")
+        refresh = refresh or data.get("refreshToken") or data.get("refresh_token")
+    return access, refresh
+
+
+class TokenCache:
+    """Per-identity tokens, optionally persisted so separate script processes share them."""
+
+    def __init__(self, path):
+        self.path = None if path in (None, "", "off") else path
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path) as f:
+                self._entries = json.load(f)
+        except (OSError, ValueError):
+            self._entries = {}
+
+    def _save(self):
+        if not self.path:
+            return
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w") as f:
+                json.dump(self._entries, f)
+            os.replace(tmp, self.path)
+        except OSError:
+            pass
+
+    def get(self, key):
+        with self._lock:
+            return self._entries.get(key)
+
+    def put(self, key, access, refresh):
+        with self._lock:
+            self._entries[key] = {
+                "accessToken": access,
+                "refreshToken": refresh,
+                "expiresAt": _token_expiry(access),
+            }
+            self._save()
+            return self._entries[key]
+
+    def drop(self, key):
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self._save()
+
+
+class SharedSession:
+    def __init__(self, base_url=BASE_URL, cache_path=CACHE_PATH, pool_size=POOL_SIZE):
+        self.base_url = base_url.rstrip("/")
+        self.cache = TokenCache(cache_path)
+        self.logins = 0
+        self.refreshes = 0
+        self._lock = threading.Lock()
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"Connection": "keep-alive", "Accept": "application/json"})
+
+    def _key(self, credentials):
+        return f"{self.base_url}|{_identity(credentials)}"
+
+    def _login(self, credentials):
+        resp = self.session.post(f"{self.base_url}/auth/login", json=credentials, timeout=TIMEOUT)
+        if resp.status_code >= 400:
+            raise AuthError(f"Login failed for {_identity(credentials)}: {resp.status_code} {resp.text}")
+        access, refresh = _tokens_from_response(resp.json())
+        if not access:
+            raise AuthError(f"Login for {_identity(credentials)} returned no access token")
+        self.logins += 1
+        return self.cache.put(self._key(credentials), access, refresh)
+
+    def _refresh(self, credentials, entry):
+        headers = {"Authorization": f"Bearer {entry['accessToken']}"}
+        body = {"refreshToken": entry["refreshToken"]} if entry.get("refreshToken") else None
+        try:
+            resp = self.session.post(f"{self.base_url}/auth/refresh", json=body, headers=headers, timeout=TIMEOUT)
+        except requests.RequestException:
+            return None
+        if resp.status_code >= 400:
+            return None
+        access, refresh = _tokens_from_response(resp.json())
+        if not access:
+            return None
+        self.refreshes += 1
+        return self.cache.put(self._key(credentials), access, refresh or entry.get("refreshToken"))
+
+    def get_token(self, credentials):
+        """Return a valid access token for these credentials, logging in at most once."""
+        if isinstance(credentials, str):
+            credentials = ROLE_CREDENTIALS[credentials]
+        key = self._key(credentials)
+        with self._lock:
+            entry = self.cache.get(key)
+            if entry and entry["expiresAt"] - REFRESH_SKEW_SECONDS > time.time():
+                return entry["accessToken"]
+            if entry and entry["expiresAt"] > time.time():
+                entry = self._refresh(credentials, entry)
+                if entry:
+                    return entry["accessToken"]
+            return self._login(credentials)["accessToken"]
+
+    def invalidate(self, credentials):
+        """Forget a cached token, e.g. after the API answered 401 with it."""
+        if isinstance(credentials, str):
+            credentials = ROLE_CREDENTIALS[credentials]
+        self.cache.drop(self._key(credentials))
+
+    def auth_headers(self, credentials, extra=None):
+        headers = {
+            "Authorization": f"Bearer {self.get_token(credentials)}",
+            "Content-Type": "application/json",
+        }
+        if extra:
+            headers.update(extra)
+        return headers
+
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def default():
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = SharedSession()
+        return _default
+
+
+def get_session():
+    return default().session
+
+
+def get_token(credentials):
+    return default().get_token(credentials)
+
+
+def auth_headers(credentials, extra=None):
+    return default().auth_headers(credentials, extra)
+
+
+def invalidate(credentials):
+    default().invalidate(credentials)